@@ -1,6 +1,23 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+from django.db.models.signals import post_migrate
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        # Registra os sinais que mantêm o cache de estatísticas e a versão do modelo de leitura das unidades
+        from . import estatisticas, leitura_unidades  # noqa: F401
+        from .busca_chamadas import verificar_triggers_apos_migrate
+        from .tarefas_exportacao import iniciar_manutencao_em_processo
+
+        estatisticas.verificar_cache_estatisticas()
+        leitura_unidades.verificar_cache_versoes()
+
+        # Manutenção da fila de exportações no worker em processo (só em processos que atendem requisições)
+        request_started.connect(iniciar_manutencao_em_processo, dispatch_uid='exportacao_manutencao')
+
+        # Triggers FTS5 da busca do histórico são SQL cru: uma migração que reconstrói a tabela os apaga
+        post_migrate.connect(verificar_triggers_apos_migrate, sender=self, dispatch_uid='busca_chamadas_triggers')
@@ -0,0 +1,175 @@
+"""
+Busca textual no histórico de chamadas (filtro `busca`).
+
+- PostgreSQL: coluna gerada `busca_vetor` (tsvector em português sem acentos, com peso por
+  campo) e índice GIN; a busca usa to_tsquery com prefixo (`termo:*`) e ts_rank_cd como
+  relevância. A configuração `portuguese_unaccent` (unaccent + stemmer português) deixa
+  a busca indiferente a acentos, como no SQLite.
+- SQLite: tabela FTS5 `accounts_registrochamada_fts` (unicode61 sem acentos, índice de
+  prefixos), mantida por triggers; a busca usa MATCH e bm25 com peso por campo.
+- Outros bancos, ou SQLite sem FTS5: icontains nos cinco campos, como antes.
+
+A coluna, a tabela e os triggers são criados pelas migrações 0019_busca_textual e
+0022_busca_textual_sem_acentos. Os termos digitados são reduzidos a palavras (letras e
+dígitos) e todos precisam aparecer, cada um como prefixo de alguma palavra da chamada. O
+telefone também é indexado só com dígitos, então "67999" encontra "(67) 99999-0000".
+
+Triggers do SQLite: são SQL cru, fora do estado de migrações do Django. Uma migração que
+reconstrói accounts_registrochamada no SQLite (alterar ou remover coluna, por exemplo)
+apaga os triggers junto com a tabela antiga. Por isso, depois de cada migrate, o sinal
+post_migrate chama garantir_triggers_fts, que compara os triggers do banco com o SQL da
+migração (MIGRACAO_TRIGGERS, a única cópia), recria os que faltarem e reindexa a tabela.
+"""
+import logging
+import re
+from importlib import import_module
+
+from django.db import connections, transaction
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+TABELA = 'accounts_registrochamada'
+TABELA_FTS = 'accounts_registrochamada_fts'
+CONFIGURACAO_PG = 'portuguese_unaccent'
+CAMPOS_BUSCA = ('nome_contato', 'telefone', 'unidade', 'descricao', 'nome_atendente')
+
+# Peso de cada coluna da tabela FTS5 no bm25 (mesma ordem das colunas, telefone_digitos por último)
+PESOS_FTS = (10.0, 8.0, 5.0, 1.0, 3.0, 8.0)
+
+_fts_disponivel = set()
+
+
+def backend_busca(alias='default'):
+    """'postgresql', 'sqlite' ou None (icontains) para a conexão `alias`"""
+    conexao = connections[alias]
+    if conexao.vendor == 'postgresql':
+        return 'postgresql'
+    if conexao.vendor != 'sqlite':
+        return None
+    if alias not in _fts_disponivel:
+        # Só o resultado positivo fica guardado: a tabela pode surgir com o migrate
+        if TABELA_FTS not in conexao.introspection.table_names():
+            return None
+        _fts_disponivel.add(alias)
+    return 'sqlite'
+
+
+def termos_busca(busca):
+    """Palavras da busca em minúsculas, sem pontuação (aspas, operadores etc.)"""
+    return re.findall(r'\w+', (busca or '').lower())
+
+
+def consulta_fts5(termos):
+    return ' '.join(f'"{termo}"*' for termo in termos)
+
+
+def consulta_tsquery(termos):
+    return ' & '.join(f'{termo}:*' for termo in termos)
+
+
+def filtro_icontains(busca):
+    filtro = Q()
+    for campo in CAMPOS_BUSCA:
+        filtro |= Q(**{f'{campo}__icontains': busca})
+    return filtro
+
+
+def filtrar_por_busca(chamadas, busca):
+    """Restringe o queryset de RegistroChamada às chamadas que casam com `busca`"""
+    termos = termos_busca(busca)
+    backend = backend_busca(chamadas.db)
+    if not termos or backend is None:
+        return chamadas.filter(filtro_icontains(busca))
+
+    if backend == 'sqlite':
+        return chamadas.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {TABELA_FTS} WHERE {TABELA_FTS} MATCH %s', [consulta_fts5(termos)],
+        ))
+    tabela = chamadas.model._meta.db_table
+    return chamadas.filter(RawSQL(
+        f"\"{tabela}\".\"busca_vetor\" @@ to_tsquery('{CONFIGURACAO_PG}', %s)",
+        [consulta_tsquery(termos)], output_field=BooleanField(),
+    ))
+
+
+def anotar_relevancia(chamadas, busca, campo='relevancia'):
+    """
+    Anota `campo` (maior = mais relevante) no queryset já filtrado por filtrar_por_busca.
+    Sem índice textual, a relevância é sempre 0 e a ordem fica pelo id.
+    """
+    termos = termos_busca(busca)
+    backend = backend_busca(chamadas.db)
+    if not termos or backend is None:
+        return chamadas.annotate(**{campo: RawSQL('0.0', [], output_field=FloatField())})
+
+    tabela = chamadas.model._meta.db_table
+    if backend == 'sqlite':
+        # Junta a tabela FTS5 uma vez; uma subconsulta correlacionada refaria o MATCH a cada linha
+        chamadas = chamadas.extra(
+            tables=[TABELA_FTS],
+            where=[f'{TABELA_FTS}.rowid = "{tabela}"."id"', f'{TABELA_FTS} MATCH %s'],
+            params=[consulta_fts5(termos)],
+        )
+        pesos = ', '.join(map(str, PESOS_FTS))
+        expressao = RawSQL(f'-bm25({TABELA_FTS}, {pesos})', [], output_field=FloatField())
+    else:
+        # ts_rank_cd é float4: convertido para float8, o valor devolvido ao Python e gravado no
+        # cursor é o mesmo que o banco compara em `relevancia < x` (senão empates na borda da
+        # página seriam pulados)
+        expressao = RawSQL(
+            f"ts_rank_cd(\"{tabela}\".\"busca_vetor\", to_tsquery('{CONFIGURACAO_PG}', %s))::float8",
+            [consulta_tsquery(termos)], output_field=FloatField(),
+        )
+    return chamadas.annotate(**{campo: expressao})
+
+
+# ===== TRIGGERS DO SQLITE =====
+
+# Migração com a definição vigente dos triggers (TRIGGERS e POPULAR_FTS). O SQL existe
+# só lá, congelado junto com a migração; este módulo não mantém outra cópia.
+MIGRACAO_TRIGGERS = 'accounts.migrations.0019_busca_textual'
+
+
+def definicao_triggers():
+    """(triggers {nome: CREATE TRIGGER}, SQL que reindexa todas as chamadas) da MIGRACAO_TRIGGERS"""
+    migracao = import_module(MIGRACAO_TRIGGERS)
+    return migracao.TRIGGERS, migracao.POPULAR_FTS
+
+
+def _normalizar_sql(sql):
+    return ' '.join((sql or '').split())
+
+
+def garantir_triggers_fts(alias='default'):
+    """
+    Recria os triggers FTS5 que faltarem (apagados na reconstrução da tabela por uma
+    migração) ou que estiverem diferentes da definição da migração, e então reindexa
+    todas as chamadas. Retorna os nomes dos triggers recriados.
+    """
+    conexao = connections[alias]
+    if conexao.vendor != 'sqlite' or TABELA_FTS not in conexao.introspection.table_names():
+        return []
+    triggers, popular = definicao_triggers()
+    with transaction.atomic(using=alias), conexao.cursor() as cursor:
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s", [TABELA])
+        existentes = {nome: _normalizar_sql(sql) for nome, sql in cursor.fetchall()}
+        recriar = [nome for nome, sql in triggers.items() if existentes.get(nome) != _normalizar_sql(sql)]
+        if not recriar:
+            return []
+        logger.warning(
+            'Triggers da busca textual ausentes ou alterados (%s): recriando e reindexando', ', '.join(recriar),
+        )
+        for nome in recriar:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {nome}')
+            cursor.execute(triggers[nome])
+        # Chamadas alteradas enquanto faltava trigger estão erradas no índice: refaz tudo
+        cursor.execute(f"INSERT INTO {TABELA_FTS} ({TABELA_FTS}) VALUES ('delete-all')")
+        cursor.execute(popular)
+    return recriar
+
+
+def verificar_triggers_apos_migrate(sender, using='default', **kwargs):
+    """post_migrate de accounts: ver garantir_triggers_fts"""
+    garantir_triggers_fts(using)
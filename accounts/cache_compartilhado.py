@@ -0,0 +1,29 @@
+"""
+Verificação, na inicialização, dos caches que precisam ser vistos por todos os workers.
+
+Os contadores do dashboard (accounts.estatisticas) e a versão do modelo de leitura das
+unidades (accounts.leitura_unidades) são atualizados por sinais no worker que gravou a
+alteração. Num cache que só existe dentro do processo (LocMemCache), os outros workers
+nunca veem a atualização; com vários workers isso é recusado em vez de mostrar dados
+errados.
+"""
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# Backends que guardam os dados só no processo
+CACHES_LOCAIS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def verificar_cache_compartilhado(configuracao, alias, uso):
+    """Levanta ImproperlyConfigured se `alias` (da setting `configuracao`) for local com vários workers"""
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    workers = getattr(settings, 'WEB_WORKERS', 1)
+    if backend in CACHES_LOCAIS and workers > 1:
+        raise ImproperlyConfigured(
+            f"{configuracao}='{alias}' usa {backend.rsplit('.', 1)[-1]}, que não é compartilhado "
+            f"entre os {workers} workers (WEB_CONCURRENCY): {uso} não chegariam aos outros "
+            f"processos. Use um cache compartilhado (FileBasedCache, Redis ou Memcached)."
+        )
@@ -0,0 +1,404 @@
+"""
+Consulta de estabelecimentos na API de dados abertos do CNES (DATASUS) com cache local.
+
+Cada estabelecimento consultado fica gravado em CnesCache. Dentro de CNES_CACHE_TTL_HORAS
+a consulta é respondida só pelo banco. Depois disso, por até CNES_CACHE_STALE_HORAS, o
+registro expirado ainda é devolvido na hora enquanto uma thread busca a versão nova
+(stale-while-revalidate). Mais antigo que isso, a requisição espera a API, mas se o
+DATASUS estiver fora do ar o registro expirado continua sendo usado. Os registros
+gravados por `manage.py import_cnes` (origem importação) não expiram: a atualização
+deles é importar de novo o arquivo mais recente do DATASUS.
+
+As chamadas à API passam por um único ClienteCnes por processo: uma requests.Session
+com pool de conexões (keep-alive), poucas novas tentativas com backoff e um disjuntor
+que, após falhas seguidas, recusa as chamadas na hora por um tempo em vez de prender
+os workers do servidor esperando o timeout.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import CnesCache
+
+logger = logging.getLogger(__name__)
+
+CABECALHOS_API_CNES = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8'
+}
+
+# Campos regravados quando um código já existente é buscado de novo
+CAMPOS_ATUALIZADOS_CNES = ['encontrado', 'dados', 'nome', 'municipio', 'uf', 'telefone', 'buscado_em', 'origem']
+
+# Origem da resposta devolvida por consultar_cnes
+ORIGEM_API = 'api'
+ORIGEM_CACHE = 'cache'
+ORIGEM_CACHE_EXPIRADO = 'cache_expirado'
+
+_revalidando = set()
+_revalidando_lock = threading.Lock()
+_executor = None
+
+
+class ErroApiCnes(Exception):
+    """A API do CNES respondeu com um status inesperado"""
+
+    def __init__(self, status):
+        super().__init__(f'Erro na consulta da API: {status}')
+        self.status = status
+
+
+class CircuitoAberto(Exception):
+    """Chamadas à API suspensas pelo disjuntor após falhas seguidas"""
+
+
+def configuracao(nome, padrao):
+    return getattr(settings, nome, padrao)
+
+
+def limpar_codigo_cnes(codigo):
+    return ''.join(filter(str.isdigit, str(codigo or '')))
+
+
+def padronizar_dados_cnes(dados_api, codigo_cnes):
+    """Dados da API no formato devolvido pelo sistema (com TODOS os campos disponíveis)"""
+    return {
+        # Identificação básica
+        'codigo_cnes': dados_api.get('codigo_cnes', codigo_cnes),
+        'nome_fantasia': dados_api.get('nome_fantasia'),
+        'nome_razao_social': dados_api.get('nome_razao_social'),
+        'numero_cnpj_entidade': dados_api.get('numero_cnpj_entidade'),
+
+        # Classificação
+        'natureza_organizacao_entidade': dados_api.get('natureza_organizacao_entidade'),
+        'tipo_gestao': dados_api.get('tipo_gestao'),
+        'descricao_nivel_hierarquia': dados_api.get('descricao_nivel_hierarquia'),
+        'descricao_esfera_administrativa': dados_api.get('descricao_esfera_administrativa'),
+        'codigo_tipo_unidade': dados_api.get('codigo_tipo_unidade'),
+
+        # Endereço completo
+        'codigo_cep_estabelecimento': dados_api.get('codigo_cep_estabelecimento'),
+        'endereco_estabelecimento': dados_api.get('endereco_estabelecimento'),
+        'numero_estabelecimento': dados_api.get('numero_estabelecimento'),
+        'bairro_estabelecimento': dados_api.get('bairro_estabelecimento'),
+        'codigo_municipio': dados_api.get('codigo_municipio'),
+        'descricao_municipio': dados_api.get('descricao_municipio'),
+        'codigo_uf': dados_api.get('codigo_uf'),
+        'sigla_uf': dados_api.get('sigla_uf'),
+
+        # Contato
+        'numero_telefone_estabelecimento': dados_api.get('numero_telefone_estabelecimento'),
+        'numero_fax_estabelecimento': dados_api.get('numero_fax_estabelecimento'),
+        'endereco_email_estabelecimento': dados_api.get('endereco_email_estabelecimento'),
+
+        # Funcionamento
+        'codigo_motivo_desabilitacao_estabelecimento': dados_api.get('codigo_motivo_desabilitacao_estabelecimento'),
+        'estabelecimento_possui_centro_cirurgico': dados_api.get('estabelecimento_possui_centro_cirurgico'),
+        'estabelecimento_possui_centro_obstetrico': dados_api.get('estabelecimento_possui_centro_obstetrico'),
+        'estabelecimento_possui_centro_neonatal': dados_api.get('estabelecimento_possui_centro_neonatal'),
+        'estabelecimento_possui_atendimento_ambulatorial': dados_api.get('estabelecimento_possui_atendimento_ambulatorial'),
+        'estabelecimento_possui_atendimento_internacao': dados_api.get('estabelecimento_possui_atendimento_internacao'),
+        'estabelecimento_possui_atendimento_urgencia': dados_api.get('estabelecimento_possui_atendimento_urgencia'),
+        'estabelecimento_possui_atendimento_outros': dados_api.get('estabelecimento_possui_atendimento_outros'),
+
+        # Campos de compatibilidade (mantidos para não quebrar código existente)
+        'codigo': dados_api.get('codigo_cnes', codigo_cnes),
+        'nome': (dados_api.get('nome_fantasia') or
+                 dados_api.get('nome_razao_social') or
+                 'Nome não informado'),
+        'municipio': dados_api.get('descricao_municipio'),
+        'uf': dados_api.get('sigla_uf'),
+        'cep': dados_api.get('codigo_cep_estabelecimento'),
+        'endereco': dados_api.get('endereco_estabelecimento'),
+        'numero': dados_api.get('numero_estabelecimento'),
+        'bairro': dados_api.get('bairro_estabelecimento'),
+        'telefone': dados_api.get('numero_telefone_estabelecimento'),
+        'email': dados_api.get('endereco_email_estabelecimento'),
+    }
+
+
+def campos_normalizados(dados_api):
+    """Campos de CnesCache extraídos da resposta da API"""
+    return {
+        'nome': (dados_api.get('nome_fantasia') or dados_api.get('nome_razao_social') or '')[:255],
+        'municipio': (dados_api.get('descricao_municipio') or '')[:100],
+        'uf': (dados_api.get('sigla_uf') or '')[:2],
+        'telefone': str(dados_api.get('numero_telefone_estabelecimento') or '')[:50],
+    }
+
+
+# ===== CLIENTE HTTP =====
+
+def esgotou_tempo_de_leitura(erro):
+    """Timeout de leitura que esgotou as novas tentativas: o requests o entrega como ConnectionError"""
+    motivo = getattr(erro.args[0], 'reason', None) if erro.args else None
+    return isinstance(motivo, ReadTimeoutError)
+
+
+class ClienteCnes:
+    """
+    Cliente da API do CNES compartilhado pelas threads do processo.
+
+    Disjuntor: após `limite_falhas` falhas seguidas (timeout, erro de conexão ou 5xx)
+    fica aberto por `espera_circuito` segundos, levantando CircuitoAberto sem tocar a
+    rede. Passado esse tempo, uma chamada de teste é liberada: sucesso fecha o
+    circuito, falha o abre de novo.
+    """
+
+    def __init__(self, url_base, timeout=(3, 5), tentativas=2, conexoes=10, limite_falhas=5, espera_circuito=30):
+        self.url_base = url_base
+        self.timeout = timeout
+        self.limite_falhas = limite_falhas
+        self.espera_circuito = espera_circuito
+
+        self.sessao = requests.Session()
+        self.sessao.headers.update(CABECALHOS_API_CNES)
+        adaptador = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=conexoes,
+            max_retries=Retry(
+                total=tentativas,
+                read=min(tentativas, 1),  # GET lento repetido no máximo uma vez
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False,
+            ),
+        )
+        self.sessao.mount('https://', adaptador)
+        self.sessao.mount('http://', adaptador)
+
+        self._lock = threading.Lock()
+        self._falhas_seguidas = 0
+        self._aberto_ate = None
+        self._testando = False
+        self.contadores = {
+            'requisicoes': 0,
+            'sucessos': 0,
+            'nao_encontrados': 0,
+            'erros_http': 0,
+            'timeouts': 0,
+            'erros_conexao': 0,
+            'recusadas_circuito': 0,
+            'circuito_aberto_vezes': 0,
+        }
+        self._latencia_total = 0.0
+        self._latencia_maxima = 0.0
+
+    def estado(self):
+        if self._aberto_ate is None:
+            return 'fechado'
+        return 'aberto' if time.monotonic() < self._aberto_ate else 'meio_aberto'
+
+    def _liberar_chamada(self):
+        with self._lock:
+            estado = self.estado()
+            if estado == 'aberto' or (estado == 'meio_aberto' and self._testando):
+                self.contadores['recusadas_circuito'] += 1
+                raise CircuitoAberto('API do CNES temporariamente desativada após falhas seguidas')
+            self._testando = estado == 'meio_aberto'
+            self.contadores['requisicoes'] += 1
+
+    def _registrar(self, contador, latencia, falha):
+        with self._lock:
+            self.contadores[contador] += 1
+            self._latencia_total += latencia
+            self._latencia_maxima = max(self._latencia_maxima, latencia)
+            self._testando = False
+            if not falha:
+                self._falhas_seguidas = 0
+                self._aberto_ate = None
+                return
+            self._falhas_seguidas += 1
+            if self._aberto_ate is not None or self._falhas_seguidas >= self.limite_falhas:
+                if self.estado() != 'aberto':
+                    self.contadores['circuito_aberto_vezes'] += 1
+                self._aberto_ate = time.monotonic() + self.espera_circuito
+
+    def get(self, codigo_cnes):
+        self._liberar_chamada()
+        inicio = time.perf_counter()
+        try:
+            response = self.sessao.get(f'{self.url_base}{codigo_cnes}', timeout=self.timeout)
+        except requests.exceptions.Timeout:
+            self._registrar('timeouts', time.perf_counter() - inicio, falha=True)
+            raise
+        except requests.exceptions.ConnectionError as e:
+            contador = 'timeouts' if esgotou_tempo_de_leitura(e) else 'erros_conexao'
+            self._registrar(contador, time.perf_counter() - inicio, falha=True)
+            raise
+        except Exception:
+            self._registrar('erros_conexao', time.perf_counter() - inicio, falha=True)
+            raise
+
+        latencia = time.perf_counter() - inicio
+        if response.status_code >= 500:
+            self._registrar('erros_http', latencia, falha=True)
+        elif response.status_code == 404:
+            self._registrar('nao_encontrados', latencia, falha=False)
+        elif response.status_code != 200:
+            self._registrar('erros_http', latencia, falha=False)
+        else:
+            self._registrar('sucessos', latencia, falha=False)
+        return response
+
+    def metricas(self):
+        with self._lock:
+            respondidas = sum(self.contadores[c] for c in (
+                'sucessos', 'nao_encontrados', 'erros_http', 'timeouts', 'erros_conexao',
+            ))
+            return {
+                **self.contadores,
+                'circuito': self.estado(),
+                'falhas_seguidas': self._falhas_seguidas,
+                'latencia_media_ms': round(self._latencia_total / respondidas * 1000, 1) if respondidas else None,
+                'latencia_maxima_ms': round(self._latencia_maxima * 1000, 1),
+            }
+
+
+_cliente = None
+_cliente_lock = threading.Lock()
+
+
+def cliente_cnes():
+    """ClienteCnes do processo, criado no primeiro uso a partir das configurações"""
+    global _cliente
+    if _cliente is None:
+        with _cliente_lock:
+            if _cliente is None:
+                _cliente = ClienteCnes(
+                    configuracao('CNES_API_URL', 'https://apidadosabertos.saude.gov.br/cnes/estabelecimentos/'),
+                    timeout=(configuracao('CNES_API_TIMEOUT_CONEXAO', 3), configuracao('CNES_API_TIMEOUT', 5)),
+                    tentativas=configuracao('CNES_API_TENTATIVAS', 2),
+                    conexoes=configuracao('CNES_API_CONEXOES', 10),
+                    limite_falhas=configuracao('CNES_CIRCUITO_FALHAS', 5),
+                    espera_circuito=configuracao('CNES_CIRCUITO_ESPERA', 30),
+                )
+    return _cliente
+
+
+def reiniciar_cliente_cnes():
+    """Descarta o cliente (conexões, disjuntor e contadores); o próximo uso cria outro"""
+    global _cliente
+    with _cliente_lock:
+        if _cliente is not None:
+            _cliente.sessao.close()
+        _cliente = None
+
+
+# ===== API =====
+
+def buscar_na_api(codigo_cnes):
+    """Resposta da API para o código (dict) ou None se o estabelecimento não existir"""
+    response = cliente_cnes().get(codigo_cnes)
+    logger.debug('CNES %s: status %s', codigo_cnes, response.status_code)
+
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
+        raise ErroApiCnes(response.status_code)
+    return response.json()
+
+
+def registro_cnes(codigo_cnes, dados_api, buscado_em=None, origem=CnesCache.ORIGEM_API):
+    """CnesCache (não salvo) com a resposta da API; dados_api None = não encontrado"""
+    return CnesCache(
+        codigo_cnes=codigo_cnes,
+        encontrado=dados_api is not None,
+        dados=dados_api or {},
+        buscado_em=buscado_em or timezone.now(),
+        origem=origem,
+        **campos_normalizados(dados_api or {}),
+    )
+
+
+def gravar_registros_cnes(registros):
+    """
+    Upsert pelo código CNES em um único comando: sem SELECT + UPDATE disputando o mesmo
+    registro. Os códigos precisam ser distintos dentro da lista.
+    """
+    CnesCache.objects.bulk_create(
+        registros,
+        update_conflicts=True,
+        unique_fields=['codigo_cnes'],
+        update_fields=CAMPOS_ATUALIZADOS_CNES,
+    )
+
+
+def atualizar_cnes(codigo_cnes):
+    """Busca o código na API e grava o resultado (inclusive 'não encontrado') no cache"""
+    registro = registro_cnes(codigo_cnes, buscar_na_api(codigo_cnes))
+    gravar_registros_cnes([registro])
+    return registro
+
+
+# ===== CACHE =====
+
+def idade_maxima(registro):
+    """Tempo em que o registro vale sem consultar a API (None = não expira)"""
+    if registro.origem == CnesCache.ORIGEM_IMPORTACAO:
+        return None
+    if registro.encontrado:
+        return timedelta(hours=configuracao('CNES_CACHE_TTL_HORAS', 24 * 7))
+    return timedelta(hours=configuracao('CNES_CACHE_TTL_NAO_ENCONTRADO_HORAS', 1))
+
+
+def _revalidar(codigo_cnes):
+    close_old_connections()
+    try:
+        atualizar_cnes(codigo_cnes)
+    except Exception as e:
+        logger.warning('Falha ao revalidar o CNES %s: %s', codigo_cnes, e)
+    finally:
+        with _revalidando_lock:
+            _revalidando.discard(codigo_cnes)
+        close_old_connections()
+
+
+def revalidar_em_segundo_plano(codigo_cnes):
+    """Agenda a atualização do código; várias requisições pelo mesmo código disparam uma só"""
+    global _executor
+    with _revalidando_lock:
+        if codigo_cnes in _revalidando:
+            return
+        _revalidando.add(codigo_cnes)
+        if _executor is None:
+            # Poucas threads: a revalidação não pode competir com as requisições
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cnes')
+    _executor.submit(_revalidar, codigo_cnes)
+
+
+def consultar_cnes(codigo_cnes):
+    """
+    Registro CnesCache do código e a origem da resposta (ORIGEM_*).
+    Propaga os erros de requests/ErroApiCnes só quando não há nada no cache.
+    """
+    registro = CnesCache.objects.filter(codigo_cnes=codigo_cnes).first()
+    if registro:
+        validade = idade_maxima(registro)
+        idade = timezone.now() - registro.buscado_em
+        if validade is None or idade <= validade:
+            return registro, ORIGEM_CACHE
+        if idade <= validade + timedelta(hours=configuracao('CNES_CACHE_STALE_HORAS', 24 * 30)):
+            revalidar_em_segundo_plano(codigo_cnes)
+            return registro, ORIGEM_CACHE_EXPIRADO
+
+    try:
+        return atualizar_cnes(codigo_cnes), ORIGEM_API
+    except (requests.exceptions.RequestException, ErroApiCnes, CircuitoAberto, ValueError) as e:
+        if registro is None:
+            raise
+        # DATASUS fora do ar: segue com a cópia antiga
+        logger.warning('API do CNES indisponível (%s); usando cache de %s', e, registro.buscado_em)
+        return registro, ORIGEM_CACHE_EXPIRADO
@@ -0,0 +1,320 @@
+"""Estatísticas do dashboard calculadas com agregação condicional e mantidas em cache"""
+from datetime import date, datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, TruncMonth
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache_compartilhado import verificar_cache_compartilhado
+from .models import RegistroChamada, UnidadeSaude
+from .periodos import data_local, filtro_dia, filtro_mes, fuso_calendario, hoje, inicio_do_dia
+
+PREFIXO_CACHE = 'estatisticas'
+
+CONTADORES_DASHBOARD = (
+    'total_unidades',
+    'executantes',
+    'solicitantes',
+    'executante_solicitante',
+    'total_chamadas',
+    'chamadas_hoje',
+    'chamadas_mes',
+)
+
+# Contador do dashboard correspondente a cada tipo de unidade
+CONTADOR_POR_TIPO = {
+    'UNIDADE_EXECUTANTE': 'executantes',
+    'UNIDADE_SOLICITANTE': 'solicitantes',
+    'EXECUTANTE_SOLICITANTE': 'executante_solicitante',
+}
+
+
+def estatisticas_unidades():
+    """Conta as unidades de saúde por tipo em uma única consulta"""
+    return UnidadeSaude.objects.aggregate(
+        total_unidades=Count('id'),
+        executantes=Count('id', filter=Q(tipo='UNIDADE_EXECUTANTE')),
+        solicitantes=Count('id', filter=Q(tipo='UNIDADE_SOLICITANTE')),
+        executante_solicitante=Count('id', filter=Q(tipo='EXECUTANTE_SOLICITANTE')),
+    )
+
+
+def estatisticas_chamadas():
+    """Conta as chamadas totais, de hoje e do mês em uma única consulta"""
+    dia = hoje()
+    return RegistroChamada.objects.aggregate(
+        total_chamadas=Count('id'),
+        chamadas_hoje=Count('id', filter=filtro_dia('data_criacao', dia)),
+        chamadas_mes=Count('id', filter=filtro_mes('data_criacao', dia)),
+    )
+
+
+def calcular_estatisticas_dashboard():
+    """Retorna os contadores do dashboard (duas consultas no total)"""
+    estatisticas = estatisticas_unidades()
+    estatisticas.update(estatisticas_chamadas())
+    return estatisticas
+
+
+def calcular_estatisticas_usuarios():
+    """Conta os usuários por situação em uma única consulta"""
+    data_limite = timezone.now() - timedelta(days=30)
+    estatisticas = User.objects.aggregate(
+        total_usuarios=Count('id'),
+        usuarios_ativos=Count('id', filter=Q(is_active=True)),
+        usuarios_admins=Count('id', filter=Q(is_staff=True)),
+        usuarios_recentes=Count('id', filter=Q(date_joined__gte=data_limite)),
+        usuarios_inativos=Count('id', filter=Q(is_active=False)),
+        usuarios_com_email=Count('id', filter=~Q(email='')),
+    )
+    estatisticas['usuarios_com_chamadas'] = User.objects.filter(
+        chamadas_criadas__isnull=False
+    ).distinct().count()
+    estatisticas['usuarios_com_unidades'] = User.objects.filter(
+        unidades_cadastradas__isnull=False
+    ).distinct().count()
+    return estatisticas
+
+
+def contagem_por_usuario(queryset, campo_usuario):
+    """Subconsulta com quantos registros de `queryset` pertencem ao usuário da linha externa"""
+    contagem = (
+        queryset.filter(**{campo_usuario: OuterRef('pk')})
+        .order_by().values(campo_usuario)
+        .annotate(total=Count('id')).values('total')
+    )
+    return Coalesce(Subquery(contagem, output_field=IntegerField()), 0)
+
+
+def anotar_atividade_usuarios(usuarios):
+    """
+    Anota em cada usuário o total de unidades, de chamadas e a data da última chamada.
+    Cada valor é uma subconsulta: juntar as duas relações numa consulta multiplicaria
+    as linhas (unidades x chamadas) antes do COUNT DISTINCT.
+    """
+    return usuarios.annotate(
+        unidades_count=contagem_por_usuario(UnidadeSaude.objects.all(), 'usuario_cadastrante'),
+        chamadas_count=contagem_por_usuario(RegistroChamada.objects.all(), 'usuario_criador'),
+        # Índice (usuario_criador, data_criacao): a última chamada sai direto do índice
+        ultima_atividade=Subquery(
+            RegistroChamada.objects.filter(usuario_criador=OuterRef('pk'))
+            .order_by('-data_criacao').values('data_criacao')[:1]
+        ),
+    )
+
+
+def unidades_mais_ativas(limite=10):
+    """Ranking das unidades com mais chamadas em uma única consulta (join pela FK unidade_saude)"""
+    unidades = (
+        UnidadeSaude.objects
+        .annotate(total_chamadas=Count('chamadas'))
+        .order_by('-total_chamadas', 'nome')[:limite]
+    )
+    return [{'unidade': unidade, 'total_chamadas': unidade.total_chamadas} for unidade in unidades]
+
+
+# ===== SÉRIES MENSAIS =====
+
+def somar_meses(mes, quantidade):
+    """Retorna o primeiro dia do mês `quantidade` meses depois (ou antes, se negativo) de `mes`"""
+    ano, indice = divmod(mes.year * 12 + mes.month - 1 + quantidade, 12)
+    return date(ano, indice + 1, 1)
+
+
+def serie_mensal(queryset, campo_data, meses=12, **agregados):
+    """
+    Agrupa o queryset por mês de `campo_data` nos últimos `meses` meses de calendário,
+    incluindo o mês atual, com uma única consulta (TruncMonth + annotate).
+    Retorna uma lista em ordem cronológica de dicionários {'mes': date, <agregados>};
+    meses sem registros aparecem com zero. Sem agregados, conta os registros em 'total'.
+    """
+    agregados = agregados or {'total': Count('id')}
+    primeiro_mes = somar_meses(hoje().replace(day=1), -(meses - 1))
+
+    linhas = (
+        queryset
+        .filter(**{f'{campo_data}__gte': inicio_do_dia(primeiro_mes)})
+        .annotate(mes_referencia=TruncMonth(campo_data, tzinfo=fuso_calendario()))
+        .values('mes_referencia')
+        .annotate(**agregados)
+        .order_by('mes_referencia')
+    )
+
+    por_mes = {}
+    for linha in linhas:
+        mes = linha.pop('mes_referencia')
+        if isinstance(mes, datetime):
+            mes = data_local(mes) if timezone.is_aware(mes) else mes.date()
+        por_mes[mes] = linha
+
+    return [
+        {'mes': mes, **por_mes.get(mes, dict.fromkeys(agregados, 0))}
+        for mes in (somar_meses(primeiro_mes, i) for i in range(meses))
+    ]
+
+
+def usuarios_por_mes(meses=12, detalhar=False):
+    """
+    Novos usuários por mês nos últimos `meses` meses (relatórios Excel, CSV e PDF).
+    Os totais vêm de uma única consulta agregada (serie_mensal). Com `detalhar`, os usuários
+    do período são lidos em mais uma consulta, já anotados com unidades e chamadas, e
+    agrupados por mês em Python: o custo não depende do período nem do número de usuários.
+    Retorna a série cronológica de {'mes', 'total', 'ativos', 'admins', 'usuarios'}.
+    """
+    serie = serie_mensal(
+        User.objects.all(), 'date_joined', meses,
+        total=Count('id'),
+        ativos=Count('id', filter=Q(is_active=True)),
+        admins=Count('id', filter=Q(is_staff=True)),
+    )
+    por_mes = {}
+    for ponto in serie:
+        ponto['usuarios'] = por_mes[ponto['mes']] = []
+
+    if detalhar and serie:
+        usuarios = anotar_atividade_usuarios(
+            User.objects.filter(date_joined__gte=inicio_do_dia(serie[0]['mes']))
+        ).order_by('date_joined')
+        for usuario in usuarios:
+            mes = data_local(usuario.date_joined).replace(day=1)
+            if mes in por_mes:
+                por_mes[mes].append(usuario)
+
+    return serie
+
+
+# ===== CACHE DOS CONTADORES =====
+
+def _alias():
+    return getattr(settings, 'ESTATISTICAS_CACHE_ALIAS', 'default')
+
+
+def _cache():
+    return caches[_alias()]
+
+
+def verificar_cache_estatisticas():
+    """Falha na inicialização se os contadores ficariam presos a um processo com vários workers"""
+    verificar_cache_compartilhado('ESTATISTICAS_CACHE_ALIAS', _alias(), 'os incrementos dos contadores')
+
+
+def _timeout():
+    # Após o timeout os contadores são recalculados do zero (rede de segurança)
+    return getattr(settings, 'ESTATISTICAS_CACHE_TIMEOUT', 300)
+
+
+def _chave(nome):
+    return f'{PREFIXO_CACHE}:{nome}'
+
+
+def _referencia_atual():
+    """Dia e mês a que os contadores 'hoje' e 'mês' se referem"""
+    return hoje().isoformat()
+
+
+def reconstruir_estatisticas_dashboard():
+    """Recalcula os contadores do dashboard e os grava no cache"""
+    estatisticas = calcular_estatisticas_dashboard()
+    dados = {_chave(nome): valor for nome, valor in estatisticas.items()}
+    dados[_chave('referencia')] = _referencia_atual()
+    _cache().set_many(dados, timeout=_timeout())
+    return estatisticas
+
+
+def obter_estatisticas_dashboard():
+    """Retorna os contadores do dashboard a partir do cache, recalculando se necessário"""
+    chaves = [_chave(nome) for nome in CONTADORES_DASHBOARD]
+    valores = _cache().get_many(chaves + [_chave('referencia')])
+
+    if len(valores) == len(chaves) + 1 and valores[_chave('referencia')] == _referencia_atual():
+        return {nome: valores[_chave(nome)] for nome in CONTADORES_DASHBOARD}
+
+    return reconstruir_estatisticas_dashboard()
+
+
+def obter_estatisticas_usuarios():
+    """Retorna as estatísticas de usuários a partir do cache, recalculando se necessário"""
+    estatisticas = _cache().get(_chave('usuarios'))
+    if estatisticas is None:
+        estatisticas = calcular_estatisticas_usuarios()
+        _cache().set(_chave('usuarios'), estatisticas, timeout=_timeout())
+    return estatisticas
+
+
+def invalidar_estatisticas_dashboard():
+    _cache().delete(_chave('referencia'))
+
+
+def invalidar_estatisticas_usuarios():
+    _cache().delete(_chave('usuarios'))
+
+
+def _incrementar_dashboard(*nomes):
+    """Incrementa contadores do dashboard; invalida tudo se algum não estiver no cache"""
+    cache = _cache()
+    if cache.get(_chave('referencia')) != _referencia_atual():
+        invalidar_estatisticas_dashboard()
+        return
+
+    for nome in nomes:
+        try:
+            cache.incr(_chave(nome))
+        except ValueError:
+            invalidar_estatisticas_dashboard()
+            return
+
+
+# ===== SINAIS =====
+
+@receiver(post_save, sender=RegistroChamada)
+def chamada_salva(sender, instance, created, **kwargs):
+    if not created:
+        return
+
+    def atualizar():
+        if data_local(instance.data_criacao).isoformat() == _referencia_atual():
+            _incrementar_dashboard('total_chamadas', 'chamadas_hoje', 'chamadas_mes')
+        else:
+            invalidar_estatisticas_dashboard()
+        invalidar_estatisticas_usuarios()
+
+    transaction.on_commit(atualizar)
+
+
+@receiver(post_save, sender=UnidadeSaude)
+def unidade_salva(sender, instance, created, **kwargs):
+    def atualizar():
+        if created and instance.tipo in CONTADOR_POR_TIPO:
+            _incrementar_dashboard('total_unidades', CONTADOR_POR_TIPO[instance.tipo])
+        else:
+            # Edições podem mudar o tipo da unidade
+            invalidar_estatisticas_dashboard()
+        invalidar_estatisticas_usuarios()
+
+    transaction.on_commit(atualizar)
+
+
+@receiver(post_delete, sender=RegistroChamada)
+@receiver(post_delete, sender=UnidadeSaude)
+def registro_excluido(sender, instance, **kwargs):
+    transaction.on_commit(invalidar_estatisticas_dashboard)
+    transaction.on_commit(invalidar_estatisticas_usuarios)
+
+
+@receiver(post_save, sender=User)
+def usuario_salvo(sender, instance, update_fields=None, **kwargs):
+    # O login só atualiza last_login, que não entra nas estatísticas
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    transaction.on_commit(invalidar_estatisticas_usuarios)
+
+
+@receiver(post_delete, sender=User)
+def usuario_excluido(sender, instance, **kwargs):
+    transaction.on_commit(invalidar_estatisticas_usuarios)
@@ -0,0 +1,90 @@
+"""
+Exportações CSV e XLSX com memória constante.
+
+CSV: as linhas são geradas sob demanda a partir de `values_list(...).iterator()` e enviadas
+por um StreamingHttpResponse; o primeiro byte sai assim que a primeira linha é lida do banco.
+
+XLSX: as linhas vão direto para um Workbook(write_only=True) do openpyxl, gravado em um
+arquivo temporário e enviado com FileResponse, sem montar listas ou DataFrames.
+"""
+import csv
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from openpyxl import Workbook
+
+# Linhas buscadas do banco por vez durante a exportação
+TAMANHO_LOTE_EXPORTACAO = 2000
+
+CONTENT_TYPE_XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# O Excel limita o nome das abas a 31 caracteres
+TAMANHO_MAXIMO_NOME_ABA = 31
+
+
+class Eco:
+    """Pseudo-arquivo cujo write() devolve o texto recebido (csv.writer dentro de um gerador)"""
+
+    def write(self, valor):
+        return valor
+
+
+def gerar_linhas_csv(cabecalho, linhas, bom=False):
+    """Gera o CSV linha a linha já formatado"""
+    writer = csv.writer(Eco())
+    if bom:
+        yield '\ufeff'
+    if cabecalho:
+        yield writer.writerow(cabecalho)
+    for linha in linhas:
+        yield writer.writerow(linha)
+
+
+def resposta_csv_streaming(nome_arquivo, cabecalho, linhas, bom=False, content_type='text/csv'):
+    """StreamingHttpResponse de download com o CSV de `linhas` (qualquer iterável de listas)"""
+    response = StreamingHttpResponse(gerar_linhas_csv(cabecalho, linhas, bom), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{nome_arquivo}"'
+    return response
+
+
+def iterar_valores(queryset, *campos, tamanho_lote=TAMANHO_LOTE_EXPORTACAO):
+    """Tuplas dos `campos` do queryset, lidas em lotes sem cache de instâncias"""
+    return queryset.values_list(*campos).iterator(chunk_size=tamanho_lote)
+
+
+# ===== XLSX =====
+
+def aba_de_registros(titulo, registros):
+    """Aba (titulo, cabecalho, linhas) a partir de uma lista de dicionários com as mesmas chaves"""
+    cabecalho = list(registros[0]) if registros else []
+    return titulo, cabecalho, (list(registro.values()) for registro in registros)
+
+
+def gerar_xlsx(abas):
+    """
+    Grava as `abas` — iterável de (titulo, cabecalho, linhas) — em um arquivo temporário
+    e o retorna aberto no início. As linhas podem ser geradores: cada uma é escrita e descartada.
+    """
+    workbook = Workbook(write_only=True)
+    for titulo, cabecalho, linhas in abas:
+        planilha = workbook.create_sheet(title=titulo[:TAMANHO_MAXIMO_NOME_ABA])
+        if cabecalho:
+            planilha.append(list(cabecalho))
+        for linha in linhas:
+            planilha.append(list(linha))
+
+    # O arquivo temporário é apagado quando o FileResponse o fecha
+    arquivo = tempfile.TemporaryFile(suffix='.xlsx')
+    workbook.save(arquivo)
+    arquivo.seek(0)
+    return arquivo
+
+
+def resposta_xlsx(nome_arquivo, abas):
+    """FileResponse de download com a planilha gerada por gerar_xlsx"""
+    return FileResponse(
+        gerar_xlsx(abas),
+        as_attachment=True,
+        filename=nome_arquivo,
+        content_type=CONTENT_TYPE_XLSX,
+    )
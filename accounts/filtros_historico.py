@@ -0,0 +1,76 @@
+"""Leitura e aplicação dos filtros do histórico de chamadas (página, API e exportações)"""
+import hashlib
+import json
+import logging
+from datetime import datetime
+
+from .busca_chamadas import filtrar_por_busca
+from .periodos import filtro_datas
+
+logger = logging.getLogger(__name__)
+
+CAMPOS_FILTRO = ('tipo', 'status', 'data_inicio', 'data_fim', 'busca')
+
+# Formatos aceitos para data_inicio e data_fim
+FORMATOS_DATA = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y')
+
+
+def valor_valido(valor):
+    """Descarta valores vazios e os 'None'/'null'/'undefined' enviados pelo front-end"""
+    if not valor:
+        return False
+    return str(valor).strip().lower() not in ('none', 'null', '', 'undefined')
+
+
+def interpretar_data(valor):
+    """Converte a data da query string (em qualquer formato aceito) ou retorna None"""
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.strptime(str(valor).strip(), formato).date()
+        except ValueError:
+            continue
+    logger.debug('Data de filtro inválida ignorada: %r', valor)
+    return None
+
+
+def ler_filtros_historico(params):
+    """
+    Lê tipo, status, data_inicio, data_fim e busca de `params` (request.GET ou dict).
+    Valores inválidos viram None; datas são convertidas para `date`.
+    """
+    filtros = {}
+    for campo in CAMPOS_FILTRO:
+        valor = params.get(campo)
+        filtros[campo] = str(valor).strip() if valor_valido(valor) else None
+
+    for campo in ('data_inicio', 'data_fim'):
+        if filtros[campo]:
+            filtros[campo] = interpretar_data(filtros[campo])
+
+    return filtros
+
+
+def filtrar_chamadas(chamadas, filtros):
+    """Aplica ao queryset de RegistroChamada os filtros retornados por ler_filtros_historico"""
+    if filtros['tipo']:
+        chamadas = chamadas.filter(tipo_chamada=filtros['tipo'])
+
+    if filtros['status']:
+        chamadas = chamadas.filter(status=filtros['status'])
+
+    if filtros['data_inicio'] or filtros['data_fim']:
+        chamadas = chamadas.filter(
+            filtro_datas('data_criacao', filtros['data_inicio'], filtros['data_fim'])
+        )
+
+    if filtros['busca']:
+        # Índice textual do banco (FTS5/tsvector); icontains se não houver
+        chamadas = filtrar_por_busca(chamadas, filtros['busca'])
+
+    return chamadas
+
+
+def hash_filtros(filtros, *extras):
+    """Hash estável dos filtros (e de parâmetros extras, como cursor e fields)"""
+    conteudo = json.dumps([filtros, extras], sort_keys=True, default=str)
+    return hashlib.sha1(conteudo.encode()).hexdigest()[:16]
@@ -0,0 +1,194 @@
+"""
+Leitura dos arquivos de estabelecimentos do CNES (DATASUS) para `manage.py import_cnes`.
+
+Aceita o CSV de dados abertos (colunas CO_CNES, NO_FANTASIA, ...; separador detectado na
+primeira linha), JSON com uma lista de estabelecimentos (ou {"estabelecimentos": [...]},
+como a API devolve) e JSON Lines. Os arquivos são lidos em fluxo, sem carregar tudo na
+memória, e cada linha vira um dict com os nomes de campo da API: o cache (CnesCache) e a
+view consultar_cnes_api tratam o que veio do arquivo igual ao que veio da API.
+
+O progresso (linhas já gravadas) fica em `<arquivo>.progresso.json`, para que uma
+importação interrompida continue de onde parou.
+"""
+import csv
+import json
+import os
+
+from .cnes import limpar_codigo_cnes
+
+# Colunas do CSV de dados abertos -> campos da API de estabelecimentos
+COLUNAS_CSV_DATASUS = {
+    'CO_CNES': 'codigo_cnes',
+    'NO_FANTASIA': 'nome_fantasia',
+    'NO_RAZAO_SOCIAL': 'nome_razao_social',
+    'NU_CNPJ_MANTENEDORA': 'numero_cnpj_entidade',
+    'DS_NATUREZA_ORGANIZACAO': 'natureza_organizacao_entidade',
+    'TP_GESTAO': 'tipo_gestao',
+    'DS_NIVEL_HIERARQUIA': 'descricao_nivel_hierarquia',
+    'DS_ESFERA_ADMINISTRATIVA': 'descricao_esfera_administrativa',
+    'TP_UNIDADE': 'codigo_tipo_unidade',
+    'CO_CEP': 'codigo_cep_estabelecimento',
+    'NO_LOGRADOURO': 'endereco_estabelecimento',
+    'NU_ENDERECO': 'numero_estabelecimento',
+    'NO_BAIRRO': 'bairro_estabelecimento',
+    'CO_IBGE': 'codigo_municipio',
+    'CO_MUNICIPIO_GESTOR': 'codigo_municipio',
+    'NO_MUNICIPIO': 'descricao_municipio',
+    'CO_UF': 'codigo_uf',
+    'CO_ESTADO_GESTOR': 'codigo_uf',
+    'SG_UF': 'sigla_uf',
+    'NU_TELEFONE': 'numero_telefone_estabelecimento',
+    'NU_FAX': 'numero_fax_estabelecimento',
+    'NO_EMAIL': 'endereco_email_estabelecimento',
+    'CO_MOTIVO_DESAB': 'codigo_motivo_desabilitacao_estabelecimento',
+    'ST_CENTRO_CIRURGICO': 'estabelecimento_possui_centro_cirurgico',
+    'ST_CENTRO_OBSTETRICO': 'estabelecimento_possui_centro_obstetrico',
+    'ST_CENTRO_NEONATAL': 'estabelecimento_possui_centro_neonatal',
+    'ST_ATEND_AMBULATORIAL': 'estabelecimento_possui_atendimento_ambulatorial',
+    'ST_ATEND_HOSPITALAR': 'estabelecimento_possui_atendimento_internacao',
+}
+
+# Código IBGE da UF -> sigla (o CSV traz só o código)
+UFS_IBGE = {
+    '11': 'RO', '12': 'AC', '13': 'AM', '14': 'RR', '15': 'PA', '16': 'AP', '17': 'TO',
+    '21': 'MA', '22': 'PI', '23': 'CE', '24': 'RN', '25': 'PB', '26': 'PE', '27': 'AL',
+    '28': 'SE', '29': 'BA', '31': 'MG', '32': 'ES', '33': 'RJ', '35': 'SP', '41': 'PR',
+    '42': 'SC', '43': 'RS', '50': 'MS', '51': 'MT', '52': 'GO', '53': 'DF',
+}
+
+FORMATOS = {'.csv': 'csv', '.txt': 'csv', '.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+def detectar_formato(caminho):
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao not in FORMATOS:
+        raise ValueError(f'Formato não reconhecido pela extensão "{extensao}": use --formato')
+    return FORMATOS[extensao]
+
+
+# ===== LEITURA =====
+
+def linhas_csv(arquivo, delimitador=None):
+    primeira = arquivo.readline()
+    # O DATASUS usa ';'; sem --delimitador, vale o separador mais frequente no cabeçalho
+    delimitador = delimitador or max(';,|\t', key=primeira.count)
+    cabecalho = next(csv.reader([primeira], delimiter=delimitador))
+    for valores in csv.reader(arquivo, delimiter=delimitador):
+        if valores:
+            yield dict(zip(cabecalho, valores))
+
+
+def objetos_json(arquivo, tamanho_bloco=1 << 16):
+    """Elementos da primeira lista do arquivo, decodificados um a um enquanto o arquivo é lido"""
+    decodificador = json.JSONDecoder()
+    buffer = ''
+    # Avança até o início da lista (pula um objeto envolvente como {"estabelecimentos": [)
+    while '[' not in buffer:
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            return
+        buffer += bloco
+    buffer = buffer[buffer.index('[') + 1:]
+    posicao = 0
+
+    while True:
+        while posicao < len(buffer) and buffer[posicao] in ' \t\r\n,':
+            posicao += 1
+        if posicao == len(buffer):
+            buffer, posicao = arquivo.read(tamanho_bloco), 0
+            if not buffer:
+                return
+            continue
+        if buffer[posicao] == ']':
+            return
+        try:
+            objeto, posicao = decodificador.raw_decode(buffer, posicao)
+        except json.JSONDecodeError:
+            # Objeto cortado no fim do bloco: junta o próximo e tenta de novo
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                raise
+            buffer, posicao = buffer[posicao:] + bloco, 0
+            continue
+        yield objeto
+
+
+def objetos_jsonl(arquivo):
+    for linha in arquivo:
+        linha = linha.strip()
+        if linha:
+            yield json.loads(linha)
+
+
+def ler_estabelecimentos(arquivo, formato, delimitador=None):
+    """Linhas do arquivo (dicts com as colunas originais), na ordem do arquivo"""
+    if formato == 'csv':
+        return linhas_csv(arquivo, delimitador)
+    if formato == 'jsonl':
+        return objetos_jsonl(arquivo)
+    return objetos_json(arquivo)
+
+
+def normalizar_estabelecimento(linha):
+    """Linha do arquivo com os nomes de campo da API, ou None se não tiver código CNES válido"""
+    dados = {}
+    for coluna, valor in linha.items():
+        if not coluna:
+            continue
+        coluna = coluna.strip()
+        campo = COLUNAS_CSV_DATASUS.get(coluna.upper()) or coluna.lower()
+        if isinstance(valor, str):
+            valor = valor.strip()
+        if valor in ('', None):
+            continue
+        dados.setdefault(campo, valor)
+
+    codigo = limpar_codigo_cnes(dados.get('codigo_cnes'))
+    if not codigo or len(codigo) > 7:
+        return None
+    dados['codigo_cnes'] = codigo.zfill(7)
+
+    if 'sigla_uf' not in dados and 'codigo_uf' in dados:
+        sigla = UFS_IBGE.get(str(dados['codigo_uf']).zfill(2))
+        if sigla:
+            dados['sigla_uf'] = sigla
+    return dados
+
+
+# ===== PROGRESSO =====
+
+def caminho_progresso(caminho):
+    return f'{caminho}.progresso.json'
+
+
+def assinatura_arquivo(caminho):
+    # Progresso só vale para o mesmo arquivo (mesmo tamanho e data de modificação)
+    info = os.stat(caminho)
+    return {'arquivo': os.path.abspath(caminho), 'tamanho': info.st_size, 'modificado_em': info.st_mtime}
+
+
+def ler_progresso(caminho):
+    """Linhas já gravadas numa execução anterior deste mesmo arquivo (0 se nenhuma)"""
+    try:
+        with open(caminho_progresso(caminho), encoding='utf-8') as arquivo:
+            progresso = json.load(arquivo)
+    except (OSError, ValueError):
+        return 0
+    if {chave: progresso.get(chave) for chave in ('arquivo', 'tamanho', 'modificado_em')} != assinatura_arquivo(caminho):
+        return 0
+    return int(progresso.get('linhas', 0))
+
+
+def gravar_progresso(caminho, linhas):
+    destino = caminho_progresso(caminho)
+    temporario = f'{destino}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump({**assinatura_arquivo(caminho), 'linhas': linhas}, arquivo)
+    os.replace(temporario, destino)
+
+
+def remover_progresso(caminho):
+    try:
+        os.remove(caminho_progresso(caminho))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,121 @@
+"""
+Índice em memória dos nomes das unidades de saúde, usado por consultar_unidade_saude_api.
+
+Cada processo guarda o nome normalizado (normalizar_texto) de todas as unidades, os
+trigramas de cada nome e um índice invertido trigrama -> unidades. Uma consulta percorre
+só as unidades que têm algum trigrama em comum com o nome pesquisado e devolve as k mais
+parecidas com a pontuação de cada uma (0 a 1), sem consultar o banco.
+
+O índice é montado a partir do modelo de leitura (leitura_unidades) e reconstruído, sem
+consultar o banco, sempre que o modelo é recarregado.
+"""
+import heapq
+import threading
+from collections import Counter
+
+from .leitura_unidades import modelo_unidades
+from .models import normalizar_texto
+
+# Pontuação mínima para considerar que o nome pesquisado é a unidade
+PONTUACAO_MINIMA = 0.6
+CANDIDATOS_PADRAO = 5
+
+
+def trigramas(texto):
+    """Trigramas de cada palavra com bordas, como o pg_trgm ('  ab', ' ab', 'ab ' ...)"""
+    resultado = set()
+    for palavra in texto.split():
+        palavra = f'  {palavra} '
+        resultado.update(palavra[i:i + 3] for i in range(len(palavra) - 2))
+    return resultado
+
+
+def palavras_significativas(texto):
+    """Palavras com mais de duas letras (ignora 'de', 'da', 'do'...), ou todas se não houver"""
+    palavras = texto.split()
+    return [palavra for palavra in palavras if len(palavra) > 2] or palavras
+
+
+class IndiceUnidades:
+    """Nomes das unidades com trigramas e índice invertido, para busca aproximada"""
+
+    def __init__(self, unidades, modelo=None):
+        self.modelo = modelo  # modelo de leitura de onde vieram as unidades
+        self.ids = []
+        self.nomes = []
+        self.normalizados = []
+        self.trigramas = []
+        self.por_trigrama = {}
+        for posicao, (unidade_id, nome, nome_busca) in enumerate(unidades):
+            normalizado = nome_busca or normalizar_texto(nome)
+            self.ids.append(unidade_id)
+            self.nomes.append(nome)
+            self.normalizados.append(normalizado)
+            grupo = trigramas(normalizado)
+            self.trigramas.append(grupo)
+            for trigrama in grupo:
+                self.por_trigrama.setdefault(trigrama, []).append(posicao)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def pontuar(self, consulta, palavras, grupo, posicao, em_comum):
+        """
+        1.0 para o mesmo nome normalizado. Senão, o maior entre a similaridade de trigramas
+        (Jaccard, para nomes completos com erros de digitação) e uma nota de "o nome contém
+        a consulta": fração dos trigramas da consulta presentes no nome e fração das
+        palavras pesquisadas que aparecem no nome, limitada a 0.9.
+        """
+        nome = self.normalizados[posicao]
+        if nome == consulta:
+            return 1.0
+        similaridade = em_comum / (len(grupo) + len(self.trigramas[posicao]) - em_comum)
+        contida = em_comum / len(grupo)
+        cobertura = sum(1 for palavra in palavras if palavra in nome) / len(palavras)
+        return max(similaridade, 0.9 * (0.7 * contida + 0.3 * cobertura))
+
+    def buscar(self, nome, k=CANDIDATOS_PADRAO):
+        """Até k candidatos [(pontuacao, id, nome)] em ordem decrescente de pontuação"""
+        consulta = normalizar_texto(nome)
+        grupo = trigramas(consulta)
+        if not grupo:
+            return []
+        palavras = palavras_significativas(consulta)
+
+        # Trigramas em comum com cada unidade, numa passada pelo índice invertido
+        em_comum = Counter()
+        for trigrama in grupo:
+            em_comum.update(self.por_trigrama.get(trigrama, ()))
+
+        # Empate: vale a ordem do índice (alfabética), por isso -posicao
+        pontuados = [
+            (self.pontuar(consulta, palavras, grupo, posicao, comuns), -posicao)
+            for posicao, comuns in em_comum.items()
+        ]
+        return [
+            (round(pontuacao, 4), self.ids[-negativa], self.nomes[-negativa])
+            for pontuacao, negativa in heapq.nlargest(k, pontuados)
+        ]
+
+
+_indice = None
+_trava = threading.Lock()
+
+
+def indice_unidades():
+    """Índice do processo, reconstruído na primeira busca depois de uma recarga do modelo de leitura"""
+    global _indice
+    modelo = modelo_unidades()
+    indice = _indice
+    if indice is None or indice.modelo is not modelo:
+        with _trava:
+            if _indice is None or _indice.modelo is not modelo:
+                _indice = IndiceUnidades(
+                    ((unidade.id, unidade.nome, unidade.nome_busca) for unidade in modelo.unidades), modelo
+                )
+            indice = _indice
+    return indice
+
+
+def buscar_unidades_por_nome(nome, k=CANDIDATOS_PADRAO):
+    return indice_unidades().buscar(nome, k)
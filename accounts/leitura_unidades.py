@@ -0,0 +1,315 @@
+"""
+Modelo de leitura das unidades de saúde, em memória em cada processo.
+
+A lista telefônica, a lista de unidades e o autocomplete de unidades leem daqui em vez de
+consultar e serializar a tabela a cada requisição. Cada unidade vira um registro com
+__slots__ (já com os dicionários que as views devolvem) e o modelo mantém índices por
+id, tipo, município (nome normalizado, ordenado para busca por prefixo) e CNES.
+
+Versão: os sinais de UnidadeSaude gravam um novo token de versão no cache
+UNIDADES_CACHE_ALIAS. Cada processo lê o token do cache no máximo a cada
+UNIDADES_VERSAO_INTERVALO segundos (não a cada requisição) e recarrega tudo com uma
+consulta se mudou; o processo que fez a alteração passa a usar a versão nova na hora. O
+alias padrão ('versoes', FileBasedCache) é visível a todos os workers da mesma máquina;
+com vários servidores use um cache compartilhado (Redis/Memcached). Além disso a cópia
+local é recarregada em segundo plano depois de UNIDADES_LEITURA_IDADE_MAXIMA segundos
+mesmo sem nova versão (a requisição que percebe isso continua com a cópia atual), o que
+limita o atraso se uma alteração não passar pelos sinais (ex.: queryset.update).
+"""
+import json
+import logging
+import threading
+import time
+import uuid
+from bisect import bisect_left
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_compartilhado import verificar_cache_compartilhado
+from .estatisticas import CONTADOR_POR_TIPO
+from .models import UnidadeSaude, normalizar_texto
+
+logger = logging.getLogger(__name__)
+
+CHAVE_VERSAO = 'unidades:versao'
+
+CAMPOS = (
+    'id', 'nome', 'municipio', 'cnes', 'tipo', 'contato_telefonico', 'endereco', 'telefone', 'responsavel',
+    'email', 'horario_funcionamento', 'servicos_emergencia', 'created_at', 'usuario_cadastrante__username',
+    'nome_busca', 'municipio_busca', 'responsavel_busca',
+)
+
+# Caracteres que não podem aparecer crus num JSON dentro de <script> (como no json_script)
+ESCAPES_SCRIPT = {ord('<'): '\\u003C', ord('>'): '\\u003E', ord('&'): '\\u0026'}
+
+
+class UnidadeLeitura:
+    """Uma unidade de saúde como as listagens usam"""
+
+    __slots__ = (
+        'id', 'nome', 'municipio', 'cnes', 'tipo', 'telefone', 'responsavel',
+        'nome_busca', 'municipio_busca', 'responsavel_busca', 'ordem',
+        'dados_lista_telefonica', 'dados_lista_unidades',
+    )
+
+    def __init__(self, linha, ordem):
+        (self.id, self.nome, self.municipio, self.cnes, self.tipo, contato_telefonico, endereco, self.telefone,
+         self.responsavel, email, horario_funcionamento, servicos_emergencia, created_at, usuario,
+         nome_busca, municipio_busca, responsavel_busca) = linha
+        self.nome_busca = nome_busca or normalizar_texto(self.nome)
+        self.municipio_busca = municipio_busca or normalizar_texto(self.municipio)
+        self.responsavel_busca = responsavel_busca or normalizar_texto(self.responsavel)
+        self.ordem = ordem  # posição na ordem por nome (a ordenação do modelo)
+
+        # Formato de api_lista_telefonica
+        self.dados_lista_telefonica = {
+            'id': self.id,
+            'nome': self.nome,
+            'telefone': self.telefone,
+            'responsavel': self.responsavel,
+            'municipio': self.municipio,
+            'cnes': self.cnes,
+            'tipo': self.tipo,
+        }
+        # Formato da página unidades_saude (UnidadesSaudeReact)
+        self.dados_lista_unidades = {
+            'id': self.id,
+            'nome': self.nome or '',
+            'municipio': self.municipio or 'Não informado',
+            'cnes': self.cnes or '',
+            'tipo': self.tipo,
+            'contato_telefonico': contato_telefonico or '',
+            'endereco': endereco or '',
+            'telefone': self.telefone or '',
+            'responsavel': self.responsavel or 'Não informado',
+            'email': email or '',
+            'horario_funcionamento': horario_funcionamento or '',
+            'servicos_emergencia': bool(servicos_emergencia),
+            'created_at': created_at.strftime('%d/%m/%Y %H:%M:%S'),
+            'usuario_cadastrante': usuario or 'Sistema',
+        }
+
+
+class ModeloUnidades:
+    """Todas as unidades em ordem de nome, com índices secundários"""
+
+    def __init__(self, linhas, versao):
+        self.versao = versao
+        self.carregado_em = time.monotonic()
+        self.unidades = [UnidadeLeitura(linha, ordem) for ordem, linha in enumerate(linhas)]
+        self.por_id = {unidade.id: unidade for unidade in self.unidades}
+        self.por_cnes = {unidade.cnes: unidade for unidade in self.unidades if unidade.cnes}
+        self.por_tipo = {}
+        self.por_municipio = {}
+        for unidade in self.unidades:
+            self.por_tipo.setdefault(unidade.tipo, []).append(unidade)
+            self.por_municipio.setdefault(unidade.municipio_busca, []).append(unidade)
+        self.chaves_municipio = sorted(self.por_municipio)
+        self.por_nome_busca = sorted(self.unidades, key=lambda unidade: unidade.nome_busca)
+        self.chaves_nome = [unidade.nome_busca for unidade in self.por_nome_busca]
+        self._json_lista_unidades = None
+
+    def __len__(self):
+        return len(self.unidades)
+
+    def contadores(self, unidades=None):
+        """Total e quantidade por tipo (de `unidades` ou de todas)"""
+        if unidades is None:
+            contadores = {'total': len(self.unidades)}
+            contadores.update({nome: len(self.por_tipo.get(tipo, ())) for tipo, nome in CONTADOR_POR_TIPO.items()})
+            return contadores
+        contadores = dict.fromkeys(CONTADOR_POR_TIPO.values(), 0)
+        contadores['total'] = len(unidades)
+        for unidade in unidades:
+            if unidade.tipo in CONTADOR_POR_TIPO:
+                contadores[CONTADOR_POR_TIPO[unidade.tipo]] += 1
+        return contadores
+
+    def municipios(self):
+        """Municípios distintos das unidades, em ordem alfabética"""
+        return sorted({unidade.municipio for unidade in self.unidades})
+
+    def com_municipio(self, prefixo):
+        """Unidades cujo município normalizado começa com `prefixo`, em ordem de nome"""
+        prefixo = normalizar_texto(prefixo)
+        inicio = bisect_left(self.chaves_municipio, prefixo)
+        fim = bisect_left(self.chaves_municipio, prefixo + '\x7f', inicio)
+        chaves = self.chaves_municipio[inicio:fim]
+        if len(chaves) == 1:
+            return self.por_municipio[chaves[0]]
+        return sorted((unidade for chave in chaves for unidade in self.por_municipio[chave]),
+                      key=lambda unidade: unidade.ordem)
+
+    def filtrar(self, busca=None, tipo=None, municipio=None):
+        """
+        Filtros da lista telefônica, com as mesmas regras das colunas normalizadas: `busca`
+        em qualquer posição do nome, responsável ou município (sem acentos/maiúsculas) ou
+        no telefone como digitado; `municipio` por prefixo. Resultado em ordem de nome.
+        """
+        if municipio:
+            unidades = self.com_municipio(municipio)
+            if tipo:
+                unidades = [unidade for unidade in unidades if unidade.tipo == tipo]
+        elif tipo:
+            unidades = self.por_tipo.get(tipo, [])
+        else:
+            unidades = self.unidades
+
+        if busca:
+            termo = normalizar_texto(busca)
+            telefone = busca.lower()
+            unidades = [
+                unidade for unidade in unidades
+                if termo in unidade.nome_busca or termo in unidade.responsavel_busca
+                or termo in unidade.municipio_busca or telefone in (unidade.telefone or '').lower()
+            ]
+        return list(unidades)
+
+    def buscar_por_nome(self, termo, limite, tipo=None):
+        """Autocomplete: nomes que começam com `termo` e, completando o limite, que o contêm"""
+        termo = normalizar_texto(termo)
+        inicio = bisect_left(self.chaves_nome, termo)
+        fim = bisect_left(self.chaves_nome, termo + '\x7f', inicio)
+        encontradas = [unidade for unidade in self.por_nome_busca[inicio:fim] if not tipo or unidade.tipo == tipo]
+        encontradas = sorted(encontradas, key=lambda unidade: unidade.ordem)[:limite]
+        if len(encontradas) < limite:
+            candidatas = self.por_tipo.get(tipo, []) if tipo else self.unidades
+            encontradas += [
+                unidade for unidade in candidatas
+                if termo in unidade.nome_busca and not unidade.nome_busca.startswith(termo)
+            ][:limite - len(encontradas)]
+        return encontradas
+
+    def json_lista_unidades(self):
+        """JSON de todas as unidades para a página unidades_saude (gerado uma vez por versão)"""
+        if self._json_lista_unidades is None:
+            dados = [unidade.dados_lista_unidades for unidade in self.unidades]
+            self._json_lista_unidades = json.dumps(dados, cls=DjangoJSONEncoder).translate(ESCAPES_SCRIPT)
+        return self._json_lista_unidades
+
+
+# ===== VERSÃO E CARGA =====
+
+def _alias():
+    return getattr(settings, 'UNIDADES_CACHE_ALIAS', 'default')
+
+
+def _cache():
+    return caches[_alias()]
+
+
+def verificar_cache_versoes():
+    """Falha na inicialização se a versão ficaria presa a um processo com vários workers"""
+    verificar_cache_compartilhado('UNIDADES_CACHE_ALIAS', _alias(), 'as alterações nas unidades')
+
+
+_versao = None  # (token, time.monotonic() da leitura no cache)
+
+
+def versao_atual():
+    """Token de versão, relido do cache no máximo a cada UNIDADES_VERSAO_INTERVALO segundos"""
+    global _versao
+    agora = time.monotonic()
+    lida = _versao
+    if lida is not None and agora - lida[1] < getattr(settings, 'UNIDADES_VERSAO_INTERVALO', 2):
+        return lida[0]
+    cache = _cache()
+    versao = cache.get(CHAVE_VERSAO)
+    if versao is None:
+        cache.add(CHAVE_VERSAO, uuid.uuid4().hex, timeout=None)
+        versao = cache.get(CHAVE_VERSAO)
+    _versao = (versao, agora)
+    return versao
+
+
+def nova_versao():
+    global _versao
+    versao = uuid.uuid4().hex
+    _cache().set(CHAVE_VERSAO, versao, timeout=None)
+    # O processo que alterou não espera o intervalo de leitura para ver a alteração
+    _versao = (versao, time.monotonic())
+
+
+_modelo = None
+_trava = threading.Lock()
+_recarregando = False
+
+
+def carregar_modelo(versao):
+    return ModeloUnidades(UnidadeSaude.objects.order_by('nome', 'id').values_list(*CAMPOS), versao)
+
+
+def _envelhecido(modelo):
+    return time.monotonic() - modelo.carregado_em > getattr(settings, 'UNIDADES_LEITURA_IDADE_MAXIMA', 300)
+
+
+def _recarregar(versao):
+    global _modelo, _recarregando
+    close_old_connections()
+    try:
+        modelo = carregar_modelo(versao)
+        with _trava:
+            # Uma versão mais nova carregada enquanto isso prevalece
+            if _modelo is None or _modelo.versao == versao:
+                _modelo = modelo
+    except Exception:
+        logger.exception('Falha ao recarregar o modelo de leitura das unidades')
+    finally:
+        _recarregando = False
+        connection.close()
+
+
+def recarregar_em_segundo_plano(versao):
+    """Recarrega o modelo numa thread (uma por vez); as requisições seguem com a cópia atual"""
+    global _recarregando
+    with _trava:
+        if _recarregando:
+            return
+        _recarregando = True
+    threading.Thread(target=_recarregar, args=(versao,), name='unidades-recarga', daemon=True).start()
+
+
+def modelo_unidades():
+    """
+    Modelo de leitura do processo: recarregado na hora quando a versão do cache muda e em
+    segundo plano quando fica velho
+    """
+    global _modelo
+    versao = versao_atual()
+    modelo = _modelo
+    if modelo is None or modelo.versao != versao:
+        with _trava:
+            if _modelo is None or _modelo.versao != versao:
+                # A versão é lida antes da carga: uma alteração durante a carga gera outra versão
+                _modelo = carregar_modelo(versao)
+            modelo = _modelo
+    elif _envelhecido(modelo):
+        recarregar_em_segundo_plano(versao)
+    return modelo
+
+
+# ===== SINAIS =====
+
+@receiver(post_save, sender=UnidadeSaude)
+@receiver(post_delete, sender=UnidadeSaude)
+def unidade_alterada(sender, instance, **kwargs):
+    transaction.on_commit(nova_versao)
+
+
+@receiver(post_save, sender=User)
+def usuario_salvo(sender, instance, update_fields=None, **kwargs):
+    # O nome do usuário cadastrante aparece na lista de unidades; o login só muda last_login
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    transaction.on_commit(nova_versao)
+
+
+@receiver(post_delete, sender=User)
+def usuario_excluido(sender, instance, **kwargs):
+    transaction.on_commit(nova_versao)
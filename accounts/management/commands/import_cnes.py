@@ -0,0 +1,107 @@
+import io
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.cnes import gravar_registros_cnes, registro_cnes
+from accounts.models import CnesCache
+from accounts.importacao_cnes import (
+    detectar_formato,
+    gravar_progresso,
+    ler_estabelecimentos,
+    ler_progresso,
+    normalizar_estabelecimento,
+    remover_progresso,
+)
+
+
+class Command(BaseCommand):
+    help = 'Importa o arquivo de estabelecimentos do CNES (CSV ou JSON do DATASUS) para a tabela local (CnesCache)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('arquivo', help='CSV de dados abertos, JSON ou JSON Lines')
+        parser.add_argument('--formato', choices=['csv', 'json', 'jsonl'], help='Padrão: pela extensão do arquivo')
+        parser.add_argument('--encoding', default='utf-8-sig', help='Os CSVs do DATASUS costumam vir em latin-1')
+        parser.add_argument('--delimitador', help='Separador do CSV (padrão: detectado no cabeçalho)')
+        parser.add_argument('--lote', type=int, default=2000, help='Linhas por transaction/upsert')
+        parser.add_argument('--uf', help='Importa só os estabelecimentos desta UF (ex.: MS)')
+        parser.add_argument('--limite', type=int, help='Para após N linhas; a próxima execução continua dali')
+        parser.add_argument('--recomecar', action='store_true', help='Ignora o progresso salvo e lê o arquivo desde o início')
+
+    def handle(self, *args, **options):
+        caminho = options['arquivo']
+        if not os.path.isfile(caminho):
+            raise CommandError(f'Arquivo não encontrado: {caminho}')
+        try:
+            formato = options['formato'] or detectar_formato(caminho)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        tamanho_lote = max(1, options['lote'])
+        uf = (options['uf'] or '').upper()
+        inicio = 0 if options['recomecar'] else ler_progresso(caminho)
+        if inicio:
+            self.stdout.write(f'Retomando após a linha {inicio:,} (use --recomecar para ler tudo de novo)')
+
+        tamanho_arquivo = os.path.getsize(caminho) or 1
+        self.lidas = inicio
+        self.gravadas = 0
+        self.ignoradas = 0
+        self.inicio = time.monotonic()
+
+        with open(caminho, 'rb') as bruto:
+            texto = io.TextIOWrapper(bruto, encoding=options['encoding'], errors='replace', newline='')
+            fonte = islice(ler_estabelecimentos(texto, formato, options['delimitador']), inicio, None)
+            linhas = islice(fonte, options['limite']) if options['limite'] else fonte
+
+            lote = {}
+            lidas_no_lote = 0
+            for linha in linhas:
+                lidas_no_lote += 1
+                dados = normalizar_estabelecimento(linha)
+                if dados is None or (uf and dados.get('sigla_uf') != uf):
+                    self.ignoradas += 1
+                else:
+                    # Código repetido no mesmo lote: vale a última linha (um upsert não pode tocar a mesma linha duas vezes)
+                    lote[dados['codigo_cnes']] = dados
+                if lidas_no_lote >= tamanho_lote:
+                    self.gravar_lote(caminho, lote, lidas_no_lote, bruto.tell() / tamanho_arquivo)
+                    lote, lidas_no_lote = {}, 0
+            if lidas_no_lote:
+                self.gravar_lote(caminho, lote, lidas_no_lote, bruto.tell() / tamanho_arquivo)
+            # Com --limite, o arquivo terminou se não sobrou nenhuma linha depois das lidas
+            terminou = not options['limite'] or next(fonte, None) is None
+
+        duracao = time.monotonic() - self.inicio
+        resumo = (
+            f'{self.lidas - inicio:,} linhas lidas nesta execução, {self.gravadas:,} estabelecimentos gravados, '
+            f'{self.ignoradas:,} ignorados em {duracao:.1f}s'
+        )
+        if terminou:
+            remover_progresso(caminho)
+            self.stdout.write(self.style.SUCCESS(f'Importação concluída: {resumo}'))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'Importação parcial: {resumo}. Rode o comando de novo para continuar da linha {self.lidas:,}.'
+            ))
+
+    def gravar_lote(self, caminho, lote, lidas_no_lote, fracao_lida):
+        agora = timezone.now()
+        with transaction.atomic():
+            gravar_registros_cnes([
+                registro_cnes(codigo, dados, agora, CnesCache.ORIGEM_IMPORTACAO) for codigo, dados in lote.items()
+            ])
+        self.lidas += lidas_no_lote
+        self.gravadas += len(lote)
+        # Só depois do commit: uma interrupção aqui no máximo regrava o último lote
+        gravar_progresso(caminho, self.lidas)
+
+        duracao = time.monotonic() - self.inicio
+        self.stdout.write(
+            f'{min(fracao_lida, 1):>6.1%} | {self.lidas:>10,} linhas | {self.gravadas:>10,} gravados | '
+            f'{self.ignoradas:>8,} ignorados | {self.gravadas / duracao if duracao else 0:>8,.0f}/s'
+        )
@@ -0,0 +1,43 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.tarefas_exportacao import executar_manutencao, processar_fila
+
+
+class Command(BaseCommand):
+    help = 'Worker da fila de exportações (TarefaExportacao) em produção: executa as tarefas pendentes e a manutenção da fila'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Threads consumindo a fila')
+        parser.add_argument('--intervalo', type=float, default=2.0, help='Segundos entre consultas à fila vazia')
+        parser.add_argument('--uma-vez', action='store_true', help='Esvazia a fila e termina')
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        intervalo = options['intervalo']
+
+        self.stdout.write(f'Worker de exportações iniciado ({workers} thread(s))')
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='exportacao') as executor:
+            while True:
+                recuperadas, removidas = executar_manutencao()
+                if recuperadas or removidas:
+                    self.stdout.write(f'Tarefas reenfileiradas: {recuperadas} | expiradas removidas: {removidas}')
+
+                executadas = sum(executor.map(lambda _: self.consumir(), range(workers)))
+                if executadas:
+                    self.stdout.write(self.style.SUCCESS(f'Tarefas executadas: {executadas}'))
+
+                if options['uma_vez']:
+                    break
+                if not executadas:
+                    time.sleep(intervalo)
+
+    def consumir(self):
+        close_old_connections()
+        try:
+            return processar_fila()
+        finally:
+            close_old_connections()
@@ -0,0 +1,68 @@
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TAMANHO_LOTE = 1000
+
+
+def normalizar_texto(valor):
+    # Cópia de accounts.models.normalizar_texto: migrações não importam código da aplicação
+    if not valor:
+        return ''
+    sem_acentos = unicodedata.normalize('NFKD', valor).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', sem_acentos).strip().lower()
+
+
+def preencher_unidade_saude(apps, schema_editor):
+    """Liga as chamadas existentes à UnidadeSaude pelo CNES e depois pelo nome normalizado exato"""
+    RegistroChamada = apps.get_model('accounts', 'RegistroChamada')
+    UnidadeSaude = apps.get_model('accounts', 'UnidadeSaude')
+
+    por_cnes = {}
+    por_nome = {}
+    for unidade_id, nome, cnes in UnidadeSaude.objects.values_list('id', 'nome', 'cnes'):
+        if cnes:
+            por_cnes[cnes.strip()] = unidade_id
+        # Nomes repetidos são ambíguos e ficam sem ligação
+        por_nome.setdefault(normalizar_texto(nome), set()).add(unidade_id)
+    por_nome = {nome: ids.pop() for nome, ids in por_nome.items() if nome and len(ids) == 1}
+
+    ultimo_id = 0
+    while True:
+        lote = list(
+            RegistroChamada.objects
+            .filter(id__gt=ultimo_id, unidade_saude__isnull=True)
+            .order_by('id')
+            .values_list('id', 'cnes', 'unidade')[:TAMANHO_LOTE]
+        )
+        if not lote:
+            break
+        ultimo_id = lote[-1][0]
+
+        # Agrupa por unidade para fazer um UPDATE por unidade em cada lote
+        chamadas_por_unidade = {}
+        for chamada_id, cnes, nome in lote:
+            unidade_id = por_cnes.get((cnes or '').strip()) or por_nome.get(normalizar_texto(nome))
+            if unidade_id:
+                chamadas_por_unidade.setdefault(unidade_id, []).append(chamada_id)
+
+        for unidade_id, chamada_ids in chamadas_por_unidade.items():
+            RegistroChamada.objects.filter(id__in=chamada_ids).update(unidade_saude_id=unidade_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_unidadesaude_contato_telefonico'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='registrochamada',
+            name='unidade_saude',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='chamadas', to='accounts.unidadesaude', verbose_name='Unidade de Saúde Cadastrada'),
+        ),
+        migrations.RunPython(preencher_unidade_saude, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-17 18:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_registrochamada_unidade_saude'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registrochamada',
+            index=models.Index(fields=['data_criacao'], name='chamada_data_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registrochamada',
+            index=models.Index(fields=['tipo_chamada', 'data_criacao'], name='chamada_tipo_data_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registrochamada',
+            index=models.Index(fields=['status', 'data_criacao'], name='chamada_status_data_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registrochamada',
+            index=models.Index(fields=['usuario_criador', 'data_criacao'], name='chamada_usuario_data_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unidadesaude',
+            index=models.Index(fields=['tipo'], name='unidade_tipo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unidadesaude',
+            index=models.Index(fields=['municipio'], name='unidade_municipio_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-17 19:09
+
+import accounts.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_indices_filtros'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TarefaExportacao',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(max_length=50, verbose_name='Tipo de Exportação')),
+                ('parametros', models.JSONField(blank=True, default=dict, verbose_name='Parâmetros')),
+                ('status', models.CharField(choices=[('pendente', 'Na fila'), ('processando', 'Processando'), ('concluida', 'Concluída'), ('erro', 'Erro')], default='pendente', max_length=20, verbose_name='Status')),
+                ('progresso', models.PositiveSmallIntegerField(default=0, verbose_name='Progresso (%)')),
+                ('mensagem', models.CharField(blank=True, default='', max_length=255, verbose_name='Mensagem')),
+                ('tentativas', models.PositiveSmallIntegerField(default=0, verbose_name='Tentativas')),
+                ('arquivo', models.FileField(blank=True, null=True, upload_to=accounts.models.arquivo_exportacao_path, verbose_name='Arquivo Gerado')),
+                ('nome_arquivo', models.CharField(blank=True, default='', max_length=255, verbose_name='Nome do Arquivo')),
+                ('content_type', models.CharField(blank=True, default='', max_length=100, verbose_name='Tipo de Conteúdo')),
+                ('criado_em', models.DateTimeField(auto_now_add=True, verbose_name='Criado em')),
+                ('iniciado_em', models.DateTimeField(blank=True, null=True, verbose_name='Iniciado em')),
+                ('concluido_em', models.DateTimeField(blank=True, null=True, verbose_name='Concluído em')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tarefas_exportacao', to=settings.AUTH_USER_MODEL, verbose_name='Usuário Solicitante')),
+            ],
+            options={
+                'verbose_name': 'Tarefa de Exportação',
+                'verbose_name_plural': 'Tarefas de Exportação',
+                'ordering': ['-criado_em'],
+                'indexes': [models.Index(fields=['status', 'criado_em'], name='exportacao_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-17 19:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_tarefaexportacao'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CnesCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('codigo_cnes', models.CharField(max_length=7, unique=True, verbose_name='Código CNES')),
+                ('encontrado', models.BooleanField(default=True, help_text='Falso quando a API respondeu 404 (cache negativo)')),
+                ('dados', models.JSONField(blank=True, default=dict, verbose_name='Resposta da API')),
+                ('nome', models.CharField(blank=True, default='', max_length=255)),
+                ('municipio', models.CharField(blank=True, default='', max_length=100)),
+                ('uf', models.CharField(blank=True, default='', max_length=2)),
+                ('telefone', models.CharField(blank=True, default='', max_length=50)),
+                ('buscado_em', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Buscado em')),
+            ],
+            options={
+                'verbose_name': 'Estabelecimento CNES (cache)',
+                'verbose_name_plural': 'Estabelecimentos CNES (cache)',
+                'ordering': ['codigo_cnes'],
+            },
+        ),
+    ]
@@ -0,0 +1,122 @@
+# Índice textual do histórico de chamadas (ver accounts/busca_chamadas.py)
+
+import logging
+
+from django.db import migrations
+from django.db.utils import OperationalError
+
+logger = logging.getLogger(__name__)
+
+TABELA = 'accounts_registrochamada'
+TABELA_FTS = 'accounts_registrochamada_fts'
+COLUNAS = 'nome_contato, telefone, unidade, descricao, nome_atendente, telefone_digitos'
+
+
+def digitos(coluna):
+    """Telefone só com dígitos, em SQL do SQLite (sem regex nativa)"""
+    expressao = f"coalesce({coluna}, '')"
+    for caractere in ('(', ')', '-', ' ', '.', '+', '/'):
+        expressao = f"replace({expressao}, '{caractere}', '')"
+    return expressao
+
+
+def valores(prefixo):
+    return (
+        f'{prefixo}.nome_contato, {prefixo}.telefone, {prefixo}.unidade, {prefixo}.descricao, '
+        f'{prefixo}.nome_atendente, {digitos(f"{prefixo}.telefone")}'
+    )
+
+
+# Fonte única do SQL dos triggers: accounts.busca_chamadas.garantir_triggers_fts compara os
+# triggers do banco com este dicionário e recria os que faltarem ou estiverem diferentes.
+# Uma migração futura que mude os triggers deve definir o próprio TRIGGERS e passar a ser
+# a MIGRACAO_TRIGGERS de busca_chamadas.
+TRIGGERS = {
+    f'{TABELA_FTS}_ai': f"""CREATE TRIGGER {TABELA_FTS}_ai AFTER INSERT ON {TABELA} BEGIN
+        INSERT INTO {TABELA_FTS} (rowid, {COLUNAS}) VALUES (new.id, {valores('new')});
+    END""",
+    f'{TABELA_FTS}_ad': f"""CREATE TRIGGER {TABELA_FTS}_ad AFTER DELETE ON {TABELA} BEGIN
+        INSERT INTO {TABELA_FTS} ({TABELA_FTS}, rowid, {COLUNAS}) VALUES ('delete', old.id, {valores('old')});
+    END""",
+    f'{TABELA_FTS}_au': f"""CREATE TRIGGER {TABELA_FTS}_au
+        AFTER UPDATE OF nome_contato, telefone, unidade, descricao, nome_atendente ON {TABELA} BEGIN
+        INSERT INTO {TABELA_FTS} ({TABELA_FTS}, rowid, {COLUNAS}) VALUES ('delete', old.id, {valores('old')});
+        INSERT INTO {TABELA_FTS} (rowid, {COLUNAS}) VALUES (new.id, {valores('new')});
+    END""",
+}
+
+# Indexa todas as chamadas já existentes
+POPULAR_FTS = f"""INSERT INTO {TABELA_FTS} (rowid, {COLUNAS})
+        SELECT {TABELA}.id, {valores(TABELA)} FROM {TABELA}"""
+
+SQLITE = [
+    # Sem conteúdo próprio (content=''): o texto continua só na tabela de chamadas
+    f"""CREATE VIRTUAL TABLE {TABELA_FTS} USING fts5(
+        {COLUNAS}, content='', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    *TRIGGERS.values(),
+    POPULAR_FTS,
+]
+
+SQLITE_REVERSO = [
+    f'DROP TRIGGER IF EXISTS {TABELA_FTS}_ai',
+    f'DROP TRIGGER IF EXISTS {TABELA_FTS}_ad',
+    f'DROP TRIGGER IF EXISTS {TABELA_FTS}_au',
+    f'DROP TABLE IF EXISTS {TABELA_FTS}',
+]
+
+POSTGRESQL = [
+    # to_tsvector com configuração fixa é IMMUTABLE, então pode ser coluna gerada
+    f"""ALTER TABLE {TABELA} ADD COLUMN busca_vetor tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(nome_contato, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(telefone, '') || ' ' ||
+                  regexp_replace(coalesce(telefone, ''), '\\D', '', 'g')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(unidade, '')), 'B') ||
+        setweight(to_tsvector('portuguese', coalesce(nome_atendente, '')), 'C') ||
+        setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'D')
+    ) STORED""",
+    f'CREATE INDEX chamada_busca_gin_idx ON {TABELA} USING GIN (busca_vetor)',
+]
+
+POSTGRESQL_REVERSO = [
+    'DROP INDEX IF EXISTS chamada_busca_gin_idx',
+    f'ALTER TABLE {TABELA} DROP COLUMN IF EXISTS busca_vetor',
+]
+
+
+def executar(schema_editor, comandos):
+    for comando in comandos:
+        schema_editor.execute(comando, params=None)
+
+
+def criar_indice_busca(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        executar(schema_editor, POSTGRESQL)
+    elif vendor == 'sqlite':
+        try:
+            executar(schema_editor, SQLITE[:1])
+        except OperationalError as e:
+            # SQLite compilado sem FTS5: a busca continua com icontains
+            logger.warning('FTS5 indisponível, busca do histórico sem índice textual: %s', e)
+            return
+        executar(schema_editor, SQLITE[1:])
+
+
+def remover_indice_busca(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        executar(schema_editor, POSTGRESQL_REVERSO)
+    elif vendor == 'sqlite':
+        executar(schema_editor, SQLITE_REVERSO)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0018_cnescache'),
+    ]
+
+    operations = [
+        migrations.RunPython(criar_indice_busca, remover_indice_busca),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.3 on 2026-10-17 20:08
+
+import re
+import unicodedata
+
+from django.conf import settings
+from django.db import migrations, models
+
+CAMPOS_BUSCA = {'nome': 'nome_busca', 'municipio': 'municipio_busca', 'responsavel': 'responsavel_busca'}
+
+
+def normalizar_texto(valor):
+    # Cópia de accounts.models.normalizar_texto da época desta migração (migrações não importam o código atual)
+    if not valor:
+        return ''
+    sem_acentos = unicodedata.normalize('NFKD', valor).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', sem_acentos).strip().lower()
+
+
+def preencher_colunas_busca(apps, schema_editor):
+    UnidadeSaude = apps.get_model('accounts', 'UnidadeSaude')
+    unidades = list(UnidadeSaude.objects.only('id', *CAMPOS_BUSCA))
+    for unidade in unidades:
+        for campo, coluna in CAMPOS_BUSCA.items():
+            setattr(unidade, coluna, normalizar_texto(getattr(unidade, campo)))
+    UnidadeSaude.objects.bulk_update(unidades, list(CAMPOS_BUSCA.values()), batch_size=500)
+
+
+def criar_indices_trigrama(apps, schema_editor):
+    # PostgreSQL: índices de trigramas atendem também as buscas por trecho (LIKE '%x%')
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for coluna in CAMPOS_BUSCA.values():
+        schema_editor.execute(
+            f'CREATE INDEX unidade_{coluna}_trgm_idx ON accounts_unidadesaude USING GIN ({coluna} gin_trgm_ops)'
+        )
+
+
+def remover_indices_trigrama(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for coluna in CAMPOS_BUSCA.values():
+        schema_editor.execute(f'DROP INDEX IF EXISTS unidade_{coluna}_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_busca_textual'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unidadesaude',
+            name='municipio_busca',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='unidadesaude',
+            name='nome_busca',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='unidadesaude',
+            name='responsavel_busca',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(preencher_colunas_busca, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='unidadesaude',
+            index=models.Index(fields=['nome_busca'], name='unidade_nome_busca_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='unidadesaude',
+            index=models.Index(fields=['municipio_busca'], name='unidade_municipio_busca_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(criar_indices_trigrama, remover_indices_trigrama),
+    ]
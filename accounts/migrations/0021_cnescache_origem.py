@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-17 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0020_colunas_busca_unidades'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cnescache',
+            name='origem',
+            field=models.CharField(choices=[('api', 'API do CNES'), ('importacao', 'Importação de arquivo')], default='api', max_length=20, verbose_name='Origem'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Busca textual do PostgreSQL sem acentos, como o FTS5 do SQLite (remove_diacritics 2):
+# "joao" encontra "João" nos dois bancos (ver accounts/busca_chamadas.py)
+
+from django.db import migrations
+
+TABELA = 'accounts_registrochamada'
+CONFIGURACAO = 'portuguese_unaccent'
+
+
+def coluna_busca(configuracao):
+    # to_tsvector com configuração fixa é IMMUTABLE, então pode ser coluna gerada
+    return f"""ALTER TABLE {TABELA} ADD COLUMN busca_vetor tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{configuracao}', coalesce(nome_contato, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(telefone, '') || ' ' ||
+                  regexp_replace(coalesce(telefone, ''), '\\D', '', 'g')), 'A') ||
+        setweight(to_tsvector('{configuracao}', coalesce(unidade, '')), 'B') ||
+        setweight(to_tsvector('{configuracao}', coalesce(nome_atendente, '')), 'C') ||
+        setweight(to_tsvector('{configuracao}', coalesce(descricao, '')), 'D')
+    ) STORED"""
+
+
+def recriar_coluna(configuracao):
+    return [
+        'DROP INDEX IF EXISTS chamada_busca_gin_idx',
+        f'ALTER TABLE {TABELA} DROP COLUMN IF EXISTS busca_vetor',
+        coluna_busca(configuracao),
+        f'CREATE INDEX chamada_busca_gin_idx ON {TABELA} USING GIN (busca_vetor)',
+    ]
+
+
+POSTGRESQL = [
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    f'CREATE TEXT SEARCH CONFIGURATION {CONFIGURACAO} (COPY = portuguese)',
+    # unaccent antes do stemmer: as palavras chegam ao dicionário português já sem acento
+    f"""ALTER TEXT SEARCH CONFIGURATION {CONFIGURACAO}
+        ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem""",
+    *recriar_coluna(CONFIGURACAO),
+]
+
+POSTGRESQL_REVERSO = [
+    *recriar_coluna('portuguese'),
+    f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {CONFIGURACAO}',
+]
+
+
+def executar(schema_editor, comandos):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for comando in comandos:
+        schema_editor.execute(comando, params=None)
+
+
+def usar_configuracao_sem_acentos(apps, schema_editor):
+    executar(schema_editor, POSTGRESQL)
+
+
+def voltar_configuracao_portuguese(apps, schema_editor):
+    executar(schema_editor, POSTGRESQL_REVERSO)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0021_cnescache_origem'),
+    ]
+
+    operations = [
+        migrations.RunPython(usar_configuracao_sem_acentos, voltar_configuracao_portuguese),
+    ]
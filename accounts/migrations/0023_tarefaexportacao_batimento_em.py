@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-17 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0022_busca_textual_sem_acentos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tarefaexportacao',
+            name='batimento_em',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Último sinal do worker'),
+        ),
+    ]
@@ -1,15 +1,48 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 import os
+import re
+import unicodedata
 
 def user_avatar_path(instance, filename):
     ext = filename.split('.')[-1]
     filename = f'user_{instance.user.id}_avatar.{ext}'
     return os.path.join('avatars', filename)
 
+def normalizar_texto(valor):
+    """Remove acentos, converte para minúsculas e colapsa espaços (usado em comparações de nomes)"""
+    if not valor:
+        return ''
+    sem_acentos = unicodedata.normalize('NFKD', valor).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', sem_acentos).strip().lower()
+
+def preencher_campos_busca(instancia, campos, update_fields=None):
+    """
+    Copia para as colunas de busca (`campo` -> `campo_busca`) o valor normalizado de cada
+    campo. Retorna `update_fields` com as colunas de busca dos campos que estão nele.
+    """
+    for campo, coluna in campos.items():
+        setattr(instancia, coluna, normalizar_texto(getattr(instancia, campo)))
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    return update_fields | {coluna for campo, coluna in campos.items() if campo in update_fields}
+
+def filtro_prefixo(coluna, texto):
+    """
+    Q para "coluna de busca começa com `texto`" que usa o índice btree da coluna: LIKE 'x%'
+    no PostgreSQL (índice varchar_pattern_ops) e intervalo no SQLite, cujo LIKE ignora
+    maiúsculas e por isso não usa índices comuns. As colunas só têm ASCII minúsculo.
+    """
+    texto = normalizar_texto(texto)
+    if connection.vendor == 'sqlite':
+        return Q(**{f'{coluna}__gte': texto, f'{coluna}__lt': texto + '\x7f'})
+    return Q(**{f'{coluna}__startswith': texto})
+
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     avatar = models.ImageField(
@@ -99,6 +132,14 @@ class RegistroChamada(models.Model):
     municipio = models.CharField(max_length=100, null=True, blank=True, verbose_name='Município')
     cnes = models.CharField(max_length=7, null=True, blank=True, verbose_name='Código CNES')
     contato_telefonico_cnes = models.CharField(max_length=20, null=True, blank=True, verbose_name='Contato Telefônico CNES')
+    unidade_saude = models.ForeignKey(
+        'UnidadeSaude',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='chamadas',
+        verbose_name='Unidade de Saúde Cadastrada'
+    )
 
     # Metadados
     data_criacao = models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')
@@ -115,6 +156,16 @@ class RegistroChamada(models.Model):
         verbose_name = 'Registro de Chamada'
         verbose_name_plural = 'Registros de Chamadas'
         ordering = ['-data_criacao']
+        # A busca textual (accounts.busca_chamadas) não aparece aqui: coluna gerada no PostgreSQL
+        # e tabela FTS5 com triggers no SQLite, criadas em SQL pelas migrações 0019 e 0022. No
+        # SQLite, migrações que reconstroem esta tabela apagam os triggers; o post_migrate os recria.
+        indexes = [
+            # Filtros do histórico, relatórios e exportações (sempre com período ou ordem por data)
+            models.Index(fields=['data_criacao'], name='chamada_data_idx'),
+            models.Index(fields=['tipo_chamada', 'data_criacao'], name='chamada_tipo_data_idx'),
+            models.Index(fields=['status', 'data_criacao'], name='chamada_status_data_idx'),
+            models.Index(fields=['usuario_criador', 'data_criacao'], name='chamada_usuario_data_idx'),
+        ]
 
     def __str__(self):
         return f"Chamada {self.tipo_chamada} - {self.data_criacao.strftime('%d/%m/%Y %H:%M')}"
@@ -148,11 +199,134 @@ class UnidadeSaude(models.Model):
         verbose_name='Usuário Cadastrante',
         help_text='Usuário que cadastrou esta unidade no sistema'
     )
+    # Sem acentos, minúsculas e espaços colapsados (normalizar_texto); preenchidos no save()
+    nome_busca = models.CharField(max_length=200, blank=True, default='', editable=False)
+    municipio_busca = models.CharField(max_length=100, blank=True, default='', editable=False)
+    responsavel_busca = models.CharField(max_length=200, blank=True, default='', editable=False)
+
+    CAMPOS_BUSCA = {'nome': 'nome_busca', 'municipio': 'municipio_busca', 'responsavel': 'responsavel_busca'}
 
     class Meta:
         verbose_name = 'Unidade de Saúde'
         verbose_name_plural = 'Unidades de Saúde'
         ordering = ['nome']
+        indexes = [
+            models.Index(fields=['tipo'], name='unidade_tipo_idx'),
+            models.Index(fields=['municipio'], name='unidade_municipio_idx'),
+            # opclasses só vale no PostgreSQL: permite LIKE 'prefixo%' com qualquer collation
+            models.Index(fields=['nome_busca'], name='unidade_nome_busca_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['municipio_busca'], name='unidade_municipio_busca_idx', opclasses=['varchar_pattern_ops']),
+        ]
 
     def __str__(self):
         return self.nome
+
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = preencher_campos_busca(self, self.CAMPOS_BUSCA, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+
+def resolver_unidade_saude(cnes=None, nome=None):
+    """
+    Encontra a UnidadeSaude de uma chamada: primeiro pelo CNES e depois pelo nome
+    normalizado exato. Retorna None se não houver unidade (ou se o nome for ambíguo).
+    """
+    cnes = (cnes or '').strip()
+    if cnes:
+        unidade = UnidadeSaude.objects.filter(cnes=cnes).first()
+        if unidade:
+            return unidade
+
+    nome_normalizado = normalizar_texto(nome)
+    if not nome_normalizado:
+        return None
+
+    # Coluna normalizada indexada; duas linhas bastam para saber se o nome é ambíguo
+    candidatas = list(UnidadeSaude.objects.filter(nome_busca=nome_normalizado)[:2])
+    return candidatas[0] if len(candidatas) == 1 else None
+
+def arquivo_exportacao_path(instance, filename):
+    # Arquivos gerados pelas tarefas de exportação, separados por usuário
+    return f'exportacoes/user_{instance.usuario_id}/{instance.pk}_{filename}'
+
+class TarefaExportacao(models.Model):
+    """
+    Exportação executada fora da requisição. A própria tabela é a fila: o worker
+    reserva a tarefa PENDENTE mais antiga e grava o arquivo gerado em MEDIA_ROOT.
+    """
+    STATUS_PENDENTE = 'pendente'
+    STATUS_PROCESSANDO = 'processando'
+    STATUS_CONCLUIDA = 'concluida'
+    STATUS_ERRO = 'erro'
+    STATUS_CHOICES = [
+        (STATUS_PENDENTE, 'Na fila'),
+        (STATUS_PROCESSANDO, 'Processando'),
+        (STATUS_CONCLUIDA, 'Concluída'),
+        (STATUS_ERRO, 'Erro'),
+    ]
+
+    usuario = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='tarefas_exportacao',
+        verbose_name='Usuário Solicitante'
+    )
+    tipo = models.CharField(max_length=50, verbose_name='Tipo de Exportação')
+    parametros = models.JSONField(default=dict, blank=True, verbose_name='Parâmetros')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDENTE, verbose_name='Status')
+    progresso = models.PositiveSmallIntegerField(default=0, verbose_name='Progresso (%)')
+    mensagem = models.CharField(max_length=255, blank=True, default='', verbose_name='Mensagem')
+    tentativas = models.PositiveSmallIntegerField(default=0, verbose_name='Tentativas')
+    arquivo = models.FileField(upload_to=arquivo_exportacao_path, null=True, blank=True, verbose_name='Arquivo Gerado')
+    nome_arquivo = models.CharField(max_length=255, blank=True, default='', verbose_name='Nome do Arquivo')
+    content_type = models.CharField(max_length=100, blank=True, default='', verbose_name='Tipo de Conteúdo')
+    criado_em = models.DateTimeField(auto_now_add=True, verbose_name='Criado em')
+    iniciado_em = models.DateTimeField(null=True, blank=True, verbose_name='Iniciado em')
+    # Renovado pelo worker enquanto executa; sem renovação a tarefa é considerada abandonada
+    batimento_em = models.DateTimeField(null=True, blank=True, verbose_name='Último sinal do worker')
+    concluido_em = models.DateTimeField(null=True, blank=True, verbose_name='Concluído em')
+
+    class Meta:
+        verbose_name = 'Tarefa de Exportação'
+        verbose_name_plural = 'Tarefas de Exportação'
+        ordering = ['-criado_em']
+        indexes = [
+            # Reserva da próxima tarefa da fila (status + ordem de chegada)
+            models.Index(fields=['status', 'criado_em'], name='exportacao_status_idx'),
+        ]
+
+    def __str__(self):
+        return f'Exportação {self.tipo} #{self.pk} ({self.status})'
+
+class CnesCache(models.Model):
+    """
+    Cópia local de um estabelecimento consultado na API do CNES (DATASUS): a resposta
+    bruta, os campos mais usados já normalizados e quando foi buscada. Consultas
+    repetidas são respondidas daqui (ver accounts.cnes).
+
+    Registros vindos do arquivo do DATASUS (`manage.py import_cnes`) não expiram: são
+    atualizados importando um arquivo mais novo, não pela API.
+    """
+    ORIGEM_API = 'api'
+    ORIGEM_IMPORTACAO = 'importacao'
+    ORIGEM_CHOICES = [
+        (ORIGEM_API, 'API do CNES'),
+        (ORIGEM_IMPORTACAO, 'Importação de arquivo'),
+    ]
+
+    codigo_cnes = models.CharField(max_length=7, unique=True, verbose_name='Código CNES')
+    encontrado = models.BooleanField(default=True, help_text='Falso quando a API respondeu 404 (cache negativo)')
+    dados = models.JSONField(default=dict, blank=True, verbose_name='Resposta da API')
+    nome = models.CharField(max_length=255, blank=True, default='')
+    municipio = models.CharField(max_length=100, blank=True, default='')
+    uf = models.CharField(max_length=2, blank=True, default='')
+    telefone = models.CharField(max_length=50, blank=True, default='')
+    buscado_em = models.DateTimeField(default=timezone.now, verbose_name='Buscado em')
+    origem = models.CharField(max_length=20, choices=ORIGEM_CHOICES, default=ORIGEM_API, verbose_name='Origem')
+
+    class Meta:
+        verbose_name = 'Estabelecimento CNES (cache)'
+        verbose_name_plural = 'Estabelecimentos CNES (cache)'
+        ordering = ['codigo_cnes']
+
+    def __str__(self):
+        return f'{self.codigo_cnes} - {self.nome or "não encontrado"}'
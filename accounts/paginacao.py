@@ -0,0 +1,105 @@
+"""
+Paginação por cursor (keyset) em ordem decrescente de (data_criacao, id).
+
+Em vez de OFFSET, cada página continua a partir da última linha da página anterior
+(`data_criacao < d OR (data_criacao = d AND id < pk)`), então páginas profundas
+custam o mesmo que a primeira e usam o índice de data_criacao. Resultados de busca
+textual são paginados do mesmo jeito por (relevancia, id).
+"""
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+TAMANHO_PAGINA_PADRAO = 50
+TAMANHO_PAGINA_MAXIMO = 200
+
+
+class CursorInvalido(ValueError):
+    pass
+
+
+def codificar_cursor(data, pk):
+    """Cursor opaco (base64 url-safe) a partir da data e do id da última linha"""
+    bruto = f'{data.isoformat()}|{pk}'.encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip('=')
+
+
+def decodificar_cursor(cursor):
+    """Retorna (data, pk) do cursor ou levanta CursorInvalido"""
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        data, pk = bruto.rsplit('|', 1)
+        return datetime.fromisoformat(data), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise CursorInvalido(f'Cursor inválido: {cursor}') from e
+
+
+def tamanho_pagina(valor, padrao=TAMANHO_PAGINA_PADRAO):
+    """Converte o parâmetro de tamanho de página, limitado a TAMANHO_PAGINA_MAXIMO"""
+    try:
+        return max(1, min(int(valor), TAMANHO_PAGINA_MAXIMO))
+    except (TypeError, ValueError):
+        return padrao
+
+
+def paginar_por_cursor(queryset, cursor=None, limite=TAMANHO_PAGINA_PADRAO, campo='data_criacao'):
+    """
+    Retorna (itens, proximo_cursor) da página que começa depois de `cursor`.
+    `proximo_cursor` é None na última página.
+    """
+    queryset = queryset.order_by(f'-{campo}', '-id')
+
+    if cursor:
+        data, pk = decodificar_cursor(cursor)
+        queryset = queryset.filter(Q(**{f'{campo}__lt': data}) | Q(**{campo: data, 'id__lt': pk}))
+
+    # Uma linha a mais indica se existe próxima página sem precisar de COUNT
+    itens = list(queryset[:limite + 1])
+    if len(itens) <= limite:
+        return itens, None
+
+    itens = itens[:limite]
+    ultimo = itens[-1]
+    return itens, codificar_cursor(getattr(ultimo, campo), ultimo.pk)
+
+
+# ===== ORDEM DE RELEVÂNCIA (busca textual) =====
+
+def codificar_cursor_relevancia(relevancia, pk):
+    """Cursor opaco da ordem por relevância: o prefixo 'r' o distingue do cursor de data"""
+    bruto = f'r|{relevancia!r}|{pk}'.encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip('=')
+
+
+def decodificar_cursor_relevancia(cursor):
+    """Retorna (relevancia, pk) do cursor ou levanta CursorInvalido"""
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        prefixo, relevancia, pk = bruto.split('|')
+        if prefixo != 'r':
+            raise ValueError(prefixo)
+        return float(relevancia), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise CursorInvalido(f'Cursor inválido: {cursor}') from e
+
+
+def paginar_por_relevancia(queryset, cursor=None, limite=TAMANHO_PAGINA_PADRAO, campo='relevancia'):
+    """
+    Como paginar_por_cursor, em ordem decrescente de (relevancia, id). O queryset precisa
+    vir anotado com `campo` (ver busca_chamadas.anotar_relevancia).
+    """
+    queryset = queryset.order_by(f'-{campo}', '-id')
+
+    if cursor:
+        relevancia, pk = decodificar_cursor_relevancia(cursor)
+        queryset = queryset.filter(Q(**{f'{campo}__lt': relevancia}) | Q(**{campo: relevancia, 'id__lt': pk}))
+
+    itens = list(queryset[:limite + 1])
+    if len(itens) <= limite:
+        return itens, None
+
+    itens = itens[:limite]
+    ultimo = itens[-1]
+    return itens, codificar_cursor_relevancia(getattr(ultimo, campo), ultimo.pk)
@@ -0,0 +1,91 @@
+"""
+Períodos de calendário (dia, mês, intervalo de datas) convertidos em intervalos
+semiabertos [início, fim) de datetimes com fuso horário.
+
+Filtrar com `campo__gte=início, campo__lt=fim` mantém a coluna intacta na consulta,
+ao contrário de `__date`, `__month` e `__year`, que com USE_TZ=True viram chamadas
+de função sobre a coluna e impedem o uso dos índices de data.
+"""
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+
+def fuso_calendario():
+    """Fuso em que os dias e meses dos relatórios são contados"""
+    return ZoneInfo(getattr(settings, 'FUSO_HORARIO_CALENDARIO', 'America/Campo_Grande'))
+
+
+def hoje():
+    """Data de hoje no fuso do calendário"""
+    return timezone.localdate(timezone=fuso_calendario())
+
+
+def data_local(momento):
+    """Data de calendário de um datetime com fuso"""
+    return timezone.localtime(momento, fuso_calendario()).date()
+
+
+def inicio_do_dia(dia):
+    """Meia-noite de `dia` no fuso do calendário"""
+    return datetime.combine(dia, time.min, tzinfo=fuso_calendario())
+
+
+def primeiro_dia_do_mes(dia):
+    return dia.replace(day=1)
+
+
+def primeiro_dia_do_mes_seguinte(dia):
+    return (dia.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def intervalo_dia(dia):
+    """[00:00 de `dia`, 00:00 do dia seguinte)"""
+    return inicio_do_dia(dia), inicio_do_dia(dia + timedelta(days=1))
+
+
+def intervalo_mes(dia):
+    """[início do mês de `dia`, início do mês seguinte)"""
+    return inicio_do_dia(primeiro_dia_do_mes(dia)), inicio_do_dia(primeiro_dia_do_mes_seguinte(dia))
+
+
+def intervalo_ano(dia):
+    """[1º de janeiro do ano de `dia`, 1º de janeiro do ano seguinte)"""
+    return inicio_do_dia(date(dia.year, 1, 1)), inicio_do_dia(date(dia.year + 1, 1, 1))
+
+
+def filtro_intervalo(campo, inicio=None, fim=None):
+    """Q de `campo` em [inicio, fim); limites None ficam abertos"""
+    condicoes = {}
+    if inicio is not None:
+        condicoes[f'{campo}__gte'] = inicio
+    if fim is not None:
+        condicoes[f'{campo}__lt'] = fim
+    return Q(**condicoes)
+
+
+def filtro_dia(campo, dia):
+    return filtro_intervalo(campo, *intervalo_dia(dia))
+
+
+def filtro_mes(campo, dia):
+    return filtro_intervalo(campo, *intervalo_mes(dia))
+
+
+def filtro_ano(campo, dia):
+    return filtro_intervalo(campo, *intervalo_ano(dia))
+
+
+def filtro_datas(campo, data_inicio=None, data_fim=None):
+    """
+    Q de `campo` entre as datas de calendário `data_inicio` e `data_fim`, ambas inclusivas
+    (equivale a `__date__gte` / `__date__lte`, mas sem função sobre a coluna).
+    """
+    return filtro_intervalo(
+        campo,
+        inicio_do_dia(data_inicio) if data_inicio else None,
+        inicio_do_dia(data_fim + timedelta(days=1)) if data_fim else None,
+    )
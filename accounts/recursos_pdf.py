@@ -0,0 +1,238 @@
+"""
+Recursos compartilhados pelos PDFs: imagens de cabeçalho/rodapé, tabelas em blocos e
+renderização de relatórios longos em vários processos.
+
+Imagens: carregadas uma vez por processo.
+
+Cada arquivo é verificado e decodificado na primeira vez que é pedido; depois disso
+o mesmo ImageReader é reaproveitado por todos os documentos, sem `os.path.exists`
+nem nova leitura do disco a cada página.
+
+As imagens são gravadas no PDF como streams binários (só FlateDecode). O ASCII85,
+ligado por padrão no ReportLab, deixa os streams ~25% maiores e, sem a extensão
+rl_accel, é codificado em Python puro: era a maior parte do tempo de cada PDF.
+"""
+import io
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from django.conf import settings
+from reportlab import rl_config
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Table
+
+# Global de propósito: vale para todo PDF gerado no processo, não só os que usam estas
+# imagens. Todos os PDFs do sistema (exportações, relatórios, fila de exportações) saem
+# por HTTP ou para MEDIA_ROOT, que aceitam binário; nenhum precisa de streams em ASCII.
+# O ReportLab lê rl_config.useA85 a cada stream gravado durante o build, então trocar o
+# valor só em volta de um doc.build() não seria seguro com várias threads gerando PDFs ao
+# mesmo tempo (requisições e o worker da fila). Quem precisar de ASCII85 em um documento
+# deve gerá-lo em outro processo.
+rl_config.useA85 = 0
+
+# Linhas por tabela nos relatórios longos (cada bloco ocupa poucas páginas)
+LINHAS_POR_BLOCO_PDF = 200
+
+_leitores = {}
+_lock = threading.Lock()
+
+
+def caminho_imagem(nome_arquivo):
+    return os.path.join(settings.BASE_DIR, 'static', 'images', nome_arquivo)
+
+
+def imagem_pdf(nome_arquivo):
+    """ImageReader já decodificado da imagem em static/images, ou None se ela não existir"""
+    try:
+        return _leitores[nome_arquivo]
+    except KeyError:
+        pass
+
+    with _lock:
+        if nome_arquivo not in _leitores:
+            caminho = caminho_imagem(nome_arquivo)
+            leitor = None
+            if os.path.exists(caminho):
+                try:
+                    leitor = ImageReader(caminho)
+                    # Decodifica agora: o ImageReader guarda os pixels para os próximos usos
+                    leitor.getRGBData()
+                except Exception as e:
+                    print(f"Erro ao carregar imagem do PDF {caminho}: {e}")
+                    leitor = None
+            _leitores[nome_arquivo] = leitor
+        return _leitores[nome_arquivo]
+
+
+def limpar_cache_imagens():
+    """Descarta as imagens carregadas (ex.: após trocar um logo sem reiniciar o processo)"""
+    with _lock:
+        _leitores.clear()
+
+
+# ===== TABELAS EM BLOCOS =====
+
+def tabelas_em_blocos(cabecalho, linhas, estilo, col_widths=None, linhas_por_bloco=LINHAS_POR_BLOCO_PDF):
+    """
+    Gera uma Table para cada `linhas_por_bloco` linhas de `linhas` (qualquer iterável),
+    todas com o mesmo `cabecalho` repetido a cada página (repeatRows) e o mesmo TableStyle.
+    Sem linhas, gera só o cabeçalho.
+    """
+    linhas = iter(linhas)
+    primeiro = True
+    while True:
+        bloco = list(islice(linhas, linhas_por_bloco))
+        if not bloco and not primeiro:
+            return
+        primeiro = False
+        yield Table([cabecalho] + bloco, colWidths=col_widths, repeatRows=1, style=estilo)
+        if len(bloco) < linhas_por_bloco:
+            return
+
+
+class FlowablesSobDemanda(list):
+    """
+    Lista de flowables para doc.build() preenchida a partir de um iterador conforme o
+    build consome os itens: só os blocos ainda não desenhados ficam na memória.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._restantes = iter(flowables)
+
+    def _abastecer(self, quantidade=1):
+        while list.__len__(self) < quantidade:
+            proximo = next(self._restantes, None)
+            if proximo is None:
+                return
+            self.append(proximo)
+
+    def __len__(self):
+        self._abastecer()
+        return list.__len__(self)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, int) and indice >= 0:
+            self._abastecer(indice + 1)
+        return list.__getitem__(self, indice)
+
+
+# ===== RENDERIZAÇÃO EM PROCESSOS =====
+#
+# O ReportLab usa um único núcleo. Para relatórios com dezenas de milhares de linhas as
+# linhas são lidas no processo da requisição, divididas em partes de tamanho fixo e cada
+# parte vira um PDF (um intervalo de páginas) em um processo do pool; as partes são
+# juntadas em ordem com pypdf. Todas usam o mesmo template de documento, então
+# cabeçalho, rodapé e cabeçalho da tabela são idênticos em todas as páginas.
+
+_pool = None
+_pool_processos = 0
+
+
+def _iniciar_processo_pdf():
+    # Processos "spawn" começam do zero: o template do documento vem de accounts.views
+    import django
+    django.setup()
+
+
+def pool_pdf(processos):
+    """Pool de processos compartilhado pelas exportações, criado no primeiro uso"""
+    global _pool, _pool_processos
+    with _lock:
+        if _pool is None or _pool_processos != processos:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # spawn: um fork herdaria as conexões abertas com o banco
+            _pool = ProcessPoolExecutor(
+                max_workers=processos,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_iniciar_processo_pdf,
+            )
+            _pool_processos = processos
+        return _pool
+
+
+def descartar_pool_pdf():
+    global _pool, _pool_processos
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_processos = 0
+
+
+def renderizar_pdf(destino, montar_documento, montar_elementos, linhas, primeira_parte=True):
+    doc = montar_documento(destino)
+    doc.build(FlowablesSobDemanda(montar_elementos(linhas, primeira_parte)))
+
+
+def renderizar_parte_pdf(montar_documento, montar_elementos, linhas, primeira_parte):
+    """Executada no processo do pool: devolve os bytes do PDF de uma parte"""
+    buffer = io.BytesIO()
+    renderizar_pdf(buffer, montar_documento, montar_elementos, linhas, primeira_parte)
+    return buffer.getvalue()
+
+
+def gerar_pdf_em_partes(destino, montar_documento, montar_elementos, linhas, processos=None, linhas_por_parte=None):
+    """
+    Grava em `destino` o PDF montado por `montar_documento(destino)` (o DocTemplate) e
+    `montar_elementos(linhas, primeira_parte)` (os flowables; títulos só na primeira parte).
+
+    Com `processos` > 1 (padrão: settings.PDF_PROCESSOS) e mais de `linhas_por_parte`
+    linhas, cada parte é renderizada em um processo do pool e as partes são juntadas.
+    As duas funções precisam ser de nível de módulo para chegar aos outros processos.
+    Sem pypdf instalado, ou com poucas linhas, tudo é renderizado no próprio processo.
+    """
+    processos = settings.PDF_PROCESSOS if processos is None else processos
+    linhas_por_parte = linhas_por_parte or settings.PDF_LINHAS_POR_PROCESSO
+    linhas = iter(linhas)
+
+    if processos > 1:
+        try:
+            from pypdf import PdfWriter
+        except ImportError:
+            print("pypdf não instalado: PDF gerado em um único processo")
+            processos = 0
+
+    if processos <= 1:
+        renderizar_pdf(destino, montar_documento, montar_elementos, linhas)
+        return
+
+    parte = list(islice(linhas, linhas_por_parte))
+    if len(parte) < linhas_por_parte:
+        # Cabe em uma parte: não compensa enviar para outro processo
+        renderizar_pdf(destino, montar_documento, montar_elementos, parte)
+        return
+
+    pool = pool_pdf(processos)
+    saida = PdfWriter()
+    pendentes = deque()
+    try:
+        primeira_parte = True
+        while parte:
+            pendentes.append(pool.submit(
+                renderizar_parte_pdf, montar_documento, montar_elementos, parte, primeira_parte,
+            ))
+            primeira_parte = False
+            # No máximo duas partes por processo aguardando: limita a memória do leitor
+            while len(pendentes) >= processos * 2:
+                saida.append(io.BytesIO(pendentes.popleft().result()))
+            parte = list(islice(linhas, linhas_por_parte))
+        while pendentes:
+            saida.append(io.BytesIO(pendentes.popleft().result()))
+    except BrokenProcessPool:
+        # Um processo morreu (ex.: falta de memória): o próximo PDF recria o pool
+        descartar_pool_pdf()
+        raise
+    finally:
+        for futuro in pendentes:
+            futuro.cancel()
+
+    buffer = io.BytesIO()
+    saida.write(buffer)
+    destino.write(buffer.getvalue())
@@ -0,0 +1,368 @@
+"""
+Fila de exportações em segundo plano.
+
+As exportações pesadas (PDF/Excel do histórico, relatórios de usuários por mês, backup)
+viram uma TarefaExportacao PENDENTE e são executadas por um worker. Em produção o worker
+é `manage.py processar_exportacoes`, num processo separado do servidor web: a geração
+dos arquivos não disputa CPU e memória com as requisições. Para desenvolvimento ou
+instalações pequenas, EXPORTACAO_WORKER_EM_PROCESSO=1 executa as tarefas em threads do
+próprio processo web.
+
+O banco é a fila. A reserva é um UPDATE condicional (pendente -> processando), então
+vários workers podem disputar a mesma tarefa sem que ela seja executada duas vezes.
+
+Enquanto executa, o worker renova `batimento_em` a cada EXPORTACAO_BATIMENTO_SEGUNDOS
+(numa thread ao lado da geração do arquivo) e a cada atualização de progresso. Só volta
+à fila a tarefa sem batimento há EXPORTACAO_TIMEOUT_MINUTOS (worker encerrado no meio),
+não a que apenas está demorando. Cada reserva é identificada por (id, tentativas): as
+gravações do worker são condicionais a ela, então uma execução antiga que acorde depois
+do reenfileiramento não sobrescreve o resultado da nova.
+
+Com o worker em processo, cada processo web também roda a manutenção (tarefas travadas,
+arquivos expirados e pendentes órfãs de um reinício) a cada EXPORTACAO_INTERVALO_MANUTENCAO
+segundos, numa thread iniciada na primeira requisição.
+"""
+import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.http import HttpRequest, QueryDict
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import TarefaExportacao
+
+logger = logging.getLogger(__name__)
+
+# Cada tipo aponta para a view de exportação síncrona que gera o arquivo
+TIPOS_EXPORTACAO = {
+    'historico_pdf': {'rotulo': 'Histórico de chamadas (PDF)', 'view': 'export_historico_pdf_simples'},
+    'historico_excel': {'rotulo': 'Histórico de chamadas (Excel)', 'view': 'export_historico_excel'},
+    'usuarios_mes_pdf': {'rotulo': 'Novos usuários por mês (PDF)', 'view': 'export_relatorio_usuarios_mes_pdf'},
+    'usuarios_mes_excel': {'rotulo': 'Novos usuários por mês (Excel)', 'view': 'export_relatorio_usuarios_mes_excel'},
+    'relatorio_geral_pdf': {'rotulo': 'Relatório geral (PDF)', 'view': 'export_relatorio_geral_pdf'},
+    'relatorio_geral_excel': {'rotulo': 'Relatório geral (Excel)', 'view': 'export_relatorio_geral_excel'},
+    'backup': {'rotulo': 'Backup do sistema', 'view': None, 'somente_admin': True},
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+_manutencao = None
+
+
+def configuracao(nome, padrao):
+    return getattr(settings, nome, padrao)
+
+
+def usuario_pode_exportar(usuario, tipo):
+    definicao = TIPOS_EXPORTACAO.get(tipo)
+    if not definicao:
+        return False
+    if definicao.get('somente_admin'):
+        return usuario.is_staff or usuario.is_superuser
+    return True
+
+
+# ===== ENFILEIRAR =====
+
+def enfileirar_exportacao(usuario, tipo, parametros=None):
+    """Cria a tarefa PENDENTE e, com o worker em processo, acorda-o após o commit"""
+    tarefa = TarefaExportacao.objects.create(usuario=usuario, tipo=tipo, parametros=parametros or {})
+    if configuracao('EXPORTACAO_WORKER_EM_PROCESSO', False):
+        transaction.on_commit(disparar_worker_em_processo)
+    return tarefa
+
+
+def disparar_worker_em_processo():
+    """Agenda o processamento da fila no pool de threads do processo"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=configuracao('EXPORTACAO_WORKERS', 2),
+                thread_name_prefix='exportacao',
+            )
+    _executor.submit(processar_fila_em_thread)
+
+
+def iniciar_manutencao_em_processo(**kwargs):
+    """
+    Receptor de request_started: inicia (uma vez por processo) a thread de manutenção.
+    Comandos do manage.py não disparam o sinal, então não iniciam a thread.
+    """
+    global _manutencao
+    if _manutencao is not None or not configuracao('EXPORTACAO_WORKER_EM_PROCESSO', False):
+        return
+    with _executor_lock:
+        if _manutencao is None:
+            _manutencao = threading.Thread(target=laco_manutencao, name='exportacao-manutencao', daemon=True)
+            _manutencao.start()
+
+
+def laco_manutencao():
+    while True:
+        close_old_connections()
+        try:
+            recuperadas, removidas = executar_manutencao()
+            if recuperadas or removidas:
+                logger.info('Tarefas reenfileiradas: %s | expiradas removidas: %s', recuperadas, removidas)
+            if TarefaExportacao.objects.filter(status=TarefaExportacao.STATUS_PENDENTE).exists():
+                disparar_worker_em_processo()
+        except Exception:
+            logger.exception('Erro na manutenção da fila de exportações')
+        finally:
+            close_old_connections()
+        time.sleep(configuracao('EXPORTACAO_INTERVALO_MANUTENCAO', 60))
+
+
+def processar_fila_em_thread():
+    # Threads do pool não passam pelo ciclo de requisição: as conexões são fechadas aqui
+    close_old_connections()
+    try:
+        processar_fila()
+    except Exception:
+        logger.exception('Erro no worker de exportações')
+    finally:
+        close_old_connections()
+
+
+# ===== WORKER =====
+
+def reservar_proxima_tarefa():
+    """Reserva a tarefa pendente mais antiga; retorna None se a fila estiver vazia"""
+    pendentes = (
+        TarefaExportacao.objects
+        .filter(status=TarefaExportacao.STATUS_PENDENTE)
+        .order_by('criado_em', 'id')
+        .values_list('id', flat=True)[:10]
+    )
+    for tarefa_id in pendentes:
+        agora = timezone.now()
+        reservada = TarefaExportacao.objects.filter(
+            id=tarefa_id, status=TarefaExportacao.STATUS_PENDENTE
+        ).update(
+            status=TarefaExportacao.STATUS_PROCESSANDO,
+            iniciado_em=agora,
+            batimento_em=agora,
+            progresso=5,
+            mensagem='Iniciando exportação',
+        )
+        if reservada:
+            return TarefaExportacao.objects.select_related('usuario').get(id=tarefa_id)
+        # Outro worker reservou primeiro: tenta a próxima
+    return None
+
+
+def processar_fila(limite=None):
+    """Executa tarefas até esvaziar a fila (ou até `limite`); retorna quantas executou"""
+    executadas = 0
+    while limite is None or executadas < limite:
+        tarefa = reservar_proxima_tarefa()
+        if tarefa is None:
+            break
+        executar_tarefa(tarefa)
+        executadas += 1
+    return executadas
+
+
+def reserva(tarefa):
+    """Filtro da tarefa enquanto ela continuar reservada por esta execução"""
+    return TarefaExportacao.objects.filter(
+        id=tarefa.id, status=TarefaExportacao.STATUS_PROCESSANDO, tentativas=tarefa.tentativas,
+    )
+
+
+def atualizar_progresso(tarefa, progresso, mensagem=''):
+    """Grava o progresso e renova o batimento; False se a tarefa não é mais desta execução"""
+    atualizada = reserva(tarefa).update(progresso=progresso, mensagem=mensagem, batimento_em=timezone.now())
+    tarefa.progresso = progresso
+    tarefa.mensagem = mensagem
+    return bool(atualizada)
+
+
+def manter_batimento(tarefa, parar):
+    """Thread ao lado da geração: renova batimento_em até `parar` ou até perder a reserva"""
+    intervalo = configuracao('EXPORTACAO_BATIMENTO_SEGUNDOS', 30)
+    try:
+        while not parar.wait(intervalo):
+            if not reserva(tarefa).update(batimento_em=timezone.now()):
+                return
+    except Exception:
+        logger.warning('Falha ao renovar o batimento da tarefa #%s', tarefa.id, exc_info=True)
+    finally:
+        connection.close()
+
+
+def executar_tarefa(tarefa):
+    """Gera o arquivo da tarefa e grava o resultado (concluída ou erro)"""
+    logger.info('Tarefa #%s (%s) de %s', tarefa.id, tarefa.tipo, tarefa.usuario.username)
+    parar = threading.Event()
+    batimento = threading.Thread(
+        target=manter_batimento, args=(tarefa, parar), name=f'exportacao-batimento-{tarefa.id}', daemon=True,
+    )
+    batimento.start()
+    try:
+        if not usuario_pode_exportar(tarefa.usuario, tarefa.tipo):
+            raise PermissionError('Exportação não permitida para este usuário')
+
+        atualizar_progresso(tarefa, 10, 'Gerando arquivo')
+        response, nome_arquivo = gerar_resposta(tarefa)
+        if response.status_code != 200:
+            raise RuntimeError(f'A exportação retornou HTTP {response.status_code}')
+
+        atualizar_progresso(tarefa, 80, 'Salvando arquivo')
+        with tempfile.TemporaryFile() as temporario:
+            gravar_conteudo(response, temporario)
+            temporario.seek(0)
+            tarefa.arquivo.save(nome_arquivo, File(temporario), save=False)
+
+        concluida = reserva(tarefa).update(
+            arquivo=tarefa.arquivo.name,
+            nome_arquivo=nome_arquivo,
+            content_type=response.get('Content-Type', 'application/octet-stream'),
+            status=TarefaExportacao.STATUS_CONCLUIDA,
+            progresso=100,
+            mensagem='Exportação concluída',
+            concluido_em=timezone.now(),
+        )
+        if not concluida:
+            # Reenfileirada (ou finalizada) por outra execução enquanto esta gerava: descarta o arquivo
+            tarefa.arquivo.delete(save=False)
+            logger.warning('Tarefa #%s não é mais desta execução; resultado descartado', tarefa.id)
+            return
+        logger.info('Tarefa #%s concluída: %s', tarefa.id, nome_arquivo)
+    except Exception as e:
+        logger.exception('Tarefa #%s falhou', tarefa.id)
+        reserva(tarefa).update(
+            status=TarefaExportacao.STATUS_ERRO,
+            mensagem=str(e)[:255],
+            concluido_em=timezone.now(),
+        )
+    finally:
+        parar.set()
+        batimento.join()
+
+
+def gerar_resposta(tarefa):
+    """Executa a exportação síncrona da tarefa; retorna (response, nome_arquivo)"""
+    from . import views
+
+    parametros = tarefa.parametros or {}
+    if tarefa.tipo == 'backup':
+        return views.gerar_backup_sistema(
+            tarefa.usuario,
+            parametros.get('format_type', 'json'),
+            bool(parametros.get('include_users')),
+            bool(parametros.get('include_unidades')),
+            bool(parametros.get('include_chamadas')),
+        )
+
+    view = getattr(views, TIPOS_EXPORTACAO[tarefa.tipo]['view'])
+    response = view(requisicao_interna(tarefa.usuario, parametros))
+    return response, nome_do_anexo(response, f'exportacao_{tarefa.id}')
+
+
+def requisicao_interna(usuario, parametros):
+    """HttpRequest GET com os filtros da tarefa, para reaproveitar as views de exportação"""
+    request = HttpRequest()
+    request.method = 'GET'
+    request.user = usuario
+    request.GET = QueryDict(mutable=True)
+    for chave, valor in parametros.items():
+        request.GET[chave] = str(valor)
+    return request
+
+
+def nome_do_anexo(response, padrao):
+    disposicao = response.get('Content-Disposition', '')
+    if 'filename=' in disposicao:
+        return disposicao.split('filename=', 1)[1].split(';')[0].strip().strip('"') or padrao
+    return padrao
+
+
+def gravar_conteudo(response, destino):
+    """Copia o corpo da resposta (normal ou streaming) para `destino`"""
+    if response.streaming:
+        for bloco in response.streaming_content:
+            destino.write(bloco if isinstance(bloco, bytes) else bloco.encode())
+        response.close()
+    else:
+        destino.write(response.content)
+
+
+# ===== MANUTENÇÃO =====
+
+def executar_manutencao():
+    """Reenfileira as tarefas travadas e apaga as expiradas; retorna (recuperadas, removidas)"""
+    return recuperar_tarefas_travadas(), remover_tarefas_expiradas()
+
+
+def recuperar_tarefas_travadas():
+    """
+    Devolve à fila as tarefas PROCESSANDO sem batimento há mais de EXPORTACAO_TIMEOUT_MINUTOS
+    (worker encerrado no meio); após EXPORTACAO_MAX_TENTATIVAS, marca como erro.
+    """
+    limite = timezone.now() - timedelta(minutes=configuracao('EXPORTACAO_TIMEOUT_MINUTOS', 5))
+    max_tentativas = configuracao('EXPORTACAO_MAX_TENTATIVAS', 3)
+    travadas = TarefaExportacao.objects.filter(status=TarefaExportacao.STATUS_PROCESSANDO).filter(
+        Q(batimento_em__lt=limite) | Q(batimento_em__isnull=True, iniciado_em__lt=limite)
+    )
+    recuperadas = 0
+    for tarefa in travadas:
+        tentativas = tarefa.tentativas + 1
+        if tentativas >= max_tentativas:
+            alteracoes = {'status': TarefaExportacao.STATUS_ERRO, 'mensagem': 'Tempo limite excedido',
+                          'concluido_em': timezone.now()}
+        else:
+            alteracoes = {'status': TarefaExportacao.STATUS_PENDENTE, 'progresso': 0,
+                          'mensagem': 'Reenfileirada após tempo limite'}
+        # Condicional, como a reserva: vários processos podem rodar a manutenção ao mesmo tempo,
+        # e um batimento renovado entre a consulta e o UPDATE mantém a tarefa com o worker
+        recuperadas += TarefaExportacao.objects.filter(
+            Q(batimento_em__lt=limite) | Q(batimento_em__isnull=True),
+            id=tarefa.id, status=TarefaExportacao.STATUS_PROCESSANDO, tentativas=tarefa.tentativas,
+        ).update(tentativas=tentativas, **alteracoes)
+    return recuperadas
+
+
+def remover_tarefas_expiradas():
+    """Apaga tarefas finalizadas (e seus arquivos) mais antigas que EXPORTACAO_RETENCAO_HORAS"""
+    limite = timezone.now() - timedelta(hours=configuracao('EXPORTACAO_RETENCAO_HORAS', 24))
+    expiradas = TarefaExportacao.objects.filter(
+        status__in=[TarefaExportacao.STATUS_CONCLUIDA, TarefaExportacao.STATUS_ERRO],
+        concluido_em__lt=limite,
+    )
+    removidas = 0
+    for tarefa in expiradas:
+        if tarefa.arquivo:
+            tarefa.arquivo.delete(save=False)
+        tarefa.delete()
+        removidas += 1
+    return removidas
+
+
+def serializar_tarefa(tarefa):
+    return {
+        'id': tarefa.id,
+        'tipo': tarefa.tipo,
+        'rotulo': TIPOS_EXPORTACAO.get(tarefa.tipo, {}).get('rotulo', tarefa.tipo),
+        'status': tarefa.status,
+        'status_display': tarefa.get_status_display(),
+        'progresso': tarefa.progresso,
+        'mensagem': tarefa.mensagem,
+        'nome_arquivo': tarefa.nome_arquivo,
+        'criado_em': tarefa.criado_em.isoformat() if tarefa.criado_em else None,
+        'concluido_em': tarefa.concluido_em.isoformat() if tarefa.concluido_em else None,
+        'url_status': reverse('api_exportacao_status', args=[tarefa.id]),
+        'url_download': (
+            reverse('download_exportacao', args=[tarefa.id])
+            if tarefa.status == TarefaExportacao.STATUS_CONCLUIDA else None
+        ),
+    }
@@ -1,3 +1,601 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from .busca_chamadas import (
+    TABELA_FTS,
+    anotar_relevancia,
+    backend_busca,
+    definicao_triggers,
+    filtrar_por_busca,
+    garantir_triggers_fts,
+)
+from . import leitura_unidades
+from .cnes import (
+    ORIGEM_CACHE,
+    CircuitoAberto,
+    ClienteCnes,
+    buscar_na_api,
+    consultar_cnes,
+    gravar_registros_cnes,
+    registro_cnes,
+    reiniciar_cliente_cnes,
+)
+from .estatisticas import verificar_cache_estatisticas
+from .importacao_cnes import caminho_progresso
+from .leitura_unidades import CHAVE_VERSAO, modelo_unidades, verificar_cache_versoes
+from .models import CnesCache, RegistroChamada, TarefaExportacao, UnidadeSaude
+from .paginacao import (
+    CursorInvalido,
+    codificar_cursor,
+    codificar_cursor_relevancia,
+    paginar_por_cursor,
+    paginar_por_relevancia,
+)
+from .tarefas_exportacao import (
+    atualizar_progresso,
+    enfileirar_exportacao,
+    executar_tarefa,
+    recuperar_tarefas_travadas,
+    reservar_proxima_tarefa,
+)
+from .views import serializar_chamada_historico
+
+
+class ImportCnesTests(TestCase):
+    """manage.py import_cnes"""
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.diretorio = diretorio.name
+
+    def arquivo(self, nome, conteudo):
+        caminho = os.path.join(self.diretorio, nome)
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(conteudo)
+        return caminho
+
+    def importar(self, caminho, *opcoes):
+        saida = StringIO()
+        call_command('import_cnes', caminho, *opcoes, stdout=saida)
+        return saida.getvalue()
+
+    def csv_datasus(self, linhas):
+        cabecalho = 'CO_CNES;NO_FANTASIA;NO_MUNICIPIO;CO_UF;NU_TELEFONE'
+        return '\n'.join([cabecalho, *linhas]) + '\n'
+
+    def test_csv_com_ponto_e_virgula(self):
+        caminho = self.arquivo('estabelecimentos.csv', self.csv_datasus([
+            '2345678;UBS Vila Almeida;Campo Grande;50;(67) 3314-0000',
+            '12345;Hospital São Julião;Dourados;50;',
+            ';Sem código;Campo Grande;50;',
+        ]))
+
+        saida = self.importar(caminho)
+
+        self.assertIn('Importação concluída', saida)
+        self.assertEqual(CnesCache.objects.count(), 2)
+        ubs = CnesCache.objects.get(codigo_cnes='2345678')
+        self.assertEqual(ubs.nome, 'UBS Vila Almeida')
+        self.assertEqual(ubs.municipio, 'Campo Grande')
+        self.assertEqual(ubs.uf, 'MS')  # sigla a partir do código IBGE da UF
+        self.assertEqual(ubs.telefone, '(67) 3314-0000')
+        self.assertEqual(ubs.origem, CnesCache.ORIGEM_IMPORTACAO)
+        # Código com menos de 7 dígitos é completado com zeros
+        self.assertEqual(CnesCache.objects.get(codigo_cnes='0012345').nome, 'Hospital São Julião')
+        self.assertFalse(os.path.exists(caminho_progresso(caminho)))
+
+    def test_json_com_objeto_envolvente(self):
+        caminho = self.arquivo('estabelecimentos.json', json.dumps({'estabelecimentos': [
+            {'codigo_cnes': 2345678, 'nome_fantasia': 'UBS Vila Almeida', 'descricao_municipio': 'Campo Grande',
+             'sigla_uf': 'MS'},
+            {'codigo_cnes': 3456789, 'nome_razao_social': 'Hospital Regional', 'codigo_uf': 50},
+        ]}))
+
+        self.importar(caminho)
+
+        self.assertEqual(
+            list(CnesCache.objects.values_list('codigo_cnes', 'nome', 'uf')),
+            [('2345678', 'UBS Vila Almeida', 'MS'), ('3456789', 'Hospital Regional', 'MS')],
+        )
+        self.assertEqual(CnesCache.objects.get(codigo_cnes='2345678').dados['descricao_municipio'], 'Campo Grande')
+
+    def test_limite_retoma_de_onde_parou(self):
+        caminho = self.arquivo('estabelecimentos.csv', self.csv_datasus(
+            f'{2000000 + i};Unidade {i};Campo Grande;50;' for i in range(5)
+        ))
+
+        saida = self.importar(caminho, '--limite', '2', '--lote', '1')
+        self.assertIn('Importação parcial', saida)
+        self.assertEqual(CnesCache.objects.count(), 2)
+        self.assertTrue(os.path.exists(caminho_progresso(caminho)))
+
+        saida = self.importar(caminho, '--limite', '2', '--lote', '1')
+        self.assertIn('Retomando após a linha 2', saida)
+        self.assertEqual(CnesCache.objects.count(), 4)
+
+        saida = self.importar(caminho, '--limite', '2', '--lote', '1')
+        self.assertIn('Importação concluída', saida)
+        self.assertEqual(
+            sorted(CnesCache.objects.values_list('codigo_cnes', flat=True)),
+            [f'{2000000 + i}' for i in range(5)],
+        )
+        self.assertFalse(os.path.exists(caminho_progresso(caminho)))
+
+    def test_reimportacao_atualiza_registros_existentes(self):
+        # Um código já consultado na API passa a ser do arquivo
+        gravar_registros_cnes([registro_cnes('2345678', {'nome_fantasia': 'Nome antigo'})])
+        caminho = self.arquivo('estabelecimentos.csv', self.csv_datasus([
+            '2345678;UBS Vila Almeida;Campo Grande;50;',
+            '3456789;Hospital Regional;Dourados;50;',
+        ]))
+        self.importar(caminho)
+
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.csv_datasus(['3456789;Hospital Regional de Dourados;Dourados;50;']))
+        self.importar(caminho, '--recomecar')
+
+        self.assertEqual(CnesCache.objects.count(), 2)
+        ubs = CnesCache.objects.get(codigo_cnes='2345678')
+        self.assertEqual(ubs.nome, 'UBS Vila Almeida')
+        self.assertEqual(ubs.origem, CnesCache.ORIGEM_IMPORTACAO)
+        self.assertEqual(CnesCache.objects.get(codigo_cnes='3456789').nome, 'Hospital Regional de Dourados')
+
+    def test_importados_nao_expiram(self):
+        caminho = self.arquivo('estabelecimentos.csv', self.csv_datasus(['2345678;UBS Vila Almeida;Campo Grande;50;']))
+        self.importar(caminho)
+        CnesCache.objects.update(buscado_em=timezone.now() - timedelta(days=400))
+
+        with mock.patch('accounts.cnes.buscar_na_api', side_effect=AssertionError('consultou a API')):
+            registro, origem = consultar_cnes('2345678')
+
+        self.assertEqual(origem, ORIGEM_CACHE)
+        self.assertEqual(registro.nome, 'UBS Vila Almeida')
+
+
+class ApiCnesFalsa(BaseHTTPRequestHandler):
+    """Responde com as respostas enfileiradas em server.respostas: (status, corpo, atraso em segundos)"""
+
+    def do_GET(self):
+        self.server.requisicoes.append(self.path)
+        status, corpo, atraso = self.server.respostas.pop(0) if self.server.respostas else (200, {}, 0)
+        time.sleep(atraso)
+        conteudo = json.dumps(corpo).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(conteudo)))
+            self.end_headers()
+            self.wfile.write(conteudo)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # o cliente desistiu (timeout)
+
+    def log_message(self, *args):
+        pass
+
+
+class ClienteCnesTests(SimpleTestCase):
+    """ClienteCnes contra um servidor HTTP local no lugar da API do DATASUS"""
+
+    def setUp(self):
+        self.servidor = ThreadingHTTPServer(('127.0.0.1', 0), ApiCnesFalsa)
+        self.servidor.daemon_threads = True
+        self.servidor.respostas = []
+        self.servidor.requisicoes = []
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        self.addCleanup(self.servidor.server_close)
+        self.addCleanup(self.servidor.shutdown)
+        self.url = f'http://127.0.0.1:{self.servidor.server_address[1]}/estabelecimentos/'
+
+    def cliente(self, **opcoes):
+        cliente = ClienteCnes(self.url, **opcoes)
+        cliente.sessao.trust_env = False  # sem proxy do ambiente para 127.0.0.1
+        self.addCleanup(cliente.sessao.close)
+        return cliente
+
+    def responder(self, *respostas):
+        self.servidor.respostas.extend(respostas)
+
+    def test_sucesso(self):
+        self.responder((200, {'codigo_cnes': 2345678, 'nome_fantasia': 'UBS Vila Almeida'}, 0))
+        cliente = self.cliente()
+
+        response = cliente.get('2345678')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['nome_fantasia'], 'UBS Vila Almeida')
+        self.assertEqual(self.servidor.requisicoes, ['/estabelecimentos/2345678'])
+        metricas = cliente.metricas()
+        self.assertEqual((metricas['requisicoes'], metricas['sucessos']), (1, 1))
+        self.assertEqual(metricas['circuito'], 'fechado')
+
+    def test_nao_encontrado_nao_conta_como_falha(self):
+        self.responder((404, {}, 0))
+        cliente = self.cliente(limite_falhas=1)
+
+        self.assertEqual(cliente.get('1234567').status_code, 404)
+
+        metricas = cliente.metricas()
+        self.assertEqual(metricas['nao_encontrados'], 1)
+        self.assertEqual(metricas['falhas_seguidas'], 0)
+        self.assertEqual(metricas['circuito'], 'fechado')
+
+    def test_erro_5xx_e_repetido(self):
+        self.responder((503, {}, 0), (200, {'codigo_cnes': 2345678}, 0))
+        cliente = self.cliente(tentativas=1)
+
+        response = cliente.get('2345678')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.servidor.requisicoes), 2)
+        self.assertEqual(cliente.metricas()['sucessos'], 1)
+
+    def test_timeout_de_leitura(self):
+        self.responder((200, {}, 0.5), (200, {}, 0.5))
+        cliente = self.cliente(timeout=(1, 0.1), tentativas=1)
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            cliente.get('2345678')
+
+        # GET lento é repetido uma única vez
+        self.assertEqual(len(self.servidor.requisicoes), 2)
+        metricas = cliente.metricas()
+        self.assertEqual(metricas['timeouts'], 1)
+        self.assertEqual(metricas['falhas_seguidas'], 1)
+
+    def test_disjuntor_abre_e_fecha_apos_chamada_de_teste(self):
+        self.responder((500, {}, 0), (500, {}, 0), (200, {}, 0))
+        cliente = self.cliente(tentativas=0, limite_falhas=2, espera_circuito=0.2)
+
+        cliente.get('2345678')
+        self.assertEqual(cliente.estado(), 'fechado')
+        cliente.get('2345678')
+        self.assertEqual(cliente.estado(), 'aberto')
+
+        # Aberto: recusa sem chamar a API
+        with self.assertRaises(CircuitoAberto):
+            cliente.get('2345678')
+        self.assertEqual(len(self.servidor.requisicoes), 2)
+
+        time.sleep(0.25)
+        self.assertEqual(cliente.estado(), 'meio_aberto')
+        self.assertEqual(cliente.get('2345678').status_code, 200)
+        self.assertEqual(cliente.estado(), 'fechado')
+
+        metricas = cliente.metricas()
+        self.assertEqual(metricas['circuito_aberto_vezes'], 1)
+        self.assertEqual(metricas['recusadas_circuito'], 1)
+        self.assertEqual(metricas['falhas_seguidas'], 0)
+
+    def test_disjuntor_meio_aberto_reabre_na_falha(self):
+        self.responder((500, {}, 0), (500, {}, 0))
+        cliente = self.cliente(tentativas=0, limite_falhas=1, espera_circuito=0.2)
+
+        cliente.get('2345678')
+        self.assertEqual(cliente.estado(), 'aberto')
+        time.sleep(0.25)
+        self.assertEqual(cliente.estado(), 'meio_aberto')
+
+        # A chamada de teste falhou: volta a ficar aberto sem esperar novo limite de falhas
+        cliente.get('2345678')
+        self.assertEqual(cliente.estado(), 'aberto')
+        self.assertEqual(cliente.metricas()['circuito_aberto_vezes'], 2)
+
+    def test_buscar_na_api(self):
+        self.responder((200, {'codigo_cnes': 2345678}, 0), (404, {}, 0))
+        reiniciar_cliente_cnes()
+        self.addCleanup(reiniciar_cliente_cnes)
+
+        with override_settings(CNES_API_URL=self.url):
+            self.assertEqual(buscar_na_api('2345678'), {'codigo_cnes': 2345678})
+            self.assertIsNone(buscar_na_api('1234567'))
+
+
+class TriggersBuscaTests(TestCase):
+    """Triggers FTS5 da busca do histórico (SQLite)"""
+
+    def setUp(self):
+        if backend_busca() != 'sqlite':
+            self.skipTest('busca textual sem FTS5 neste banco')
+        self.usuario = User.objects.create_user('atendente')
+
+    def chamada(self, nome_contato):
+        return RegistroChamada.objects.create(
+            nome_contato=nome_contato, telefone='(67) 3314-0000', tipo_chamada='contato',
+            status='chamada_recebida', nome_atendente='Atendente', descricao='Teste',
+            unidade='UBS Vila Almeida', usuario_criador=self.usuario,
+        )
+
+    def buscar(self, busca):
+        return list(filtrar_por_busca(RegistroChamada.objects.all(), busca).values_list('nome_contato', flat=True))
+
+    def test_recria_triggers_apagados_e_reindexa(self):
+        triggers, _ = definicao_triggers()
+        self.chamada('João Almeida')
+        with connection.cursor() as cursor:
+            for nome in triggers:
+                cursor.execute(f'DROP TRIGGER {nome}')
+        # Sem trigger, a chamada nova não entra no índice
+        self.chamada('Maria Conceição')
+        self.assertEqual(self.buscar('maria'), [])
+
+        self.assertEqual(sorted(garantir_triggers_fts()), sorted(triggers))
+
+        self.assertEqual(self.buscar('conceicao'), ['Maria Conceição'])
+        self.assertEqual(self.buscar('joao'), ['João Almeida'])
+        self.chamada('Mariana Souza')
+        self.assertEqual(sorted(self.buscar('mari')), ['Maria Conceição', 'Mariana Souza'])
+        self.assertEqual(garantir_triggers_fts(), [])
+
+    def test_substitui_trigger_diferente_da_migracao(self):
+        nome = f'{TABELA_FTS}_ai'
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TRIGGER {nome}')
+            cursor.execute(f'CREATE TRIGGER {nome} AFTER INSERT ON accounts_registrochamada BEGIN SELECT 1; END')
+        self.chamada('Maria Conceição')
+        self.assertEqual(self.buscar('maria'), [])
+
+        self.assertEqual(garantir_triggers_fts(), [nome])
+
+        self.assertEqual(self.buscar('maria'), ['Maria Conceição'])
+        self.chamada('Mariana Souza')
+        self.assertEqual(sorted(self.buscar('mari')), ['Maria Conceição', 'Mariana Souza'])
+
+
+@override_settings(EXPORTACAO_WORKER_EM_PROCESSO=False)
+class FilaExportacaoTests(TestCase):
+    """Reserva, batimento e reenfileiramento das tarefas de exportação"""
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        midia = override_settings(MEDIA_ROOT=diretorio.name)
+        midia.enable()
+        self.addCleanup(midia.disable)
+        self.usuario = User.objects.create_user('atendente')
+
+    def envelhecer(self, tarefa, minutos=60):
+        TarefaExportacao.objects.filter(id=tarefa.id).update(batimento_em=timezone.now() - timedelta(minutes=minutos))
+
+    def gerar(self, conteudo=b'id;nome\n'):
+        return mock.patch(
+            'accounts.tarefas_exportacao.gerar_resposta',
+            return_value=(HttpResponse(conteudo, content_type='text/csv'), 'historico.csv'),
+        )
+
+    def test_tarefa_reservada_uma_unica_vez(self):
+        enfileirar_exportacao(self.usuario, 'historico_excel')
+
+        tarefa = reservar_proxima_tarefa()
+
+        self.assertEqual(tarefa.status, TarefaExportacao.STATUS_PROCESSANDO)
+        self.assertIsNotNone(tarefa.batimento_em)
+        self.assertIsNone(reservar_proxima_tarefa())
+
+    def test_reenfileira_pelo_batimento_e_nao_pela_idade(self):
+        enfileirar_exportacao(self.usuario, 'historico_excel')
+        tarefa = reservar_proxima_tarefa()
+        # Iniciada há muito tempo, mas o worker continua dando sinal: não volta à fila
+        TarefaExportacao.objects.filter(id=tarefa.id).update(iniciado_em=timezone.now() - timedelta(hours=3))
+        self.assertEqual(recuperar_tarefas_travadas(), 0)
+
+        self.envelhecer(tarefa)
+        self.assertEqual(recuperar_tarefas_travadas(), 1)
+        tarefa.refresh_from_db()
+        self.assertEqual((tarefa.status, tarefa.tentativas), (TarefaExportacao.STATUS_PENDENTE, 1))
+
+    def test_execucao_reenfileirada_nao_sobrescreve_a_nova(self):
+        enfileirar_exportacao(self.usuario, 'historico_excel')
+        antiga = reservar_proxima_tarefa()
+        self.envelhecer(antiga)
+        recuperar_tarefas_travadas()
+        nova = reservar_proxima_tarefa()
+        self.assertEqual(nova.tentativas, 1)
+
+        # A execução antiga termina depois do reenfileiramento: nada é gravado
+        with self.gerar(b'antigo'):
+            executar_tarefa(antiga)
+        self.assertFalse(atualizar_progresso(antiga, 50))
+        registro = TarefaExportacao.objects.get(id=nova.id)
+        self.assertEqual(registro.status, TarefaExportacao.STATUS_PROCESSANDO)
+        self.assertFalse(registro.arquivo)
+
+        with self.gerar(b'novo'):
+            executar_tarefa(nova)
+        registro.refresh_from_db()
+        self.assertEqual(registro.status, TarefaExportacao.STATUS_CONCLUIDA)
+        with registro.arquivo.open('rb') as arquivo:
+            self.assertEqual(arquivo.read(), b'novo')
+
+        # E um erro na execução antiga não marca a tarefa concluída como erro
+        with mock.patch('accounts.tarefas_exportacao.gerar_resposta', side_effect=RuntimeError('falhou')):
+            executar_tarefa(antiga)
+        registro.refresh_from_db()
+        self.assertEqual(registro.status, TarefaExportacao.STATUS_CONCLUIDA)
+
+    def test_limite_de_tentativas_marca_erro(self):
+        enfileirar_exportacao(self.usuario, 'historico_excel')
+        for _ in range(settings.EXPORTACAO_MAX_TENTATIVAS):
+            tarefa = reservar_proxima_tarefa()
+            self.envelhecer(tarefa)
+            recuperar_tarefas_travadas()
+        tarefa.refresh_from_db()
+        self.assertEqual(tarefa.status, TarefaExportacao.STATUS_ERRO)
+        self.assertIsNone(reservar_proxima_tarefa())
+
+
+class PaginacaoCursorTests(TestCase):
+    """Histórico paginado por (data_criacao, id)"""
+
+    def setUp(self):
+        self.usuario = User.objects.create_user('atendente')
+
+    def chamada(self):
+        return RegistroChamada.objects.create(
+            nome_contato='Contato', telefone='(67) 3314-0000', tipo_chamada='contato',
+            status='chamada_recebida', nome_atendente='Atendente', descricao='Chamada',
+            unidade='UBS Vila Almeida', usuario_criador=self.usuario,
+        )
+
+    def test_empates_de_data_na_borda_da_pagina(self):
+        ids = [self.chamada().id for _ in range(5)]
+        RegistroChamada.objects.update(data_criacao=timezone.now().replace(microsecond=0))
+        antiga = self.chamada()
+        RegistroChamada.objects.filter(id=antiga.id).update(data_criacao=timezone.now() - timedelta(days=1))
+
+        for limite in (1, 2, 3):
+            with self.subTest(limite=limite):
+                vistas, cursor = [], None
+                while True:
+                    itens, cursor = paginar_por_cursor(RegistroChamada.objects.all(), cursor, limite)
+                    vistas += [item.id for item in itens]
+                    if cursor is None:
+                        break
+                # Mesma data: id decrescente; a chamada mais antiga por último
+                self.assertEqual(vistas, sorted(ids, reverse=True) + [antiga.id])
+
+    def test_cursor_invalido(self):
+        for cursor in ('nao-e-base64!', codificar_cursor_relevancia(0.5, 1)):
+            with self.subTest(cursor=cursor), self.assertRaises(CursorInvalido):
+                paginar_por_cursor(RegistroChamada.objects.all(), cursor)
+
+    @override_settings(FUSO_HORARIO_CALENDARIO='America/Campo_Grande')
+    def test_data_serializada_no_fuso_do_calendario(self):
+        chamada = self.chamada()
+        chamada.data_criacao = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
+        # 12:00 UTC é 08:00 em Campo Grande (TIME_ZONE, São Paulo, daria 09:00)
+        self.assertEqual(serializar_chamada_historico(chamada)['data_criacao'], '15/01/2025 08:00')
+
+
+class PaginacaoRelevanciaTests(TestCase):
+    """Busca do histórico paginada por (relevancia, id)"""
+
+    def setUp(self):
+        self.usuario = User.objects.create_user('atendente')
+
+    def chamada(self, descricao):
+        return RegistroChamada.objects.create(
+            nome_contato='Contato', telefone='(67) 3314-0000', tipo_chamada='contato',
+            status='chamada_recebida', nome_atendente='Atendente', descricao=descricao,
+            unidade='UBS Vila Almeida', usuario_criador=self.usuario,
+        )
+
+    def paginas(self, busca, limite):
+        chamadas = anotar_relevancia(filtrar_por_busca(RegistroChamada.objects.all(), busca), busca)
+        vistas, cursor = [], None
+        while True:
+            itens, cursor = paginar_por_relevancia(chamadas, cursor, limite)
+            vistas += [item.id for item in itens]
+            if cursor is None:
+                return vistas
+
+    def test_empates_de_relevancia_na_borda_da_pagina(self):
+        # Textos iguais têm exatamente a mesma relevância: as páginas cortam no meio do empate
+        empatadas = [self.chamada('Sistema lento na regulação').id for _ in range(5)]
+        melhores = [self.chamada('Sistema lento, lento desde cedo').id for _ in range(2)]
+        self.chamada('Sem relação com a busca')
+
+        for limite in (1, 2, 3):
+            with self.subTest(limite=limite):
+                vistas = self.paginas('lento', limite)
+                self.assertEqual(len(vistas), len(set(vistas)))
+                self.assertEqual(set(vistas), set(empatadas + melhores))
+                if backend_busca() is not None:
+                    # Mais ocorrências primeiro; empates em ordem decrescente de id
+                    self.assertEqual(vistas, sorted(melhores, reverse=True) + sorted(empatadas, reverse=True))
+
+    def test_cursor_invalido(self):
+        chamadas = anotar_relevancia(RegistroChamada.objects.all(), 'lento')
+        for cursor in ('nao-e-base64!', codificar_cursor(timezone.now(), 1)):
+            with self.subTest(cursor=cursor), self.assertRaises(CursorInvalido):
+                paginar_por_relevancia(chamadas, cursor)
+
+
+@override_settings(UNIDADES_CACHE_ALIAS='default', UNIDADES_VERSAO_INTERVALO=60, UNIDADES_LEITURA_IDADE_MAXIMA=300)
+class ModeloUnidadesTests(TestCase):
+    """Invalidação do modelo de leitura das unidades"""
+
+    def setUp(self):
+        self.reiniciar()
+        self.addCleanup(self.reiniciar)
+
+    def reiniciar(self):
+        leitura_unidades._modelo = None
+        leitura_unidades._versao = None
+        leitura_unidades._cache().delete(CHAVE_VERSAO)
+
+    def unidade(self, nome):
+        with self.captureOnCommitCallbacks(execute=True):
+            return UnidadeSaude.objects.create(nome=nome, endereco='Rua A', telefone='6733140000', horario_funcionamento='24h')
+
+    def nomes(self):
+        return [unidade.nome for unidade in modelo_unidades().unidades]
+
+    def test_alteracao_no_processo_recarrega_na_hora(self):
+        self.unidade('UBS Centro')
+        self.assertEqual(self.nomes(), ['UBS Centro'])
+
+        nova = self.unidade('UBS Vila Nova')
+        self.assertEqual(self.nomes(), ['UBS Centro', 'UBS Vila Nova'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            nova.delete()
+        self.assertEqual(self.nomes(), ['UBS Centro'])
+
+    def test_versao_de_outro_processo_lida_so_depois_do_intervalo(self):
+        self.unidade('UBS Centro')
+        modelo = modelo_unidades()
+        # Outro worker alterou a tabela e gravou uma nova versão no cache compartilhado
+        UnidadeSaude.objects.create(nome='UBS Outro Worker', endereco='Rua B', telefone='1', horario_funcionamento='24h')
+        leitura_unidades._cache().set(CHAVE_VERSAO, 'outro-worker', timeout=None)
+
+        with self.assertNumQueries(0):
+            self.assertIs(modelo_unidades(), modelo)
+
+        with override_settings(UNIDADES_VERSAO_INTERVALO=0):
+            self.assertEqual(self.nomes(), ['UBS Centro', 'UBS Outro Worker'])
+            self.assertEqual(modelo_unidades().versao, 'outro-worker')
+
+    def test_modelo_velho_e_recarregado_fora_da_requisicao(self):
+        self.unidade('UBS Centro')
+        modelo = modelo_unidades()
+        modelo.carregado_em -= 301
+
+        with mock.patch.object(leitura_unidades, 'recarregar_em_segundo_plano') as recarregar, \
+                self.assertNumQueries(0):
+            self.assertIs(modelo_unidades(), modelo)
+        recarregar.assert_called_once_with(modelo.versao)
+
+
+class CacheCompartilhadoTests(SimpleTestCase):
+    """Caches atualizados por sinais precisam ser vistos por todos os workers"""
+
+    def configuracao(self, workers, alias):
+        return override_settings(WEB_WORKERS=workers, ESTATISTICAS_CACHE_ALIAS=alias, UNIDADES_CACHE_ALIAS=alias)
+
+    def test_locmem_com_varios_workers_e_recusado(self):
+        for verificar in (verificar_cache_estatisticas, verificar_cache_versoes):
+            with self.subTest(verificar=verificar.__name__):
+                with self.configuracao(2, 'default'), self.assertRaises(ImproperlyConfigured):
+                    verificar()
+                with self.configuracao(1, 'default'):
+                    verificar()
+                with self.configuracao(2, 'versoes'):
+                    verificar()
@@ -19,12 +19,17 @@ urlpatterns = [
     path('unidades-saude/export-pdf/', views.export_unidades_pdf, name='export_unidades_pdf'),
     path('unidades-saude/export-excel/', views.export_unidades_excel, name='export_unidades_excel'),
     path('unidades-saude/export-csv/', views.export_unidades_csv, name='export_unidades_csv'),
+    path('api/cnes/metricas/', views.api_cnes_metricas, name='api_cnes_metricas'),
     path('api/cnes/<str:codigo_cnes>/', views.consultar_cnes_api, name='consultar_cnes_api'),
     path('api/unidade-saude/', views.consultar_unidade_saude_api, name='consultar_unidade_saude_api'),
     path('historico/', views.historico_chamadas, name='historico_chamadas'),
+    path('api/historico/', views.api_historico_chamadas, name='api_historico_chamadas'),
     path('historico/export-pdf/', views.export_historico_pdf_simples, name='export_historico_pdf'),
     path('historico/export-excel/', views.export_historico_excel, name='export_historico_excel'),
     path('historico/export-csv/', views.export_historico_csv, name='export_historico_csv'),
+    path('api/exportacoes/', views.api_exportacoes, name='api_exportacoes'),
+    path('api/exportacoes/<int:tarefa_id>/', views.api_exportacao_status, name='api_exportacao_status'),
+    path('exportacoes/<int:tarefa_id>/download/', views.download_exportacao, name='download_exportacao'),
     path('chamada/<int:chamada_id>/detalhes/', views.visualizar_detalhes_chamada, name='visualizar_detalhes_chamada'),
     path('chamada/<int:chamada_id>/editar-form/', views.editar_chamada_form, name='editar_chamada_form'),
     path('api/editar-chamada/', views.editar_chamada_api, name='editar_chamada_api'),
@@ -58,6 +63,7 @@ urlpatterns = [
     path('remove-avatar/', views.remove_avatar, name='remove_avatar'),
     path('lista-telefonica/', views.lista_telefonica, name='lista_telefonica'),
     path('api/lista-telefonica/', views.api_lista_telefonica, name='api_lista_telefonica'),
+    path('api/unidades/autocomplete/', views.api_unidades_autocomplete, name='api_unidades_autocomplete'),
     path('test-react/', views.test_react_view, name='test_react'),
     path('debug-console/', views.debug_console_view, name='debug_console'),
     path('test-react-validation/', views.test_react_validation_view, name='test_react_validation'),
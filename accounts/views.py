@@ -6,16 +6,32 @@ from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse, HttpResponse
-from .models import RegistroChamada, UnidadeSaude, UserProfile
+from django.http import FileResponse, Http404, JsonResponse, HttpResponse
+from .models import (
+    RegistroChamada,
+    TarefaExportacao,
+    UnidadeSaude,
+    UserProfile,
+    resolver_unidade_saude,
+)
+from .exportacao import aba_de_registros, iterar_valores, resposta_csv_streaming, resposta_xlsx
+from .filtros_historico import filtrar_chamadas, hash_filtros, ler_filtros_historico
+from .busca_chamadas import anotar_relevancia
+from .indice_unidades import CANDIDATOS_PADRAO, PONTUACAO_MINIMA, indice_unidades
+from .leitura_unidades import modelo_unidades
+from .paginacao import CursorInvalido, paginar_por_cursor, paginar_por_relevancia, tamanho_pagina
+from .cnes import CircuitoAberto, ErroApiCnes, cliente_cnes, consultar_cnes, limpar_codigo_cnes, padronizar_dados_cnes
+from .recursos_pdf import gerar_pdf_em_partes, imagem_pdf, tabelas_em_blocos
+from .tarefas_exportacao import enfileirar_exportacao, serializar_tarefa, usuario_pode_exportar
+from .periodos import filtro_ano, filtro_datas, filtro_dia, filtro_mes, fuso_calendario, hoje as hoje_calendario
+from .estatisticas import anotar_atividade_usuarios, obter_estatisticas_dashboard, obter_estatisticas_usuarios, serie_mensal, unidades_mais_ativas, usuarios_por_mes
 from django.utils import timezone
 import json
 import requests
 from django.db.models import Q
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 import csv
-import pandas as pd
 import io
 import os
 from django.conf import settings
@@ -29,7 +45,7 @@ from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
 from django.core.paginator import Paginator
-from django.db.models import Count
+from django.db.models import Count, Max
 from datetime import datetime, timedelta
 import calendar
 
@@ -58,35 +74,8 @@ def test_react_validation_view(request):
 @login_required
 def home_debug_view(request):
     """Página de debug para diagnosticar problemas na página principal"""
-    from .models import UnidadeSaude, RegistroChamada
-    from django.utils import timezone
-    
-    # Estatísticas das unidades de saúde
-    total_unidades = UnidadeSaude.objects.count()
-    executantes = UnidadeSaude.objects.filter(tipo='UNIDADE_EXECUTANTE').count()
-    solicitantes = UnidadeSaude.objects.filter(tipo='UNIDADE_SOLICITANTE').count()
-    executante_solicitante = UnidadeSaude.objects.filter(tipo='EXECUTANTE_SOLICITANTE').count()
-    
-    # Estatísticas das chamadas
-    total_chamadas = RegistroChamada.objects.count()
-    chamadas_hoje = RegistroChamada.objects.filter(
-        data_criacao__date=timezone.now().date()
-    ).count()
-    chamadas_mes = RegistroChamada.objects.filter(
-        data_criacao__month=timezone.now().month,
-        data_criacao__year=timezone.now().year
-    ).count()
-    
     context = {
-        'estatisticas': {
-            'total_unidades': total_unidades,
-            'executantes': executantes,
-            'solicitantes': solicitantes,
-            'executante_solicitante': executante_solicitante,
-            'total_chamadas': total_chamadas,
-            'chamadas_hoje': chamadas_hoje,
-            'chamadas_mes': chamadas_mes,
-        },
+        'estatisticas': obter_estatisticas_dashboard(),
         'usuario': request.user,
     }
     
@@ -112,21 +101,8 @@ class HomeView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Estatísticas das unidades de saúde
-        total_unidades = UnidadeSaude.objects.count()
-        executantes = UnidadeSaude.objects.filter(tipo='UNIDADE_EXECUTANTE').count()
-        solicitantes = UnidadeSaude.objects.filter(tipo='UNIDADE_SOLICITANTE').count()
-        executante_solicitante = UnidadeSaude.objects.filter(tipo='EXECUTANTE_SOLICITANTE').count()
-        
-        # Estatísticas das chamadas
-        total_chamadas = RegistroChamada.objects.count()
-        chamadas_hoje = RegistroChamada.objects.filter(
-            data_criacao__date=timezone.now().date()
-        ).count()
-        chamadas_mes = RegistroChamada.objects.filter(
-            data_criacao__month=timezone.now().month,
-            data_criacao__year=timezone.now().year
-        ).count()
+        # Estatísticas das unidades e chamadas (uma consulta por tabela)
+        estatisticas = obter_estatisticas_dashboard()
         
         # Últimas unidades cadastradas
         ultimas_unidades = UnidadeSaude.objects.order_by('-created_at')[:3]
@@ -135,15 +111,7 @@ class HomeView(LoginRequiredMixin, TemplateView):
         ultimas_chamadas = RegistroChamada.objects.order_by('-data_criacao')[:5]
         
         context.update({
-            'estatisticas': {
-                'total_unidades': total_unidades,
-                'executantes': executantes,
-                'solicitantes': solicitantes,
-                'executante_solicitante': executante_solicitante,
-                'total_chamadas': total_chamadas,
-                'chamadas_hoje': chamadas_hoje,
-                'chamadas_mes': chamadas_mes,
-            },
+            'estatisticas': estatisticas,
             'ultimas_unidades': ultimas_unidades,
             'ultimas_chamadas': ultimas_chamadas,
             'usuario': self.request.user,
@@ -188,6 +156,7 @@ class RegistroChamadaReactView(RegistroChamadaView):
                 municipio=data.get('municipio', ''),
                 cnes=data.get('cnes', ''),
                 contato_telefonico_cnes=data.get('contato_telefonico_cnes', ''),
+                unidade_saude=resolver_unidade_saude(data.get('cnes'), data.get('unidade')),
                 
                 # Dados da Chamada
                 tipo_chamada=data.get('tipo_chamada', ''),
@@ -230,49 +199,24 @@ class RegistroChamadaReactView(RegistroChamadaView):
 @login_required
 def unidades_saude(request):
     """Lista todas as unidades de saúde com interface React moderna"""
-    import json
     from django.core.serializers.json import DjangoJSONEncoder
-    
-    unidades = UnidadeSaude.objects.all().order_by('nome')
+
+    # Unidades e JSON vêm do modelo de leitura em memória (serializado uma vez por versão)
+    modelo = modelo_unidades()
     
     # Calcular estatísticas por tipo
-    total_unidades = unidades.count()
-    executantes = unidades.filter(tipo='UNIDADE_EXECUTANTE').count()
-    solicitantes = unidades.filter(tipo='UNIDADE_SOLICITANTE').count()
-    executante_solicitante = unidades.filter(tipo='EXECUTANTE_SOLICITANTE').count()
-    
-    # Serializar unidades para JSON
-    unidades_data = []
-    for unidade in unidades:
-        # Sanitizar dados para evitar problemas de JSON
-        unidade_data = {
-            'id': unidade.id,
-            'nome': str(unidade.nome).replace('"', '\\"').replace("'", "\\'") if unidade.nome else '',
-            'municipio': str(unidade.municipio or 'Não informado').replace('"', '\\"').replace("'", "\\'"),
-            'cnes': str(unidade.cnes or '').replace('"', '\\"').replace("'", "\\'"),
-            'tipo': str(unidade.tipo).replace('"', '\\"').replace("'", "\\'"),
-            'contato_telefonico': str(unidade.contato_telefonico or '').replace('"', '\\"').replace("'", "\\'"),
-            'endereco': str(unidade.endereco).replace('"', '\\"').replace("'", "\\'") if unidade.endereco else '',
-            'telefone': str(unidade.telefone).replace('"', '\\"').replace("'", "\\'") if unidade.telefone else '',
-            'responsavel': str(unidade.responsavel or 'Não informado').replace('"', '\\"').replace("'", "\\'"),
-            'email': str(unidade.email or '').replace('"', '\\"').replace("'", "\\'"),
-            'horario_funcionamento': str(unidade.horario_funcionamento or '').replace('"', '\\"').replace("'", "\\'"),
-            'servicos_emergencia': bool(unidade.servicos_emergencia),
-            'created_at': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S'),
-            'usuario_cadastrante': str(unidade.usuario_cadastrante.username if unidade.usuario_cadastrante else 'Sistema').replace('"', '\\"').replace("'", "\\'")
-        }
-        unidades_data.append(unidade_data)
+    contadores = obter_estatisticas_dashboard()
     
     estatisticas = {
-        'total': total_unidades,
-        'executantes': executantes,
-        'solicitantes': solicitantes,
-        'executante_solicitante': executante_solicitante,
+        'total': contadores['total_unidades'],
+        'executantes': contadores['executantes'],
+        'solicitantes': contadores['solicitantes'],
+        'executante_solicitante': contadores['executante_solicitante'],
     }
     
     context = {
-        'unidades': unidades,  # Para compatibilidade com template original se necessário
-        'unidades_json': json.dumps(unidades_data, cls=DjangoJSONEncoder),
+        'unidades': modelo.unidades,  # Para compatibilidade com template original se necessário
+        'unidades_json': modelo.json_lista_unidades(),
         'estatisticas': estatisticas,
         'estatisticas_json': json.dumps(estatisticas, cls=DjangoJSONEncoder),
     }
@@ -464,15 +408,14 @@ from reportlab.lib.units import mm
 class CustomDocTemplate(BaseDocTemplate):
     """Template personalizado para PDFs com cabeçalho e rodapé"""
     
+    # Imagens do cabeçalho/rodapé (static/images), carregadas uma vez por processo
+    IMAGEM_BRASAO = 'brasao_ms.png'
+    IMAGEM_LOGO_NOVA = 'logo nova.jpeg'
+    IMAGEM_IGPR = 'igpr.png'
+    
     def __init__(self, filename, **kwargs):
         BaseDocTemplate.__init__(self, filename, **kwargs)
         
-        # Caminhos das imagens
-        static_path = os.path.join(settings.BASE_DIR, 'static', 'images')
-        self.brasao_path = os.path.join(static_path, 'brasao_ms.png')
-        self.logo_nova_path = os.path.join(static_path, 'logo nova.jpeg')
-        self.igpr_path = os.path.join(static_path, 'igpr.png')
-        
         # Configurar template da página
         frame = Frame(
             72, 72, 
@@ -484,65 +427,132 @@ class CustomDocTemplate(BaseDocTemplate):
         self.addPageTemplates([template])
     
     def add_page_decorations(self, canvas, doc):
-        """Adiciona cabeçalho e rodapé em cada página"""
+        """
+        Adiciona cabeçalho e rodapé em cada página. As imagens são desenhadas uma única
+        vez por documento em um Form XObject; cada página apenas o referencia.
+        """
         try:
             # Obter dimensões da página atual
             page_width = canvas._pagesize[0]
             page_height = canvas._pagesize[1]
             
-            # Cabeçalho - Brasão MS (esquerda) - Ajustado para paisagem
-            if os.path.exists(self.brasao_path):
-                canvas.drawImage(
-                    self.brasao_path, 
-                    50, page_height - 100,  # Posição superior esquerda
-                    width=80, height=80,  # Tamanho reduzido para paisagem
-                    preserveAspectRatio=True
-                )
-            
-            # Cabeçalho - Logo Nova (direita) - Ajustado para paisagem
-            if os.path.exists(self.logo_nova_path):
-                canvas.drawImage(
-                    self.logo_nova_path, 
-                    page_width - 130, page_height - 100,  # Posição superior direita
-                    width=120, height=80,  # Tamanho ajustado para paisagem
-                    preserveAspectRatio=True
-                )
-            
-            # Rodapé - IGPR (centralizada) - Ajustado para paisagem
-            if os.path.exists(self.igpr_path):
-                canvas.drawImage(
-                    self.igpr_path, 
-                    (page_width - 120) / 2, 15,  # Posição centralizada no rodapé
-                    width=120, height=60,  # Tamanho ajustado para paisagem
-                    preserveAspectRatio=True
-                )
+            nome_form = f'decoracoes_{int(page_width)}x{int(page_height)}'
+            if not canvas.hasForm(nome_form):
+                canvas.beginForm(nome_form)
+                self.desenhar_decoracoes(canvas, page_width, page_height)
+                canvas.endForm()
+            canvas.doForm(nome_form)
                 
         except Exception as e:
             print(f"Erro ao adicionar decorações da página: {e}")
+    
+    def desenhar_decoracoes(self, canvas, page_width, page_height):
+        # Cabeçalho - Brasão MS (esquerda) - Ajustado para paisagem
+        brasao = imagem_pdf(self.IMAGEM_BRASAO)
+        if brasao:
+            canvas.drawImage(
+                brasao, 
+                50, page_height - 100,  # Posição superior esquerda
+                width=80, height=80,  # Tamanho reduzido para paisagem
+                preserveAspectRatio=True
+            )
+        
+        # Cabeçalho - Logo Nova (direita) - Ajustado para paisagem
+        logo_nova = imagem_pdf(self.IMAGEM_LOGO_NOVA)
+        if logo_nova:
+            canvas.drawImage(
+                logo_nova, 
+                page_width - 130, page_height - 100,  # Posição superior direita
+                width=120, height=80,  # Tamanho ajustado para paisagem
+                preserveAspectRatio=True
+            )
+        
+        # Rodapé - IGPR (centralizada) - Ajustado para paisagem
+        igpr = imagem_pdf(self.IMAGEM_IGPR)
+        if igpr:
+            canvas.drawImage(
+                igpr, 
+                (page_width - 120) / 2, 15,  # Posição centralizada no rodapé
+                width=120, height=60,  # Tamanho ajustado para paisagem
+                preserveAspectRatio=True
+            )
 
 def adicionar_cabecalho_pdf(story):
     """Função auxiliar para adicionar espaçamento após o cabeçalho"""
     # Apenas adiciona espaçamento, pois as imagens são adicionadas pelo template
     story.append(Spacer(1, 40))
 
-@login_required
-def export_historico_pdf_simples(request):
-    """Exportar histórico de chamadas em PDF - Versão Simples e Funcional"""
-    try:
-        import pytz
-        from reportlab.lib.pagesizes import A4, landscape
-        
-        response = HttpResponse(content_type='application/pdf')
-        response['Content-Disposition'] = 'attachment; filename="historico_chamadas.pdf"'
-        
-        # Usar SimpleDocTemplate simples em orientação paisagem
-        doc = SimpleDocTemplate(response, pagesize=landscape(A4), 
-                              leftMargin=30, rightMargin=30, 
-                              topMargin=80, bottomMargin=80)
-        elements = []
-        
+# Tabela do PDF do histórico: poucas colunas para caber em A4 paisagem
+CABECALHO_PDF_HISTORICO = ['Data/Hora', 'Contato', 'Telefone', 'Unidade', 'Município', 'Tipo', 'Status']
+
+LARGURAS_PDF_HISTORICO = [
+    1.0*inch,   # Data/Hora
+    1.5*inch,   # Contato
+    1.0*inch,   # Telefone
+    2.0*inch,   # Unidade (maior)
+    1.0*inch,   # Município
+    1.5*inch,   # Tipo
+    0.8*inch    # Status
+]  # Total: ~8.8 inches (cabe bem em A4 paisagem)
+
+# Um único TableStyle compartilhado por todos os blocos da tabela
+ESTILO_PDF_HISTORICO = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 7),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 3),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+def abreviar(texto, limite):
+    texto = texto or ''
+    return texto[:limite] + '...' if len(texto) > limite else texto
+
+def linhas_pdf_historico(chamadas):
+    """Linhas da tabela do PDF do histórico, lidas do banco em lotes"""
+    tipos = dict(RegistroChamada.TIPO_CHOICES)
+    status = dict(RegistroChamada.STATUS_CHOICES)
+    campos = ('data_criacao', 'nome_contato', 'telefone', 'unidade', 'municipio', 'tipo_chamada', 'status')
+    fuso = fuso_calendario()
+    for (data_criacao, nome_contato, telefone, unidade, municipio,
+         tipo_chamada, status_chamada) in iterar_valores(chamadas, *campos):
+        # Converter data para o fuso horário local
+        data_local = timezone.localtime(data_criacao, fuso)
+        
+        yield [
+            data_local.strftime('%d/%m/%Y\n%H:%M'),  # Quebra de linha para economizar espaço
+            abreviar(nome_contato, 20),
+            abreviar(telefone, 15),
+            abreviar(unidade, 30),
+            abreviar(municipio, 15),
+            abreviar(tipos.get(tipo_chamada) or tipo_chamada, 20),
+            status.get(status_chamada, status_chamada),
+        ]
+
+def documento_pdf_historico(destino):
+    from reportlab.lib.pagesizes import A4, landscape
+    
+    # Usar SimpleDocTemplate simples em orientação paisagem
+    return SimpleDocTemplate(destino, pagesize=landscape(A4), 
+                             leftMargin=30, rightMargin=30, 
+                             topMargin=80, bottomMargin=80)
+
+def elementos_pdf_historico(linhas, primeira_parte=True):
+    """Flowables do PDF do histórico: título (só na primeira parte) e a tabela em blocos"""
+    if primeira_parte:
         # Adicionar apenas espaçamento no topo (sem imagens por enquanto para evitar embaralhamento)
-        elements.append(Spacer(1, 30))
+        yield Spacer(1, 30)
         
         # Estilos
         styles = getSampleStyleSheet()
@@ -556,68 +566,42 @@ def export_historico_pdf_simples(request):
         )
         
         # Título
-        elements.append(Paragraph("Relatório de Histórico de Chamadas", title_style))
-        
-        # Usar fuso horário de Campo Grande/MS
-        campo_grande_tz = pytz.timezone('America/Campo_Grande')
-        agora_local = timezone.now().astimezone(campo_grande_tz)
+        yield Paragraph("Relatório de Histórico de Chamadas", title_style)
         
-        elements.append(Paragraph(f"Gerado em: {agora_local.strftime('%d/%m/%Y às %H:%M')} (Campo Grande/MS)", styles['Normal']))
-        elements.append(Spacer(1, 20))
-        
-        # Query base - sem filtros para evitar erros
-        chamadas = RegistroChamada.objects.all().order_by('-data_criacao')
+        # Usar fuso horário do calendário (Campo Grande/MS)
+        agora_local = timezone.localtime(timezone.now(), fuso_calendario())
         
-        # Preparar dados para a tabela com MENOS colunas para caber na página
-        # Reduzir para apenas as colunas mais importantes
-        data = [['Data/Hora', 'Contato', 'Telefone', 'Unidade', 'Município', 'Tipo', 'Status']]
-        for chamada in chamadas:
-            # Converter data para fuso horário local
-            data_local = chamada.data_criacao.astimezone(campo_grande_tz)
-            
-            data.append([
-                data_local.strftime('%d/%m/%Y\n%H:%M'),  # Quebra de linha para economizar espaço
-                chamada.nome_contato[:20] + '...' if len(chamada.nome_contato) > 20 else chamada.nome_contato,
-                chamada.telefone[:15] + '...' if len(chamada.telefone) > 15 else chamada.telefone,
-                chamada.unidade[:30] + '...' if len(chamada.unidade) > 30 else chamada.unidade,
-                chamada.municipio[:15] + '...' if chamada.municipio and len(chamada.municipio) > 15 else (chamada.municipio or ''),
-                (chamada.get_tipo_chamada_display() or chamada.tipo_chamada)[:20] + '...' if len(chamada.get_tipo_chamada_display() or chamada.tipo_chamada) > 20 else (chamada.get_tipo_chamada_display() or chamada.tipo_chamada),
-                chamada.get_status_display()
-            ])
+        yield Paragraph(f"Gerado em: {agora_local.strftime('%d/%m/%Y às %H:%M')} (Campo Grande/MS)", styles['Normal'])
+        yield Spacer(1, 20)
+    
+    yield from tabelas_em_blocos(
+        CABECALHO_PDF_HISTORICO, linhas,
+        ESTILO_PDF_HISTORICO, col_widths=LARGURAS_PDF_HISTORICO,
+    )
+
+def gerar_pdf_historico(chamadas, destino, processos=None, linhas_por_parte=None):
+    """
+    Grava em `destino` o PDF do histórico. A tabela é dividida em blocos de tamanho fixo
+    criados durante o build, então tempo e memória crescem linearmente com as chamadas.
+    Com settings.PDF_PROCESSOS > 1 (ou `processos`), relatórios longos são renderizados
+    em partes paralelas (ver recursos_pdf.gerar_pdf_em_partes).
+    """
+    gerar_pdf_em_partes(
+        destino, documento_pdf_historico, elementos_pdf_historico,
+        linhas_pdf_historico(chamadas), processos=processos, linhas_por_parte=linhas_por_parte,
+    )
+
+@login_required
+def export_historico_pdf_simples(request):
+    """Exportar histórico de chamadas em PDF - Versão Simples e Funcional"""
+    try:
+        response = HttpResponse(content_type='application/pdf')
+        response['Content-Disposition'] = 'attachment; filename="historico_chamadas.pdf"'
         
-        # Criar tabela com larguras específicas para 7 colunas (mais fácil de caber)
-        col_widths = [
-            1.0*inch,   # Data/Hora
-            1.5*inch,   # Contato
-            1.0*inch,   # Telefone
-            2.0*inch,   # Unidade (maior)
-            1.0*inch,   # Município
-            1.5*inch,   # Tipo
-            0.8*inch    # Status
-        ]  # Total: ~8.8 inches (cabe bem em A4 paisagem)
-        
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 3),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ]))
+        # Aplicar os mesmos filtros da página de histórico
+        chamadas = aplicar_filtros_seguros(RegistroChamada.objects.all(), request).order_by('-data_criacao')
         
-        elements.append(table)
-        doc.build(elements)
+        gerar_pdf_historico(chamadas, response)
         return response
     
     except Exception as e:
@@ -640,67 +624,7 @@ def export_historico_pdf_simples(request):
 
 def aplicar_filtros_seguros(chamadas, request):
     """Função auxiliar para aplicar filtros de forma segura"""
-    # Aplicar os mesmos filtros da página de histórico
-    tipo_filtro = request.GET.get('tipo')
-    status_filtro = request.GET.get('status')
-    data_inicio = request.GET.get('data_inicio')
-    data_fim = request.GET.get('data_fim')
-    busca = request.GET.get('busca')
-    
-    # Função auxiliar para validar valores
-    def is_valid_value(value):
-        if not value:
-            return False
-        str_value = str(value).strip().lower()
-        return str_value not in ['none', 'null', '', 'undefined']
-    
-    # Aplicar filtros com validação segura
-    if is_valid_value(tipo_filtro):
-        chamadas = chamadas.filter(tipo_chamada=tipo_filtro)
-    
-    if is_valid_value(status_filtro):
-        chamadas = chamadas.filter(status=status_filtro)
-    
-    if is_valid_value(data_inicio):
-        try:
-            from datetime import datetime
-            # Tentar diferentes formatos de data
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']:
-                try:
-                    data_inicio_obj = datetime.strptime(str(data_inicio).strip(), fmt).date()
-                    chamadas = chamadas.filter(data_criacao__date__gte=data_inicio_obj)
-                    break
-                except ValueError:
-                    continue
-        except Exception as e:
-            print(f"Erro ao processar data_inicio: {e}")
-            pass
-    
-    if is_valid_value(data_fim):
-        try:
-            from datetime import datetime
-            # Tentar diferentes formatos de data
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']:
-                try:
-                    data_fim_obj = datetime.strptime(str(data_fim).strip(), fmt).date()
-                    chamadas = chamadas.filter(data_criacao__date__lte=data_fim_obj)
-                    break
-                except ValueError:
-                    continue
-        except Exception as e:
-            print(f"Erro ao processar data_fim: {e}")
-            pass
-    
-    if is_valid_value(busca):
-        chamadas = chamadas.filter(
-            Q(nome_contato__icontains=busca) |
-            Q(telefone__icontains=busca) |
-            Q(unidade__icontains=busca) |
-            Q(descricao__icontains=busca) |
-            Q(nome_atendente__icontains=busca)
-        )
-    
-    return chamadas
+    return filtrar_chamadas(chamadas, ler_filtros_historico(request.GET))
 
 def export_unidades_pdf(request):
     response = HttpResponse(content_type='application/pdf')
@@ -763,71 +687,56 @@ def export_unidades_pdf(request):
     doc.build(elements)
     return response
 
+CABECALHO_EXPORTACAO_UNIDADES = [
+    'Nome', 'CNES', 'Tipo', 'Endereço', 'Telefone', 'Responsável', 'Email',
+    'Horário de Funcionamento', 'Serviços de Emergência', 'Data de Cadastro',
+]
+
+def linhas_exportacao_unidades(unidades):
+    """Linhas das exportações de unidades (CSV e Excel), lidas do banco em lotes"""
+    campos = (
+        'nome', 'cnes', 'tipo', 'endereco', 'telefone', 'responsavel', 'email',
+        'horario_funcionamento', 'servicos_emergencia', 'created_at',
+    )
+    for (nome, cnes, tipo, endereco, telefone, responsavel, email,
+         horario, emergencia, created_at) in iterar_valores(unidades, *campos):
+        yield [
+            nome,
+            cnes or '',
+            tipo,
+            endereco,
+            telefone,
+            responsavel or '',
+            email or '',
+            horario or '',
+            'Sim' if emergencia else 'Não',
+            created_at.strftime('%d/%m/%Y %H:%M:%S')
+        ]
+
 def export_unidades_excel(request):
-    unidades = UnidadeSaude.objects.all()
-    
-    # Criar DataFrame com pandas
-    data = []
-    for unidade in unidades:
-        data.append({
-            'Nome': unidade.nome,
-            'CNES': unidade.cnes or '',
-            'Tipo': unidade.tipo,
-            'Endereço': unidade.endereco,
-            'Telefone': unidade.telefone,
-            'Responsável': unidade.responsavel or '',
-            'Email': unidade.email or '',
-            'Horário de Funcionamento': unidade.horario_funcionamento or '',
-            'Serviços de Emergência': 'Sim' if unidade.servicos_emergencia else 'Não',
-            'Data de Cadastro': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S')
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Criar resposta Excel
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = 'attachment; filename="unidades_saude.xlsx"'
-    
-    df.to_excel(response, index=False, engine='openpyxl')
-    return response
+    linhas = linhas_exportacao_unidades(UnidadeSaude.objects.all())
+    return resposta_xlsx('unidades_saude.xlsx', [('Sheet1', CABECALHO_EXPORTACAO_UNIDADES, linhas)])
 
 def export_unidades_csv(request):
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="unidades_saude.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['Nome', 'CNES', 'Tipo', 'Endereço', 'Telefone', 'Responsável', 'Email', 
-                    'Horário de Funcionamento', 'Serviços de Emergência', 'Data de Cadastro'])
-    
-    unidades = UnidadeSaude.objects.all()
-    for unidade in unidades:
-        writer.writerow([
-            unidade.nome,
-            unidade.cnes or '',
-            unidade.tipo,
-            unidade.endereco,
-            unidade.telefone,
-            unidade.responsavel or '',
-            unidade.email or '',
-            unidade.horario_funcionamento or '',
-            'Sim' if unidade.servicos_emergencia else 'Não',
-            unidade.created_at.strftime('%d/%m/%Y %H:%M:%S')
-        ])
-    
-    return response
+    return resposta_csv_streaming(
+        'unidades_saude.csv',
+        CABECALHO_EXPORTACAO_UNIDADES,
+        linhas_exportacao_unidades(UnidadeSaude.objects.all()),
+    )
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def consultar_cnes_api(request, codigo_cnes):
     """
     View para consultar a API do CNES do Ministério da Saúde
-    Funciona como proxy para evitar problemas de CORS
+    Funciona como proxy para evitar problemas de CORS; as respostas ficam em cache
+    no banco (CnesCache, ver accounts.cnes)
     """
     if request.method != 'GET':
         return JsonResponse({'erro': 'Método não permitido'}, status=405)
     
     # Validar se o código CNES tem 7 dígitos
-    codigo_limpo = ''.join(filter(str.isdigit, str(codigo_cnes)))
+    codigo_limpo = limpar_codigo_cnes(codigo_cnes)
     
     if len(codigo_limpo) != 7:
         return JsonResponse({
@@ -836,100 +745,39 @@ def consultar_cnes_api(request, codigo_cnes):
         }, status=400)
     
     try:
-        # Consultar a API oficial do Ministério da Saúde
-        url = f'https://apidadosabertos.saude.gov.br/cnes/estabelecimentos/{codigo_limpo}'
-        
         # Debug logs
         print(f"🔍 [DEBUG CNES] Consultando código: {codigo_cnes} -> {codigo_limpo}")
-        print(f"🔍 [DEBUG CNES] URL: {url}")
-        
-        # Headers para a requisição
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8'
-        }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        registro, origem = consultar_cnes(codigo_limpo)
         
-        print(f"🔍 [DEBUG CNES] Status Code: {response.status_code}")
-        print(f"🔍 [DEBUG CNES] Resposta: {response.text[:200]}...")
+        print(f"🔍 [DEBUG CNES] Origem: {origem} (buscado em {registro.buscado_em})")
         
-        if response.status_code == 404:
+        if not registro.encontrado:
             return JsonResponse({
                 'sucesso': False,
                 'erro': 'Código CNES não encontrado na base de dados do Ministério da Saúde'
             }, status=404)
         
-        if response.status_code != 200:
-            return JsonResponse({
-                'sucesso': False,
-                'erro': f'Erro na consulta da API: {response.status_code}'
-            }, status=response.status_code)
-        
-        dados_api = response.json()
-        
-        # Padronizar os dados retornados com TODOS os campos disponíveis
-        dados_padronizados = {
-            # Identificação básica
-            'codigo_cnes': dados_api.get('codigo_cnes', codigo_limpo),
-            'nome_fantasia': dados_api.get('nome_fantasia'),
-            'nome_razao_social': dados_api.get('nome_razao_social'),
-            'numero_cnpj_entidade': dados_api.get('numero_cnpj_entidade'),
-            
-            # Classificação
-            'natureza_organizacao_entidade': dados_api.get('natureza_organizacao_entidade'),
-            'tipo_gestao': dados_api.get('tipo_gestao'),
-            'descricao_nivel_hierarquia': dados_api.get('descricao_nivel_hierarquia'),
-            'descricao_esfera_administrativa': dados_api.get('descricao_esfera_administrativa'),
-            'codigo_tipo_unidade': dados_api.get('codigo_tipo_unidade'),
-            
-            # Endereço completo
-            'codigo_cep_estabelecimento': dados_api.get('codigo_cep_estabelecimento'),
-            'endereco_estabelecimento': dados_api.get('endereco_estabelecimento'),
-            'numero_estabelecimento': dados_api.get('numero_estabelecimento'),
-            'bairro_estabelecimento': dados_api.get('bairro_estabelecimento'),
-            'codigo_municipio': dados_api.get('codigo_municipio'),
-            'descricao_municipio': dados_api.get('descricao_municipio'),
-            'codigo_uf': dados_api.get('codigo_uf'),
-            'sigla_uf': dados_api.get('sigla_uf'),
-            
-            # Contato
-            'numero_telefone_estabelecimento': dados_api.get('numero_telefone_estabelecimento'),
-            'numero_fax_estabelecimento': dados_api.get('numero_fax_estabelecimento'),
-            'endereco_email_estabelecimento': dados_api.get('endereco_email_estabelecimento'),
-            
-            # Funcionamento
-            'codigo_motivo_desabilitacao_estabelecimento': dados_api.get('codigo_motivo_desabilitacao_estabelecimento'),
-            'estabelecimento_possui_centro_cirurgico': dados_api.get('estabelecimento_possui_centro_cirurgico'),
-            'estabelecimento_possui_centro_obstetrico': dados_api.get('estabelecimento_possui_centro_obstetrico'),
-            'estabelecimento_possui_centro_neonatal': dados_api.get('estabelecimento_possui_centro_neonatal'),
-            'estabelecimento_possui_atendimento_ambulatorial': dados_api.get('estabelecimento_possui_atendimento_ambulatorial'),
-            'estabelecimento_possui_atendimento_internacao': dados_api.get('estabelecimento_possui_atendimento_internacao'),
-            'estabelecimento_possui_atendimento_urgencia': dados_api.get('estabelecimento_possui_atendimento_urgencia'),
-            'estabelecimento_possui_atendimento_outros': dados_api.get('estabelecimento_possui_atendimento_outros'),
-            
-            # Campos de compatibilidade (mantidos para não quebrar código existente)
-            'codigo': dados_api.get('codigo_cnes', codigo_limpo),
-            'nome': (dados_api.get('nome_fantasia') or 
-                    dados_api.get('nome_razao_social') or 
-                    'Nome não informado'),
-            'municipio': dados_api.get('descricao_municipio'),
-            'uf': dados_api.get('sigla_uf'),
-            'cep': dados_api.get('codigo_cep_estabelecimento'),
-            'endereco': dados_api.get('endereco_estabelecimento'),
-            'numero': dados_api.get('numero_estabelecimento'),
-            'bairro': dados_api.get('bairro_estabelecimento'),
-            'telefone': dados_api.get('numero_telefone_estabelecimento'),
-            'email': dados_api.get('endereco_email_estabelecimento'),
-        }
-        
         return JsonResponse({
             'sucesso': True,
-            'dados': dados_padronizados,
-            'fonte': 'Ministério da Saúde - DATASUS'
+            'dados': padronizar_dados_cnes(registro.dados, codigo_limpo),
+            'fonte': 'Ministério da Saúde - DATASUS',
+            'cache': origem,
+            'atualizado_em': registro.buscado_em.isoformat(),
         })
         
+    except ErroApiCnes as e:
+        return JsonResponse({
+            'sucesso': False,
+            'erro': str(e)
+        }, status=e.status)
+        
+    except CircuitoAberto:
+        return JsonResponse({
+            'sucesso': False,
+            'erro': 'API do Ministério da Saúde indisponível no momento. Tente novamente em instantes.'
+        }, status=503)
+        
     except requests.exceptions.Timeout:
         return JsonResponse({
             'sucesso': False,
@@ -948,12 +796,38 @@ def consultar_cnes_api(request, codigo_cnes):
             'erro': f'Erro interno: {str(e)}'
         }, status=500)
 
+@login_required
+@user_passes_test(is_admin_user)
+def api_cnes_metricas(request):
+    """Latência, erros e estado do disjuntor do cliente da API do CNES (neste processo)"""
+    return JsonResponse({'success': True, 'metricas': cliente_cnes().metricas()})
+
+def dados_unidade_consulta(unidade):
+    """Dados de uma unidade na resposta de consultar_unidade_saude_api"""
+    return {
+        'id': unidade.id,
+        'nome': unidade.nome,
+        'municipio': unidade.municipio or 'Não informado',
+        'cnes': unidade.cnes or '',
+        'tipo': unidade.get_tipo_display(),  # Obtém o texto legível do choice
+        'tipo_codigo': unidade.tipo,  # Código do tipo
+        'endereco': unidade.endereco or 'Não informado',
+        'telefone': unidade.telefone or 'Não informado',
+        'responsavel': unidade.responsavel or 'Não informado',
+        'email': unidade.email or 'Não informado',
+        'horario_funcionamento': unidade.horario_funcionamento or 'Não informado',
+        'servicos_emergencia': unidade.servicos_emergencia,
+        'data_cadastro': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S'),
+        'usuario_cadastrante': unidade.usuario_cadastrante.username if unidade.usuario_cadastrante else 'Sistema'
+    }
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def consultar_unidade_saude_api(request):
     """
     API para consultar unidades de saúde cadastradas no sistema
-    Recebe o nome da unidade e retorna os dados se encontrada
+    Recebe o nome da unidade e retorna os dados da mais parecida (índice de trigramas em
+    memória, ver accounts/indice_unidades.py) junto com os candidatos e suas pontuações
     """
     if request.method != 'POST':
         return JsonResponse({'erro': 'Método não permitido'}, status=405)
@@ -971,141 +845,44 @@ def consultar_unidade_saude_api(request):
         
         print(f"🔍 [DEBUG UNIDADE] Consultando: '{nome_unidade}'")
         
-        # Buscar a unidade no banco de dados (busca case-insensitive e mais precisa)
-        try:
-            # Primeiro, tentar busca exata
-            try:
-                unidade = UnidadeSaude.objects.get(nome__iexact=nome_unidade)
-                print(f"✅ [DEBUG UNIDADE] Busca exata encontrada: {unidade.nome}")
-            except UnidadeSaude.DoesNotExist:
-                # Se não encontrar exata, tentar busca por substring completa
-                try:
-                    unidade = UnidadeSaude.objects.get(nome__icontains=nome_unidade)
-                    print(f"✅ [DEBUG UNIDADE] Busca por substring encontrada: {unidade.nome}")
-                except UnidadeSaude.DoesNotExist:
-                    # Busca mais restritiva por palavras-chave (requer todas as palavras principais)
-                    palavras = [p for p in nome_unidade.lower().split() if len(p) > 2]
-                    print(f"🔍 [DEBUG UNIDADE] Buscando por palavras-chave (todas): {palavras}")
-                    
-                    if len(palavras) == 0:
-                        raise UnidadeSaude.DoesNotExist
-                    
-                    # Buscar unidades que contenham TODAS as palavras principais
-                    query = Q()
-                    for palavra in palavras:
-                        query &= Q(nome__icontains=palavra)  # AND ao invés de OR
-                    
-                    unidades_encontradas = UnidadeSaude.objects.filter(query)
-                    
-                    if unidades_encontradas.exists():
-                        unidade = unidades_encontradas.first()
-                        print(f"✅ [DEBUG UNIDADE] Busca por todas palavras encontrada: {unidade.nome}")
-                    else:
-                        # Se não encontrar com todas as palavras, tentar com as 2 primeiras palavras mais importantes
-                        palavras_importantes = palavras[:2] if len(palavras) >= 2 else palavras
-                        print(f"🔍 [DEBUG UNIDADE] Buscando por palavras importantes: {palavras_importantes}")
-                        
-                        query_importante = Q()
-                        for palavra in palavras_importantes:
-                            query_importante &= Q(nome__icontains=palavra)
-                        
-                        unidades_importantes = UnidadeSaude.objects.filter(query_importante)
-                        
-                        if unidades_importantes.exists():
-                            unidade = unidades_importantes.first()
-                            print(f"✅ [DEBUG UNIDADE] Busca por palavras importantes encontrada: {unidade.nome}")
-                        else:
-                            raise UnidadeSaude.DoesNotExist
-            
-            print(f"✅ [DEBUG UNIDADE] Unidade encontrada: {unidade.nome}")
-            
-            # Preparar dados da unidade
-            dados_unidade = {
-                'id': unidade.id,
-                'nome': unidade.nome,
-                'municipio': unidade.municipio or 'Não informado',
-                'cnes': unidade.cnes or '',
-                'tipo': unidade.get_tipo_display(),  # Obtém o texto legível do choice
-                'tipo_codigo': unidade.tipo,  # Código do tipo
-                'endereco': unidade.endereco or 'Não informado',
-                'telefone': unidade.telefone or 'Não informado',
-                'responsavel': unidade.responsavel or 'Não informado',
-                'email': unidade.email or 'Não informado',
-                'horario_funcionamento': unidade.horario_funcionamento or 'Não informado',
-                'servicos_emergencia': unidade.servicos_emergencia,
-                'data_cadastro': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S'),
-                'usuario_cadastrante': unidade.usuario_cadastrante.username if unidade.usuario_cadastrante else 'Sistema'
-            }
-            
-            return JsonResponse({
-                'sucesso': True,
-                'unidade': dados_unidade,
-                'fonte': 'Sistema Local de Cadastro'
-            })
-            
-        except UnidadeSaude.DoesNotExist:
-            print(f"❌ [DEBUG UNIDADE] Unidade não encontrada: '{nome_unidade}'")
-            
-            # Listar todas as unidades cadastradas para debug
-            todas_unidades = UnidadeSaude.objects.all()
-            unidades_existentes = [u.nome for u in todas_unidades]
-            print(f"💡 [DEBUG UNIDADE] Total de unidades cadastradas: {len(unidades_existentes)}")
-            print(f"💡 [DEBUG UNIDADE] Unidades disponíveis: {unidades_existentes}")
-            
-            # Buscar unidades similares
-            unidades_similares = []
-            if nome_unidade.split():
-                primeira_palavra = nome_unidade.split()[0]
-                unidades_similares = UnidadeSaude.objects.filter(
-                    Q(nome__icontains=primeira_palavra)
-                )[:5]
-                unidades_similares_nomes = [u.nome for u in unidades_similares]
-                print(f"💡 [DEBUG UNIDADE] Unidades similares com '{primeira_palavra}': {unidades_similares_nomes}")
-            
+        indice = indice_unidades()
+        resultados = indice.buscar(nome_unidade, CANDIDATOS_PADRAO)
+        candidatos = [
+            {'id': unidade_id, 'nome': nome, 'pontuacao': pontuacao}
+            for pontuacao, unidade_id, nome in resultados
+        ]
+        
+        unidade = None
+        if resultados and resultados[0][0] >= PONTUACAO_MINIMA:
+            unidade = UnidadeSaude.objects.select_related('usuario_cadastrante').filter(id=resultados[0][1]).first()
+        
+        if unidade is None:
+            print(f"❌ [DEBUG UNIDADE] Unidade não encontrada: '{nome_unidade}' (candidatos: {candidatos})")
             return JsonResponse({
                 'sucesso': False,
                 'erro': f'Unidade "{nome_unidade}" não encontrada no sistema',
-                'unidades_similares': [u.nome for u in unidades_similares],
-                'todas_unidades': unidades_existentes,  # Para debug completo
+                'unidades_similares': [candidato['nome'] for candidato in candidatos],
+                'candidatos': candidatos,
                 'debug_info': {
                     'nome_pesquisado': nome_unidade,
-                    'total_unidades_cadastradas': len(unidades_existentes),
-                    'metodo_busca': 'busca_exata_e_palavras_chave'
+                    'total_unidades_cadastradas': len(indice),
+                    'pontuacao_minima': PONTUACAO_MINIMA,
+                    'metodo_busca': 'indice_trigramas'
                 }
             }, status=404)
-            
-        except UnidadeSaude.MultipleObjectsReturned:
-            # Se houver múltiplas unidades, retornar a primeira
-            unidade = UnidadeSaude.objects.filter(
-                Q(nome__iexact=nome_unidade) |
-                Q(nome__icontains=nome_unidade)
-            ).first()
-            
-            print(f"⚠️ [DEBUG UNIDADE] Múltiplas unidades encontradas, retornando: {unidade.nome}")
-            
-            dados_unidade = {
-                'id': unidade.id,
-                'nome': unidade.nome,
-                'municipio': unidade.municipio or 'Não informado',
-                'cnes': unidade.cnes or '',
-                'tipo': unidade.get_tipo_display(),
-                'tipo_codigo': unidade.tipo,
-                'endereco': unidade.endereco or 'Não informado',
-                'telefone': unidade.telefone or 'Não informado',
-                'responsavel': unidade.responsavel or 'Não informado',
-                'email': unidade.email or 'Não informado',
-                'horario_funcionamento': unidade.horario_funcionamento or 'Não informado',
-                'servicos_emergencia': unidade.servicos_emergencia,
-                'data_cadastro': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S'),
-                'usuario_cadastrante': unidade.usuario_cadastrante.username if unidade.usuario_cadastrante else 'Sistema'
-            }
-            
-            return JsonResponse({
-                'sucesso': True,
-                'unidade': dados_unidade,
-                'fonte': 'Sistema Local de Cadastro',
-                'aviso': 'Múltiplas unidades encontradas, retornando a primeira'
-            })
+        
+        print(f"✅ [DEBUG UNIDADE] Unidade encontrada: {unidade.nome} (pontuação {resultados[0][0]})")
+        
+        resposta = {
+            'sucesso': True,
+            'unidade': dados_unidade_consulta(unidade),
+            'pontuacao': resultados[0][0],
+            'candidatos': candidatos,
+            'fonte': 'Sistema Local de Cadastro'
+        }
+        if len(resultados) > 1 and resultados[1][0] == resultados[0][0]:
+            resposta['aviso'] = 'Múltiplas unidades encontradas, retornando a primeira'
+        return JsonResponse(resposta)
     
     except json.JSONDecodeError:
         return JsonResponse({
@@ -1120,6 +897,96 @@ def consultar_unidade_saude_api(request):
             'erro': f'Erro interno do servidor: {str(e)}'
         }, status=500)
 
+def filtrar_chamadas_historico(params):
+    """Chamadas filtradas por tipo, status, data_inicio, data_fim e busca da query string"""
+    return filtrar_chamadas(RegistroChamada.objects.all(), ler_filtros_historico(params))
+
+def serializar_chamada_historico(chamada):
+    """Formato de uma chamada usado pelo componente HistoricoReact"""
+    return {
+        'id': chamada.id,
+        'data_criacao': timezone.localtime(chamada.data_criacao, fuso_calendario()).strftime('%d/%m/%Y %H:%M'),
+        'nome_contato': chamada.nome_contato,
+        'telefone': chamada.telefone,
+        'unidade_solicitante': {
+            'id': chamada.unidade_saude_id or 0,
+            'nome': chamada.unidade or 'N/A',
+        },
+        'unidade_executante': {'id': 0, 'nome': 'N/A'},
+        'municipio': chamada.municipio or '',
+        'cnes': chamada.cnes or '',
+        'tipo_chamada': chamada.tipo_chamada,
+        'status': chamada.status,
+        'descricao': chamada.descricao,
+        'nome_atendente': chamada.nome_atendente,
+        'usuario_criador': {
+            'id': chamada.usuario_criador_id or 0,
+            'username': chamada.usuario_criador.username if chamada.usuario_criador else 'Sistema',
+        },
+    }
+
+def ordem_historico(params):
+    """'relevancia' quando há busca (a menos que ?ordem=data), senão 'data'"""
+    if ler_filtros_historico(params)['busca'] and params.get('ordem') != 'data':
+        return 'relevancia'
+    return 'data'
+
+def pagina_historico(params, campos=None):
+    """
+    Página de chamadas filtradas, paginada por cursor: (relevancia, id) quando há busca,
+    (data_criacao, id) sem busca ou com ?ordem=data
+    """
+    chamadas = filtrar_chamadas_historico(params).select_related('usuario_criador')
+    por_pagina = tamanho_pagina(params.get('por_pagina'))
+    ordem = ordem_historico(params)
+    if ordem == 'relevancia':
+        chamadas = anotar_relevancia(chamadas, params.get('busca'))
+        itens, proximo_cursor = paginar_por_relevancia(chamadas, params.get('cursor'), por_pagina)
+    else:
+        itens, proximo_cursor = paginar_por_cursor(chamadas, params.get('cursor'), por_pagina)
+    
+    registros = [serializar_chamada_historico(chamada) for chamada in itens]
+    if campos:
+        registros = [{campo: registro[campo] for campo in campos} for registro in registros]
+    
+    return {
+        'chamadas': registros,
+        'proximo_cursor': proximo_cursor,
+        'por_pagina': por_pagina,
+        'ordem': ordem,
+    }
+
+# Campos que podem ser pedidos em ?fields= na API do histórico
+CAMPOS_HISTORICO = (
+    'id', 'data_criacao', 'nome_contato', 'telefone', 'unidade_solicitante', 'unidade_executante',
+    'municipio', 'cnes', 'tipo_chamada', 'status', 'descricao', 'nome_atendente', 'usuario_criador',
+)
+
+def campos_solicitados(params):
+    """Campos pedidos em ?fields=a,b,c (desconhecidos são ignorados; vazio = todos)"""
+    pedidos = [campo.strip() for campo in params.get('fields', '').split(',')]
+    return [campo for campo in CAMPOS_HISTORICO if campo in pedidos] or None
+
+def etag_historico(request):
+    """
+    ETag da API do histórico: última atualização e total das chamadas filtradas
+    mais o hash dos filtros, cursor, ordem, tamanho da página e campos pedidos.
+    """
+    filtros = ler_filtros_historico(request.GET)
+    resumo = filtrar_chamadas(RegistroChamada.objects.all(), filtros).aggregate(
+        ultima_atualizacao=Max('data_atualizacao'),
+        total=Count('id'),
+    )
+    return hash_filtros(
+        filtros,
+        request.GET.get('cursor', ''),
+        ordem_historico(request.GET),
+        tamanho_pagina(request.GET.get('por_pagina')),
+        campos_solicitados(request.GET),
+        resumo['ultima_atualizacao'],
+        resumo['total'],
+    )
+
 @login_required
 def historico_chamadas(request):
     """View para exibir o histórico de chamadas"""
@@ -1130,53 +997,19 @@ def historico_chamadas(request):
     data_fim = request.GET.get('data_fim')
     busca = request.GET.get('busca')
     
-    # Query base
-    chamadas = RegistroChamada.objects.all()
-    
-    # Aplicar filtros
-    if tipo_filtro:
-        chamadas = chamadas.filter(tipo_chamada=tipo_filtro)
-    
-    if status_filtro:
-        chamadas = chamadas.filter(status=status_filtro)
-    
-    if data_inicio:
-        try:
-            from datetime import datetime
-            data_inicio_obj = datetime.strptime(data_inicio, '%Y-%m-%d').date()
-            chamadas = chamadas.filter(data_criacao__date__gte=data_inicio_obj)
-        except ValueError:
-            pass
-    
-    if data_fim:
-        try:
-            from datetime import datetime
-            data_fim_obj = datetime.strptime(data_fim, '%Y-%m-%d').date()
-            chamadas = chamadas.filter(data_criacao__date__lte=data_fim_obj)
-        except ValueError:
-            pass
-    
-    if busca:
-        chamadas = chamadas.filter(
-            Q(nome_contato__icontains=busca) |
-            Q(telefone__icontains=busca) |
-            Q(unidade__icontains=busca) |
-            Q(descricao__icontains=busca) |
-            Q(nome_atendente__icontains=busca)
-        )
+    chamadas = filtrar_chamadas_historico(request.GET)
     
-    # Ordenar por data mais recente
-    chamadas = chamadas.order_by('-data_criacao')
+    # Primeira página (ou a página do cursor informado); as seguintes vêm de api_historico_chamadas
+    try:
+        pagina = pagina_historico(request.GET)
+    except CursorInvalido:
+        pagina = pagina_historico({**request.GET.dict(), 'cursor': ''})
     
     # Estatísticas
     total_chamadas = chamadas.count()
-    chamadas_hoje = RegistroChamada.objects.filter(
-        data_criacao__date=timezone.now().date()
-    ).count()
-    chamadas_mes = RegistroChamada.objects.filter(
-        data_criacao__month=timezone.now().month,
-        data_criacao__year=timezone.now().year
-    ).count()
+    contadores_chamadas = obter_estatisticas_dashboard()
+    chamadas_hoje = contadores_chamadas['chamadas_hoje']
+    chamadas_mes = contadores_chamadas['chamadas_mes']
     
     # Tipos de chamada atualizados (baseados no formulário atual)
     TIPOS_CHAMADA_ATUAIS = [
@@ -1221,7 +1054,11 @@ def historico_chamadas(request):
         status_chamadas[status] = RegistroChamada.objects.filter(status=status).count()
     
     context = {
-        'chamadas': chamadas,
+        'chamadas': pagina['chamadas'],
+        'paginacao': {
+            'proximo_cursor': pagina['proximo_cursor'],
+            'por_pagina': pagina['por_pagina'],
+        },
         'total_chamadas': total_chamadas,
         'chamadas_hoje': chamadas_hoje,
         'chamadas_mes': chamadas_mes,
@@ -1233,6 +1070,7 @@ def historico_chamadas(request):
             'data_inicio': data_inicio,
             'data_fim': data_fim,
             'busca': busca,
+            'ordem': request.GET.get('ordem'),
         },
         'tipo_choices': TIPOS_CHAMADA_ATUAIS,
         'status_choices': RegistroChamada.STATUS_CHOICES,
@@ -1240,6 +1078,21 @@ def historico_chamadas(request):
     
     return render(request, 'historico_react.html', context)
 
+@login_required
+@condition(etag_func=etag_historico)
+def api_historico_chamadas(request):
+    """
+    API JSON do histórico com os mesmos filtros da página, paginada por cursor.
+    Aceita ?fields= para reduzir o payload e responde 304 quando o If-None-Match
+    ainda corresponde ao ETag atual.
+    """
+    try:
+        pagina = pagina_historico(request.GET, campos_solicitados(request.GET))
+    except CursorInvalido as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    return JsonResponse({'success': True, 'data': pagina})
+
 @login_required
 def export_historico_pdf(request):
     """Exportar histórico de chamadas em PDF - Versão Corrigida"""
@@ -1274,46 +1127,7 @@ def export_historico_pdf(request):
         elements.append(Spacer(1, 20))
         
         # Aplicar os mesmos filtros da página de histórico
-        tipo_filtro = request.GET.get('tipo')
-        status_filtro = request.GET.get('status')
-        data_inicio = request.GET.get('data_inicio')
-        data_fim = request.GET.get('data_fim')
-        busca = request.GET.get('busca')
-        
-        # Query base
-        chamadas = RegistroChamada.objects.all()
-        
-        # Aplicar filtros
-        if tipo_filtro:
-            chamadas = chamadas.filter(tipo_chamada=tipo_filtro)
-        
-        if status_filtro:
-            chamadas = chamadas.filter(status=status_filtro)
-    
-        if data_inicio:
-            try:
-                from datetime import datetime
-                data_inicio_obj = datetime.strptime(data_inicio, '%Y-%m-%d').date()
-                chamadas = chamadas.filter(data_criacao__date__gte=data_inicio_obj)
-            except ValueError:
-                pass
-        
-        if data_fim:
-            try:
-                from datetime import datetime
-                data_fim_obj = datetime.strptime(data_fim, '%Y-%m-%d').date()
-                chamadas = chamadas.filter(data_criacao__date__lte=data_fim_obj)
-            except ValueError:
-                pass
-        
-        if busca:
-            chamadas = chamadas.filter(
-                Q(nome_contato__icontains=busca) |
-                Q(telefone__icontains=busca) |
-                Q(unidade__icontains=busca) |
-                Q(descricao__icontains=busca) |
-                Q(nome_atendente__icontains=busca)
-            )
+        chamadas = filtrar_chamadas(RegistroChamada.objects.all(), ler_filtros_historico(request.GET))
         
         # Ordenar por data mais recente
         chamadas = chamadas.order_by('-data_criacao')
@@ -1373,6 +1187,45 @@ def export_historico_pdf(request):
         doc.build(elements)
         return response
 
+CABECALHO_EXPORTACAO_HISTORICO = [
+    'Data e Hora', 'Nome do Contato', 'Telefone', 'Função/Cargo', 'Setor de Atuação',
+    'Nome da Unidade', 'Município', 'Código CNES', 'Contato Telefônico CNES',
+    'Tipo de Chamada', 'Status', 'Nome do Atendente', 'Descrição da Solicitação',
+    'Solução/Encaminhamento', 'Usuário Criador', 'Data de Atualização',
+]
+
+def linhas_exportacao_historico(chamadas):
+    """Linhas das exportações do histórico (CSV e Excel), lidas do banco em lotes"""
+    tipos = dict(RegistroChamada.TIPO_CHOICES)
+    status = dict(RegistroChamada.STATUS_CHOICES)
+    campos = (
+        'data_criacao', 'nome_contato', 'telefone', 'funcao', 'setor', 'unidade', 'municipio',
+        'cnes', 'contato_telefonico_cnes', 'tipo_chamada', 'status', 'nome_atendente',
+        'descricao', 'solucao', 'usuario_criador__first_name', 'usuario_criador__username',
+        'data_atualizacao',
+    )
+    for (data_criacao, nome_contato, telefone, funcao, setor, unidade, municipio, cnes,
+         contato_cnes, tipo_chamada, status_chamada, nome_atendente, descricao, solucao,
+         criador_nome, criador_username, data_atualizacao) in iterar_valores(chamadas, *campos):
+        yield [
+            data_criacao.strftime('%d/%m/%Y %H:%M:%S'),
+            nome_contato,
+            telefone,
+            funcao or '',
+            setor or '',
+            unidade,
+            municipio or '',
+            cnes or '',
+            contato_cnes or '',
+            tipos.get(tipo_chamada) or tipo_chamada,
+            status.get(status_chamada, status_chamada),
+            nome_atendente,
+            descricao,
+            solucao or '',
+            criador_nome or criador_username or '',
+            data_atualizacao.strftime('%d/%m/%Y %H:%M:%S'),
+        ]
+
 @csrf_exempt
 def export_historico_excel(request):
     """Exportar histórico de chamadas em Excel"""
@@ -1389,188 +1242,105 @@ def export_historico_excel(request):
     
     try:
         # Aplicar os mesmos filtros da página de histórico
-        tipo_filtro = request.GET.get('tipo', '').strip()
-        status_filtro = request.GET.get('status', '').strip()
-        data_inicio = request.GET.get('data_inicio', '').strip()
-        data_fim = request.GET.get('data_fim', '').strip()
-        busca = request.GET.get('busca', '').strip()
-        
-        print(f"🔍 [EXPORT] Filtros: tipo='{tipo_filtro}', status='{status_filtro}', busca='{busca}'")
-        
-        # Query base
-        chamadas = RegistroChamada.objects.all()
-        print(f"🔍 [EXPORT] Total inicial: {chamadas.count()}")
-        
-        # Aplicar filtros apenas se não estiverem vazios
-        if tipo_filtro and tipo_filtro != '':
-            chamadas = chamadas.filter(tipo_chamada=tipo_filtro)
-            print(f"🔍 [EXPORT] Após filtro tipo: {chamadas.count()}")
-        
-        if status_filtro and status_filtro != '':
-            chamadas = chamadas.filter(status=status_filtro)
-            print(f"🔍 [EXPORT] Após filtro status: {chamadas.count()}")
+        filtros = ler_filtros_historico(request.GET)
+        print(f"🔍 [EXPORT] Filtros: {filtros}")
         
-        if data_inicio and data_inicio != '':
-            try:
-                from datetime import datetime
-                data_inicio_obj = datetime.strptime(data_inicio, '%Y-%m-%d').date()
-                chamadas = chamadas.filter(data_criacao__date__gte=data_inicio_obj)
-                print(f"🔍 [EXPORT] Após filtro data_inicio: {chamadas.count()}")
-            except ValueError:
-                print(f"❌ [EXPORT] Erro no formato data_inicio: {data_inicio}")
-                pass
-        
-        if data_fim and data_fim != '':
-            try:
-                from datetime import datetime
-                data_fim_obj = datetime.strptime(data_fim, '%Y-%m-%d').date()
-                chamadas = chamadas.filter(data_criacao__date__lte=data_fim_obj)
-                print(f"🔍 [EXPORT] Após filtro data_fim: {chamadas.count()}")
-            except ValueError:
-                print(f"❌ [EXPORT] Erro no formato data_fim: {data_fim}")
-                pass
-        
-        if busca and busca != '':
-            chamadas = chamadas.filter(
-                Q(nome_contato__icontains=busca) |
-                Q(telefone__icontains=busca) |
-                Q(unidade__icontains=busca) |
-                Q(descricao__icontains=busca) |
-                Q(nome_atendente__icontains=busca)
-            )
-            print(f"🔍 [EXPORT] Após filtro busca: {chamadas.count()}")
+        chamadas = filtrar_chamadas(RegistroChamada.objects.all(), filtros)
         
         # Ordenar por data mais recente
         chamadas = chamadas.order_by('-data_criacao')
         print(f"✅ [EXPORT] Total final: {chamadas.count()}")
         
-        # Criar DataFrame com pandas
-        data = []
-        for chamada in chamadas:
-            data.append({
-                'Data e Hora': chamada.data_criacao.strftime('%d/%m/%Y %H:%M:%S'),
-                'Nome do Contato': chamada.nome_contato,
-                'Telefone': chamada.telefone,
-                'Função/Cargo': chamada.funcao or '',
-                'Setor de Atuação': chamada.setor or '',
-                'Nome da Unidade': chamada.unidade,
-                'Município': chamada.municipio or '',
-                'Código CNES': chamada.cnes or '',
-                'Contato Telefônico CNES': chamada.contato_telefonico_cnes or '',
-                'Tipo de Chamada': chamada.get_tipo_chamada_display() or chamada.tipo_chamada,
-                'Status': chamada.get_status_display(),
-                'Nome do Atendente': chamada.nome_atendente,
-                'Descrição da Solicitação': chamada.descricao,
-                'Solução/Encaminhamento': chamada.solucao or '',
-                'Usuário Criador': chamada.usuario_criador.first_name or chamada.usuario_criador.username,
-                'Data de Atualização': chamada.data_atualizacao.strftime('%d/%m/%Y %H:%M:%S'),
-            })
-        
-        print(f"📊 [EXPORT] Dados coletados: {len(data)} registros")
-        
-        # Criar DataFrame
-        import pandas as pd
-        df = pd.DataFrame(data)
-        print(f"📊 [EXPORT] DataFrame criado: {len(df)} linhas")
-        
-        # Criar resposta Excel
-        response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        response['Content-Disposition'] = 'attachment; filename="historico_chamadas.xlsx"'
-        
-        # Converter para Excel
-        df.to_excel(response, index=False, engine='openpyxl')
+        # Planilha gravada linha a linha (openpyxl write-only)
+        response = resposta_xlsx(
+            'historico_chamadas.xlsx',
+            [('Sheet1', CABECALHO_EXPORTACAO_HISTORICO, linhas_exportacao_historico(chamadas))],
+        )
         print(f"✅ [EXPORT] Excel gerado com sucesso!")
-        
+
         return response
-        
+
     except Exception as e:
         print(f"❌ [EXPORT] Erro durante exportação: {str(e)}")
         import traceback
         traceback.print_exc()
         
         # Retornar erro HTTP em caso de falha
-        return HttpResponse(f"Erro na exportação: {str(e)}", status=500)
-
-@login_required
-def export_historico_csv(request):
-    """Exportar histórico de chamadas em CSV"""
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="historico_chamadas.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow([
-        'Data e Hora', 'Nome do Contato', 'Telefone', 'Função/Cargo', 'Setor de Atuação',
-        'Nome da Unidade', 'Município', 'Código CNES', 'Contato Telefônico CNES',
-        'Tipo de Chamada', 'Status', 'Nome do Atendente', 'Descrição da Solicitação',
-        'Solução/Encaminhamento', 'Usuário Criador', 'Data de Atualização'
-    ])
-    
-    # Aplicar os mesmos filtros da página de histórico
-    tipo_filtro = request.GET.get('tipo')
-    status_filtro = request.GET.get('status')
-    data_inicio = request.GET.get('data_inicio')
-    data_fim = request.GET.get('data_fim')
-    busca = request.GET.get('busca')
-    
-    # Query base
-    chamadas = RegistroChamada.objects.all()
-    
-    # Aplicar filtros
-    if tipo_filtro:
-        chamadas = chamadas.filter(tipo_chamada=tipo_filtro)
-    
-    if status_filtro:
-        chamadas = chamadas.filter(status=status_filtro)
-    
-    if data_inicio:
-        try:
-            from datetime import datetime
-            data_inicio_obj = datetime.strptime(data_inicio, '%Y-%m-%d').date()
-            chamadas = chamadas.filter(data_criacao__date__gte=data_inicio_obj)
-        except ValueError:
-            pass
-    
-    if data_fim:
-        try:
-            from datetime import datetime
-            data_fim_obj = datetime.strptime(data_fim, '%Y-%m-%d').date()
-            chamadas = chamadas.filter(data_criacao__date__lte=data_fim_obj)
-        except ValueError:
-            pass
-    
-    if busca:
-        chamadas = chamadas.filter(
-            Q(nome_contato__icontains=busca) |
-            Q(telefone__icontains=busca) |
-            Q(unidade__icontains=busca) |
-            Q(descricao__icontains=busca) |
-            Q(nome_atendente__icontains=busca)
-        )
-    
+        return HttpResponse(f"Erro na exportação: {str(e)}", status=500)
+
+@login_required
+def export_historico_csv(request):
+    """Exportar histórico de chamadas em CSV"""
+    # Aplicar os mesmos filtros da página de histórico
+    chamadas = filtrar_chamadas(RegistroChamada.objects.all(), ler_filtros_historico(request.GET))
+
     # Ordenar por data mais recente
     chamadas = chamadas.order_by('-data_criacao')
+
+    return resposta_csv_streaming(
+        'historico_chamadas.csv',
+        CABECALHO_EXPORTACAO_HISTORICO,
+        linhas_exportacao_historico(chamadas),
+    )
+
+# ===== EXPORTAÇÕES EM SEGUNDO PLANO =====
+
+def tarefas_visiveis(usuario):
+    tarefas = TarefaExportacao.objects.all()
+    if not usuario.is_superuser:
+        tarefas = tarefas.filter(usuario=usuario)
+    return tarefas
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def api_exportacoes(request):
+    """
+    GET: últimas exportações do usuário.
+    POST {"tipo": ..., "parametros": {...}}: enfileira uma exportação e responde 202
+    com a URL de status para acompanhar o progresso.
+    """
+    if request.method == 'GET':
+        tarefas = TarefaExportacao.objects.filter(usuario=request.user)[:20]
+        return JsonResponse({'success': True, 'tarefas': [serializar_tarefa(t) for t in tarefas]})
     
-    for chamada in chamadas:
-        writer.writerow([
-            chamada.data_criacao.strftime('%d/%m/%Y %H:%M:%S'),
-            chamada.nome_contato,
-            chamada.telefone,
-            chamada.funcao or '',
-            chamada.setor or '',
-            chamada.unidade,
-            chamada.municipio or '',
-            chamada.cnes or '',
-            chamada.contato_telefonico_cnes or '',
-            chamada.get_tipo_chamada_display() or chamada.tipo_chamada,
-            chamada.get_status_display(),
-            chamada.nome_atendente,
-            chamada.descricao,
-            chamada.solucao or '',
-            chamada.usuario_criador.first_name or chamada.usuario_criador.username,
-            chamada.data_atualizacao.strftime('%d/%m/%Y %H:%M:%S'),
-        ])
+    try:
+        data = json.loads(request.body or '{}')
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'message': 'JSON inválido'}, status=400)
     
-    return response
+    tipo = data.get('tipo', '')
+    parametros = data.get('parametros') or {}
+    if not isinstance(parametros, dict):
+        return JsonResponse({'success': False, 'message': 'Parâmetros inválidos'}, status=400)
+    
+    if not usuario_pode_exportar(request.user, tipo):
+        return JsonResponse({'success': False, 'message': f'Exportação não disponível: {tipo}'}, status=403)
+    
+    tarefa = enfileirar_exportacao(request.user, tipo, parametros)
+    return JsonResponse({'success': True, 'tarefa': serializar_tarefa(tarefa)}, status=202)
+
+@login_required
+@require_http_methods(["GET"])
+def api_exportacao_status(request, tarefa_id):
+    """Progresso de uma exportação (consultado periodicamente pelas páginas React)"""
+    tarefa = get_object_or_404(tarefas_visiveis(request.user), id=tarefa_id)
+    return JsonResponse({'success': True, 'tarefa': serializar_tarefa(tarefa)})
+
+@login_required
+def download_exportacao(request, tarefa_id):
+    """Download do arquivo gerado por uma exportação concluída"""
+    tarefa = get_object_or_404(
+        tarefas_visiveis(request.user), id=tarefa_id, status=TarefaExportacao.STATUS_CONCLUIDA
+    )
+    if not tarefa.arquivo:
+        raise Http404('Arquivo da exportação não encontrado')
+    
+    return FileResponse(
+        tarefa.arquivo.open('rb'),
+        as_attachment=True,
+        filename=tarefa.nome_arquivo,
+        content_type=tarefa.content_type or None,
+    )
 
 # ===== EXPORTAÇÃO DE USUÁRIOS =====
 
@@ -1665,17 +1435,16 @@ def export_usuarios_pdf(request):
     doc.build(elements)
     return response
 
-@login_required
-def export_usuarios_excel(request):
-    """Exportar usuários em Excel"""
+def filtrar_usuarios_exportacao(params):
+    """Usuários filtrados como na página de gerenciamento, com totais de atividade"""
     # Aplicar os mesmos filtros da página
-    busca = request.GET.get('busca', '').strip()
-    is_active = request.GET.get('is_active', '')
-    is_staff = request.GET.get('is_staff', '')
-    
+    busca = params.get('busca', '').strip()
+    is_active = params.get('is_active', '')
+    is_staff = params.get('is_staff', '')
+
     # Query base
     usuarios = User.objects.all()
-    
+
     # Aplicar filtros
     if busca:
         usuarios = usuarios.filter(
@@ -1684,115 +1453,63 @@ def export_usuarios_excel(request):
             Q(last_name__icontains=busca) |
             Q(email__icontains=busca)
         )
-    
+
     if is_active == 'true':
         usuarios = usuarios.filter(is_active=True)
     elif is_active == 'false':
         usuarios = usuarios.filter(is_active=False)
-    
+
     if is_staff == 'true':
         usuarios = usuarios.filter(is_staff=True)
     elif is_staff == 'false':
         usuarios = usuarios.filter(is_staff=False)
-    
+
     # Ordenar por data de criação
-    usuarios = usuarios.order_by('-date_joined')
-    
-    # Criar DataFrame com pandas
-    data = []
-    for usuario in usuarios:
-        # Contar unidades e chamadas do usuário
-        unidades_count = UnidadeSaude.objects.filter(usuario_cadastrante=usuario).count()
-        chamadas_count = RegistroChamada.objects.filter(usuario_criador=usuario).count()
-        
-        data.append({
-            'Nome Completo': usuario.get_full_name() or 'Não informado',
-            'Nome de Usuário': usuario.username,
-            'Email': usuario.email or 'Não informado',
-            'Primeiro Nome': usuario.first_name or 'Não informado',
-            'Último Nome': usuario.last_name or 'Não informado',
-            'Tipo de Usuário': 'Administrador' if usuario.is_staff else 'Usuário',
-            'Status': 'Ativo' if usuario.is_active else 'Inativo',
-            'Superusuário': 'Sim' if usuario.is_superuser else 'Não',
-            'Data de Cadastro': usuario.date_joined.strftime('%d/%m/%Y %H:%M:%S'),
-            'Último Login': usuario.last_login.strftime('%d/%m/%Y %H:%M:%S') if usuario.last_login else 'Nunca fez login',
-            'Unidades Cadastradas': unidades_count,
-            'Chamadas Registradas': chamadas_count,
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Criar resposta Excel
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = 'attachment; filename="usuarios_sistema.xlsx"'
-    
-    df.to_excel(response, index=False, engine='openpyxl')
-    return response
+    return anotar_atividade_usuarios(usuarios.order_by('-date_joined'))
+
+CABECALHO_EXPORTACAO_USUARIOS = [
+    'Nome Completo', 'Nome de Usuário', 'Email', 'Primeiro Nome', 'Último Nome',
+    'Tipo de Usuário', 'Status', 'Superusuário', 'Data de Cadastro', 'Último Login',
+    'Unidades Cadastradas', 'Chamadas Registradas',
+]
+
+def linhas_exportacao_usuarios(usuarios):
+    """Linhas das exportações de usuários (CSV e Excel), lidas do banco em lotes"""
+    campos = (
+        'first_name', 'last_name', 'username', 'email', 'is_staff', 'is_active', 'is_superuser',
+        'date_joined', 'last_login', 'unidades_count', 'chamadas_count',
+    )
+    for (first_name, last_name, username, email, is_staff, is_active, is_superuser,
+         date_joined, last_login, unidades_count, chamadas_count) in iterar_valores(usuarios, *campos):
+        yield [
+            f'{first_name} {last_name}'.strip() or 'Não informado',
+            username,
+            email or 'Não informado',
+            first_name or 'Não informado',
+            last_name or 'Não informado',
+            'Administrador' if is_staff else 'Usuário',
+            'Ativo' if is_active else 'Inativo',
+            'Sim' if is_superuser else 'Não',
+            date_joined.strftime('%d/%m/%Y %H:%M:%S'),
+            last_login.strftime('%d/%m/%Y %H:%M:%S') if last_login else 'Nunca fez login',
+            unidades_count,
+            chamadas_count,
+        ]
+
+@login_required
+def export_usuarios_excel(request):
+    """Exportar usuários em Excel"""
+    linhas = linhas_exportacao_usuarios(filtrar_usuarios_exportacao(request.GET))
+    return resposta_xlsx('usuarios_sistema.xlsx', [('Sheet1', CABECALHO_EXPORTACAO_USUARIOS, linhas)])
 
 @login_required
 def export_usuarios_csv(request):
     """Exportar usuários em CSV"""
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="usuarios_sistema.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow([
-        'Nome Completo', 'Nome de Usuário', 'Email', 'Primeiro Nome', 'Último Nome',
-        'Tipo de Usuário', 'Status', 'Superusuário', 'Data de Cadastro', 'Último Login',
-        'Unidades Cadastradas', 'Chamadas Registradas'
-    ])
-    
-    # Aplicar os mesmos filtros da página
-    busca = request.GET.get('busca', '').strip()
-    is_active = request.GET.get('is_active', '')
-    is_staff = request.GET.get('is_staff', '')
-    
-    # Query base
-    usuarios = User.objects.all()
-    
-    # Aplicar filtros
-    if busca:
-        usuarios = usuarios.filter(
-            Q(username__icontains=busca) |
-            Q(first_name__icontains=busca) |
-            Q(last_name__icontains=busca) |
-            Q(email__icontains=busca)
-        )
-    
-    if is_active == 'true':
-        usuarios = usuarios.filter(is_active=True)
-    elif is_active == 'false':
-        usuarios = usuarios.filter(is_active=False)
-    
-    if is_staff == 'true':
-        usuarios = usuarios.filter(is_staff=True)
-    elif is_staff == 'false':
-        usuarios = usuarios.filter(is_staff=False)
-    
-    # Ordenar por data de criação
-    usuarios = usuarios.order_by('-date_joined')
-    
-    for usuario in usuarios:
-        # Contar unidades e chamadas do usuário
-        unidades_count = UnidadeSaude.objects.filter(usuario_cadastrante=usuario).count()
-        chamadas_count = RegistroChamada.objects.filter(usuario_criador=usuario).count()
-        
-        writer.writerow([
-            usuario.get_full_name() or 'Não informado',
-            usuario.username,
-            usuario.email or 'Não informado',
-            usuario.first_name or 'Não informado',
-            usuario.last_name or 'Não informado',
-            'Administrador' if usuario.is_staff else 'Usuário',
-            'Ativo' if usuario.is_active else 'Inativo',
-            'Sim' if usuario.is_superuser else 'Não',
-            usuario.date_joined.strftime('%d/%m/%Y %H:%M:%S'),
-            usuario.last_login.strftime('%d/%m/%Y %H:%M:%S') if usuario.last_login else 'Nunca fez login',
-            unidades_count,
-            chamadas_count,
-        ])
-    
-    return response
+    return resposta_csv_streaming(
+        'usuarios_sistema.csv',
+        CABECALHO_EXPORTACAO_USUARIOS,
+        linhas_exportacao_usuarios(filtrar_usuarios_exportacao(request.GET)),
+    )
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -1873,6 +1590,8 @@ def editar_chamada_api(request):
         chamada.nome_atendente = data.get('nome_atendente', '').strip()
         chamada.descricao = data.get('descricao', '').strip()
         chamada.solucao = data.get('solucao', '').strip() or None
+        # Unidade e CNES podem ter mudado: resolver a unidade de novo, como na criação
+        chamada.unidade_saude = resolver_unidade_saude(chamada.cnes, chamada.unidade)
         
         # Atualizar data de modificação automaticamente
         chamada.data_atualizacao = timezone.now()
@@ -2222,9 +1941,8 @@ def notificacoes(request):
     # Estatísticas para exibir na página
     total_chamadas = RegistroChamada.objects.filter(usuario_criador=request.user).count()
     chamadas_mes = RegistroChamada.objects.filter(
+        filtro_mes('data_criacao', hoje_calendario()),
         usuario_criador=request.user,
-        data_criacao__month=timezone.now().month,
-        data_criacao__year=timezone.now().year
     ).count()
     
     # Serializar configurações para JSON
@@ -2347,44 +2065,13 @@ def get_user_statistics(current_user):
     """Função auxiliar para obter estatísticas reais dos usuários"""
     from datetime import datetime, timedelta
     
-    # Estatísticas gerais de usuários
-    total_usuarios = User.objects.count()
-    usuarios_ativos = User.objects.filter(is_active=True).count()
-    usuarios_admins = User.objects.filter(is_staff=True).count()
-    
-    # Usuários criados recentemente (últimos 30 dias)
-    data_limite = timezone.now() - timedelta(days=30)
-    usuarios_recentes = User.objects.filter(date_joined__gte=data_limite).count()
-    
-    # Estatísticas adicionais
-    usuarios_inativos = User.objects.filter(is_active=False).count()
-    usuarios_com_email = User.objects.exclude(email='').count()
-    
     # Últimos usuários criados (para preview)
     ultimos_usuarios = User.objects.order_by('-date_joined')[:5]
     
-    # Dados de atividade
-    usuarios_com_chamadas = User.objects.filter(
-        chamadas_criadas__isnull=False
-    ).distinct().count()
-    
-    usuarios_com_unidades = User.objects.filter(
-        unidades_cadastradas__isnull=False
-    ).distinct().count()
-    
     return {
         'usuario': current_user,
         'data_atual': timezone.now(),
-        'estatisticas_usuarios': {
-            'total_usuarios': total_usuarios,
-            'usuarios_ativos': usuarios_ativos,
-            'usuarios_admins': usuarios_admins,
-            'usuarios_recentes': usuarios_recentes,
-            'usuarios_inativos': usuarios_inativos,
-            'usuarios_com_email': usuarios_com_email,
-            'usuarios_com_chamadas': usuarios_com_chamadas,
-            'usuarios_com_unidades': usuarios_com_unidades,
-        },
+        'estatisticas_usuarios': dict(obter_estatisticas_usuarios()),
         'ultimos_usuarios': ultimos_usuarios,
     }
 
@@ -2436,7 +2123,7 @@ def gerenciar_usuarios(request):
         try:
             from datetime import datetime
             data_inicio = datetime.strptime(date_from, '%Y-%m-%d').date()
-            usuarios = usuarios.filter(date_joined__date__gte=data_inicio)
+            usuarios = usuarios.filter(filtro_datas('date_joined', data_inicio=data_inicio))
         except ValueError:
             pass
     
@@ -2444,7 +2131,7 @@ def gerenciar_usuarios(request):
         try:
             from datetime import datetime
             data_fim = datetime.strptime(date_to, '%Y-%m-%d').date()
-            usuarios = usuarios.filter(date_joined__date__lte=data_fim)
+            usuarios = usuarios.filter(filtro_datas('date_joined', data_fim=data_fim))
         except ValueError:
             pass
     
@@ -2480,43 +2167,32 @@ def gerenciar_usuarios(request):
     else:
         usuarios = usuarios.order_by('-date_joined')
     
-    # Adicionar estatísticas para cada usuário
-    usuarios_com_stats = []
-    for usuario in usuarios:
-        # Contar unidades cadastradas pelo usuário
-        unidades_count = UnidadeSaude.objects.filter(usuario_cadastrante=usuario).count()
-        
-        # Contar chamadas registradas pelo usuário
-        chamadas_count = RegistroChamada.objects.filter(usuario_criador=usuario).count()
-        
-        # Última atividade (última chamada registrada)
-        ultima_chamada = RegistroChamada.objects.filter(usuario_criador=usuario).order_by('-data_criacao').first()
-        ultima_atividade = ultima_chamada.data_criacao if ultima_chamada else None
-        
-        usuarios_com_stats.append({
-            'usuario': usuario,
-            'unidades_count': unidades_count,
-            'chamadas_count': chamadas_count,
-            'ultima_atividade': ultima_atividade,
-        })
+    # Estatísticas de cada usuário calculadas no banco (sem consultas por usuário)
+    usuarios = anotar_atividade_usuarios(usuarios)
     
-    # Paginação
-    paginator = Paginator(usuarios_com_stats, 10)  # 10 usuários por página
+    # Paginação no banco: apenas a página atual é carregada
+    paginator = Paginator(usuarios, 10)  # 10 usuários por página
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    page_obj.object_list = [
+        {
+            'usuario': usuario,
+            'unidades_count': usuario.unidades_count,
+            'chamadas_count': usuario.chamadas_count,
+            'ultima_atividade': usuario.ultima_atividade,
+        }
+        for usuario in page_obj.object_list
+    ]
     
     # Estatísticas gerais
-    total_usuarios = User.objects.count()
-    usuarios_ativos = User.objects.filter(is_active=True).count()
-    usuarios_staff = User.objects.filter(is_staff=True).count()
-    usuarios_inativos = User.objects.filter(is_active=False).count()
+    estatisticas_gerais = obter_estatisticas_usuarios()
     
     context = {
         'page_obj': page_obj,
-        'total_usuarios': total_usuarios,
-        'usuarios_ativos': usuarios_ativos,
-        'usuarios_staff': usuarios_staff,
-        'usuarios_inativos': usuarios_inativos,
+        'total_usuarios': estatisticas_gerais['total_usuarios'],
+        'usuarios_ativos': estatisticas_gerais['usuarios_ativos'],
+        'usuarios_staff': estatisticas_gerais['usuarios_admins'],
+        'usuarios_inativos': estatisticas_gerais['usuarios_inativos'],
         'filtros': {
             'busca': busca,
             'is_active': is_active,
@@ -2549,18 +2225,16 @@ def detalhes_usuario(request, user_id):
     chamadas_registradas = RegistroChamada.objects.filter(usuario_criador=usuario).order_by('-data_criacao')
     
     # Estatísticas por período
-    hoje = timezone.now().date()
-    inicio_mes = hoje.replace(day=1)
-    inicio_ano = hoje.replace(month=1, day=1)
+    hoje = hoje_calendario()
     
     # Chamadas do usuário por período
-    chamadas_hoje = chamadas_registradas.filter(data_criacao__date=hoje).count()
-    chamadas_mes = chamadas_registradas.filter(data_criacao__date__gte=inicio_mes).count()
-    chamadas_ano = chamadas_registradas.filter(data_criacao__date__gte=inicio_ano).count()
+    chamadas_hoje = chamadas_registradas.filter(filtro_dia('data_criacao', hoje)).count()
+    chamadas_mes = chamadas_registradas.filter(filtro_mes('data_criacao', hoje)).count()
+    chamadas_ano = chamadas_registradas.filter(filtro_ano('data_criacao', hoje)).count()
     
     # Unidades do usuário por período
-    unidades_mes = unidades_cadastradas.filter(created_at__date__gte=inicio_mes).count()
-    unidades_ano = unidades_cadastradas.filter(created_at__date__gte=inicio_ano).count()
+    unidades_mes = unidades_cadastradas.filter(filtro_mes('created_at', hoje)).count()
+    unidades_ano = unidades_cadastradas.filter(filtro_ano('created_at', hoje)).count()
     
     # Atividade recente (últimas 10 ações)
     atividades_recentes = []
@@ -2849,30 +2523,11 @@ def api_estatisticas_usuarios(request):
         }, status=401)
     
     try:
-        # Calcular estatísticas em tempo real
-        total_usuarios = User.objects.count()
-        usuarios_ativos = User.objects.filter(is_active=True).count()
-        usuarios_admins = User.objects.filter(is_staff=True).count()
-        
-        # Usuários criados recentemente (últimos 30 dias)
-        data_limite = timezone.now() - timedelta(days=30)
-        usuarios_recentes = User.objects.filter(date_joined__gte=data_limite).count()
-        
-        # Estatísticas adicionais
-        usuarios_inativos = User.objects.filter(is_active=False).count()
-        usuarios_com_email = User.objects.exclude(email='').count()
-        
-        # Dados de atividade
-        usuarios_com_chamadas = User.objects.filter(
-            chamadas_criadas__isnull=False
-        ).distinct().count()
-        
-        usuarios_com_unidades = User.objects.filter(
-            unidades_cadastradas__isnull=False
-        ).distinct().count()
+        # Estatísticas gerais (mantidas em cache e atualizadas por sinais)
+        estatisticas_gerais = obter_estatisticas_usuarios()
         
         # Últimos usuários criados
-        ultimos_usuarios = User.objects.order_by('-date_joined')[:5]
+        ultimos_usuarios = anotar_atividade_usuarios(User.objects.order_by('-date_joined'))[:5]
         ultimos_usuarios_data = []
         
         for usuario in ultimos_usuarios:
@@ -2884,36 +2539,22 @@ def api_estatisticas_usuarios(request):
                 'is_active': usuario.is_active,
                 'is_staff': usuario.is_staff,
                 'date_joined': usuario.date_joined.strftime('%d/%m/%Y %H:%M'),
-                'chamadas_count': RegistroChamada.objects.filter(usuario_criador=usuario).count(),
-                'unidades_count': UnidadeSaude.objects.filter(usuario_cadastrante=usuario).count(),
+                'chamadas_count': usuario.chamadas_count,
+                'unidades_count': usuario.unidades_count,
             })
         
         # Estatísticas por mês (últimos 6 meses)
         meses_stats = []
-        for i in range(6):
-            data_mes = timezone.now() - timedelta(days=30*i)
-            usuarios_mes = User.objects.filter(
-                date_joined__month=data_mes.month,
-                date_joined__year=data_mes.year
-            ).count()
+        for ponto in reversed(serie_mensal(User.objects.all(), 'date_joined', 6)):
             meses_stats.append({
-                'mes': data_mes.strftime('%b/%Y'),
-                'usuarios': usuarios_mes
+                'mes': ponto['mes'].strftime('%b/%Y'),
+                'usuarios': ponto['total']
             })
         
         return JsonResponse({
             'success': True,
             'data': {
-                'estatisticas_gerais': {
-                    'total_usuarios': total_usuarios,
-                    'usuarios_ativos': usuarios_ativos,
-                    'usuarios_admins': usuarios_admins,
-                    'usuarios_recentes': usuarios_recentes,
-                    'usuarios_inativos': usuarios_inativos,
-                    'usuarios_com_email': usuarios_com_email,
-                    'usuarios_com_chamadas': usuarios_com_chamadas,
-                    'usuarios_com_unidades': usuarios_com_unidades,
-                },
+                'estatisticas_gerais': estatisticas_gerais,
                 'ultimos_usuarios': ultimos_usuarios_data,
                 'estatisticas_mensais': meses_stats,
                 'timestamp': timezone.now().isoformat(),
@@ -2927,6 +2568,153 @@ def api_estatisticas_usuarios(request):
             'message': f'Erro ao carregar estatísticas: {str(e)}'
         }, status=500)
 
+def gerar_backup_sistema(usuario, format_type, include_users, include_unidades, include_chamadas):
+    """Gera o arquivo de backup (JSON ou CSV); retorna (response, filename)"""
+    # Gerar backup baseado nas opções selecionadas
+    backup_data = {}
+    backup_info = {
+        'gerado_em': timezone.now().isoformat(),
+        'gerado_por': usuario.username,
+        'versao_sistema': '1.0',
+        'tipos_incluidos': []
+    }
+    
+    if include_users:
+        users_data = []
+        for user in User.objects.all():
+            users_data.append({
+                'id': user.id,
+                'username': user.username,
+                'first_name': user.first_name,
+                'last_name': user.last_name,
+                'email': user.email,
+                'is_staff': user.is_staff,
+                'is_active': user.is_active,
+                'date_joined': user.date_joined.isoformat(),
+                'last_login': user.last_login.isoformat() if user.last_login else None,
+            })
+        backup_data['usuarios'] = users_data
+        backup_info['tipos_incluidos'].append(f"Usuários ({len(users_data)})")
+    
+    if include_unidades:
+        unidades_data = []
+        for unidade in UnidadeSaude.objects.all():
+            unidades_data.append({
+                'id': unidade.id,
+                'nome': unidade.nome,
+                'municipio': unidade.municipio,
+                'tipo': unidade.tipo,
+                'endereco': unidade.endereco,
+                'telefone': unidade.telefone,
+                'responsavel': unidade.responsavel,
+                'cnes': unidade.cnes,
+                'email': unidade.email,
+                'horario_funcionamento': unidade.horario_funcionamento,
+                'servicos_emergencia': unidade.servicos_emergencia,
+                'created_at': unidade.created_at.isoformat(),
+                'updated_at': unidade.updated_at.isoformat(),
+                'usuario_cadastrante_id': unidade.usuario_cadastrante.id if unidade.usuario_cadastrante else None,
+            })
+        backup_data['unidades_saude'] = unidades_data
+        backup_info['tipos_incluidos'].append(f"Unidades de Saúde ({len(unidades_data)})")
+    
+    if include_chamadas:
+        chamadas_data = []
+        for chamada in RegistroChamada.objects.all():
+            chamadas_data.append({
+                'id': chamada.id,
+                'nome_contato': chamada.nome_contato,
+                'telefone': chamada.telefone,
+                'funcao': chamada.funcao,
+                'setor': chamada.setor,
+                'unidade': chamada.unidade,
+                'municipio': chamada.municipio,
+                'cnes': chamada.cnes,
+                'contato_telefonico_cnes': chamada.contato_telefonico_cnes,
+                'tipo_chamada': chamada.tipo_chamada,
+                'status': chamada.status,
+                'nome_atendente': chamada.nome_atendente,
+                'descricao': chamada.descricao,
+                'solucao': chamada.solucao,
+                'data_criacao': chamada.data_criacao.isoformat(),
+                'usuario_criador_id': chamada.usuario_criador.id if chamada.usuario_criador else None,
+            })
+        backup_data['chamadas'] = chamadas_data
+        backup_info['tipos_incluidos'].append(f"Chamadas ({len(chamadas_data)})")
+    
+    backup_data['_info'] = backup_info
+    
+    # Preparar resposta de download
+    if format_type == 'json':
+        response = HttpResponse(
+            json.dumps(backup_data, indent=2, ensure_ascii=False),
+            content_type='application/json'
+        )
+        filename = f"backup_sistema_{timezone.now().strftime('%Y%m%d_%H%M%S')}.json"
+    elif format_type == 'csv':
+        response = HttpResponse(content_type='text/csv')
+        filename = f"backup_sistema_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        writer = csv.writer(response)
+        
+        # Cabeçalho com informações do backup
+        writer.writerow(['=== BACKUP DO SISTEMA ==='])
+        writer.writerow(['Gerado em:', backup_info['gerado_em']])
+        writer.writerow(['Gerado por:', backup_info['gerado_por']])
+        writer.writerow(['Tipos incluídos:', ', '.join(backup_info['tipos_incluidos'])])
+        writer.writerow([])
+        
+        # Dados dos usuários
+        if include_users:
+            writer.writerow(['=== USUÁRIOS ==='])
+            writer.writerow(['ID', 'Username', 'Nome', 'Sobrenome', 'Email', 'É Admin', 'Ativo', 'Data Cadastro'])
+            for user_data in backup_data.get('usuarios', []):
+                writer.writerow([
+                    user_data['id'],
+                    user_data['username'],
+                    user_data['first_name'],
+                    user_data['last_name'],
+                    user_data['email'],
+                    'Sim' if user_data['is_staff'] else 'Não',
+                    'Sim' if user_data['is_active'] else 'Não',
+                    user_data['date_joined']
+                ])
+            writer.writerow([])
+        
+        # Dados das unidades
+        if include_unidades:
+            writer.writerow(['=== UNIDADES DE SAÚDE ==='])
+            writer.writerow(['ID', 'Nome', 'Município', 'Tipo', 'CNES', 'Telefone', 'Data Cadastro'])
+            for unidade_data in backup_data.get('unidades_saude', []):
+                writer.writerow([
+                    unidade_data['id'],
+                    unidade_data['nome'],
+                    unidade_data['municipio'],
+                    unidade_data['tipo'],
+                    unidade_data['cnes'],
+                    unidade_data['telefone'],
+                    unidade_data['created_at']
+                ])
+            writer.writerow([])
+        
+        # Dados das chamadas
+        if include_chamadas:
+            writer.writerow(['=== CHAMADAS ==='])
+            writer.writerow(['ID', 'Contato', 'Telefone', 'Unidade', 'Tipo', 'Status', 'Data'])
+            for chamada_data in backup_data.get('chamadas', []):
+                writer.writerow([
+                    chamada_data['id'],
+                    chamada_data['nome_contato'],
+                    chamada_data['telefone'],
+                    chamada_data['unidade'],
+                    chamada_data['tipo_chamada'],
+                    chamada_data['status'],
+                    chamada_data['data_criacao']
+                ])
+    
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
+    return response, filename
+
 @login_required
 @user_passes_test(is_admin_user)
 def backup_sistema(request):
@@ -2935,180 +2723,38 @@ def backup_sistema(request):
     # Função protegida por decorator - apenas administradores podem acessar
     
     if request.method == 'POST':
-        try:
-            backup_type = request.POST.get('backup_type', '')
-            format_type = request.POST.get('format_type', 'json')
-            include_users = request.POST.get('include_users') == 'on'
-            include_unidades = request.POST.get('include_unidades') == 'on'
-            include_chamadas = request.POST.get('include_chamadas') == 'on'
-            
-            if not any([include_users, include_unidades, include_chamadas]):
-                messages.error(request, 'Selecione pelo menos um tipo de dados para fazer backup.')
-                return redirect('backup_sistema')
-            
-            # Gerar backup baseado nas opções selecionadas
-            backup_data = {}
-            backup_info = {
-                'gerado_em': timezone.now().isoformat(),
-                'gerado_por': request.user.username,
-                'versao_sistema': '1.0',
-                'tipos_incluidos': []
-            }
-            
-            if include_users:
-                users_data = []
-                for user in User.objects.all():
-                    users_data.append({
-                        'id': user.id,
-                        'username': user.username,
-                        'first_name': user.first_name,
-                        'last_name': user.last_name,
-                        'email': user.email,
-                        'is_staff': user.is_staff,
-                        'is_active': user.is_active,
-                        'date_joined': user.date_joined.isoformat(),
-                        'last_login': user.last_login.isoformat() if user.last_login else None,
-                    })
-                backup_data['usuarios'] = users_data
-                backup_info['tipos_incluidos'].append(f"Usuários ({len(users_data)})")
-            
-            if include_unidades:
-                unidades_data = []
-                for unidade in UnidadeSaude.objects.all():
-                    unidades_data.append({
-                        'id': unidade.id,
-                        'nome': unidade.nome,
-                        'municipio': unidade.municipio,
-                        'tipo': unidade.tipo,
-                        'endereco': unidade.endereco,
-                        'telefone': unidade.telefone,
-                        'responsavel': unidade.responsavel,
-                        'cnes': unidade.cnes,
-                        'email': unidade.email,
-                        'horario_funcionamento': unidade.horario_funcionamento,
-                        'servicos_emergencia': unidade.servicos_emergencia,
-                        'created_at': unidade.created_at.isoformat(),
-                        'updated_at': unidade.updated_at.isoformat(),
-                        'usuario_cadastrante_id': unidade.usuario_cadastrante.id if unidade.usuario_cadastrante else None,
-                    })
-                backup_data['unidades_saude'] = unidades_data
-                backup_info['tipos_incluidos'].append(f"Unidades de Saúde ({len(unidades_data)})")
-            
-            if include_chamadas:
-                chamadas_data = []
-                for chamada in RegistroChamada.objects.all():
-                    chamadas_data.append({
-                        'id': chamada.id,
-                        'nome_contato': chamada.nome_contato,
-                        'telefone': chamada.telefone,
-                        'funcao': chamada.funcao,
-                        'setor': chamada.setor,
-                        'unidade': chamada.unidade,
-                        'municipio': chamada.municipio,
-                        'cnes': chamada.cnes,
-                        'contato_telefonico_cnes': chamada.contato_telefonico_cnes,
-                        'tipo_chamada': chamada.tipo_chamada,
-                        'status': chamada.status,
-                        'nome_atendente': chamada.nome_atendente,
-                        'descricao': chamada.descricao,
-                        'solucao': chamada.solucao,
-                        'data_criacao': chamada.data_criacao.isoformat(),
-                        'usuario_criador_id': chamada.usuario_criador.id if chamada.usuario_criador else None,
-                    })
-                backup_data['chamadas'] = chamadas_data
-                backup_info['tipos_incluidos'].append(f"Chamadas ({len(chamadas_data)})")
-            
-            backup_data['_info'] = backup_info
-            
-            # Preparar resposta de download
-            if format_type == 'json':
-                response = HttpResponse(
-                    json.dumps(backup_data, indent=2, ensure_ascii=False),
-                    content_type='application/json'
-                )
-                filename = f"backup_sistema_{timezone.now().strftime('%Y%m%d_%H%M%S')}.json"
-            elif format_type == 'csv':
-                response = HttpResponse(content_type='text/csv')
-                filename = f"backup_sistema_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                writer = csv.writer(response)
-                
-                # Cabeçalho com informações do backup
-                writer.writerow(['=== BACKUP DO SISTEMA ==='])
-                writer.writerow(['Gerado em:', backup_info['gerado_em']])
-                writer.writerow(['Gerado por:', backup_info['gerado_por']])
-                writer.writerow(['Tipos incluídos:', ', '.join(backup_info['tipos_incluidos'])])
-                writer.writerow([])
-                
-                # Dados dos usuários
-                if include_users:
-                    writer.writerow(['=== USUÁRIOS ==='])
-                    writer.writerow(['ID', 'Username', 'Nome', 'Sobrenome', 'Email', 'É Admin', 'Ativo', 'Data Cadastro'])
-                    for user_data in backup_data.get('usuarios', []):
-                        writer.writerow([
-                            user_data['id'],
-                            user_data['username'],
-                            user_data['first_name'],
-                            user_data['last_name'],
-                            user_data['email'],
-                            'Sim' if user_data['is_staff'] else 'Não',
-                            'Sim' if user_data['is_active'] else 'Não',
-                            user_data['date_joined']
-                        ])
-                    writer.writerow([])
-                
-                # Dados das unidades
-                if include_unidades:
-                    writer.writerow(['=== UNIDADES DE SAÚDE ==='])
-                    writer.writerow(['ID', 'Nome', 'Município', 'Tipo', 'CNES', 'Telefone', 'Data Cadastro'])
-                    for unidade_data in backup_data.get('unidades_saude', []):
-                        writer.writerow([
-                            unidade_data['id'],
-                            unidade_data['nome'],
-                            unidade_data['municipio'],
-                            unidade_data['tipo'],
-                            unidade_data['cnes'],
-                            unidade_data['telefone'],
-                            unidade_data['created_at']
-                        ])
-                    writer.writerow([])
-                
-                # Dados das chamadas
-                if include_chamadas:
-                    writer.writerow(['=== CHAMADAS ==='])
-                    writer.writerow(['ID', 'Contato', 'Telefone', 'Unidade', 'Tipo', 'Status', 'Data'])
-                    for chamada_data in backup_data.get('chamadas', []):
-                        writer.writerow([
-                            chamada_data['id'],
-                            chamada_data['nome_contato'],
-                            chamada_data['telefone'],
-                            chamada_data['unidade'],
-                            chamada_data['tipo_chamada'],
-                            chamada_data['status'],
-                            chamada_data['data_criacao']
-                        ])
-            
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            
-            # Registrar a ação de backup
-            messages.success(request, f'Backup gerado com sucesso! Arquivo: {filename}')
-            
-            return response
-            
-        except Exception as e:
-            messages.error(request, f'Erro ao gerar backup: {str(e)}')
+        format_type = request.POST.get('format_type', 'json')
+        include_users = request.POST.get('include_users') == 'on'
+        include_unidades = request.POST.get('include_unidades') == 'on'
+        include_chamadas = request.POST.get('include_chamadas') == 'on'
+        
+        if not any([include_users, include_unidades, include_chamadas]):
+            messages.error(request, 'Selecione pelo menos um tipo de dados para fazer backup.')
             return redirect('backup_sistema')
+        
+        # O backup é gerado pela fila de exportações, fora da requisição (a página acompanha
+        # o progresso pelo ExportacaoService; sem JavaScript, o download aparece na lista abaixo)
+        tarefa = enfileirar_exportacao(request.user, 'backup', {
+            'format_type': format_type,
+            'include_users': include_users,
+            'include_unidades': include_unidades,
+            'include_chamadas': include_chamadas,
+        })
+        messages.success(request, f'Backup #{tarefa.id} em preparação.')
+        return redirect('backup_sistema')
     
     # GET - Exibir página de configuração de backup
     # Calcular estatísticas para exibir na página
+    contadores_unidades = obter_estatisticas_dashboard()
     stats = {
         'total_usuarios': User.objects.count(),
         'usuarios_ativos': User.objects.filter(is_active=True).count(),
         'usuarios_admins': User.objects.filter(is_staff=True).count(),
-        'total_unidades': UnidadeSaude.objects.count(),
+        'total_unidades': contadores_unidades['total_unidades'],
         'unidades_tipos': {
-            'executantes': UnidadeSaude.objects.filter(tipo='UNIDADE_EXECUTANTE').count(),
-            'solicitantes': UnidadeSaude.objects.filter(tipo='UNIDADE_SOLICITANTE').count(),
-            'executante_solicitante': UnidadeSaude.objects.filter(tipo='EXECUTANTE_SOLICITANTE').count(),
+            'executantes': contadores_unidades['executantes'],
+            'solicitantes': contadores_unidades['solicitantes'],
+            'executante_solicitante': contadores_unidades['executante_solicitante'],
         },
         'total_chamadas': RegistroChamada.objects.count(),
         'chamadas_tipos': {},
@@ -3142,6 +2788,10 @@ def backup_sistema(request):
         'stats': stats,
         'disk_space_free': round(disk_space_free, 2),
         'estimated_backup_size': sum(stats['tamanho_estimado'].values()),
+        'backups_recentes': [
+            serializar_tarefa(tarefa)
+            for tarefa in TarefaExportacao.objects.filter(usuario=request.user, tipo='backup')[:5]
+        ],
     }
     
     return render(request, 'backup_sistema.html', context)
@@ -3181,6 +2831,10 @@ def relatorios_sistema(request):
         'total_chamadas': RegistroChamada.objects.count(),
     }
     
+    # Séries mensais (últimos 12 meses, uma consulta por tabela)
+    serie_usuarios = serie_mensal(User.objects.all(), 'date_joined', 12)
+    serie_chamadas = serie_mensal(RegistroChamada.objects.all(), 'data_criacao', 12)
+    
     # RELATÓRIO DE USUÁRIOS
     usuarios_stats = {
         'por_mes': {},
@@ -3190,21 +2844,13 @@ def relatorios_sistema(request):
         },
         'atividade_recente': {},
         'top_usuarios': [],
-        'usuarios_mes_atual': User.objects.filter(
-            date_joined__year=hoje.year,
-            date_joined__month=hoje.month
-        ).count()
+        'usuarios_mes_atual': serie_usuarios[-1]['total']
     }
     
-    # Usuários por mês (últimos 12 meses)
-    for i in range(12):
-        data = hoje - timedelta(days=30 * i)
-        mes_nome = calendar.month_name[data.month]
-        usuarios_mes = User.objects.filter(
-            date_joined__year=data.year,
-            date_joined__month=data.month
-        ).count()
-        usuarios_stats['por_mes'][f"{mes_nome} {data.year}"] = usuarios_mes
+    # Usuários por mês (últimos 12 meses, do mais recente para o mais antigo)
+    for ponto in reversed(serie_usuarios):
+        mes_nome = calendar.month_name[ponto['mes'].month]
+        usuarios_stats['por_mes'][f"{mes_nome} {ponto['mes'].year}"] = ponto['total']
     
     # Top usuários por atividade - VERSÃO SIMPLIFICADA E GARANTIDA
     usuarios_stats['top_usuarios'] = []
@@ -3289,18 +2935,7 @@ def relatorios_sistema(request):
         unidades_stats['por_municipio'][municipio['municipio']] = municipio['total']
     
     # Unidades mais ativas (com mais chamadas)
-    # Como não há ForeignKey direto, vamos calcular manualmente
-    unidades_ativas_data = []
-    for unidade in UnidadeSaude.objects.all():
-        total_chamadas = RegistroChamada.objects.filter(unidade=unidade.nome).count()
-        unidades_ativas_data.append({
-            'unidade': unidade,
-            'total_chamadas': total_chamadas
-        })
-    
-    # Ordenar por total de chamadas e pegar os top 10
-    unidades_ativas_data.sort(key=lambda x: x['total_chamadas'], reverse=True)
-    unidades_stats['mais_ativas'] = unidades_ativas_data[:10]
+    unidades_stats['mais_ativas'] = unidades_mais_ativas(10)
     
     # RELATÓRIO DE CHAMADAS
     chamadas_stats = {
@@ -3350,15 +2985,10 @@ def relatorios_sistema(request):
         count = RegistroChamada.objects.filter(status=status).count()
         chamadas_stats['por_status'][status.replace('_', ' ').title()] = count
     
-    # Chamadas por mês (últimos 12 meses)
-    for i in range(12):
-        data = hoje - timedelta(days=30 * i)
-        mes_nome = calendar.month_name[data.month]
-        chamadas_mes = RegistroChamada.objects.filter(
-            data_criacao__year=data.year,
-            data_criacao__month=data.month
-        ).count()
-        chamadas_stats['por_mes'][f"{mes_nome} {data.year}"] = chamadas_mes
+    # Chamadas por mês (últimos 12 meses, do mais recente para o mais antigo)
+    for ponto in reversed(serie_chamadas):
+        mes_nome = calendar.month_name[ponto['mes'].month]
+        chamadas_stats['por_mes'][f"{mes_nome} {ponto['mes'].year}"] = ponto['total']
     
     # ANÁLISES AVANÇADAS
     analises = {
@@ -3370,11 +3000,8 @@ def relatorios_sistema(request):
     }
     
     # Calcular crescimento mensal
-    mes_atual = User.objects.filter(date_joined__month=hoje.month, date_joined__year=hoje.year).count()
-    mes_anterior = User.objects.filter(
-        date_joined__month=(hoje - timedelta(days=30)).month,
-        date_joined__year=(hoje - timedelta(days=30)).year
-    ).count()
+    mes_atual = serie_usuarios[-1]['total']
+    mes_anterior = serie_usuarios[-2]['total']
     
     if mes_anterior > 0:
         analises['crescimento_usuarios'] = round(((mes_atual - mes_anterior) / mes_anterior) * 100, 1)
@@ -3423,7 +3050,6 @@ def relatorios_sistema(request):
 @login_required
 def export_relatorio_usuarios_mes_excel(request):
     """Exportar relatório detalhado de Novos Usuários por Mês em Excel"""
-    import pandas as pd
     from datetime import datetime, timedelta
     import calendar
     
@@ -3435,23 +3061,20 @@ def export_relatorio_usuarios_mes_excel(request):
     dados_mensais = []
     dados_detalhados = []
     
+    # Totais por mês e usuários do período (já anotados) em consultas fixas
+    serie = usuarios_por_mes(periodo_meses, detalhar=True)
+    
     # Calcular dados para cada mês
-    for i in range(periodo_meses):
-        data_mes = hoje - timedelta(days=30 * i)
+    for ponto in serie:
+        data_mes = ponto['mes']
         mes_nome = calendar.month_name[data_mes.month]
         ano = data_mes.year
         
-        # Usuários criados no mês
-        usuarios_mes = User.objects.filter(
-            date_joined__year=ano,
-            date_joined__month=data_mes.month
-        ).order_by('date_joined')
-        
         # Estatísticas do mês
-        total_mes = usuarios_mes.count()
-        ativos_mes = usuarios_mes.filter(is_active=True).count()
-        admins_mes = usuarios_mes.filter(is_staff=True).count()
-        usuarios_comuns_mes = usuarios_mes.filter(is_staff=False).count()
+        total_mes = ponto['total']
+        ativos_mes = ponto['ativos']
+        admins_mes = ponto['admins']
+        usuarios_comuns_mes = total_mes - admins_mes
         
         dados_mensais.append({
             'Mês': f"{mes_nome} {ano}",
@@ -3466,10 +3089,7 @@ def export_relatorio_usuarios_mes_excel(request):
         })
         
         # Dados detalhados de cada usuário do mês
-        for usuario in usuarios_mes:
-            unidades_count = UnidadeSaude.objects.filter(usuario_cadastrante=usuario).count()
-            chamadas_count = RegistroChamada.objects.filter(usuario_criador=usuario).count()
-            
+        for usuario in ponto['usuarios']:
             dados_detalhados.append({
                 'Mês Cadastro': f"{mes_nome} {ano}",
                 'Data Cadastro': usuario.date_joined.strftime('%d/%m/%Y %H:%M:%S'),
@@ -3480,27 +3100,18 @@ def export_relatorio_usuarios_mes_excel(request):
                 'Status': 'Ativo' if usuario.is_active else 'Inativo',
                 'Superusuário': 'Sim' if usuario.is_superuser else 'Não',
                 'Último Login': usuario.last_login.strftime('%d/%m/%Y %H:%M:%S') if usuario.last_login else 'Nunca fez login',
-                'Unidades Cadastradas': unidades_count,
-                'Chamadas Registradas': chamadas_count,
+                'Unidades Cadastradas': usuario.unidades_count,
+                'Chamadas Registradas': usuario.chamadas_count,
                 'Dias Desde Cadastro': (timezone.now().date() - usuario.date_joined.date()).days,
             })
     
-    # Reverter para ordem cronológica
-    dados_mensais.reverse()
-    
-    # Estatísticas gerais do período
-    total_periodo = User.objects.filter(
-        date_joined__gte=hoje - timedelta(days=30 * periodo_meses)
-    ).count()
-    
-    usuarios_periodo = User.objects.filter(
-        date_joined__gte=hoje - timedelta(days=30 * periodo_meses)
-    )
+    # Estatísticas gerais do período (somadas a partir da série mensal)
+    total_periodo = sum(ponto['total'] for ponto in serie)
     
     estatisticas_periodo = {
         'Total Usuários Criados': total_periodo,
-        'Usuários Ativos': usuarios_periodo.filter(is_active=True).count(),
-        'Administradores': usuarios_periodo.filter(is_staff=True).count(),
+        'Usuários Ativos': sum(ponto['ativos'] for ponto in serie),
+        'Administradores': sum(ponto['admins'] for ponto in serie),
         'Taxa Média Mensal': round(total_periodo / periodo_meses, 2),
         'Melhor Mês': max(dados_mensais, key=lambda x: x['Total Novos Usuários'])['Mês'] if dados_mensais else 'N/A',
         'Máximo em um Mês': max(dados_mensais, key=lambda x: x['Total Novos Usuários'])['Total Novos Usuários'] if dados_mensais else 0,
@@ -3508,92 +3119,74 @@ def export_relatorio_usuarios_mes_excel(request):
         'Data do Relatório': timezone.now().strftime('%d/%m/%Y %H:%M:%S'),
     }
     
-    # Criar arquivo Excel com múltiplas abas
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = 'attachment; filename="relatorio_usuarios_por_mes.xlsx"'
-    
-    with pd.ExcelWriter(response, engine='openpyxl') as writer:
+    # Arquivo Excel com múltiplas abas
+    abas = [
         # Aba 1: Resumo Mensal
-        df_mensal = pd.DataFrame(dados_mensais)
-        df_mensal.to_excel(writer, sheet_name='Resumo Mensal', index=False)
-        
+        aba_de_registros('Resumo Mensal', dados_mensais),
         # Aba 2: Usuários Detalhados
-        df_detalhado = pd.DataFrame(dados_detalhados)
-        df_detalhado.to_excel(writer, sheet_name='Usuários Detalhados', index=False)
-        
+        aba_de_registros('Usuários Detalhados', dados_detalhados),
         # Aba 3: Estatísticas do Período
-        df_stats = pd.DataFrame([estatisticas_periodo])
-        df_stats.to_excel(writer, sheet_name='Estatísticas Período', index=False)
-        
-        # Aba 4: Análise de Tendências
-        if len(dados_mensais) >= 2:
-            tendencias = []
-            for i in range(1, len(dados_mensais)):
-                mes_atual = dados_mensais[i]
-                mes_anterior = dados_mensais[i-1]
-                
-                crescimento = mes_atual['Total Novos Usuários'] - mes_anterior['Total Novos Usuários']
-                crescimento_perc = round((crescimento / mes_anterior['Total Novos Usuários'] * 100) if mes_anterior['Total Novos Usuários'] > 0 else 0, 2)
-                
-                tendencias.append({
-                    'Mês': mes_atual['Mês'],
-                    'Usuários Mês Atual': mes_atual['Total Novos Usuários'],
-                    'Usuários Mês Anterior': mes_anterior['Total Novos Usuários'],
-                    'Crescimento Absoluto': crescimento,
-                    'Crescimento (%)': crescimento_perc,
-                    'Tendência': 'Crescimento' if crescimento > 0 else 'Decréscimo' if crescimento < 0 else 'Estável'
-                })
+        aba_de_registros('Estatísticas Período', [estatisticas_periodo]),
+    ]
+    
+    # Aba 4: Análise de Tendências
+    if len(dados_mensais) >= 2:
+        tendencias = []
+        for i in range(1, len(dados_mensais)):
+            mes_atual = dados_mensais[i]
+            mes_anterior = dados_mensais[i-1]
             
-            df_tendencias = pd.DataFrame(tendencias)
-            df_tendencias.to_excel(writer, sheet_name='Análise Tendências', index=False)
+            crescimento = mes_atual['Total Novos Usuários'] - mes_anterior['Total Novos Usuários']
+            crescimento_perc = round((crescimento / mes_anterior['Total Novos Usuários'] * 100) if mes_anterior['Total Novos Usuários'] > 0 else 0, 2)
+            
+            tendencias.append({
+                'Mês': mes_atual['Mês'],
+                'Usuários Mês Atual': mes_atual['Total Novos Usuários'],
+                'Usuários Mês Anterior': mes_anterior['Total Novos Usuários'],
+                'Crescimento Absoluto': crescimento,
+                'Crescimento (%)': crescimento_perc,
+                'Tendência': 'Crescimento' if crescimento > 0 else 'Decréscimo' if crescimento < 0 else 'Estável'
+            })
+        
+        abas.append(aba_de_registros('Análise Tendências', tendencias))
     
-    return response
+    return resposta_xlsx('relatorio_usuarios_por_mes.xlsx', abas)
 
 @login_required
 def export_relatorio_usuarios_mes_csv(request):
     """Exportar relatório de Novos Usuários por Mês em CSV"""
-    import csv
-    from datetime import datetime, timedelta
     import calendar
     
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="relatorio_usuarios_por_mes.csv"'
-    
-    writer = csv.writer(response)
+    linhas = []
     
     # Cabeçalho do relatório
-    writer.writerow(['RELATÓRIO DE NOVOS USUÁRIOS POR MÊS'])
-    writer.writerow(['Data de Geração:', timezone.now().strftime('%d/%m/%Y %H:%M:%S')])
-    writer.writerow(['Sistema de Registro de Chamados'])
-    writer.writerow([])  # Linha em branco
+    linhas.append(['RELATÓRIO DE NOVOS USUÁRIOS POR MÊS'])
+    linhas.append(['Data de Geração:', timezone.now().strftime('%d/%m/%Y %H:%M:%S')])
+    linhas.append(['Sistema de Registro de Chamados'])
+    linhas.append([])  # Linha em branco
     
     # Configurar período
-    hoje = timezone.now().date()
     periodo_meses = int(request.GET.get('periodo', 12))
     
     # Cabeçalho dos dados
-    writer.writerow([
+    linhas.append([
         'Mês/Ano', 'Total Novos Usuários', 'Usuários Ativos', 
         'Administradores', 'Usuários Comuns', 'Taxa de Ativação (%)', 
         'Percentual Admins (%)'
     ])
     
-    # Dados mensais
+    # Dados mensais (uma única consulta, já em ordem cronológica)
+    serie = usuarios_por_mes(periodo_meses)
+    
     dados_mensais = []
-    for i in range(periodo_meses):
-        data_mes = hoje - timedelta(days=30 * i)
-        mes_nome = calendar.month_name[data_mes.month]
-        ano = data_mes.year
+    for ponto in serie:
+        mes_nome = calendar.month_name[ponto['mes'].month]
+        ano = ponto['mes'].year
         
-        usuarios_mes = User.objects.filter(
-            date_joined__year=ano,
-            date_joined__month=data_mes.month
-        )
-        
-        total_mes = usuarios_mes.count()
-        ativos_mes = usuarios_mes.filter(is_active=True).count()
-        admins_mes = usuarios_mes.filter(is_staff=True).count()
-        usuarios_comuns_mes = usuarios_mes.filter(is_staff=False).count()
+        total_mes = ponto['total']
+        ativos_mes = ponto['ativos']
+        admins_mes = ponto['admins']
+        usuarios_comuns_mes = total_mes - admins_mes
         
         dados_mensais.append([
             f"{mes_nome} {ano}",
@@ -3606,23 +3199,21 @@ def export_relatorio_usuarios_mes_csv(request):
         ])
     
     # Escrever dados em ordem cronológica
-    dados_mensais.reverse()
-    for linha in dados_mensais:
-        writer.writerow(linha)
+    linhas.extend(dados_mensais)
     
     # Estatísticas resumo
-    writer.writerow([])  # Linha em branco
-    writer.writerow(['ESTATÍSTICAS DO PERÍODO'])
+    linhas.append([])  # Linha em branco
+    linhas.append(['ESTATÍSTICAS DO PERÍODO'])
     
     total_periodo = sum(linha[1] for linha in dados_mensais)
-    writer.writerow(['Total de Usuários Criados:', total_periodo])
-    writer.writerow(['Média Mensal:', round(total_periodo / periodo_meses, 2)])
+    linhas.append(['Total de Usuários Criados:', total_periodo])
+    linhas.append(['Média Mensal:', round(total_periodo / periodo_meses, 2)])
     
     if dados_mensais:
         melhor_mes_linha = max(dados_mensais, key=lambda x: x[1])
-        writer.writerow(['Melhor Mês:', f"{melhor_mes_linha[0]} ({melhor_mes_linha[1]} usuários)"])
+        linhas.append(['Melhor Mês:', f"{melhor_mes_linha[0]} ({melhor_mes_linha[1]} usuários)"])
     
-    return response
+    return resposta_csv_streaming('relatorio_usuarios_por_mes.csv', None, linhas)
 
 @login_required
 def export_relatorio_usuarios_mes_pdf(request):
@@ -3785,48 +3376,25 @@ def export_relatorio_usuarios_mes_pdf(request):
         total_periodo = 0
         dados_mensais = []
         
-        for i in range(periodo_meses):
-            data_mes = hoje - timedelta(days=30 * i)
-            mes_nome = calendar.month_name[data_mes.month]
-            ano = data_mes.year
+        # Uma única consulta agrupada por mês (já em ordem cronológica)
+        serie = usuarios_por_mes(periodo_meses)
+        
+        for ponto in serie:
+            total_mes = ponto['total']
+            ativos_mes = ponto['ativos']
+            taxa_ativacao = round((ativos_mes / total_mes * 100) if total_mes > 0 else 0, 1)
             
-            # Buscar usuários do mês
-            try:
-                usuarios_mes = User.objects.filter(
-                    date_joined__year=ano,
-                    date_joined__month=data_mes.month
-                )
-                
-                total_mes = usuarios_mes.count()
-                ativos_mes = usuarios_mes.filter(is_active=True).count()
-                admins_mes = usuarios_mes.filter(is_staff=True).count()
-                taxa_ativacao = round((ativos_mes / total_mes * 100) if total_mes > 0 else 0, 1)
-                
-                dados_mensais.append({
-                    'mes': f"{mes_nome} {ano}",
-                    'total': total_mes,
-                    'ativos': ativos_mes,
-                    'admins': admins_mes,
-                    'taxa': taxa_ativacao
-                })
-                total_periodo += total_mes
-                
-            except Exception as e:
-                print(f"❌ [PDF] Erro ao processar mês {mes_nome} {ano}: {e}")
-                # Adicionar dados vazios em caso de erro
-                dados_mensais.append({
-                    'mes': f"{mes_nome} {ano}",
-                    'total': 0,
-                    'ativos': 0,
-                    'admins': 0,
-                    'taxa': 0
-                })
+            dados_mensais.append({
+                'mes': f"{calendar.month_name[ponto['mes'].month]} {ponto['mes'].year}",
+                'total': total_mes,
+                'ativos': ativos_mes,
+                'admins': ponto['admins'],
+                'taxa': taxa_ativacao
+            })
+            total_periodo += total_mes
         
         print(f"📈 [PDF] Dados coletados: {len(dados_mensais)} meses, Total: {total_periodo} usuários")
         
-        # Reverter para ordem cronológica
-        dados_mensais.reverse()
-        
         # === CRIAR TABELA PRINCIPAL ===
         for dado in dados_mensais:
             dados_tabela.append([
@@ -4175,51 +3743,33 @@ def remove_avatar(request):
 @login_required
 def lista_telefonica(request):
     """View para exibir a lista telefônica das unidades de saúde"""
-    # Buscar todas as unidades de saúde
-    unidades = UnidadeSaude.objects.all().order_by('nome')
+    modelo = modelo_unidades()
     
     # Filtros
     busca = request.GET.get('busca', '')
     tipo_filtro = request.GET.get('tipo', '')
     municipio_filtro = request.GET.get('municipio', '')
     
-    # Aplicar filtros
-    if busca:
-        unidades = unidades.filter(
-            Q(nome__icontains=busca) |
-            Q(telefone__icontains=busca) |
-            Q(responsavel__icontains=busca) |
-            Q(municipio__icontains=busca)
-        )
-    
-    if tipo_filtro:
-        unidades = unidades.filter(tipo=tipo_filtro)
-    
-    if municipio_filtro:
-        unidades = unidades.filter(municipio__icontains=municipio_filtro)
+    # Aplicar filtros (em memória)
+    unidades = modelo.filtrar(busca, tipo_filtro, municipio_filtro)
     
     # Estatísticas
-    total_unidades = unidades.count()
-    executantes = unidades.filter(tipo='UNIDADE_EXECUTANTE').count()
-    solicitantes = unidades.filter(tipo='UNIDADE_SOLICITANTE').count()
-    executante_solicitante = unidades.filter(tipo='EXECUTANTE_SOLICITANTE').count()
-    
-    # Lista de municípios únicos para o filtro
-    municipios = UnidadeSaude.objects.values_list('municipio', flat=True).distinct().order_by('municipio')
+    contadores = modelo.contadores(unidades)
     
     context = {
         'unidades': unidades,
-        'municipios': municipios,
+        # Lista de municípios únicos para o filtro
+        'municipios': modelo.municipios(),
         'filtros': {
             'busca': busca,
             'tipo': tipo_filtro,
             'municipio': municipio_filtro,
         },
         'estatisticas': {
-            'total': total_unidades,
-            'executantes': executantes,
-            'solicitantes': solicitantes,
-            'executante_solicitante': executante_solicitante,
+            'total': contadores['total'],
+            'executantes': contadores['executantes'],
+            'solicitantes': contadores['solicitantes'],
+            'executante_solicitante': contadores['executante_solicitante'],
         }
     }
     
@@ -4228,38 +3778,64 @@ def lista_telefonica(request):
 @csrf_exempt
 @login_required
 def api_lista_telefonica(request):
-    """API para listar unidades de saúde para a Lista Telefônica (React)"""
+    """
+    API para listar unidades de saúde para a Lista Telefônica (React)
+
+    Filtra e pagina o modelo de leitura em memória. Sem `por_pagina` devolve todas as
+    unidades filtradas, como antes; com `por_pagina` (e `pagina`, a partir de 1) só a página.
+    """
     busca = request.GET.get('busca', '')
     tipo_filtro = request.GET.get('tipo', '')
     municipio_filtro = request.GET.get('municipio', '')
 
-    unidades = UnidadeSaude.objects.all().order_by('nome')
+    unidades = modelo_unidades().filtrar(busca, tipo_filtro, municipio_filtro)
+    resposta = {'total': len(unidades)}
 
-    if busca:
-        unidades = unidades.filter(
-            Q(nome__icontains=busca) |
-            Q(telefone__icontains=busca) |
-            Q(responsavel__icontains=busca) |
-            Q(municipio__icontains=busca)
-        )
-    if tipo_filtro:
-        unidades = unidades.filter(tipo=tipo_filtro)
-    if municipio_filtro:
-        unidades = unidades.filter(municipio__icontains=municipio_filtro)
+    if request.GET.get('por_pagina'):
+        por_pagina = tamanho_pagina(request.GET.get('por_pagina'))
+        try:
+            pagina = max(1, int(request.GET.get('pagina', 1)))
+        except ValueError:
+            pagina = 1
+        unidades = unidades[(pagina - 1) * por_pagina:pagina * por_pagina]
+        resposta.update({'pagina': pagina, 'por_pagina': por_pagina})
+
+    resposta['unidades'] = [u.dados_lista_telefonica for u in unidades]
+    return JsonResponse(resposta, safe=False)
 
-    data = [
+@login_required
+def api_unidades_autocomplete(request):
+    """
+    API para autocomplete dos nomes das unidades de saúde (modelo de leitura em memória)
+    """
+    query = request.GET.get('q', '').strip()
+    tipo_filtro = request.GET.get('tipo', '')
+
+    if len(query) < 2:
+        return JsonResponse({
+            'results': []
+        })
+
+    try:
+        limite = max(1, min(int(request.GET.get('limit', 10)), 50))
+    except ValueError:
+        limite = 10
+
+    results = [
         {
-            'id': u.id,
-            'nome': u.nome,
-            'telefone': u.telefone,
-            'responsavel': u.responsavel,
-            'municipio': u.municipio,
-            'cnes': u.cnes,
-            'tipo': u.tipo,
+            'id': unidade.id,
+            'text': unidade.nome,
+            'nome': unidade.nome,
+            'municipio': unidade.municipio,
+            'cnes': unidade.cnes,
+            'tipo': unidade.tipo,
         }
-        for u in unidades
+        for unidade in modelo_unidades().buscar_por_nome(query, limite, tipo_filtro)
     ]
-    return JsonResponse({'unidades': data}, safe=False)
+
+    return JsonResponse({
+        'results': results
+    })
 
 @login_required
 def export_relatorio_geral_excel(request):
@@ -4292,15 +3868,13 @@ def export_relatorio_geral_excel(request):
 def export_relatorio_geral_csv(request):
     """Exporta relatório geral em CSV - TEMPORARIAMENTE DESABILITADO"""
     # Função temporariamente simplificada para resolver problemas de indentação
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    response['Content-Disposition'] = 'attachment; filename="relatorio_temporario.csv"'
-    response.write('\ufeff')
-    
-    import csv
-    writer = csv.writer(response)
-    writer.writerow(['Funcionalidade', 'Status'])
-    writer.writerow(['Relatório CSV', 'Em desenvolvimento'])
-    return response
+    return resposta_csv_streaming(
+        'relatorio_temporario.csv',
+        ['Funcionalidade', 'Status'],
+        [['Relatório CSV', 'Em desenvolvimento']],
+        bom=True,
+        content_type='text/csv; charset=utf-8',
+    )
 
 @login_required
 def export_relatorio_geral_pdf(request):
@@ -24,35 +24,10 @@ def test_basic_react(request):
 @login_required
 def home_react_working(request):
     """Dashboard React que funciona com certeza"""
-    from .models import RegistroChamada, UnidadeSaude
-    from django.utils import timezone
-    
-    # Estatísticas das unidades de saúde
-    total_unidades = UnidadeSaude.objects.count()
-    executantes = UnidadeSaude.objects.filter(tipo='UNIDADE_EXECUTANTE').count()
-    solicitantes = UnidadeSaude.objects.filter(tipo='UNIDADE_SOLICITANTE').count()
-    executante_solicitante = UnidadeSaude.objects.filter(tipo='EXECUTANTE_SOLICITANTE').count()
-    
-    # Estatísticas das chamadas
-    total_chamadas = RegistroChamada.objects.count()
-    chamadas_hoje = RegistroChamada.objects.filter(
-        data_criacao__date=timezone.now().date()
-    ).count()
-    chamadas_mes = RegistroChamada.objects.filter(
-        data_criacao__month=timezone.now().month,
-        data_criacao__year=timezone.now().year
-    ).count()
+    from .estatisticas import obter_estatisticas_dashboard
     
     context = {
-        'estatisticas': {
-            'total_unidades': total_unidades,
-            'executantes': executantes,
-            'solicitantes': solicitantes,
-            'executante_solicitante': executante_solicitante,
-            'total_chamadas': total_chamadas,
-            'chamadas_hoje': chamadas_hoje,
-            'chamadas_mes': chamadas_mes,
-        }
+        'estatisticas': obter_estatisticas_dashboard()
     }
     
     return render(request, 'home_react_working.html', context)
\ No newline at end of file
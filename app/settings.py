@@ -97,6 +97,84 @@ if 'DATABASE_URL' in os.environ:
     )
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# LocMem por padrão; em produção com vários workers use um backend compartilhado
+# (ex.: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache)
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'app-cache'),
+    }
+}
+
+# Contadores do dashboard: alias do cache e intervalo de recálculo completo (segundos).
+# Os sinais incrementam os contadores no cache, então ele precisa ser visto por todos os
+# workers: com WEB_CONCURRENCY > 1 use um CACHE_BACKEND compartilhado (Redis/Memcached;
+# incr atômico). A inicialização falha se o alias for LocMemCache e WEB_WORKERS > 1.
+ESTATISTICAS_CACHE_ALIAS = os.environ.get('ESTATISTICAS_CACHE_ALIAS', 'default')
+ESTATISTICAS_CACHE_TIMEOUT = int(os.environ.get('ESTATISTICAS_CACHE_TIMEOUT', 300))
+
+# Workers do servidor (o gunicorn lê WEB_CONCURRENCY); usado para recusar configurações
+# de cache que não chegam a todos eles
+WEB_WORKERS = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Versões dos modelos de leitura em memória (accounts.leitura_unidades). O cache precisa ser
+# visível a todos os workers: por padrão um FileBasedCache (mesma máquina); com vários
+# servidores e CACHE_BACKEND compartilhado (Redis/Memcached) use UNIDADES_CACHE_ALIAS=default.
+# A inicialização falha se o alias for LocMemCache e WEB_WORKERS > 1.
+CACHES['versoes'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': os.environ.get('CACHE_VERSOES_LOCATION', str(BASE_DIR / '.cache' / 'versoes')),
+}
+UNIDADES_CACHE_ALIAS = os.environ.get('UNIDADES_CACHE_ALIAS', 'versoes')
+# Cada processo lê o token de versão no cache no máximo a cada UNIDADES_VERSAO_INTERVALO
+# segundos: é o atraso máximo para os outros workers verem uma alteração nas unidades
+UNIDADES_VERSAO_INTERVALO = float(os.environ.get('UNIDADES_VERSAO_INTERVALO', 2))
+# Idade máxima (segundos) da cópia local, recarregada em segundo plano mesmo sem nova versão
+UNIDADES_LEITURA_IDADE_MAXIMA = int(os.environ.get('UNIDADES_LEITURA_IDADE_MAXIMA', 300))
+
+# Exportações em segundo plano (accounts.tarefas_exportacao)
+# Em produção as tarefas são executadas por `python manage.py processar_exportacoes`, um
+# processo separado dos workers web (ex.: outro serviço do systemd/supervisor). Com
+# EXPORTACAO_WORKER_EM_PROCESSO=1 elas rodam em threads do próprio servidor web, o que
+# só convém em desenvolvimento: as exportações pesadas voltariam a disputar o servidor.
+EXPORTACAO_WORKER_EM_PROCESSO = os.environ.get('EXPORTACAO_WORKER_EM_PROCESSO', '0') == '1'
+EXPORTACAO_WORKERS = int(os.environ.get('EXPORTACAO_WORKERS', 2))
+# O worker renova o batimento da tarefa a cada EXPORTACAO_BATIMENTO_SEGUNDOS; sem batimento
+# por EXPORTACAO_TIMEOUT_MINUTOS a tarefa volta à fila (uma exportação longa e viva não volta)
+EXPORTACAO_BATIMENTO_SEGUNDOS = int(os.environ.get('EXPORTACAO_BATIMENTO_SEGUNDOS', 30))
+EXPORTACAO_TIMEOUT_MINUTOS = int(os.environ.get('EXPORTACAO_TIMEOUT_MINUTOS', 5))
+EXPORTACAO_MAX_TENTATIVAS = 3
+EXPORTACAO_RETENCAO_HORAS = int(os.environ.get('EXPORTACAO_RETENCAO_HORAS', 24))
+# Worker em processo: segundos entre as rodadas de manutenção (travadas, expiradas, pendentes)
+EXPORTACAO_INTERVALO_MANUTENCAO = int(os.environ.get('EXPORTACAO_INTERVALO_MANUTENCAO', 60))
+
+# PDFs longos (accounts.recursos_pdf.gerar_pdf_em_partes): com PDF_PROCESSOS > 1 as linhas
+# são divididas em partes de PDF_LINHAS_POR_PROCESSO, renderizadas em processos separados
+# e juntadas com pypdf. 0 ou 1 = tudo no próprio processo.
+PDF_PROCESSOS = int(os.environ.get('PDF_PROCESSOS', 0))
+PDF_LINHAS_POR_PROCESSO = int(os.environ.get('PDF_LINHAS_POR_PROCESSO', 3000))
+
+# Consulta ao CNES (accounts.cnes): respostas da API guardadas no banco (CnesCache).
+# Dentro do TTL a consulta não sai do banco; até CNES_CACHE_STALE_HORAS depois disso o
+# registro antigo é devolvido na hora e atualizado em segundo plano. O que veio de
+# `manage.py import_cnes` não expira (atualize importando um arquivo mais novo).
+CNES_API_URL = os.environ.get('CNES_API_URL', 'https://apidadosabertos.saude.gov.br/cnes/estabelecimentos/')
+CNES_API_TIMEOUT = float(os.environ.get('CNES_API_TIMEOUT', 5))  # leitura, por tentativa
+CNES_API_TIMEOUT_CONEXAO = float(os.environ.get('CNES_API_TIMEOUT_CONEXAO', 3))
+CNES_API_TENTATIVAS = int(os.environ.get('CNES_API_TENTATIVAS', 2))
+CNES_API_CONEXOES = int(os.environ.get('CNES_API_CONEXOES', 10))  # conexões keep-alive no pool
+# Disjuntor: após CNES_CIRCUITO_FALHAS falhas seguidas, a API fica sem ser chamada por
+# CNES_CIRCUITO_ESPERA segundos (as consultas usam o cache ou falham na hora)
+CNES_CIRCUITO_FALHAS = int(os.environ.get('CNES_CIRCUITO_FALHAS', 5))
+CNES_CIRCUITO_ESPERA = int(os.environ.get('CNES_CIRCUITO_ESPERA', 30))
+CNES_CACHE_TTL_HORAS = int(os.environ.get('CNES_CACHE_TTL_HORAS', 24 * 7))
+CNES_CACHE_STALE_HORAS = int(os.environ.get('CNES_CACHE_STALE_HORAS', 24 * 30))
+CNES_CACHE_TTL_NAO_ENCONTRADO_HORAS = int(os.environ.get('CNES_CACHE_TTL_NAO_ENCONTRADO_HORAS', 1))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -123,6 +201,9 @@ LANGUAGE_CODE = 'pt-br'
 
 TIME_ZONE = 'America/Sao_Paulo'
 
+# Fuso em que dias e meses dos relatórios e filtros de data são contados (accounts/periodos.py)
+FUSO_HORARIO_CALENDARIO = 'America/Campo_Grande'
+
 USE_I18N = True
 
 USE_TZ = True
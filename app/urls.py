@@ -28,6 +28,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('accounts/', include('accounts.urls')),
     path('api-auth/', include('rest_framework.urls')),
+    path('api/municipios/', include('municipios.urls')),
 
     # Esta rota deve ser a última. Ela redireciona todo o tráfego que não é de API para o index.html do React.
     re_path(r'^.*', TemplateView.as_view(template_name='index.html')),
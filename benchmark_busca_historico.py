@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark da busca textual do histórico de chamadas (filtro `busca`)
+
+Cria um banco de teste temporário e vai aumentando o histórico (por padrão 10.000,
+50.000 e 200.000 chamadas). Em cada tamanho compara, para termos raros e comuns:
+
+- icontains nos cinco campos (a busca antiga: varre a tabela inteira);
+- índice textual (FTS5 no SQLite, tsvector + GIN no PostgreSQL), primeira página em
+  ordem de data e em ordem de relevância, e o COUNT usado pela página do histórico.
+
+Os tempos são medianas de --repeticoes execuções, em milissegundos.
+
+Uso:
+    python benchmark_busca_historico.py
+    python benchmark_busca_historico.py --tamanhos 20000 100000 --repeticoes 10
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+from accounts.busca_chamadas import anotar_relevancia, backend_busca, filtro_icontains, filtrar_por_busca
+from accounts.models import RegistroChamada
+from accounts.paginacao import paginar_por_cursor, paginar_por_relevancia
+
+TIPOS = [tipo for tipo, _ in RegistroChamada.TIPO_CHOICES]
+STATUS = [status for status, _ in RegistroChamada.STATUS_CHOICES]
+NOMES = ['Ana', 'João', 'Maria', 'José', 'Antônio', 'Francisca', 'Carlos', 'Paulo', 'Luíza', 'Márcia']
+SOBRENOMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Pereira', 'Lima', 'Gonçalves', 'Araújo', 'Ribeiro']
+DESCRICOES = [
+    'Sistema lento ao abrir a regulação', 'Usuário sem acesso ao sistema CORE', 'Reset de senha solicitado',
+    'Dúvida sobre fluxo de regulação de leitos', 'Unidade sem internet desde ontem',
+    'Solicitação de treinamento para a equipe', 'Cancelamento de solicitação duplicada',
+]
+MUNICIPIOS = ['Campo Grande', 'Dourados', 'Três Lagoas', 'Corumbá', 'Ponta Porã']
+
+# (rótulo, busca): termos raros (poucas linhas) e comuns (boa parte da tabela)
+BUSCAS = [
+    ('raro: palavra', 'desfibrilador'),
+    ('raro: telefone', '6733181'),
+    ('raro: nome + sobrenome', 'marcia araujo 77'),
+    ('comum: palavra', 'sistema'),
+    ('comum: unidade', 'corumba'),
+]
+
+
+def gerar_dados(inicio, fim, id_usuario, lote=20000):
+    """Insere as chamadas [inicio, fim) distribuídas no último ano"""
+    tabela = RegistroChamada._meta.db_table
+    sql = (
+        f'INSERT INTO {tabela} (nome_contato, telefone, tipo_chamada, status, nome_atendente, '
+        f'descricao, unidade, municipio, data_criacao, data_atualizacao, usuario_criador_id) '
+        f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
+    )
+    agora = timezone.now()
+    with connection.cursor() as cursor:
+        for inicio_lote in range(inicio, fim, lote):
+            valores = []
+            for i in range(inicio_lote, min(inicio_lote + lote, fim)):
+                data = agora - timedelta(seconds=random.randrange(365 * 24 * 3600))
+                descricao = random.choice(DESCRICOES)
+                if i % 2000 == 0:
+                    descricao += ' (desfibrilador parado)'
+                municipio = random.choice(MUNICIPIOS)
+                valores.append((
+                    f'{random.choice(NOMES)} {random.choice(SOBRENOMES)} {i}', f'(67) 9{random.randrange(10**8):08d}',
+                    random.choice(TIPOS), random.choice(STATUS), random.choice(NOMES), descricao,
+                    f'UBS {random.choice(SOBRENOMES)} - {municipio}', municipio, data, data, id_usuario,
+                ))
+            if inicio_lote == 0:
+                valores[0] = (valores[0][0], '(67) 3318-1000') + valores[0][2:]
+            cursor.executemany(sql, valores)
+
+
+def mediana_ms(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def medir(busca, repeticoes):
+    chamadas = RegistroChamada.objects.all()
+    antiga = chamadas.filter(filtro_icontains(busca))
+    nova = filtrar_por_busca(chamadas, busca)
+    return {
+        'icontains': mediana_ms(lambda: paginar_por_cursor(antiga), repeticoes),
+        'icontains_total': mediana_ms(antiga.count, repeticoes),
+        'indice_data': mediana_ms(lambda: paginar_por_cursor(nova), repeticoes),
+        'indice_relevancia': mediana_ms(lambda: paginar_por_relevancia(anotar_relevancia(nova, busca)), repeticoes),
+        'indice_total': mediana_ms(nova.count, repeticoes),
+        'linhas': nova.count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 50000, 200000])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        backend = backend_busca()
+        print(f"🔎 Índice textual: {backend or 'nenhum (icontains)'} ({connection.vendor})\n")
+        id_usuario = User.objects.create_user('bench_busca', 'bench_busca@exemplo.com', 'x').id
+
+        print(f"{'Chamadas':>9} | {'Busca':>22} | {'Linhas':>7} | {'icontains':>9} | {'COUNT':>8} | "
+              f"{'índ. data':>9} | {'índ. relev.':>11} | {'COUNT':>8}")
+        print(f"{'':>9} | {'':>22} | {'':>7} | {'(ms)':>9} | {'(ms)':>8} | {'(ms)':>9} | {'(ms)':>11} | {'(ms)':>8}")
+        print('-' * 104)
+        total = 0
+        for tamanho in sorted(args.tamanhos):
+            inicio = time.perf_counter()
+            gerar_dados(total, tamanho, id_usuario)
+            total = tamanho
+            print(f"{'':>9}   ({tamanho:,} chamadas geradas em {time.perf_counter() - inicio:.1f}s, índice incluso)")
+            for rotulo, busca in BUSCAS:
+                r = medir(busca, args.repeticoes)
+                print(f"{tamanho:>9,} | {rotulo:>22} | {r['linhas']:>7,} | {r['icontains']:>9.1f} | "
+                      f"{r['icontains_total']:>8.1f} | {r['indice_data']:>9.1f} | {r['indice_relevancia']:>11.1f} | "
+                      f"{r['indice_total']:>8.1f}")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
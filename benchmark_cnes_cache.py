@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark do cache local do CNES (consultar_cnes_api + accounts.cnes)
+
+Sobe um servidor HTTP local que imita a API de estabelecimentos do DATASUS (com atraso
+configurável e um modo "fora do ar") e mede, pela view /accounts/api/cnes/<codigo>/:
+
+- consultas frias (cada código vai até a API) x repetidas (respondidas pelo banco);
+- registro expirado dentro da janela stale: resposta imediata + revalidação em segundo plano;
+- API fora do ar: com cópia no cache a consulta continua funcionando; sem cópia, erro;
+- API lenta (acima do timeout): após CNES_CIRCUITO_FALHAS timeouts seguidos o disjuntor
+  abre e as consultas falham na hora, sem esperar a rede.
+
+A coluna "Conexões" mostra quantas conexões TCP novas a API recebeu (keep-alive do
+ClienteCnes); ao final são impressos os contadores do cliente (/accounts/api/cnes/metricas/).
+
+Uso:
+    python benchmark_cnes_cache.py
+    python benchmark_cnes_cache.py --codigos 100 --repeticoes 10 --atraso 0.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+from accounts.cnes import cliente_cnes, reiniciar_cliente_cnes
+from accounts.models import CnesCache
+
+
+class ApiCnesFalsa(BaseHTTPRequestHandler):
+    """Imita GET /cnes/estabelecimentos/<codigo> (códigos terminados em 9 não existem)"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, como a API real
+    atraso = 0.3
+    fora_do_ar = False
+    lenta = False
+    chamadas = 0
+    conexoes = set()
+
+    def do_GET(self):
+        ApiCnesFalsa.chamadas += 1
+        ApiCnesFalsa.conexoes.add(self.client_address)
+        time.sleep(self.atraso * (20 if self.lenta else 1))
+        codigo = self.path.rstrip('/').rsplit('/', 1)[-1]
+        if self.fora_do_ar:
+            self.responder(503, {'erro': 'Serviço indisponível'})
+        elif codigo.endswith('9'):
+            self.responder(404, {'erro': 'Não encontrado'})
+        else:
+            self.responder(200, {
+                'codigo_cnes': codigo,
+                'nome_fantasia': f'Estabelecimento {codigo}',
+                'descricao_municipio': 'CAMPO GRANDE',
+                'sigla_uf': 'MS',
+                'numero_telefone_estabelecimento': '(67) 3318-0000',
+            })
+
+    def responder(self, status, corpo):
+        conteudo = json.dumps(corpo).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, *args):
+        pass
+
+
+def consultar(cliente, codigo):
+    inicio = time.perf_counter()
+    resposta = cliente.get(f'/accounts/api/cnes/{codigo}/')
+    return (time.perf_counter() - inicio) * 1000, resposta
+
+
+def resumo(rotulo, tempos, respostas, chamadas_api, conexoes):
+    status = sorted({r.status_code for r in respostas})
+    origens = sorted({r.json().get('cache', '-') for r in respostas})
+    print(
+        f"{rotulo:>34} | {statistics.median(tempos):>9.2f} | {max(tempos):>9.2f} | "
+        f"{chamadas_api:>8} | {conexoes:>8} | {','.join(map(str, status)):>7} | {','.join(origens)}"
+    )
+
+
+def medir(rotulo, cliente, codigos):
+    chamadas_antes = ApiCnesFalsa.chamadas
+    conexoes_antes = len(ApiCnesFalsa.conexoes)
+    tempos, respostas = [], []
+    for codigo in codigos:
+        tempo, resposta = consultar(cliente, codigo)
+        tempos.append(tempo)
+        respostas.append(resposta)
+    resumo(rotulo, tempos, respostas, ApiCnesFalsa.chamadas - chamadas_antes,
+           len(ApiCnesFalsa.conexoes) - conexoes_antes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--codigos', type=int, default=50, help='Códigos distintos consultados')
+    parser.add_argument('--repeticoes', type=int, default=5, help='Consultas repetidas de cada código')
+    parser.add_argument('--atraso', type=float, default=0.3, help='Atraso da API falsa (segundos)')
+    args = parser.parse_args()
+
+    ApiCnesFalsa.atraso = args.atraso
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), ApiCnesFalsa)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    settings.CNES_API_URL = f'http://127.0.0.1:{servidor.server_port}/cnes/estabelecimentos/'
+    settings.CNES_API_TIMEOUT = args.atraso * 5
+    reiniciar_cliente_cnes()
+    settings.ALLOWED_HOSTS = ['*']
+    if connection.vendor == 'sqlite':
+        # Banco de teste em arquivo (o padrão em memória trava com a revalidação em thread)
+        connection.settings_dict['TEST']['NAME'] = 'benchmark_cnes.sqlite3'
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        cliente = Client()
+        cliente.force_login(User.objects.create_user('bench_cnes', 'bench_cnes@exemplo.com', 'x'))
+        codigos = [f'{5000000 + i * 10 + 1}' for i in range(args.codigos)]
+
+        print(f"🏥 Benchmark do cache do CNES: API falsa com {args.atraso * 1000:.0f} ms de atraso\n")
+        print(f"{'Cenário':>34} | {'Mediana':>9} | {'Máximo':>9} | {'API':>8} | {'Conexões':>8} | {'Status':>7} | Origem")
+        print(f"{'':>34} | {'(ms)':>9} | {'(ms)':>9} | {'chamadas':>8} | {'novas':>8} |")
+        print('-' * 107)
+
+        medir('frio (1ª consulta de cada código)', cliente, codigos)
+        medir(f'repetido ({args.repeticoes}x cada código)', cliente, codigos * args.repeticoes)
+        medir('inexistente (1ª consulta)', cliente, ['5999999'])
+        medir('inexistente (repetido)', cliente, ['5999999'] * args.repeticoes)
+
+        # Expirado, mas dentro da janela stale: resposta imediata e revalidação em thread
+        CnesCache.objects.update(buscado_em=timezone.now() - timedelta(hours=settings.CNES_CACHE_TTL_HORAS + 1))
+        medir('expirado (stale-while-revalidate)', cliente, codigos)
+        # Espera os workers de revalidação esvaziarem a fila
+        limite = time.monotonic() + args.atraso * len(codigos) + 5
+        while True:
+            frescos = CnesCache.objects.filter(
+                codigo_cnes__in=codigos, buscado_em__gte=timezone.now() - timedelta(minutes=1),
+            ).count()
+            if frescos == len(codigos) or time.monotonic() > limite:
+                break
+            time.sleep(0.2)
+        print(f"{'':>34}   revalidados em segundo plano: {frescos}/{len(codigos)}")
+
+        # DATASUS fora do ar com registros muito antigos (fora da janela stale)
+        ApiCnesFalsa.fora_do_ar = True
+        CnesCache.objects.update(buscado_em=timezone.now() - timedelta(days=365))
+        medir('API fora do ar, com cache antigo', cliente, codigos[:10])
+        medir('API fora do ar, sem cache', cliente, ['5888881'])
+
+        print('\n📊 Contadores do cliente após a queda da API:')
+        for nome, valor in cliente_cnes().metricas().items():
+            print(f"   {nome}: {valor}")
+        print()
+
+        # API lenta (cliente novo, disjuntor fechado): timeouts seguidos abrem o disjuntor
+        reiniciar_cliente_cnes()
+        ApiCnesFalsa.fora_do_ar = False
+        ApiCnesFalsa.lenta = True
+        novos = [f'{5700000 + i * 10 + 1}' for i in range(settings.CNES_CIRCUITO_FALHAS)]
+        medir('API lenta, até abrir o disjuntor', cliente, novos)
+        medir('API lenta, disjuntor aberto', cliente, [f'{5800000 + i * 10 + 1}' for i in range(10)])
+        medir('disjuntor aberto, com cache', cliente, codigos[:10])
+
+        print('\n📊 Contadores do cliente após a lentidão da API:')
+        for nome, valor in cliente_cnes().metricas().items():
+            print(f"   {nome}: {valor}")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+        servidor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
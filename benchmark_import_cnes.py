@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark do `manage.py import_cnes`
+
+Gera um arquivo sintético no formato do CSV de dados abertos do CNES (separador ';',
+latin-1) e outro em JSON, importa num banco de teste temporário e mede:
+
+- linhas/s da importação completa (upsert em lotes);
+- interrupção com --limite e retomada pelo arquivo de progresso;
+- reimportação do mesmo arquivo (tudo vira UPDATE);
+- consultas pela view /accounts/api/cnes/<codigo>/ depois da importação: todas saem do
+  banco (a URL da API aponta para uma porta fechada).
+
+Uso:
+    python benchmark_import_cnes.py
+    python benchmark_import_cnes.py --linhas 300000 --lote 5000
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from io import StringIO
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+
+from accounts.cnes import reiniciar_cliente_cnes
+from accounts.importacao_cnes import caminho_progresso
+from accounts.models import CnesCache
+
+COLUNAS = [
+    'CO_CNES', 'CO_UNIDADE', 'CO_UF', 'CO_IBGE', 'NU_CNPJ_MANTENEDORA', 'NO_RAZAO_SOCIAL', 'NO_FANTASIA',
+    'DS_NIVEL_HIERARQUIA', 'DS_ESFERA_ADMINISTRATIVA', 'TP_UNIDADE', 'CO_CEP', 'NO_LOGRADOURO',
+    'NU_ENDERECO', 'NO_BAIRRO', 'NU_TELEFONE', 'NO_EMAIL', 'ST_CENTRO_CIRURGICO',
+]
+UFS = ['50', '51', '52', '35', '41']
+
+
+def linha_sintetica(i):
+    uf = random.choice(UFS)
+    return [
+        f'{i:07d}', f'{uf}{i:010d}', uf, f'{uf}02704', '00000000000191',
+        f'SECRETARIA MUNICIPAL DE SAÚDE {i}', f'UNIDADE BÁSICA DE SAÚDE {i}', 'ATENÇÃO BÁSICA',
+        'MUNICIPAL', '02', '79000000', 'RUA DAS ACÁCIAS', str(i % 2000), 'CENTRO',
+        '(67) 3318-0000', f'ubs{i}@saude.ms.gov.br', random.choice(['S', 'N']),
+    ]
+
+
+def gerar_csv(caminho, linhas):
+    with open(caminho, 'w', encoding='latin-1', newline='') as arquivo:
+        escritor = csv.writer(arquivo, delimiter=';')
+        escritor.writerow(COLUNAS)
+        for i in range(1, linhas + 1):
+            escritor.writerow(linha_sintetica(i))
+            if i % 1000 == 0:
+                escritor.writerow(['inválido'] + [''] * (len(COLUNAS) - 1))
+
+
+def gerar_json(caminho, linhas):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('{"estabelecimentos": [\n')
+        for i in range(1, linhas + 1):
+            registro = {
+                'codigo_cnes': i, 'nome_fantasia': f'HOSPITAL {i}', 'descricao_municipio': 'CAMPO GRANDE',
+                'sigla_uf': 'MS', 'numero_telefone_estabelecimento': '6733180000',
+            }
+            arquivo.write(('' if i == 1 else ',\n') + json.dumps(registro, ensure_ascii=False))
+        arquivo.write('\n]}')
+
+
+def importar(rotulo, caminho, **opcoes):
+    saida = StringIO()
+    inicio = time.perf_counter()
+    call_command('import_cnes', caminho, stdout=saida, **opcoes)
+    duracao = time.perf_counter() - inicio
+    ultima = saida.getvalue().strip().splitlines()[-1]
+    print(f"{rotulo:>36} | {duracao:>8.2f}s | {CnesCache.objects.count():>9,} no banco | "
+          f"progresso salvo: {'sim' if os.path.exists(caminho_progresso(caminho)) else 'não'}")
+    print(f"{'':>36}   {ultima}")
+    return duracao
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=100000)
+    parser.add_argument('--lote', type=int, default=2000)
+    args = parser.parse_args()
+
+    # Nenhuma consulta pode sair para a rede
+    settings.CNES_API_URL = 'http://127.0.0.1:9/cnes/estabelecimentos/'
+    settings.ALLOWED_HOSTS = ['*']
+    reiniciar_cliente_cnes()
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    with tempfile.TemporaryDirectory() as pasta:
+        try:
+            arquivo_csv = os.path.join(pasta, 'cnes_estabelecimentos.csv')
+            arquivo_json = os.path.join(pasta, 'estabelecimentos.json')
+            print(f"🏗️  Gerando {args.linhas:,} estabelecimentos sintéticos (CSV e JSON)...")
+            gerar_csv(arquivo_csv, args.linhas)
+            gerar_json(arquivo_json, args.linhas // 10)
+            print(f"   CSV: {os.path.getsize(arquivo_csv) / 1024 / 1024:.1f} MB\n")
+
+            opcoes_csv = {'encoding': 'latin-1', 'lote': args.lote}
+            importar('CSV interrompido (--limite 40%)', arquivo_csv, limite=int(args.linhas * 0.4), **opcoes_csv)
+            importar('CSV retomado', arquivo_csv, **opcoes_csv)
+            CnesCache.objects.all().delete()
+            duracao = importar('CSV completo (banco vazio)', arquivo_csv, **opcoes_csv)
+            print(f"{'':>36}   {args.linhas / duracao:,.0f} linhas/s")
+            importar('CSV reimportado (só UPDATE)', arquivo_csv, **opcoes_csv)
+            importar('CSV só MS (--uf MS)', arquivo_csv, uf='MS', recomecar=True, **opcoes_csv)
+            importar('JSON da API', arquivo_json, lote=args.lote)
+
+            cliente = Client()
+            cliente.force_login(User.objects.create_user('bench_import', 'bench_import@exemplo.com', 'x'))
+            tempos, status = [], set()
+            for codigo in random.sample(range(1, args.linhas + 1), 200):
+                inicio = time.perf_counter()
+                resposta = cliente.get(f'/accounts/api/cnes/{codigo:07d}/')
+                tempos.append((time.perf_counter() - inicio) * 1000)
+                status.add((resposta.status_code, resposta.json().get('cache')))
+            print(f"\n🔍 200 consultas após a importação: mediana {statistics.median(tempos):.2f} ms, "
+                  f"máximo {max(tempos):.2f} ms, respostas {sorted(status)}")
+        finally:
+            connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
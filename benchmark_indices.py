@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos índices de RegistroChamada e UnidadeSaude (migração 0016)
+
+Cria um banco de teste temporário, gera chamadas sintéticas e mede as consultas
+usadas pelo histórico, relatórios e exportações sem e com os índices, mostrando
+o plano de execução de cada uma.
+
+Uso:
+    python benchmark_indices.py                 # 1.000.000 de chamadas
+    python benchmark_indices.py --linhas 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+from accounts.models import RegistroChamada, UnidadeSaude
+
+TIPOS = [tipo for tipo, _ in RegistroChamada.TIPO_CHOICES]
+STATUS = [status for status, _ in RegistroChamada.STATUS_CHOICES]
+TIPOS_UNIDADE = [tipo for tipo, _ in UnidadeSaude.TIPO_CHOICES]
+MUNICIPIOS = [f'Município {i}' for i in range(79)]
+
+
+def gerar_dados(linhas, usuarios=50, unidades=5000, lote=20000):
+    """Insere usuários, unidades e chamadas sintéticas distribuídas nos últimos 3 anos"""
+    print(f"🏗️  Gerando {linhas:,} chamadas sintéticas...")
+    inicio = time.perf_counter()
+
+    ids_usuarios = [
+        User.objects.create_user(f'bench{i}', f'bench{i}@exemplo.com', 'x').id
+        for i in range(usuarios)
+    ]
+
+    UnidadeSaude.objects.bulk_create([
+        UnidadeSaude(
+            nome=f'Unidade {i}', municipio=random.choice(MUNICIPIOS), tipo=random.choice(TIPOS_UNIDADE),
+            cnes=f'{i:07d}', endereco='-', telefone='-', horario_funcionamento='24h',
+        )
+        for i in range(unidades)
+    ], batch_size=1000)
+
+    # INSERT direto: bulk_create sobrescreveria data_criacao (auto_now_add)
+    tabela = RegistroChamada._meta.db_table
+    sql = (
+        f'INSERT INTO {tabela} (nome_contato, telefone, tipo_chamada, status, nome_atendente, '
+        f'descricao, unidade, data_criacao, data_atualizacao, usuario_criador_id) '
+        f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
+    )
+    agora = timezone.now()
+    segundos_periodo = 3 * 365 * 24 * 3600
+
+    with connection.cursor() as cursor:
+        for inicio_lote in range(0, linhas, lote):
+            valores = []
+            for _ in range(min(lote, linhas - inicio_lote)):
+                data = agora - timedelta(seconds=random.randrange(segundos_periodo))
+                valores.append((
+                    'Contato', '67999999999', random.choice(TIPOS), random.choice(STATUS), 'Atendente',
+                    'Descrição sintética', f'Unidade {random.randrange(unidades)}', data, data,
+                    random.choice(ids_usuarios),
+                ))
+            cursor.executemany(sql, valores)
+
+    print(f"   ✅ Dados gerados em {time.perf_counter() - inicio:.1f}s")
+    return ids_usuarios
+
+
+def consultas(id_usuario):
+    """Consultas representativas do histórico, relatórios e exportações: nome -> (queryset, contar?)"""
+    agora = timezone.now()
+    inicio_mes = timezone.localtime(agora).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    ultimos_30_dias = agora - timedelta(days=30)
+
+    return {
+        'Histórico (últimas 50)': (RegistroChamada.objects.order_by('-data_criacao')[:50], False),
+        'Tipo + últimos 30 dias': (
+            RegistroChamada.objects
+            .filter(tipo_chamada='sistema_lento', data_criacao__gte=ultimos_30_dias)
+            .order_by('-data_criacao')[:50],
+            False,
+        ),
+        'Status + mês atual (count)': (
+            RegistroChamada.objects.filter(status='chamada_recebida', data_criacao__gte=inicio_mes),
+            True,
+        ),
+        'Usuário + últimos 30 dias': (
+            RegistroChamada.objects
+            .filter(usuario_criador_id=id_usuario, data_criacao__gte=ultimos_30_dias)
+            .order_by('-data_criacao')[:50],
+            False,
+        ),
+        'Chamadas do mês (count)': (RegistroChamada.objects.filter(data_criacao__gte=inicio_mes), True),
+        'Unidades por tipo': (UnidadeSaude.objects.filter(tipo='UNIDADE_SOLICITANTE')[:50], False),
+        'Unidades por município': (
+            UnidadeSaude.objects.values('municipio').annotate(total=Count('id')).order_by('-total')[:10],
+            False,
+        ),
+    }
+
+
+def medir(titulo, id_usuario, repeticoes):
+    print(f"\n{'=' * 70}\n{titulo}\n{'=' * 70}")
+    resultados = {}
+    for nome, (queryset, contar) in consultas(id_usuario).items():
+        executar = (lambda: queryset.count()) if contar else (lambda: list(queryset.all()))
+        executar()  # aquecimento
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            executar()
+        resultados[nome] = (time.perf_counter() - inicio) / repeticoes * 1000
+        print(f"\n📊 {nome}: {resultados[nome]:.2f} ms")
+        for linha in queryset.explain().splitlines():
+            print(f"      {linha}")
+    return resultados
+
+
+def indices_benchmark():
+    return [(RegistroChamada, indice) for indice in RegistroChamada._meta.indexes] + \
+           [(UnidadeSaude, indice) for indice in UnidadeSaude._meta.indexes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=1_000_000, help='quantidade de chamadas sintéticas')
+    parser.add_argument('--repeticoes', type=int, default=5, help='execuções de cada consulta')
+    args = parser.parse_args()
+
+    random.seed(42)
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        ids_usuarios = gerar_dados(args.linhas)
+
+        # Medição sem os índices da migração 0016
+        with connection.schema_editor() as editor:
+            for modelo, indice in indices_benchmark():
+                editor.remove_index(modelo, indice)
+        antes = medir('SEM ÍNDICES', ids_usuarios[0], args.repeticoes)
+
+        with connection.schema_editor() as editor:
+            for modelo, indice in indices_benchmark():
+                editor.add_index(modelo, indice)
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        depois = medir('COM ÍNDICES', ids_usuarios[0], args.repeticoes)
+
+        print(f"\n{'=' * 70}\nRESUMO ({args.linhas:,} chamadas, {connection.vendor})\n{'=' * 70}")
+        print(f"{'Consulta':<32}{'Sem índice':>12}{'Com índice':>12}{'Ganho':>10}")
+        for nome in antes:
+            ganho = antes[nome] / depois[nome] if depois[nome] else float('inf')
+            print(f"{nome:<32}{antes[nome]:>10.2f}ms{depois[nome]:>10.2f}ms{ganho:>9.1f}x")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
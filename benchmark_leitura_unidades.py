@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark do modelo de leitura das unidades (accounts.leitura_unidades)
+
+Cria um banco de teste temporário e vai aumentando o cadastro de unidades (por padrão
+500, 2.000 e 10.000). Em cada tamanho compara, para a lista telefônica (sem filtro, com
+busca, com tipo + município) e para o JSON da página unidades_saude:
+
+- consulta e serialização a cada requisição (como as views faziam);
+- modelo em memória (filtro nos registros, dicionários e JSON prontos por versão);
+- a recarga completa do modelo depois de uma alteração.
+
+Os tempos são medianas de --repeticoes execuções, em milissegundos.
+
+Uso:
+    python benchmark_leitura_unidades.py
+    python benchmark_leitura_unidades.py --tamanhos 1000 20000 --repeticoes 20
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import setup_test_environment
+
+from accounts.leitura_unidades import modelo_unidades, nova_versao
+from accounts.models import UnidadeSaude, filtro_prefixo, normalizar_texto
+
+TIPOS = [tipo for tipo, _ in UnidadeSaude.TIPO_CHOICES]
+PREFIXOS = ['UBS', 'USF', 'Hospital', 'Clínica', 'Centro de Especialidades', 'Policlínica', 'CAPS']
+BAIRROS = ['Vila Almeida', 'Centro', 'Coophavila', 'Aero Rancho', 'Jardim Paulista', 'São Francisco', 'Tiradentes']
+MUNICIPIOS = ['Campo Grande', 'Dourados', 'Três Lagoas', 'Corumbá', 'Ponta Porã', 'São Gabriel do Oeste']
+
+# (rótulo, busca, tipo, município)
+FILTROS = [
+    ('sem filtro', '', '', ''),
+    ('busca "sao francisco"', 'sao francisco', '', ''),
+    ('tipo + município', '', 'UNIDADE_EXECUTANTE', 'campo'),
+]
+
+
+def gerar_unidades(inicio, fim):
+    unidades = []
+    for i in range(inicio, fim):
+        nome = f'{random.choice(PREFIXOS)} {random.choice(BAIRROS)} {i}'
+        municipio = random.choice(MUNICIPIOS)
+        responsavel = f'Responsável {i}'
+        # bulk_create não chama save(): as colunas normalizadas são preenchidas aqui
+        unidades.append(UnidadeSaude(
+            nome=nome, municipio=municipio, cnes=f'{2000000 + i}', tipo=random.choice(TIPOS),
+            endereco='Rua A, 100', telefone=f'(67) 3{random.randrange(10**7):07d}', responsavel=responsavel,
+            horario_funcionamento='07h às 17h', nome_busca=normalizar_texto(nome),
+            municipio_busca=normalizar_texto(municipio), responsavel_busca=normalizar_texto(responsavel),
+        ))
+    UnidadeSaude.objects.bulk_create(unidades, batch_size=1000)
+    nova_versao()
+
+
+def lista_no_banco(busca, tipo, municipio):
+    unidades = UnidadeSaude.objects.all().order_by('nome')
+    if busca:
+        termo = normalizar_texto(busca)
+        unidades = unidades.filter(
+            Q(nome_busca__contains=termo) | Q(telefone__icontains=busca) |
+            Q(responsavel_busca__contains=termo) | Q(municipio_busca__contains=termo)
+        )
+    if tipo:
+        unidades = unidades.filter(tipo=tipo)
+    if municipio:
+        unidades = unidades.filter(filtro_prefixo('municipio_busca', municipio))
+    return json.dumps({'unidades': [
+        {'id': u.id, 'nome': u.nome, 'telefone': u.telefone, 'responsavel': u.responsavel,
+         'municipio': u.municipio, 'cnes': u.cnes, 'tipo': u.tipo}
+        for u in unidades
+    ]})
+
+
+def lista_em_memoria(busca, tipo, municipio):
+    unidades = modelo_unidades().filtrar(busca, tipo, municipio)
+    return json.dumps({'total': len(unidades), 'unidades': [u.dados_lista_telefonica for u in unidades]})
+
+
+def pagina_unidades_no_banco():
+    dados = []
+    for unidade in UnidadeSaude.objects.all().order_by('nome'):
+        dados.append({
+            'id': unidade.id, 'nome': unidade.nome or '', 'municipio': unidade.municipio or 'Não informado',
+            'cnes': unidade.cnes or '', 'tipo': unidade.tipo, 'contato_telefonico': unidade.contato_telefonico or '',
+            'endereco': unidade.endereco or '', 'telefone': unidade.telefone or '',
+            'responsavel': unidade.responsavel or 'Não informado', 'email': unidade.email or '',
+            'horario_funcionamento': unidade.horario_funcionamento or '',
+            'servicos_emergencia': bool(unidade.servicos_emergencia),
+            'created_at': unidade.created_at.strftime('%d/%m/%Y %H:%M:%S'),
+            'usuario_cadastrante': unidade.usuario_cadastrante.username if unidade.usuario_cadastrante else 'Sistema',
+        })
+    return json.dumps(dados, cls=DjangoJSONEncoder)
+
+
+def recarregar():
+    nova_versao()
+    return modelo_unidades()
+
+
+def mediana_ms(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[500, 2000, 10000])
+    parser.add_argument('--repeticoes', type=int, default=10)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        print(f"🏥 Modelo de leitura das unidades ({connection.vendor})\n")
+        print(f"{'Unidades':>9} | {'Caminho':>22} | {'Linhas':>7} | {'Banco (ms)':>10} | {'Memória (ms)':>12}")
+        print('-' * 72)
+        total = 0
+        for tamanho in sorted(args.tamanhos):
+            gerar_unidades(total, tamanho)
+            total = tamanho
+            modelo_unidades()
+            for rotulo, busca, tipo, municipio in FILTROS:
+                linhas = len(modelo_unidades().filtrar(busca, tipo, municipio))
+                banco = mediana_ms(lambda: lista_no_banco(busca, tipo, municipio), args.repeticoes)
+                memoria = mediana_ms(lambda: lista_em_memoria(busca, tipo, municipio), args.repeticoes)
+                print(f"{tamanho:>9,} | {rotulo:>22} | {linhas:>7,} | {banco:>10.2f} | {memoria:>12.3f}")
+            banco = mediana_ms(pagina_unidades_no_banco, args.repeticoes)
+            memoria = mediana_ms(lambda: modelo_unidades().json_lista_unidades(), args.repeticoes)
+            print(f"{tamanho:>9,} | {'JSON unidades_saude':>22} | {tamanho:>7,} | {banco:>10.2f} | {memoria:>12.3f}")
+            print(f"{'':>9}   (recarga do modelo após uma alteração: {mediana_ms(recarregar, 3):.1f} ms)")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark do autocomplete de municípios (api_municipios_autocomplete e api_municipios)
+
+Cadastra os 79 municípios de MS num banco de teste temporário e compara, para uma
+sequência de digitação típica ("ca", "cam", "camp", ...):
+
+- icontains no banco (a busca original, sensível a acentos);
+- colunas normalizadas no banco (nome_busca: prefixo pelo índice + trecho);
+- índice em memória (bisect sobre os nomes normalizados ordenados);
+- as views chamadas com RequestFactory, contando as consultas ao banco.
+
+Os tempos são medianas de --repeticoes execuções, em microssegundos.
+
+Uso:
+    python benchmark_municipios_autocomplete.py
+    python benchmark_municipios_autocomplete.py --repeticoes 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+
+from accounts.models import filtro_prefixo, normalizar_texto
+from municipios.indice_municipios import indice_municipios
+from municipios.models import Municipio
+from municipios.views import api_municipios, api_municipios_autocomplete
+
+MUNICIPIOS_MS = [
+    'Água Clara', 'Alcinópolis', 'Amambai', 'Anastácio', 'Anaurilândia', 'Angélica', 'Antônio João',
+    'Aparecida do Taboado', 'Aquidauana', 'Aral Moreira', 'Bandeirantes', 'Bataguassu', 'Batayporã',
+    'Bela Vista', 'Bodoquena', 'Bonito', 'Brasilândia', 'Caarapó', 'Camapuã', 'Campo Grande', 'Caracol',
+    'Cassilândia', 'Chapadão do Sul', 'Corguinho', 'Coronel Sapucaia', 'Corumbá', 'Costa Rica', 'Coxim',
+    'Deodápolis', 'Dois Irmãos do Buriti', 'Douradina', 'Dourados', 'Eldorado', 'Fátima do Sul', 'Figueirão',
+    'Glória de Dourados', 'Guia Lopes da Laguna', 'Iguatemi', 'Inocência', 'Itaporã', 'Itaquiraí', 'Ivinhema',
+    'Japorã', 'Jaraguari', 'Jardim', 'Jateí', 'Juti', 'Ladário', 'Laguna Carapã', 'Maracaju', 'Miranda',
+    'Mundo Novo', 'Naviraí', 'Nioaque', 'Nova Alvorada do Sul', 'Nova Andradina', 'Novo Horizonte do Sul',
+    'Paraíso das Águas', 'Paranaíba', 'Paranhos', 'Pedro Gomes', 'Ponta Porã', 'Porto Murtinho',
+    'Ribas do Rio Pardo', 'Rio Brilhante', 'Rio Negro', 'Rio Verde de Mato Grosso', 'Rochedo',
+    'Santa Rita do Pardo', 'São Gabriel do Oeste', 'Selvíria', 'Sete Quedas', 'Sidrolândia', 'Sonora',
+    'Tacuru', 'Taquarussu', 'Terenos', 'Três Lagoas', 'Vicentina',
+]
+
+# Digitação de "Campo Grande", "São Gabriel" (sem acento) e "Três Lagoas"
+TERMOS = ['ca', 'cam', 'camp', 'campo', 'campo g', 'sa', 'sao', 'sao g', 'sao gab', 'tr', 'tres', 'lagoas']
+
+
+def icontains_no_banco(termo, limite=10):
+    return list(Municipio.objects.filter(nome__icontains=termo).order_by('nome')[:limite])
+
+
+def colunas_normalizadas_no_banco(termo, limite=10):
+    encontrados = list(Municipio.objects.filter(filtro_prefixo('nome_busca', termo)).order_by('nome')[:limite])
+    if len(encontrados) < limite:
+        encontrados += Municipio.objects.filter(
+            nome_busca__contains=normalizar_texto(termo),
+        ).exclude(id__in=[municipio.id for municipio in encontrados]).order_by('nome')[:limite - len(encontrados)]
+    return encontrados
+
+
+def em_memoria(termo, limite=10):
+    return indice_municipios().buscar(termo, limite)
+
+
+def mediana_us(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        for termo in TERMOS:
+            inicio = time.perf_counter()
+            funcao(termo)
+            tempos.append((time.perf_counter() - inicio) * 1e6)
+    return statistics.median(tempos), max(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=500, help='Vezes que a sequência de termos é buscada')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        for nome in MUNICIPIOS_MS:
+            Municipio.objects.create(nome=nome)
+        usuario = User.objects.create_user('bench_municipios', 'bench_municipios@exemplo.com', 'x')
+        fabrica = RequestFactory()
+
+        def view(funcao, parametro):
+            def chamar(termo):
+                request = fabrica.get('/', {parametro: termo, 'limit': 10})
+                request.user = usuario
+                return funcao(request)
+            return chamar
+
+        caminhos = [
+            ('icontains (original)', icontains_no_banco),
+            ('colunas normalizadas', colunas_normalizadas_no_banco),
+            ('índice em memória', em_memoria),
+            ('view autocomplete', view(api_municipios_autocomplete, 'q')),
+            ('view api_municipios', view(api_municipios, 'search')),
+        ]
+
+        print(f"🗺️  {len(MUNICIPIOS_MS)} municípios, {len(TERMOS)} termos x {args.repeticoes} repetições\n")
+        print(f"{'Caminho':>22} | {'Mediana (µs)':>12} | {'Máximo (µs)':>11} | {'Consultas/busca':>15} | 'sao gab' encontra")
+        print('-' * 95)
+        for rotulo, funcao in caminhos:
+            mediana, maximo = mediana_us(funcao, args.repeticoes)
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as consultas:
+                for termo in TERMOS:
+                    funcao(termo)
+            resultado = funcao('sao gab')
+            if hasattr(resultado, 'content'):
+                encontrou = 'São Gabriel' in resultado.content.decode('unicode_escape')
+            else:
+                encontrou = any(municipio.nome.startswith('São Gabriel') for municipio in resultado)
+            print(f"{rotulo:>22} | {mediana:>12.1f} | {maximo:>11.1f} | "
+                  f"{len(consultas) / len(TERMOS):>15.1f} | {'sim' if encontrou else 'não'}")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
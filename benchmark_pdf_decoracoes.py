@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark das decorações de página dos PDFs (CustomDocTemplate)
+
+Gera PDFs no formato do histórico de chamadas com centenas de páginas e compara
+o cabeçalho/rodapé antigo (drawImage com o caminho do arquivo e os.path.exists
+em toda página, imagens em ASCII85) com o atual (ImageReader em cache no processo,
+um Form XObject por documento, imagens em binário), medindo tempo de CPU e tamanho.
+
+Uso:
+    python benchmark_pdf_decoracoes.py
+    python benchmark_pdf_decoracoes.py --paginas 100 300 600 --repeticoes 5
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import PageBreak, Spacer, Table, TableStyle
+
+from accounts.recursos_pdf import caminho_imagem, limpar_cache_imagens
+from accounts.views import CustomDocTemplate
+
+LINHAS_POR_PAGINA = 20
+
+ESTILO_TABELA = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+])
+
+
+class CustomDocTemplateAntigo(CustomDocTemplate):
+    """Decorações como eram antes: caminho do arquivo e os.path.exists a cada página"""
+
+    USA_ASCII85 = True
+
+    def add_page_decorations(self, canvas, doc):
+        page_width, page_height = canvas._pagesize
+        brasao = caminho_imagem(self.IMAGEM_BRASAO)
+        logo_nova = caminho_imagem(self.IMAGEM_LOGO_NOVA)
+        igpr = caminho_imagem(self.IMAGEM_IGPR)
+        if os.path.exists(brasao):
+            canvas.drawImage(brasao, 50, page_height - 100, width=80, height=80, preserveAspectRatio=True)
+        if os.path.exists(logo_nova):
+            canvas.drawImage(logo_nova, page_width - 130, page_height - 100, width=120, height=80, preserveAspectRatio=True)
+        if os.path.exists(igpr):
+            canvas.drawImage(igpr, (page_width - 120) / 2, 15, width=120, height=60, preserveAspectRatio=True)
+
+
+def gerar_elementos(paginas):
+    """Uma tabela de chamadas sintéticas por página"""
+    cabecalho = ['Data', 'Contato', 'Telefone', 'Unidade', 'Tipo', 'Status']
+    elementos = []
+    for pagina in range(paginas):
+        dados = [cabecalho] + [
+            [f'{pagina % 28 + 1:02d}/01/2025 10:{linha:02d}', f'Contato {pagina}-{linha}', '(67) 99999-0000',
+             f'Unidade {linha}', 'Contato', 'Chamada recebida']
+            for linha in range(LINHAS_POR_PAGINA)
+        ]
+        tabela = Table(dados)
+        tabela.setStyle(ESTILO_TABELA)
+        elementos.append(tabela)
+        elementos.append(PageBreak())
+    return elementos
+
+
+def gerar_elementos_vazios(paginas):
+    """Páginas quase vazias: isola o custo do cabeçalho/rodapé"""
+    elementos = []
+    for _ in range(paginas):
+        elementos.append(Spacer(1, 10))
+        elementos.append(PageBreak())
+    return elementos
+
+
+def gerar_pdf(classe, paginas, elementos=gerar_elementos):
+    rl_config.useA85 = int(getattr(classe, 'USA_ASCII85', False))
+    buffer = io.BytesIO()
+    doc = classe(buffer, pagesize=letter)
+    doc.build(elementos(paginas))
+    return buffer.getvalue()
+
+
+def medir(classe, paginas, repeticoes, elementos=gerar_elementos, documentos=1):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.process_time()
+        for _ in range(documentos):
+            pdf = gerar_pdf(classe, paginas, elementos)
+        tempos.append(time.process_time() - inicio)
+    return min(tempos), len(pdf)
+
+
+def imprimir_linha(rotulo, antigo, atual):
+    (tempo_antigo, tamanho_antigo), (tempo_atual, tamanho_atual) = antigo, atual
+    ganho = tempo_antigo / tempo_atual if tempo_atual else float('inf')
+    print(
+        f"{rotulo:>22} | {tempo_antigo:>10.3f} | {tempo_atual:>10.3f} | {ganho:>6.2f}x | "
+        f"{tamanho_antigo / 1024:>11.1f} | {tamanho_atual / 1024:>10.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paginas', type=int, nargs='+', default=[100, 300, 600])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    print("📄 Benchmark das decorações de página dos PDFs")
+    print(f"   {LINHAS_POR_PAGINA} linhas por página, melhor de {args.repeticoes} execuções (tempo de CPU)\n")
+
+    # A primeira geração aquece o cache de imagens do processo, como num servidor já em uso
+    limpar_cache_imagens()
+    gerar_pdf(CustomDocTemplate, 1)
+
+    print(f"{'Cenário':>22} | {'Antigo (s)':>10} | {'Atual (s)':>10} | {'Ganho':>7} | {'Antigo (KB)':>11} | {'Atual (KB)':>10}")
+    print('-' * 86)
+    for paginas in args.paginas:
+        imprimir_linha(
+            f'histórico {paginas} pág.',
+            medir(CustomDocTemplateAntigo, paginas, args.repeticoes),
+            medir(CustomDocTemplate, paginas, args.repeticoes),
+        )
+    for paginas in args.paginas:
+        imprimir_linha(
+            f'só decorações {paginas} pág.',
+            medir(CustomDocTemplateAntigo, paginas, args.repeticoes, gerar_elementos_vazios),
+            medir(CustomDocTemplate, paginas, args.repeticoes, gerar_elementos_vazios),
+        )
+    imprimir_linha(
+        '30 documentos de 1 pág.',
+        medir(CustomDocTemplateAntigo, 1, args.repeticoes, gerar_elementos_vazios, documentos=30),
+        medir(CustomDocTemplate, 1, args.repeticoes, gerar_elementos_vazios, documentos=30),
+    )
+
+
+if __name__ == '__main__':
+    main()
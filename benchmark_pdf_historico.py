@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark do PDF do histórico de chamadas (gerar_pdf_historico)
+
+Cria um banco de teste temporário com chamadas sintéticas e compara a geração antiga
+(uma única Table com todas as linhas, montada a partir de uma lista em memória) com a
+atual (tabelas em blocos com cabeçalho repetido, criadas sob demanda a partir de
+values_list().iterator()), medindo tempo e número de páginas. Com --memoria, mede também
+o pico de memória alocada (tracemalloc deixa a geração algumas vezes mais lenta).
+Com --processos N, mede também a renderização em N processos com as partes juntadas
+(gerar_pdf_em_partes); o pool é aquecido antes, como num servidor já em uso.
+
+A versão antiga só é medida até --limite-antigo linhas: acima disso o tempo de divisão
+da tabela única cresce de forma superlinear.
+
+Uso:
+    python benchmark_pdf_historico.py                      # 10.000 e 100.000 linhas
+    python benchmark_pdf_historico.py --linhas 5000 20000 --limite-antigo 20000
+    python benchmark_pdf_historico.py --linhas 2000 --memoria
+    python benchmark_pdf_historico.py --linhas 30000 --processos 4 --linhas-por-parte 3000
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+from functools import partial
+
+import django
+
+# Configurar Django
+sys.path.append('.')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.platypus import SimpleDocTemplate, Table
+
+from accounts.models import RegistroChamada
+from accounts.recursos_pdf import pool_pdf
+from accounts.views import (
+    CABECALHO_PDF_HISTORICO,
+    ESTILO_PDF_HISTORICO,
+    LARGURAS_PDF_HISTORICO,
+    gerar_pdf_historico,
+    linhas_pdf_historico,
+)
+
+TIPOS = [tipo for tipo, _ in RegistroChamada.TIPO_CHOICES]
+STATUS = [status for status, _ in RegistroChamada.STATUS_CHOICES]
+
+
+def gerar_dados(linhas, lote=20000):
+    """Insere chamadas sintéticas distribuídas no último ano"""
+    print(f"🏗️  Gerando {linhas:,} chamadas sintéticas...")
+    inicio = time.perf_counter()
+    id_usuario = User.objects.create_user('bench_pdf', 'bench_pdf@exemplo.com', 'x').id
+
+    # INSERT direto: bulk_create sobrescreveria data_criacao (auto_now_add)
+    tabela = RegistroChamada._meta.db_table
+    sql = (
+        f'INSERT INTO {tabela} (nome_contato, telefone, tipo_chamada, status, nome_atendente, '
+        f'descricao, unidade, municipio, data_criacao, data_atualizacao, usuario_criador_id) '
+        f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
+    )
+    agora = timezone.now()
+    with connection.cursor() as cursor:
+        for inicio_lote in range(0, linhas, lote):
+            valores = []
+            for i in range(min(lote, linhas - inicio_lote)):
+                data = agora - timedelta(seconds=random.randrange(365 * 24 * 3600))
+                valores.append((
+                    f'Contato {inicio_lote + i}', '(67) 99999-0000', random.choice(TIPOS), random.choice(STATUS),
+                    'Atendente', 'Descrição sintética', f'Unidade de Saúde {random.randrange(500)}',
+                    'Campo Grande', data, data, id_usuario,
+                ))
+            cursor.executemany(sql, valores)
+    print(f"   ✅ Dados gerados em {time.perf_counter() - inicio:.1f}s")
+
+
+def gerar_pdf_tabela_unica(chamadas, destino):
+    """Geração antiga: todas as linhas em memória e uma única Table"""
+    doc = SimpleDocTemplate(destino, pagesize=landscape(A4),
+                            leftMargin=30, rightMargin=30, topMargin=80, bottomMargin=80)
+    dados = [CABECALHO_PDF_HISTORICO] + list(linhas_pdf_historico(chamadas))
+    tabela = Table(dados, colWidths=LARGURAS_PDF_HISTORICO)
+    tabela.setStyle(ESTILO_PDF_HISTORICO)
+    doc.build([tabela])
+
+
+def medir(funcao, limite, memoria=False):
+    chamadas = RegistroChamada.objects.order_by('-data_criacao')[:limite]
+    buffer = io.BytesIO()
+    if memoria:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    funcao(chamadas, buffer)
+    tempo = time.perf_counter() - inicio
+    pico = None
+    if memoria:
+        pico = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    paginas = buffer.getvalue().count(b'/Type /Page\n')
+    return tempo, pico, paginas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--limite-antigo', type=int, default=10000,
+                        help='Maior quantidade de linhas medida com a tabela única')
+    parser.add_argument('--memoria', action='store_true', help='Medir o pico de memória com tracemalloc')
+    parser.add_argument('--processos', type=int, default=0, help='Medir também a renderização em N processos')
+    parser.add_argument('--linhas-por-parte', type=int, default=3000, help='Linhas por parte com --processos')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    nome_original = connection.creation.create_test_db(verbosity=0)
+    try:
+        gerar_dados(max(args.linhas))
+        if args.processos > 1:
+            # Sobe os processos do pool antes das medições
+            pool = pool_pdf(args.processos)
+            list(pool.map(abs, range(args.processos)))
+
+        print(f"\n{'Linhas':>8} | {'Versão':>12} | {'Tempo (s)':>9} | {'Pico mem. (MB)':>14} | {'Páginas':>7} | {'µs/linha':>8}")
+        print('-' * 75)
+        for linhas in args.linhas:
+            versoes = [('em blocos', gerar_pdf_historico)]
+            if args.processos > 1:
+                versoes.append((f'{args.processos} processos', partial(
+                    gerar_pdf_historico, processos=args.processos, linhas_por_parte=args.linhas_por_parte,
+                )))
+            if linhas <= args.limite_antigo:
+                versoes.insert(0, ('tabela única', gerar_pdf_tabela_unica))
+            for nome, funcao in versoes:
+                tempo, pico, paginas = medir(funcao, linhas, args.memoria)
+                memoria = f'{pico:.1f}' if pico is not None else '-'
+                print(f"{linhas:>8,} | {nome:>12} | {tempo:>9.2f} | {memoria:>14} | {paginas:>7} | {tempo / linhas * 1e6:>8.0f}")
+            if linhas > args.limite_antigo:
+                print(f"{linhas:>8,} | {'tabela única':>12} | {'(não medida: acima de --limite-antigo)':>45}")
+    finally:
+        connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
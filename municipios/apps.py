@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class MunicipiosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'municipios'
-    verbose_name = 'Municípios' 
\ No newline at end of file
+    verbose_name = 'Municípios'
+
+    def ready(self):
+        # Registra os sinais que descartam o índice em memória dos municípios
+        from . import indice_municipios  # noqa: F401
@@ -0,0 +1,99 @@
+"""
+Índice em memória dos municípios para api_municipios e o autocomplete.
+
+A tabela é pequena (os municípios de MS) e quase nunca muda, então cada processo guarda
+os municípios ordenados pelo nome normalizado (sem acentos, minúsculas) e responde às
+buscas por prefixo com bisect, sem consultar o banco. O índice é carregado no primeiro
+uso e descartado pelos sinais post_save/post_delete de Municipio.
+"""
+import threading
+from bisect import bisect_left
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import normalizar_texto
+
+from .models import Municipio
+
+
+class MunicipioIndexado:
+    """Os campos de Municipio usados pelas APIs (mesmos nomes de atributo)"""
+
+    __slots__ = ('id', 'nome', 'estado', 'nome_busca', 'ordem')
+
+    def __init__(self, id, nome, estado, nome_busca, ordem):
+        self.id = id
+        self.nome = nome
+        self.estado = estado
+        self.nome_busca = nome_busca
+        self.ordem = ordem  # posição na ordem por nome (a ordenação do modelo)
+
+
+class IndiceMunicipios:
+    def __init__(self, municipios):
+        # `municipios` já vem em ordem de nome
+        self.por_nome = [
+            MunicipioIndexado(id, nome, estado, nome_busca or normalizar_texto(nome), ordem)
+            for ordem, (id, nome, estado, nome_busca) in enumerate(municipios)
+        ]
+        self.por_nome_busca = sorted(self.por_nome, key=lambda municipio: municipio.nome_busca)
+        self.chaves = [municipio.nome_busca for municipio in self.por_nome_busca]
+
+    def __len__(self):
+        return len(self.por_nome)
+
+    def todos(self, limite):
+        return self.por_nome[:limite]
+
+    def com_prefixo(self, prefixo):
+        """Municípios cujo nome normalizado começa com `prefixo` (já normalizado)"""
+        inicio = bisect_left(self.chaves, prefixo)
+        fim = bisect_left(self.chaves, prefixo + '\x7f', inicio)
+        return self.por_nome_busca[inicio:fim]
+
+    def buscar(self, termo, limite):
+        """
+        Mesma regra de antes no banco: primeiro os que começam com `termo`, em ordem de nome,
+        e, se faltar para completar o limite, os que contêm o termo em outra posição
+        """
+        termo = normalizar_texto(termo)
+        encontrados = sorted(self.com_prefixo(termo), key=lambda municipio: municipio.ordem)[:limite]
+        if len(encontrados) < limite:
+            encontrados += [
+                municipio for municipio in self.por_nome
+                if termo in municipio.nome_busca and not municipio.nome_busca.startswith(termo)
+            ][:limite - len(encontrados)]
+        return encontrados
+
+
+_indice = None
+_trava = threading.Lock()
+
+
+def indice_municipios():
+    """Índice do processo, carregado no primeiro uso depois de uma alteração"""
+    global _indice
+    indice = _indice
+    if indice is None:
+        with _trava:
+            if _indice is None:
+                _indice = IndiceMunicipios(
+                    Municipio.objects.order_by('nome').values_list('id', 'nome', 'estado', 'nome_busca')
+                )
+            indice = _indice
+    return indice
+
+
+def invalidar_indice_municipios():
+    global _indice
+    _indice = None
+
+
+# ===== SINAIS =====
+
+@receiver(post_save, sender=Municipio)
+@receiver(post_delete, sender=Municipio)
+def municipio_alterado(sender, instance, **kwargs):
+    transaction.on_commit(invalidar_indice_municipios)
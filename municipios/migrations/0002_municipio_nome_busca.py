@@ -0,0 +1,58 @@
+# Generated by Django 5.2.3 on 2026-10-17 20:08
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalizar_texto(valor):
+    # Cópia de accounts.models.normalizar_texto da época desta migração (migrações não importam o código atual)
+    if not valor:
+        return ''
+    sem_acentos = unicodedata.normalize('NFKD', valor).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', sem_acentos).strip().lower()
+
+
+def preencher_nome_busca(apps, schema_editor):
+    Municipio = apps.get_model('municipios', 'Municipio')
+    municipios = list(Municipio.objects.only('id', 'nome'))
+    for municipio in municipios:
+        municipio.nome_busca = normalizar_texto(municipio.nome)
+    Municipio.objects.bulk_update(municipios, ['nome_busca'], batch_size=500)
+
+
+def criar_indice_trigrama(apps, schema_editor):
+    # PostgreSQL: índice de trigramas para as buscas por trecho do nome (LIKE '%x%')
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX municipio_nome_busca_trgm_idx ON municipios_municipio USING GIN (nome_busca gin_trgm_ops)'
+    )
+
+
+def remover_indice_trigrama(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS municipio_nome_busca_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('municipios', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='municipio',
+            name='nome_busca',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(preencher_nome_busca, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='municipio',
+            index=models.Index(fields=['nome_busca'], name='municipio_nome_busca_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(criar_indice_trigrama, remover_indice_trigrama),
+    ]
@@ -1,15 +1,28 @@
 from django.db import models
 
+from accounts.models import preencher_campos_busca
+
 class Municipio(models.Model):
     nome = models.CharField(max_length=100, unique=True, verbose_name="Nome do Município")
     estado = models.CharField(max_length=2, default="MS", verbose_name="Estado")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Data de Criação")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Última Atualização")
+    # Nome sem acentos, em minúsculas e com espaços colapsados; preenchido no save()
+    nome_busca = models.CharField(max_length=100, blank=True, default='', editable=False)
+
+    CAMPOS_BUSCA = {'nome': 'nome_busca'}
 
     class Meta:
         verbose_name = "Município"
         verbose_name_plural = "Municípios"
         ordering = ['nome']
+        indexes = [
+            models.Index(fields=['nome_busca'], name='municipio_nome_busca_idx', opclasses=['varchar_pattern_ops']),
+        ]
 
     def __str__(self):
-        return f"{self.nome} - {self.estado}" 
\ No newline at end of file
+        return f"{self.nome} - {self.estado}"
+
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = preencher_campos_busca(self, self.CAMPOS_BUSCA, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
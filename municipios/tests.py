@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from .models import Municipio
+
+
+class ApiMunicipiosTests(TestCase):
+    """Rotas /api/municipios/ usadas pelos formulários React"""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campo_grande = Municipio.objects.create(nome='Campo Grande')
+            Municipio.objects.create(nome='Corumbá')
+        self.client.force_login(User.objects.create_user('atendente'))
+
+    def test_autocomplete(self):
+        resposta = self.client.get('/api/municipios/autocomplete/', {'q': 'camp'})
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(resposta.json()['results'], [
+            {'id': 'Campo Grande', 'text': 'Campo Grande', 'nome': 'Campo Grande'},
+        ])
+
+    def test_lista_e_detalhe(self):
+        resposta = self.client.get('/api/municipios/')
+        self.assertEqual(resposta.status_code, 200)
+        nomes = [municipio['nome'] for municipio in resposta.json()['municipios']]
+        self.assertEqual(nomes, ['Campo Grande', 'Corumbá'])
+
+        resposta = self.client.get(f'/api/municipios/{self.campo_grande.id}/')
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(resposta.json()['municipio']['nome'], 'Campo Grande')
+
+    def test_exige_login(self):
+        self.client.logout()
+        resposta = self.client.get('/api/municipios/autocomplete/', {'q': 'camp'})
+        self.assertEqual(resposta.status_code, 302)
@@ -2,9 +2,18 @@ from django.shortcuts import render
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
+from .indice_municipios import indice_municipios
 from .models import Municipio
 import json
 
+def buscar_municipios(termo, limite):
+    """
+    Municípios pelo nome sem acentos/maiúsculas ("sao gabriel" encontra "São Gabriel do
+    Oeste"): primeiro os que começam com `termo` e, se faltar para completar o limite, os
+    que contêm o termo em outra posição. Responde do índice em memória, sem consultar o banco.
+    """
+    return indice_municipios().buscar(termo, limite)
+
 @login_required
 def api_municipios(request):
     """
@@ -14,15 +23,14 @@ def api_municipios(request):
         # Buscar parâmetro de filtro
         search = request.GET.get('search', '').strip()
         
-        # Filtrar municípios
-        municipios = Municipio.objects.all()
-        
-        if search:
-            municipios = municipios.filter(nome__icontains=search)
-        
         # Limitar resultados
         limit = int(request.GET.get('limit', 20))
-        municipios = municipios[:limit]
+        
+        # Filtrar municípios
+        if search:
+            municipios = buscar_municipios(search, limit)
+        else:
+            municipios = indice_municipios().todos(limit)
         
         # Preparar dados para JSON
         data = []
@@ -81,9 +89,7 @@ def api_municipios_autocomplete(request):
             'results': []
         })
     
-    municipios = Municipio.objects.filter(
-        nome__icontains=query
-    ).order_by('nome')[:10]
+    municipios = buscar_municipios(query, 10)
     
     results = []
     for municipio in municipios:
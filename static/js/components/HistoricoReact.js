@@ -1,9 +1,11 @@
 // HistoricoReact.js - Componente React para Histórico de Chamadas
+
 class HistoricoReact extends React.Component {
     constructor(props) {
         super(props);
         this.state = {
             chamadas: this.props.chamadas || [],
+            // Chamadas exibidas: já filtradas pelo servidor, só a ordenação da tabela é local
             chamadasFiltradas: this.props.chamadas || [],
             filtros: this.props.filtros || {
                 tipo: '',
@@ -24,14 +26,126 @@ class HistoricoReact extends React.Component {
             showEditarModal: false,
             chamadaSelecionada: null,
             dadosEdicao: {},
-            salvandoEdicao: false
+            salvandoEdicao: false,
+            // Paginação por cursor (as próximas páginas vêm da API do histórico)
+            proximoCursor: (this.props.paginacao && this.props.paginacao.proximo_cursor) || null,
+            carregandoMais: false,
+            // Exportação PDF/Excel em andamento no servidor ({ tipo, progresso, mensagem })
+            exportacao: null
         };
+        this.sentinelaRef = React.createRef();
     }
 
     componentDidMount() {
         console.log('✅ Componente HistoricoReact iniciado');
-        this.aplicarFiltros();
         this.initializeAnimations();
+        this.observarSentinela();
+    }
+
+    componentWillUnmount() {
+        clearTimeout(this.temporizadorFiltros);
+        if (this.observer) {
+            this.observer.disconnect();
+        }
+    }
+
+    observarSentinela = () => {
+        // Rolagem infinita: carrega a próxima página quando o fim da tabela fica visível
+        if (typeof IntersectionObserver === 'undefined' || !this.sentinelaRef.current) return;
+
+        this.observer = new IntersectionObserver(entries => {
+            // Só busca no servidor quando o usuário já está na última página carregada
+            const naUltimaPagina = this.state.currentPage >= this.getTotalPages();
+            if (naUltimaPagina && entries.some(entry => entry.isIntersecting)) {
+                this.carregarMaisChamadas();
+            }
+        }, { rootMargin: '200px' });
+        this.observer.observe(this.sentinelaRef.current);
+    }
+
+    // Filtros atuais (estado) como query string da API do histórico
+    parametrosFiltros = () => {
+        const { filtros } = this.state;
+        const { paginacao } = this.props;
+        const params = new URLSearchParams();
+        Object.entries(filtros || {}).forEach(([campo, valor]) => {
+            if (valor) params.append(campo, valor);
+        });
+        if (paginacao && paginacao.por_pagina) params.append('por_pagina', paginacao.por_pagina);
+        return params;
+    }
+
+    buscarPaginaHistorico = async (params) => {
+        const { urls } = this.props;
+        const response = await fetch(`${urls.api_historico}?${params.toString()}`, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            credentials: 'same-origin'
+        });
+        const resultado = await response.json();
+
+        if (!response.ok || !resultado.success) {
+            throw new Error(resultado.message || `HTTP ${response.status}`);
+        }
+        return resultado.data;
+    }
+
+    // Filtros são aplicados no servidor: a cada mudança a lista é recarregada desde a primeira página
+    recarregarChamadas = async () => {
+        const { urls } = this.props;
+        if (!urls || !urls.api_historico) return;
+
+        // Descarta respostas de filtros que já mudaram (ex.: digitação na busca)
+        const requisicao = (this.requisicaoFiltros || 0) + 1;
+        this.requisicaoFiltros = requisicao;
+        this.setState({ isLoading: true });
+        try {
+            const pagina = await this.buscarPaginaHistorico(this.parametrosFiltros());
+            if (requisicao !== this.requisicaoFiltros) return;
+
+            this.setState({
+                chamadas: pagina.chamadas,
+                chamadasFiltradas: pagina.chamadas,
+                proximoCursor: pagina.proximo_cursor,
+                selectedChamadas: [],
+                currentPage: 1,
+                isLoading: false
+            });
+        } catch (error) {
+            if (requisicao !== this.requisicaoFiltros) return;
+            console.error('❌ Erro ao filtrar chamadas:', error);
+            this.showNotification('Erro ao carregar as chamadas filtradas', 'error');
+            this.setState({ isLoading: false });
+        }
+    }
+
+    carregarMaisChamadas = async () => {
+        const { proximoCursor, carregandoMais } = this.state;
+        const { urls } = this.props;
+        if (!proximoCursor || carregandoMais || !urls || !urls.api_historico) return;
+
+        const requisicao = this.requisicaoFiltros;
+        this.setState({ carregandoMais: true });
+        try {
+            // Filtros atuais, os mesmos da primeira página carregada
+            const params = this.parametrosFiltros();
+            params.append('cursor', proximoCursor);
+            const pagina = await this.buscarPaginaHistorico(params);
+            if (requisicao !== this.requisicaoFiltros) {
+                this.setState({ carregandoMais: false });
+                return;
+            }
+
+            // Mantém a página atual ao acrescentar registros
+            this.setState(prevState => ({
+                chamadas: [...prevState.chamadas, ...pagina.chamadas],
+                chamadasFiltradas: [...prevState.chamadasFiltradas, ...pagina.chamadas],
+                proximoCursor: pagina.proximo_cursor,
+                carregandoMais: false
+            }));
+        } catch (error) {
+            console.error('❌ Erro ao carregar mais chamadas:', error);
+            this.setState({ carregandoMais: false });
+        }
     }
 
     initializeAnimations = () => {
@@ -56,50 +170,13 @@ class HistoricoReact extends React.Component {
                 [campo]: valor
             }
         }), () => {
-            this.aplicarFiltros();
-        });
-    }
-
-    aplicarFiltros = () => {
-        const { chamadas, filtros } = this.state;
-        let chamadasFiltradas = [...chamadas];
-
-        // Filtro por busca
-        if (filtros.busca) {
-            const busca = filtros.busca.toLowerCase();
-            chamadasFiltradas = chamadasFiltradas.filter(chamada =>
-                chamada.nome_contato.toLowerCase().includes(busca) ||
-                chamada.telefone.includes(busca) ||
-                chamada.unidade_solicitante.nome.toLowerCase().includes(busca) ||
-                chamada.unidade_executante.nome.toLowerCase().includes(busca) ||
-                chamada.descricao.toLowerCase().includes(busca) ||
-                chamada.nome_atendente.toLowerCase().includes(busca)
-            );
-        }
-
-        // Filtro por tipo
-        if (filtros.tipo) {
-            chamadasFiltradas = chamadasFiltradas.filter(chamada =>
-                chamada.tipo_chamada === filtros.tipo
-            );
-        }
-
-        // Filtro por status
-        if (filtros.status) {
-            chamadasFiltradas = chamadasFiltradas.filter(chamada =>
-                chamada.status === filtros.status
-            );
-        }
-
-        // Filtros de data (simulação - em produção seria feito no backend)
-        if (filtros.data_inicio || filtros.data_fim) {
-            // Para simplificar, mantemos todas as chamadas quando há filtros de data
-            // Em produção, isso seria processado no backend
-        }
-
-        this.setState({ 
-            chamadasFiltradas,
-            currentPage: 1 // Reset para primeira página
+            // Na busca espera o usuário parar de digitar antes de consultar o servidor
+            clearTimeout(this.temporizadorFiltros);
+            if (campo === 'busca') {
+                this.temporizadorFiltros = setTimeout(this.recarregarChamadas, 300);
+            } else {
+                this.recarregarChamadas();
+            }
         });
     }
 
@@ -112,11 +189,8 @@ class HistoricoReact extends React.Component {
             busca: ''
         };
 
-        this.setState({ 
-            filtros: filtrosLimpos,
-            chamadasFiltradas: this.state.chamadas,
-            currentPage: 1
-        });
+        clearTimeout(this.temporizadorFiltros);
+        this.setState({ filtros: filtrosLimpos }, this.recarregarChamadas);
     }
 
     handleSort = (field) => {
@@ -210,6 +284,12 @@ class HistoricoReact extends React.Component {
         return Math.ceil(chamadasFiltradas.length / itemsPerPage);
     }
 
+    // PDF e Excel são gerados por uma tarefa no servidor; o CSV é baixado direto (streaming)
+    TIPOS_EXPORTACAO_FILA = {
+        pdf: 'historico_pdf',
+        excel: 'historico_excel'
+    };
+
     handleExport = (tipo) => {
         const { filtros } = this.state;
         const { urls } = this.props;
@@ -222,6 +302,11 @@ class HistoricoReact extends React.Component {
             }
         });
         
+        if (this.TIPOS_EXPORTACAO_FILA[tipo] && window.ExportacaoService) {
+            this.exportarEmSegundoPlano(tipo, Object.fromEntries(params.entries()));
+            return;
+        }
+        
         let exportUrl;
         switch (tipo) {
             case 'pdf':
@@ -244,6 +329,34 @@ class HistoricoReact extends React.Component {
         this.showNotification(`Exportação ${tipo.toUpperCase()} iniciada!`, 'success');
     }
 
+    exportarEmSegundoPlano = async (tipo, parametros) => {
+        if (this.state.exportacao) {
+            this.showNotification('Aguarde a exportação em andamento terminar.', 'warning');
+            return;
+        }
+        
+        this.setState({
+            showExportOptions: false,
+            exportacao: { tipo, progresso: 0, mensagem: 'Na fila' }
+        });
+        this.showNotification(`Exportação ${tipo.toUpperCase()} enviada para processamento.`, 'info');
+        
+        try {
+            await window.ExportacaoService.exportar(this.TIPOS_EXPORTACAO_FILA[tipo], parametros, {
+                csrfToken: this.props.csrfToken,
+                onProgresso: (tarefa) => this.setState({
+                    exportacao: { tipo, progresso: tarefa.progresso, mensagem: tarefa.mensagem || tarefa.status_display }
+                })
+            });
+            this.showNotification(`Exportação ${tipo.toUpperCase()} concluída!`, 'success');
+        } catch (error) {
+            console.error('❌ Erro na exportação:', error);
+            this.showNotification(`Erro na exportação ${tipo.toUpperCase()}: ${error.message}`, 'error');
+        } finally {
+            this.setState({ exportacao: null });
+        }
+    }
+
     showNotification = (message, type = 'info') => {
         const notification = document.createElement('div');
         notification.className = `notification-toast ${type}`;
@@ -376,20 +489,20 @@ class HistoricoReact extends React.Component {
             if (response.ok) {
                 const result = await response.json();
                 if (result.success) {
-                    // Atualizar a lista de chamadas no estado
+                    // Atualizar a chamada editada nas listas do estado
+                    const atualizar = lista => lista.map(chamada =>
+                        chamada.id === dadosEdicao.id
+                            ? { ...chamada, ...dadosEdicao }
+                            : chamada
+                    );
                     this.setState(prevState => ({
-                        chamadas: prevState.chamadas.map(chamada => 
-                            chamada.id === dadosEdicao.id 
-                                ? { ...chamada, ...dadosEdicao }
-                                : chamada
-                        ),
+                        chamadas: atualizar(prevState.chamadas),
+                        chamadasFiltradas: atualizar(prevState.chamadasFiltradas),
                         showEditarModal: false,
                         salvandoEdicao: false,
                         chamadaSelecionada: null,
                         dadosEdicao: {}
-                    }), () => {
-                        this.aplicarFiltros(); // Reaplicar filtros para atualizar a visualização
-                    });
+                    }));
 
                     this.showNotification('Chamada atualizada com sucesso!', 'success');
                 } else {
@@ -442,7 +555,7 @@ class HistoricoReact extends React.Component {
     render() {
         const { 
             chamadasFiltradas, filtros, isLoading, selectedChamadas, 
-            currentPage, itemsPerPage, sortField, sortDirection, showExportOptions,
+            currentPage, itemsPerPage, sortField, sortDirection, showExportOptions, exportacao,
             showDetalhesModal, showEditarModal, chamadaSelecionada, dadosEdicao, salvandoEdicao
         } = this.state;
         
@@ -590,10 +703,20 @@ class HistoricoReact extends React.Component {
                                     <button 
                                         className="btn-export"
                                         onClick={() => this.setState({ showExportOptions: !showExportOptions })}
+                                        disabled={!!exportacao}
                                     >
-                                        <i className="fas fa-download"></i>
-                                        Exportar
-                                        <i className="fas fa-chevron-down"></i>
+                                        {exportacao ? (
+                                            <>
+                                                <i className="fas fa-spinner fa-spin"></i>
+                                                {exportacao.tipo.toUpperCase()} {exportacao.progresso}%
+                                            </>
+                                        ) : (
+                                            <>
+                                                <i className="fas fa-download"></i>
+                                                Exportar
+                                                <i className="fas fa-chevron-down"></i>
+                                            </>
+                                        )}
                                     </button>
                                     
                                     {showExportOptions && (
@@ -781,6 +904,20 @@ class HistoricoReact extends React.Component {
                                 </div>
                             </div>
                         )}
+
+                        {/* Próximas páginas do servidor */}
+                        <div ref={this.sentinelaRef} className="pagination-container">
+                            {this.state.proximoCursor && (
+                                <button
+                                    className="pagination-btn"
+                                    disabled={this.state.carregandoMais}
+                                    onClick={this.carregarMaisChamadas}
+                                >
+                                    <i className={`fas ${this.state.carregandoMais ? 'fa-spinner fa-spin' : 'fa-chevron-down'}`}></i>
+                                    {this.state.carregandoMais ? 'Carregando...' : 'Carregar mais chamadas'}
+                                </button>
+                            )}
+                        </div>
                     </div>
                 </div>
 
@@ -8,6 +8,8 @@
         const [selectedPeriod, setSelectedPeriod] = React.useState('12');
         const [showFilter, setShowFilter] = React.useState(false);
         const [showPeriodDropdown, setShowPeriodDropdown] = React.useState(false);
+        // Exportação Excel/PDF em andamento no servidor ({ format, progresso })
+        const [exportacao, setExportacao] = React.useState(null);
 
         // Definição das abas de navegação modernizadas
         const tabs = [
@@ -55,27 +57,83 @@
             console.log(`Período alterado para: ${period} meses`);
         };
 
-        // Função para fazer download
-        const handleExport = (format) => {
-            let url;
-            switch(format) {
-                case 'excel':
-                    url = exportUrls?.geral_excel || '/accounts/sistema/relatorios/export-excel/';
-                    break;
-                case 'csv':
-                    url = exportUrls?.geral_csv || '/accounts/sistema/relatorios/export-csv/';
-                    break;
-                case 'pdf':
-                    url = exportUrls?.geral_pdf || '/accounts/sistema/relatorios/export-pdf/';
-                    break;
-                default:
-                    return;
+        // Excel e PDF são gerados por uma tarefa no servidor; o CSV é baixado direto
+        const tiposExportacaoFila = {
+            geral: { excel: 'relatorio_geral_excel', pdf: 'relatorio_geral_pdf' },
+            usuarios: { excel: 'usuarios_mes_excel', pdf: 'usuarios_mes_pdf' }
+        };
+
+        const urlsExportacaoPadrao = {
+            geral_excel: '/accounts/sistema/relatorios/export-excel/',
+            geral_csv: '/accounts/sistema/relatorios/export-csv/',
+            geral_pdf: '/accounts/sistema/relatorios/export-pdf/',
+            usuarios_excel: '/accounts/sistema/relatorios/usuarios-mes/export-excel/',
+            usuarios_csv: '/accounts/sistema/relatorios/usuarios-mes/export-csv/',
+            usuarios_pdf: '/accounts/sistema/relatorios/usuarios-mes/export-pdf/'
+        };
+
+        const exportarEmSegundoPlano = async (format, relatorio) => {
+            if (exportacao) {
+                return;
+            }
+            setExportacao({ format, relatorio, progresso: 0 });
+            try {
+                // Período selecionado na página, repassado à view como ?periodo= (meses)
+                await window.ExportacaoService.exportar(tiposExportacaoFila[relatorio][format], { periodo: selectedPeriod }, {
+                    onProgresso: (tarefa) => setExportacao({ format, relatorio, progresso: tarefa.progresso })
+                });
+            } catch (error) {
+                console.error('❌ Erro na exportação:', error);
+                alert(`Erro na exportação: ${error.message}`);
+            } finally {
+                setExportacao(null);
             }
-            
+        };
+
+        // Função para fazer download (relatorio: 'geral' ou 'usuarios')
+        const handleExport = (format, event, relatorio = 'geral') => {
+            // Os links de exportação têm href só como alternativa sem JavaScript: sem isto o
+            // navegador também seguiria o link e geraria a exportação na própria requisição
+            if (event) {
+                event.preventDefault();
+            }
+
+            if (tiposExportacaoFila[relatorio][format] && window.ExportacaoService) {
+                exportarEmSegundoPlano(format, relatorio);
+                return;
+            }
+
+            const chave = `${relatorio}_${format}`;
+            let url = (exportUrls && exportUrls[chave]) || urlsExportacaoPadrao[chave];
+            if (!url) {
+                return;
+            }
+            url = `${url}${url.includes('?') ? '&' : '?'}periodo=${encodeURIComponent(selectedPeriod)}`;
             console.log(`Exportando relatório em formato ${format} via ${url}`);
             window.open(url, '_blank');
         };
 
+        // Botões Excel/CSV/PDF de um relatório
+        const renderExportButtons = (relatorio) => React.createElement('div', { className: 'export-buttons' },
+            [
+                { format: 'excel', className: 'excel', icon: 'fas fa-file-excel', label: 'Excel' },
+                { format: 'csv', className: 'csv', icon: 'fas fa-file-csv', label: 'CSV' },
+                { format: 'pdf', className: 'pdf', icon: 'fas fa-file-pdf', label: 'PDF' }
+            ].map(botao =>
+                React.createElement('a', {
+                    key: botao.format,
+                    href: (exportUrls && exportUrls[`${relatorio}_${botao.format}`]) || '#',
+                    className: `export-btn ${botao.className}`,
+                    onClick: (event) => handleExport(botao.format, event, relatorio)
+                },
+                    React.createElement('i', { className: botao.icon }),
+                    exportacao && exportacao.relatorio === relatorio && exportacao.format === botao.format
+                        ? `${exportacao.progresso}%`
+                        : botao.label
+                )
+            )
+        );
+
         React.useEffect(() => {
             // Fechar dropdown quando clicar fora
             const handleClickOutside = (event) => {
@@ -981,32 +1039,7 @@
                                 'rgba(239, 68, 68, 0.3)'
                             )
                         ),
-                        React.createElement('div', { className: 'export-buttons' },
-                            React.createElement('a', {
-                                href: exportUrls?.geral_excel || '#',
-                                className: 'export-btn excel',
-                                onClick: () => handleExport('excel')
-                            },
-                                React.createElement('i', { className: 'fas fa-file-excel' }),
-                                'Excel'
-                            ),
-                            React.createElement('a', {
-                                href: exportUrls?.geral_csv || '#',
-                                className: 'export-btn csv',
-                                onClick: () => handleExport('csv')
-                            },
-                                React.createElement('i', { className: 'fas fa-file-csv' }),
-                                'CSV'
-                            ),
-                            React.createElement('a', {
-                                href: exportUrls?.geral_pdf || '#',
-                                className: 'export-btn pdf',
-                                onClick: () => handleExport('pdf')
-                            },
-                                React.createElement('i', { className: 'fas fa-file-pdf' }),
-                                'PDF'
-                            )
-                        )
+                        renderExportButtons('geral')
                     );
 
                 case 'usuarios':
@@ -1039,7 +1072,8 @@
                                 )
                             ),
                             renderTopUsers()
-                        )
+                        ),
+                        renderExportButtons('usuarios')
                     );
 
                 case 'unidades':
@@ -1363,18 +1397,21 @@
                                 React.createElement('div', { className: 'export-buttons' },
                                     React.createElement('button', {
                                         className: 'export-btn excel-btn',
-                                        onClick: () => handleExport('excel'),
+                                        onClick: (event) => handleExport('excel', event),
+                                        disabled: !!exportacao,
                                         title: 'Exportar para Excel'
                                     },
                                         React.createElement('div', { className: 'btn-content' },
                                             React.createElement('i', { className: 'fas fa-file-excel' }),
-                                            React.createElement('span', { className: 'btn-text' }, 'Excel'),
+                                            React.createElement('span', { className: 'btn-text' },
+                                                exportacao && exportacao.relatorio === 'geral' && exportacao.format === 'excel' ? `${exportacao.progresso}%` : 'Excel'
+                                            ),
                                             React.createElement('div', { className: 'btn-description' }, '.xlsx')
                                         )
                                     ),
                                     React.createElement('button', {
                                         className: 'export-btn csv-btn',
-                                        onClick: () => handleExport('csv'),
+                                        onClick: (event) => handleExport('csv', event),
                                         title: 'Exportar para CSV'
                                     },
                                         React.createElement('div', { className: 'btn-content' },
@@ -1385,12 +1422,15 @@
                                     ),
                                     React.createElement('button', {
                                         className: 'export-btn pdf-btn',
-                                        onClick: () => handleExport('pdf'),
+                                        onClick: (event) => handleExport('pdf', event),
+                                        disabled: !!exportacao,
                                         title: 'Exportar para PDF'
                                     },
                                         React.createElement('div', { className: 'btn-content' },
                                             React.createElement('i', { className: 'fas fa-file-pdf' }),
-                                            React.createElement('span', { className: 'btn-text' }, 'PDF'),
+                                            React.createElement('span', { className: 'btn-text' },
+                                                exportacao && exportacao.relatorio === 'geral' && exportacao.format === 'pdf' ? `${exportacao.progresso}%` : 'PDF'
+                                            ),
                                             React.createElement('div', { className: 'btn-description' }, '.pdf')
                                         )
                                     )
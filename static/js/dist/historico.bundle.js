@@ -1,3 +1,3 @@
 /*! For license information please see historico.bundle.js.LICENSE.txt */
-(()=>{"use strict";var e={64:(e,t,n)=>{function a(e){return a="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},a(e)}function o(){var e,t,n="function"==typeof Symbol?Symbol:{},a=n.iterator||"@@iterator",c=n.toStringTag||"@@toStringTag";function i(n,a,o,c){var i=a&&a.prototype instanceof s?a:s,d=Object.create(i.prototype);return r(d,"_invoke",function(n,a,o){var r,c,i,s=0,d=o||[],m=!1,u={p:0,n:0,v:e,a:f,f:f.bind(e,4),d:function(t,n){return r=t,c=0,i=e,u.n=n,l}};function f(n,a){for(c=n,i=a,t=0;!m&&s&&!o&&t<d.length;t++){var o,r=d[t],f=u.p,p=r[2];n>3?(o=p===a)&&(i=r[(c=r[4])?5:(c=3,3)],r[4]=r[5]=e):r[0]<=f&&((o=n<2&&f<r[1])?(c=0,u.v=a,u.n=r[1]):f<p&&(o=n<3||r[0]>a||a>p)&&(r[4]=n,r[5]=a,u.n=p,c=0))}if(o||n>1)return l;throw m=!0,a}return function(o,d,p){if(s>1)throw TypeError("Generator is already running");for(m&&1===d&&f(d,p),c=d,i=p;(t=c<2?e:i)||!m;){r||(c?c<3?(c>1&&(u.n=-1),f(c,i)):u.n=i:u.v=i);try{if(s=2,r){if(c||(o="next"),t=r[o]){if(!(t=t.call(r,i)))throw TypeError("iterator result is not an object");if(!t.done)return t;i=t.value,c<2&&(c=0)}else 1===c&&(t=r.return)&&t.call(r),c<2&&(i=TypeError("The iterator does not provide a '"+o+"' method"),c=1);r=e}else if((t=(m=u.n<0)?i:n.call(a,u))!==l)break}catch(t){r=e,c=1,i=t}finally{s=1}}return{value:t,done:m}}}(n,o,c),!0),d}var l={};function s(){}function d(){}function m(){}t=Object.getPrototypeOf;var u=[][a]?t(t([][a]())):(r(t={},a,function(){return this}),t),f=m.prototype=s.prototype=Object.create(u);function p(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,m):(e.__proto__=m,r(e,c,"GeneratorFunction")),e.prototype=Object.create(f),e}return d.prototype=m,r(f,"constructor",m),r(m,"constructor",d),d.displayName="GeneratorFunction",r(m,c,"GeneratorFunction"),r(f),r(f,c,"Generator"),r(f,a,function(){return this}),r(f,"toString",function(){return"[object Generator]"}),(o=function(){return{w:i,m:p}})()}function r(e,t,n,a){var o=Object.defineProperty;try{o({},"",{})}catch(e){o=0}r=function(e,t,n,a){if(t)o?o(e,t,{value:n,enumerable:!a,configurable:!a,writable:!a}):e[t]=n;else{var c=function(t,n){r(e,t,function(e){return this._invoke(t,n,e)})};c("next",0),c("throw",1),c("return",2)}},r(e,t,n,a)}function c(e,t,n,a,o,r,c){try{var i=e[r](c),l=i.value}catch(e){return void n(e)}i.done?t(l):Promise.resolve(l).then(a,o)}function i(e){return function(){var t=this,n=arguments;return new Promise(function(a,o){var r=e.apply(t,n);function i(e){c(r,a,o,i,l,"next",e)}function l(e){c(r,a,o,i,l,"throw",e)}i(void 0)})}}function l(e){return function(e){if(Array.isArray(e))return s(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(e){if("string"==typeof e)return s(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?s(e,t):void 0}}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function s(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,a=Array(t);n<t;n++)a[n]=e[n];return a}function d(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);t&&(a=a.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,a)}return n}function m(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?d(Object(n),!0).forEach(function(t){g(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):d(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function u(e,t){for(var n=0;n<t.length;n++){var a=t[n];a.enumerable=a.enumerable||!1,a.configurable=!0,"value"in a&&(a.writable=!0),Object.defineProperty(e,b(a.key),a)}}function f(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(f=function(){return!!e})()}function p(e){return p=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},p(e)}function h(e,t){return h=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},h(e,t)}function g(e,t,n){return(t=b(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function b(e){var t=function(e){if("object"!=a(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=a(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==a(t)?t:t+""}e=n.hmd(e);var E=function(){function e(t){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),g(n=function(e,t,n){return t=p(t),function(e,t){if(t&&("object"==a(t)||"function"==typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,f()?Reflect.construct(t,n||[],p(e).constructor):t.apply(e,n))}(this,e,[t]),"initializeAnimations",function(){var e=document.querySelector(".historico-form-container");e&&(e.style.opacity="0",e.style.transform="translateY(20px)",setTimeout(function(){e.style.transition="all 0.6s ease",e.style.opacity="1",e.style.transform="translateY(0)"},100))}),g(n,"handleFiltroChange",function(e,t){n.setState(function(n){return{filtros:m(m({},n.filtros),{},g({},e,t))}},function(){n.aplicarFiltros()})}),g(n,"aplicarFiltros",function(){var e=n.state,t=e.chamadas,a=e.filtros,o=l(t);if(a.busca){var r=a.busca.toLowerCase();o=o.filter(function(e){return e.nome_contato.toLowerCase().includes(r)||e.telefone.includes(r)||e.unidade_solicitante.nome.toLowerCase().includes(r)||e.unidade_executante.nome.toLowerCase().includes(r)||e.descricao.toLowerCase().includes(r)||e.nome_atendente.toLowerCase().includes(r)})}a.tipo&&(o=o.filter(function(e){return e.tipo_chamada===a.tipo})),a.status&&(o=o.filter(function(e){return e.status===a.status})),a.data_inicio||a.data_fim,n.setState({chamadasFiltradas:o,currentPage:1})}),g(n,"limparFiltros",function(){n.setState({filtros:{tipo:"",status:"",data_inicio:"",data_fim:"",busca:""},chamadasFiltradas:n.state.chamadas,currentPage:1})}),g(n,"handleSort",function(e){var t=n.state,a=t.sortField,o=t.sortDirection,r=a===e&&"asc"===o?"desc":"asc";n.setState({sortField:e,sortDirection:r},function(){n.sortChamadas()})}),g(n,"sortChamadas",function(){var e=n.state,t=e.chamadasFiltradas,a=e.sortField,o=e.sortDirection,r=l(t).sort(function(e,t){var n=e[a],r=t[a];return"unidade_solicitante"===a&&(n=e.unidade_solicitante.nome,r=t.unidade_solicitante.nome),"string"==typeof n&&(n=n.toLowerCase(),r=r.toLowerCase()),"asc"===o?n>r?1:-1:n<r?1:-1});n.setState({chamadasFiltradas:r})}),g(n,"handlePageChange",function(e){n.setState({currentPage:e})}),g(n,"toggleChamadaSelection",function(e){n.setState(function(t){return{selectedChamadas:t.selectedChamadas.includes(e)?t.selectedChamadas.filter(function(t){return t!==e}):[].concat(l(t.selectedChamadas),[e])}})}),g(n,"selectAllChamadas",function(){n.state.chamadasFiltradas;var e=n.getCurrentPageChamadas();n.setState(function(t){if(e.every(function(e){return t.selectedChamadas.includes(e.id)}))return{selectedChamadas:t.selectedChamadas.filter(function(t){return!e.some(function(e){return e.id===t})})};var n=e.filter(function(e){return!t.selectedChamadas.includes(e.id)}).map(function(e){return e.id});return{selectedChamadas:[].concat(l(t.selectedChamadas),l(n))}})}),g(n,"getCurrentPageChamadas",function(){var e=n.state,t=e.chamadasFiltradas,a=e.currentPage,o=e.itemsPerPage,r=(a-1)*o,c=r+o;return t.slice(r,c)}),g(n,"getTotalPages",function(){var e=n.state,t=e.chamadasFiltradas,a=e.itemsPerPage;return Math.ceil(t.length/a)}),g(n,"handleExport",function(e){var t,a=n.state.filtros,o=n.props.urls,r=new URLSearchParams;switch(Object.keys(a).forEach(function(e){a[e]&&r.append(e,a[e])}),e){case"pdf":t=o.export_pdf;break;case"excel":t=o.export_excel;break;case"csv":t=o.export_csv;break;default:return}var c="".concat(t,"?").concat(r.toString());window.open(c,"_blank"),n.setState({showExportOptions:!1}),n.showNotification("Exportação ".concat(e.toUpperCase()," iniciada!"),"success")}),g(n,"showNotification",function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"info",n=document.createElement("div");n.className="notification-toast ".concat(t),n.innerHTML='\n            <div class="toast-icon">\n                <i class="fas '.concat("success"===t?"fa-check-circle":"error"===t?"fa-exclamation-circle":"warning"===t?"fa-exclamation-triangle":"fa-info-circle",'"></i>\n            </div>\n            <div class="toast-content">').concat(e,'</div>\n            <button type="button" class="toast-close" onclick="this.parentElement.remove()">\n                <i class="fas fa-times"></i>\n            </button>\n        ');var a=document.querySelector(".notifications-premium");a||((a=document.createElement("div")).className="notifications-premium",document.querySelector(".content-wrapper").prepend(a)),a.appendChild(n),setTimeout(function(){n.parentNode&&(n.style.opacity="0",n.style.transform="translateX(100%)",setTimeout(function(){return n.remove()},300))},5e3)}),g(n,"verDetalhes",function(){var e=i(o().m(function e(t){var a,r,c;return o().w(function(e){for(;;)switch(e.p=e.n){case 0:return n.setState({isLoading:!0}),e.p=1,e.n=2,fetch("/accounts/chamada/".concat(t,"/detalhes/"),{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest","Content-Type":"application/json"}});case 2:if(!(a=e.v).ok){e.n=4;break}return e.n=3,a.json();case 3:(r=e.v).success?n.setState({chamadaSelecionada:r.data,showDetalhesModal:!0,isLoading:!1}):(n.showNotification(r.message||"Erro ao carregar detalhes","error"),n.setState({isLoading:!1})),e.n=5;break;case 4:n.showNotification("Erro ao carregar detalhes da chamada","error"),n.setState({isLoading:!1});case 5:e.n=7;break;case 6:e.p=6,c=e.v,console.error("Erro ao buscar detalhes:",c),n.showNotification("Erro de conexão ao buscar detalhes","error"),n.setState({isLoading:!1});case 7:return e.a(2)}},e,null,[[1,6]])}));return function(t){return e.apply(this,arguments)}}()),g(n,"abrirEdicao",function(){var e=i(o().m(function e(t){var a,r,c;return o().w(function(e){for(;;)switch(e.p=e.n){case 0:return n.setState({isLoading:!0}),e.p=1,e.n=2,fetch("/accounts/chamada/".concat(t,"/editar-form/"),{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest","Content-Type":"application/json"}});case 2:if(!(a=e.v).ok){e.n=4;break}return e.n=3,a.json();case 3:(r=e.v).success?n.setState({chamadaSelecionada:r.data,dadosEdicao:m({},r.data),showEditarModal:!0,isLoading:!1}):(n.showNotification(r.message||"Erro ao carregar dados para edição","error"),n.setState({isLoading:!1})),e.n=5;break;case 4:n.showNotification("Erro ao carregar dados para edição","error"),n.setState({isLoading:!1});case 5:e.n=7;break;case 6:e.p=6,c=e.v,console.error("Erro ao buscar dados para edição:",c),n.showNotification("Erro de conexão ao buscar dados","error"),n.setState({isLoading:!1});case 7:return e.a(2)}},e,null,[[1,6]])}));return function(t){return e.apply(this,arguments)}}()),g(n,"salvarEdicao",i(o().m(function e(){var t,a,r,c;return o().w(function(e){for(;;)switch(e.p=e.n){case 0:if((t=n.state.dadosEdicao).nome_contato&&t.telefone&&t.unidade){e.n=1;break}return n.showNotification("Preencha todos os campos obrigatórios","warning"),e.a(2);case 1:return n.setState({salvandoEdicao:!0}),e.p=2,e.n=3,fetch("/accounts/api/editar-chamada/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":n.props.csrfToken},body:JSON.stringify(t)});case 3:if(!(a=e.v).ok){e.n=5;break}return e.n=4,a.json();case 4:(r=e.v).success?(n.setState(function(e){return{chamadas:e.chamadas.map(function(e){return e.id===t.id?m(m({},e),t):e}),showEditarModal:!1,salvandoEdicao:!1,chamadaSelecionada:null,dadosEdicao:{}}},function(){n.aplicarFiltros()}),n.showNotification("Chamada atualizada com sucesso!","success")):(n.showNotification(r.message||"Erro ao salvar alterações","error"),n.setState({salvandoEdicao:!1})),e.n=6;break;case 5:n.showNotification("Erro ao salvar alterações","error"),n.setState({salvandoEdicao:!1});case 6:e.n=8;break;case 7:e.p=7,c=e.v,console.error("Erro ao salvar edição:",c),n.showNotification("Erro de conexão ao salvar","error"),n.setState({salvandoEdicao:!1});case 8:return e.a(2)}},e,null,[[2,7]])}))),g(n,"fecharModais",function(){n.setState({showDetalhesModal:!1,showEditarModal:!1,chamadaSelecionada:null,dadosEdicao:{},salvandoEdicao:!1})}),g(n,"atualizarDadosEdicao",function(e,t){n.setState(function(n){return{dadosEdicao:m(m({},n.dadosEdicao),{},g({},e,t))}})}),g(n,"formatStatus",function(e){return{PENDENTE:{label:"Pendente",class:"warning"},EM_ANDAMENTO:{label:"Em Andamento",class:"info"},CONCLUIDA:{label:"Concluída",class:"success"},CANCELADA:{label:"Cancelada",class:"danger"}}[e]||{label:e,class:"secondary"}}),n.state={chamadas:n.props.chamadas||[],chamadasFiltradas:n.props.chamadas||[],filtros:n.props.filtros||{tipo:"",status:"",data_inicio:"",data_fim:"",busca:""},isLoading:!1,selectedChamadas:[],currentPage:1,itemsPerPage:10,sortField:"data_criacao",sortDirection:"desc",showExportOptions:!1,showDetalhesModal:!1,showEditarModal:!1,chamadaSelecionada:null,dadosEdicao:{},salvandoEdicao:!1},n}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&h(e,t)}(e,React.Component),t=e,n=[{key:"componentDidMount",value:function(){console.log("✅ Componente HistoricoReact iniciado"),this.aplicarFiltros(),this.initializeAnimations()}},{key:"render",value:function(){var e=this,t=this.state,n=t.chamadasFiltradas,a=t.filtros,o=t.isLoading,r=t.selectedChamadas,c=t.currentPage,i=(t.itemsPerPage,t.sortField),l=t.sortDirection,s=t.showExportOptions,d=t.showDetalhesModal,m=t.showEditarModal,u=t.chamadaSelecionada,f=t.dadosEdicao,p=t.salvandoEdicao,h=this.props.opcoes,g=this.getCurrentPageChamadas(),b=this.getTotalPages(),E=g.length>0&&g.every(function(e){return r.includes(e.id)});return React.createElement("div",{className:"historico-form-container"},o&&React.createElement("div",{className:"loading-overlay-historico"},React.createElement("div",{className:"loading-spinner-historico"})),React.createElement("div",{className:"form-header-historico"},React.createElement("h2",{className:"form-title-historico"},React.createElement("i",{className:"fas fa-filter"}),"Filtros e Resultados"),React.createElement("p",{className:"form-subtitle-historico"},"Encontrados ",n.length," registros")),React.createElement("div",{className:"form-body-historico"},React.createElement("div",{className:"filtros-section"},React.createElement("div",{className:"filtros-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-search"}),"Filtrar Chamadas"),React.createElement("div",{className:"filtros-actions"},React.createElement("button",{className:"btn-filter secondary",onClick:this.limparFiltros},React.createElement("i",{className:"fas fa-broom"}),"Limpar"))),React.createElement("div",{className:"filtros-grid"},React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-search"}),"Buscar"),React.createElement("input",{type:"text",className:"filtro-input",value:a.busca,onChange:function(t){return e.handleFiltroChange("busca",t.target.value)},placeholder:"Nome, telefone, unidade..."})),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-list"}),"Tipo de Chamada"),React.createElement("select",{className:"filtro-select",value:a.tipo,onChange:function(t){return e.handleFiltroChange("tipo",t.target.value)}},React.createElement("option",{value:""},"Todos os tipos"),h.tipos_chamada.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-flag"}),"Status"),React.createElement("select",{className:"filtro-select",value:a.status,onChange:function(t){return e.handleFiltroChange("status",t.target.value)}},React.createElement("option",{value:""},"Todos os status"),h.status_choices.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-calendar"}),"Data Início"),React.createElement("input",{type:"date",className:"filtro-input",value:a.data_inicio,onChange:function(t){return e.handleFiltroChange("data_inicio",t.target.value)}})),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-calendar"}),"Data Fim"),React.createElement("input",{type:"date",className:"filtro-input",value:a.data_fim,onChange:function(t){return e.handleFiltroChange("data_fim",t.target.value)}})))),React.createElement("div",{className:"resultados-section"},React.createElement("div",{className:"resultados-header"},React.createElement("div",{className:"resultados-info"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-table"}),"Registros"),React.createElement("span",{className:"resultados-count"},n.length," encontrados")),React.createElement("div",{className:"resultados-actions"},React.createElement("div",{className:"export-dropdown"},React.createElement("button",{className:"btn-export",onClick:function(){return e.setState({showExportOptions:!s})}},React.createElement("i",{className:"fas fa-download"}),"Exportar",React.createElement("i",{className:"fas fa-chevron-down"})),s&&React.createElement("div",{className:"export-options"},React.createElement("button",{onClick:function(){return e.handleExport("pdf")}},React.createElement("i",{className:"fas fa-file-pdf"}),"PDF"),React.createElement("button",{onClick:function(){return e.handleExport("excel")}},React.createElement("i",{className:"fas fa-file-excel"}),"Excel"),React.createElement("button",{onClick:function(){return e.handleExport("csv")}},React.createElement("i",{className:"fas fa-file-csv"}),"CSV"))))),React.createElement("div",{className:"table-container"},React.createElement("table",{className:"table-modern"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,React.createElement("input",{type:"checkbox",checked:E,onChange:this.selectAllChamadas})),React.createElement("th",{className:"sortable ".concat("data_criacao"===i?l:""),onClick:function(){return e.handleSort("data_criacao")}},"Data/Hora",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",{className:"sortable ".concat("nome_contato"===i?l:""),onClick:function(){return e.handleSort("nome_contato")}},"Contato",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",null,"Telefone"),React.createElement("th",{className:"sortable ".concat("unidade_solicitante"===i?l:""),onClick:function(){return e.handleSort("unidade_solicitante")}},"Unidade Solicitante",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",null,"Tipo"),React.createElement("th",null,"Status"),React.createElement("th",null,"Atendente"),React.createElement("th",null,"Ações"))),React.createElement("tbody",null,0===g.length?React.createElement("tr",null,React.createElement("td",{colSpan:"9",className:"no-data"},React.createElement("div",{className:"no-data-content"},React.createElement("i",{className:"fas fa-search"}),React.createElement("h4",null,"Nenhum registro encontrado"),React.createElement("p",null,"Tente ajustar os filtros para encontrar mais resultados")))):g.map(function(t){var n=e.formatStatus(t.status);return React.createElement("tr",{key:t.id},React.createElement("td",null,React.createElement("input",{type:"checkbox",checked:r.includes(t.id),onChange:function(){return e.toggleChamadaSelection(t.id)}})),React.createElement("td",null,t.data_criacao),React.createElement("td",null,React.createElement("div",{className:"contact-info"},React.createElement("strong",null,t.nome_contato))),React.createElement("td",null,React.createElement("a",{href:"tel:".concat(t.telefone),className:"phone-link"},t.telefone)),React.createElement("td",null,t.unidade_solicitante.nome),React.createElement("td",null,React.createElement("span",{className:"tipo-badge"},t.tipo_chamada)),React.createElement("td",null,React.createElement("span",{className:"status-badge ".concat(n.class)},n.label)),React.createElement("td",null,t.nome_atendente),React.createElement("td",null,React.createElement("div",{className:"action-buttons"},React.createElement("button",{className:"btn-action view",title:"Ver detalhes",onClick:function(){return e.verDetalhes(t.id)}},React.createElement("i",{className:"fas fa-eye"})),React.createElement("button",{className:"btn-action edit",title:"Editar",onClick:function(){return e.abrirEdicao(t.id)}},React.createElement("i",{className:"fas fa-edit"})))))})))),b>1&&React.createElement("div",{className:"pagination-container"},React.createElement("div",{className:"pagination-info"},"Página ",c," de ",b,"(",n.length," registros)"),React.createElement("div",{className:"pagination-controls"},React.createElement("button",{className:"pagination-btn",disabled:1===c,onClick:function(){return e.handlePageChange(c-1)}},React.createElement("i",{className:"fas fa-chevron-left"}),"Anterior"),Array.from({length:Math.min(5,b)},function(t,n){var a;return a=b<=5||c<=3?n+1:c>=b-2?b-4+n:c-2+n,React.createElement("button",{key:a,className:"pagination-btn ".concat(c===a?"active":""),onClick:function(){return e.handlePageChange(a)}},a)}),React.createElement("button",{className:"pagination-btn",disabled:c===b,onClick:function(){return e.handlePageChange(c+1)}},"Próximo",React.createElement("i",{className:"fas fa-chevron-right"})))))),d&&u&&React.createElement("div",{className:"modal-overlay",onClick:this.fecharModais},React.createElement("div",{className:"modal-content modal-large",onClick:function(e){return e.stopPropagation()}},React.createElement("div",{className:"modal-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-eye"}),"Detalhes da Chamada ",u.codigo),React.createElement("button",{className:"modal-close",onClick:this.fecharModais},React.createElement("i",{className:"fas fa-times"}))),React.createElement("div",{className:"modal-body"},React.createElement("div",{className:"detalhes-grid"},React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Contato:"),React.createElement("span",null,u.nome_contato)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Telefone:"),React.createElement("span",null,React.createElement("a",{href:"tel:".concat(u.telefone),className:"phone-link"},u.telefone))),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Função:"),React.createElement("span",null,u.funcao||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Setor:"),React.createElement("span",null,u.setor||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Unidade:"),React.createElement("span",null,u.unidade)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Município:"),React.createElement("span",null,u.municipio||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"CNES:"),React.createElement("span",null,u.cnes||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Contato CNES:"),React.createElement("span",null,u.contato_telefonico_cnes||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Tipo de Chamada:"),React.createElement("span",{className:"tipo-badge"},u.tipo_chamada)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Status:"),React.createElement("span",{className:"status-badge ".concat(this.formatStatus(u.status).class)},u.status)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Atendente:"),React.createElement("span",null,u.nome_atendente)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Criado por:"),React.createElement("span",null,u.usuario_criador)),React.createElement("div",{className:"detalhe-item full-width"},React.createElement("label",null,"Descrição:"),React.createElement("p",{className:"descricao-completa"},u.descricao)),u.solucao&&React.createElement("div",{className:"detalhe-item full-width"},React.createElement("label",null,"Solução:"),React.createElement("p",{className:"solucao-completa"},u.solucao)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Data de Criação:"),React.createElement("span",null,u.data_criacao)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Última Atualização:"),React.createElement("span",null,u.data_atualizacao)))))),m&&u&&React.createElement("div",{className:"modal-overlay",onClick:this.fecharModais},React.createElement("div",{className:"modal-content modal-large",onClick:function(e){return e.stopPropagation()}},React.createElement("div",{className:"modal-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-edit"}),"Editar Chamada ",u.codigo),React.createElement("button",{className:"modal-close",onClick:this.fecharModais},React.createElement("i",{className:"fas fa-times"}))),React.createElement("div",{className:"modal-body"},React.createElement("form",{className:"edicao-form",onSubmit:function(t){t.preventDefault(),e.salvarEdicao()}},React.createElement("div",{className:"form-grid"},React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"nome_contato"},"Nome do Contato *"),React.createElement("input",{type:"text",id:"nome_contato",value:f.nome_contato||"",onChange:function(t){return e.atualizarDadosEdicao("nome_contato",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"telefone"},"Telefone *"),React.createElement("input",{type:"tel",id:"telefone",value:f.telefone||"",onChange:function(t){return e.atualizarDadosEdicao("telefone",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"funcao"},"Função"),React.createElement("input",{type:"text",id:"funcao",value:f.funcao||"",onChange:function(t){return e.atualizarDadosEdicao("funcao",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"setor"},"Setor"),React.createElement("input",{type:"text",id:"setor",value:f.setor||"",onChange:function(t){return e.atualizarDadosEdicao("setor",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"unidade"},"Unidade *"),React.createElement("input",{type:"text",id:"unidade",value:f.unidade||"",onChange:function(t){return e.atualizarDadosEdicao("unidade",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"municipio"},"Município"),React.createElement("input",{type:"text",id:"municipio",value:f.municipio||"",onChange:function(t){return e.atualizarDadosEdicao("municipio",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"cnes"},"CNES"),React.createElement("input",{type:"text",id:"cnes",value:f.cnes||"",onChange:function(t){return e.atualizarDadosEdicao("cnes",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"contato_telefonico_cnes"},"Contato CNES"),React.createElement("input",{type:"tel",id:"contato_telefonico_cnes",value:f.contato_telefonico_cnes||"",onChange:function(t){return e.atualizarDadosEdicao("contato_telefonico_cnes",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"tipo_chamada"},"Tipo de Chamada *"),React.createElement("select",{id:"tipo_chamada",value:f.tipo_chamada||"",onChange:function(t){return e.atualizarDadosEdicao("tipo_chamada",t.target.value)},required:!0},React.createElement("option",{value:""},"Selecione o tipo"),h.tipos_chamada.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"status"},"Status *"),React.createElement("select",{id:"status",value:f.status||"",onChange:function(t){return e.atualizarDadosEdicao("status",t.target.value)},required:!0},React.createElement("option",{value:""},"Selecione o status"),h.status_choices.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"nome_atendente"},"Atendente *"),React.createElement("input",{type:"text",id:"nome_atendente",value:f.nome_atendente||"",onChange:function(t){return e.atualizarDadosEdicao("nome_atendente",t.target.value)},required:!0})),React.createElement("div",{className:"form-group full-width"},React.createElement("label",{htmlFor:"descricao"},"Descrição *"),React.createElement("textarea",{id:"descricao",rows:"4",value:f.descricao||"",onChange:function(t){return e.atualizarDadosEdicao("descricao",t.target.value)},required:!0})),React.createElement("div",{className:"form-group full-width"},React.createElement("label",{htmlFor:"solucao"},"Solução"),React.createElement("textarea",{id:"solucao",rows:"3",value:f.solucao||"",onChange:function(t){return e.atualizarDadosEdicao("solucao",t.target.value)},placeholder:"Descreva a solução aplicada (opcional)"}))),React.createElement("div",{className:"modal-footer"},React.createElement("button",{type:"button",className:"btn-cancel",onClick:this.fecharModais,disabled:p},"Cancelar"),React.createElement("button",{type:"submit",className:"btn-save",disabled:p},p?React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-spinner fa-spin"}),"Salvando..."):React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-save"}),"Salvar Alterações"))))))))}}],n&&u(t.prototype,n),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n}(),v=document.createElement("style");function R(){console.log("🔍 Debug - Tentando renderizar HistoricoReact"),console.log("🔍 Debug - Dados:",window.historicoData);var e=document.getElementById("historico-react-root");if(console.log("🔍 Debug - Container encontrado:",e),e&&window.historicoData&&"undefined"!=typeof React&&"undefined"!=typeof ReactDOM){console.log("✅ Todos os requisitos atendidos, inicializando React...");var t=ReactDOM.createRoot?ReactDOM.createRoot(e):null;t?(console.log("✅ Renderizando com React 18"),t.render(React.createElement(E,window.historicoData))):(console.log("✅ Renderizando com React 17"),ReactDOM.render(React.createElement(E,window.historicoData),e))}else console.error("❌ Erro: Container ou dados não encontrados",{container:e,dados:window.historicoData}),e&&(e.innerHTML='\n                <div style="padding: 2rem; text-align: center; background: white; border-radius: 12px; margin: 2rem;">\n                    <div style="color: #dc2626; font-size: 3rem; margin-bottom: 1rem;">⚠️</div>\n                    <h3 style="color: #374151; margin-bottom: 1rem;">Erro ao carregar histórico</h3>\n                    <p style="color: #6b7280; margin-bottom: 2rem;">\n                        Não foi possível carregar o componente de histórico.\n                    </p>\n                    <button onclick="window.location.reload()" style="\n                        background: #6366f1; \n                        color: white; \n                        padding: 0.75rem 1.5rem; \n                        border: none; \n                        border-radius: 8px; \n                        cursor: pointer;\n                        font-weight: 500;\n                    ">\n                        🔄 Recarregar Página\n                    </button>\n                </div>\n            ')}v.textContent='\n/* ===== SEÇÃO DE FILTROS ===== */\n.filtros-section {\n    margin-bottom: 2rem;\n    padding: 1.5rem;\n    background: #f8fafc;\n    border-radius: 16px;\n    border: 1px solid #e2e8f0;\n}\n\n.filtros-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: 1.5rem;\n}\n\n.filtros-header h3 {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    color: #1f2937;\n    font-size: 1.125rem;\n    font-weight: 600;\n    margin: 0;\n}\n\n.filtros-actions {\n    display: flex;\n    gap: 0.75rem;\n}\n\n.btn-filter {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.5rem 1rem;\n    border-radius: 8px;\n    font-weight: 500;\n    border: none;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    font-size: 0.875rem;\n}\n\n.btn-filter.secondary {\n    background: #f3f4f6;\n    color: #374151;\n    border: 1px solid #d1d5db;\n}\n\n.btn-filter.secondary:hover {\n    background: #e5e7eb;\n    transform: translateY(-1px);\n}\n\n.filtros-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));\n    gap: 1rem;\n}\n\n.filtro-group {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.filtro-group label {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    font-weight: 500;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.filtro-input, .filtro-select {\n    padding: 0.5rem 0.75rem;\n    border: 1px solid #d1d5db;\n    border-radius: 8px;\n    font-size: 0.875rem;\n    transition: all 0.3s ease;\n    background: white;\n}\n\n.filtro-input:focus, .filtro-select:focus {\n    outline: none;\n    border-color: #6366f1;\n    box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);\n}\n\n/* ===== SEÇÃO DE RESULTADOS ===== */\n.resultados-section {\n    margin-top: 2rem;\n}\n\n.resultados-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: 1rem;\n    padding-bottom: 1rem;\n    border-bottom: 1px solid #e5e7eb;\n}\n\n.resultados-info {\n    display: flex;\n    align-items: center;\n    gap: 1rem;\n}\n\n.resultados-info h3 {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    color: #1f2937;\n    font-size: 1.125rem;\n    font-weight: 600;\n    margin: 0;\n}\n\n.resultados-count {\n    background: #f3f4f6;\n    color: #374151;\n    padding: 0.25rem 0.75rem;\n    border-radius: 12px;\n    font-size: 0.875rem;\n    font-weight: 500;\n}\n\n.resultados-actions {\n    display: flex;\n    gap: 1rem;\n    align-items: center;\n}\n\n/* ===== DROPDOWN DE EXPORTAÇÃO ===== */\n.export-dropdown {\n    position: relative;\n}\n\n.btn-export {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.5rem 1rem;\n    background: linear-gradient(135deg, #6366f1, #4f46e5);\n    color: white;\n    border: none;\n    border-radius: 8px;\n    font-weight: 500;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    font-size: 0.875rem;\n}\n\n.btn-export:hover {\n    transform: translateY(-1px);\n    box-shadow: 0 4px 12px rgba(99, 102, 241, 0.3);\n}\n\n.export-options {\n    position: absolute;\n    top: 100%;\n    right: 0;\n    background: white;\n    border: 1px solid #e5e7eb;\n    border-radius: 8px;\n    box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);\n    z-index: 1000;\n    margin-top: 0.5rem;\n    min-width: 120px;\n}\n\n.export-options button {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    width: 100%;\n    padding: 0.75rem 1rem;\n    background: none;\n    border: none;\n    color: #374151;\n    cursor: pointer;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.export-options button:hover {\n    background: #f3f4f6;\n    color: #6366f1;\n}\n\n.export-options button:first-child {\n    border-radius: 8px 8px 0 0;\n}\n\n.export-options button:last-child {\n    border-radius: 0 0 8px 8px;\n}\n\n/* ===== TABELA ===== */\n.table-container {\n    background: white;\n    border-radius: 12px;\n    overflow: hidden;\n    border: 1px solid #e5e7eb;\n    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);\n}\n\n.table-modern {\n    width: 100%;\n    border-collapse: collapse;\n}\n\n.table-modern th {\n    background: #f8fafc;\n    padding: 1rem 0.75rem;\n    text-align: left;\n    font-weight: 600;\n    color: #374151;\n    font-size: 0.875rem;\n    border-bottom: 1px solid #e5e7eb;\n    position: relative;\n}\n\n.table-modern th.sortable {\n    cursor: pointer;\n    user-select: none;\n    transition: all 0.2s ease;\n}\n\n.table-modern th.sortable:hover {\n    background: #f1f5f9;\n    color: #6366f1;\n}\n\n.table-modern th.sortable i {\n    margin-left: 0.5rem;\n    opacity: 0.5;\n}\n\n.table-modern th.sortable.asc i:before {\n    content: "\\f0de";\n    opacity: 1;\n    color: #6366f1;\n}\n\n.table-modern th.sortable.desc i:before {\n    content: "\\f0dd";\n    opacity: 1;\n    color: #6366f1;\n}\n\n.table-modern td {\n    padding: 0.75rem;\n    border-bottom: 1px solid #f1f5f9;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.table-modern tbody tr:hover {\n    background: #f8fafc;\n}\n\n.table-modern tbody tr:last-child td {\n    border-bottom: none;\n}\n\n/* ===== BADGES E STATUS ===== */\n.status-badge {\n    padding: 0.25rem 0.75rem;\n    border-radius: 12px;\n    font-size: 0.75rem;\n    font-weight: 500;\n    text-transform: uppercase;\n    letter-spacing: 0.025em;\n}\n\n.status-badge.success {\n    background: rgba(16, 185, 129, 0.1);\n    color: #047857;\n}\n\n.status-badge.warning {\n    background: rgba(245, 158, 11, 0.1);\n    color: #d97706;\n}\n\n.status-badge.info {\n    background: rgba(59, 130, 246, 0.1);\n    color: #1d4ed8;\n}\n\n.status-badge.danger {\n    background: rgba(239, 68, 68, 0.1);\n    color: #dc2626;\n}\n\n.status-badge.secondary {\n    background: rgba(107, 114, 128, 0.1);\n    color: #4b5563;\n}\n\n.tipo-badge {\n    background: #f3f4f6;\n    color: #374151;\n    padding: 0.25rem 0.5rem;\n    border-radius: 6px;\n    font-size: 0.75rem;\n    font-weight: 500;\n}\n\n/* ===== AÇÕES DA TABELA ===== */\n.action-buttons {\n    display: flex;\n    gap: 0.5rem;\n}\n\n.btn-action {\n    width: 32px;\n    height: 32px;\n    border: none;\n    border-radius: 6px;\n    cursor: pointer;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.btn-action.view {\n    background: rgba(59, 130, 246, 0.1);\n    color: #1d4ed8;\n}\n\n.btn-action.view:hover {\n    background: rgba(59, 130, 246, 0.2);\n    transform: scale(1.05);\n}\n\n.btn-action.edit {\n    background: rgba(245, 158, 11, 0.1);\n    color: #d97706;\n}\n\n.btn-action.edit:hover {\n    background: rgba(245, 158, 11, 0.2);\n    transform: scale(1.05);\n}\n\n/* ===== PAGINAÇÃO ===== */\n.pagination-container {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-top: 1.5rem;\n    padding-top: 1rem;\n    border-top: 1px solid #e5e7eb;\n}\n\n.pagination-info {\n    color: #6b7280;\n    font-size: 0.875rem;\n}\n\n.pagination-controls {\n    display: flex;\n    gap: 0.5rem;\n}\n\n.pagination-btn {\n    display: flex;\n    align-items: center;\n    gap: 0.25rem;\n    padding: 0.5rem 0.75rem;\n    border: 1px solid #d1d5db;\n    background: white;\n    color: #374151;\n    border-radius: 6px;\n    cursor: pointer;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.pagination-btn:hover:not(:disabled) {\n    background: #f3f4f6;\n    border-color: #6366f1;\n    color: #6366f1;\n}\n\n.pagination-btn:disabled {\n    opacity: 0.5;\n    cursor: not-allowed;\n}\n\n.pagination-btn.active {\n    background: #6366f1;\n    color: white;\n    border-color: #6366f1;\n}\n\n/* ===== SEM DADOS ===== */\n.no-data {\n    text-align: center;\n    padding: 3rem 1rem;\n}\n\n.no-data-content {\n    display: flex;\n    flex-direction: column;\n    align-items: center;\n    gap: 1rem;\n    color: #6b7280;\n}\n\n.no-data-content i {\n    font-size: 3rem;\n    opacity: 0.5;\n}\n\n.no-data-content h4 {\n    color: #374151;\n    margin: 0;\n}\n\n.no-data-content p {\n    margin: 0;\n    font-size: 0.875rem;\n}\n\n/* ===== LINKS ESPECIAIS ===== */\n.phone-link {\n    color: #6366f1;\n    text-decoration: none;\n    font-weight: 500;\n}\n\n.phone-link:hover {\n    text-decoration: underline;\n}\n\n.contact-info strong {\n    color: #1f2937;\n}\n\n/* ===== LOADING OVERLAY ===== */\n.loading-overlay-historico {\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(4px);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    z-index: 1000;\n    border-radius: 24px;\n}\n\n/* ===== MODAIS ===== */\n.modal-overlay {\n    position: fixed;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: rgba(0, 0, 0, 0.6);\n    backdrop-filter: blur(4px);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    z-index: 10000;\n    padding: 1rem;\n}\n\n.modal-content {\n    background: white;\n    border-radius: 16px;\n    box-shadow: 0 25px 50px rgba(0, 0, 0, 0.3);\n    width: 100%;\n    max-width: 600px;\n    max-height: 90vh;\n    overflow: hidden;\n    display: flex;\n    flex-direction: column;\n    animation: modalSlideIn 0.3s ease-out;\n}\n\n.modal-content.modal-large {\n    max-width: 900px;\n}\n\n@keyframes modalSlideIn {\n    from {\n        opacity: 0;\n        transform: translateY(-20px) scale(0.95);\n    }\n    to {\n        opacity: 1;\n        transform: translateY(0) scale(1);\n    }\n}\n\n.modal-header {\n    padding: 1.5rem 2rem;\n    border-bottom: 1px solid #e5e7eb;\n    display: flex;\n    align-items: center;\n    justify-content: space-between;\n    background: #f8fafc;\n}\n\n.modal-header h3 {\n    margin: 0;\n    display: flex;\n    align-items: center;\n    gap: 0.75rem;\n    color: #1f2937;\n    font-size: 1.25rem;\n    font-weight: 600;\n}\n\n.modal-close {\n    width: 40px;\n    height: 40px;\n    border: none;\n    background: rgba(156, 163, 175, 0.1);\n    border-radius: 50%;\n    color: #6b7280;\n    cursor: pointer;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    transition: all 0.2s ease;\n    font-size: 1.125rem;\n}\n\n.modal-close:hover {\n    background: rgba(239, 68, 68, 0.1);\n    color: #dc2626;\n}\n\n.modal-body {\n    padding: 2rem;\n    overflow-y: auto;\n    flex: 1;\n}\n\n.modal-footer {\n    padding: 1.5rem 2rem;\n    border-top: 1px solid #e5e7eb;\n    display: flex;\n    gap: 1rem;\n    justify-content: flex-end;\n    background: #f8fafc;\n}\n\n/* ===== DETALHES ===== */\n.detalhes-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n    gap: 1.5rem;\n}\n\n.detalhe-item {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.detalhe-item.full-width {\n    grid-column: 1 / -1;\n}\n\n.detalhe-item label {\n    font-weight: 600;\n    color: #374151;\n    font-size: 0.875rem;\n    text-transform: uppercase;\n    letter-spacing: 0.025em;\n}\n\n.detalhe-item span {\n    color: #1f2937;\n    font-size: 1rem;\n}\n\n.descricao-completa,\n.solucao-completa {\n    background: #f3f4f6;\n    padding: 1rem;\n    border-radius: 8px;\n    color: #374151;\n    line-height: 1.6;\n    margin: 0;\n    white-space: pre-wrap;\n}\n\n.solucao-completa {\n    background: #ecfdf5;\n    border-left: 4px solid #10b981;\n}\n\n/* ===== FORMULÁRIO DE EDIÇÃO ===== */\n.edicao-form {\n    display: flex;\n    flex-direction: column;\n    gap: 1.5rem;\n}\n\n.form-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));\n    gap: 1.5rem;\n}\n\n.form-group {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.form-group.full-width {\n    grid-column: 1 / -1;\n}\n\n.form-group label {\n    font-weight: 500;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.form-group input,\n.form-group select,\n.form-group textarea {\n    padding: 0.75rem;\n    border: 1px solid #d1d5db;\n    border-radius: 8px;\n    font-size: 0.875rem;\n    transition: all 0.3s ease;\n    background: white;\n}\n\n.form-group input:focus,\n.form-group select:focus,\n.form-group textarea:focus {\n    outline: none;\n    border-color: #6366f1;\n    box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);\n}\n\n.form-group textarea {\n    resize: vertical;\n    min-height: 100px;\n    font-family: inherit;\n}\n\n/* ===== BOTÕES DOS MODAIS ===== */\n.btn-cancel,\n.btn-save {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.75rem 1.5rem;\n    border-radius: 8px;\n    font-weight: 500;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    border: none;\n    font-size: 0.875rem;\n}\n\n.btn-cancel {\n    background: #f3f4f6;\n    color: #374151;\n    border: 1px solid #d1d5db;\n}\n\n.btn-cancel:hover:not(:disabled) {\n    background: #e5e7eb;\n    transform: translateY(-1px);\n}\n\n.btn-save {\n    background: linear-gradient(135deg, #6366f1, #4f46e5);\n    color: white;\n}\n\n.btn-save:hover:not(:disabled) {\n    transform: translateY(-1px);\n    box-shadow: 0 8px 25px rgba(99, 102, 241, 0.3);\n}\n\n.btn-save:disabled,\n.btn-cancel:disabled {\n    opacity: 0.6;\n    cursor: not-allowed;\n}\n\n/* ===== RESPONSIVIDADE ===== */\n@media (max-width: 768px) {\n    .filtros-grid {\n        grid-template-columns: 1fr;\n    }\n    \n    .resultados-header {\n        flex-direction: column;\n        gap: 1rem;\n        align-items: flex-start;\n    }\n    \n    .table-container {\n        overflow-x: auto;\n    }\n    \n    .pagination-container {\n        flex-direction: column;\n        gap: 1rem;\n        align-items: center;\n    }\n    \n    .pagination-controls {\n        flex-wrap: wrap;\n        justify-content: center;\n    }\n    \n    .modal-content {\n        max-width: 95vw;\n        margin: 0.5rem;\n    }\n    \n    .modal-header,\n    .modal-body,\n    .modal-footer {\n        padding: 1rem;\n    }\n    \n    .detalhes-grid {\n        grid-template-columns: 1fr;\n        gap: 1rem;\n    }\n    \n    .form-grid {\n        grid-template-columns: 1fr;\n        gap: 1rem;\n    }\n    \n    .modal-footer {\n        flex-direction: column;\n    }\n}\n',document.querySelector("#historico-styles")||(v.id="historico-styles",document.head.appendChild(v)),window.HistoricoReact=E,e.exports&&(e.exports=E),"loading"===document.readyState?document.addEventListener("DOMContentLoaded",R):R()}},t={};function n(a){var o=t[a];if(void 0!==o)return o.exports;var r=t[a]={id:a,loaded:!1,exports:{}};return e[a](r,r.exports,n),r.loaded=!0,r.exports}n.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),n(64),console.log("🚀 Carregando bundle do HistoricoReact..."),console.log("✅ Bundle do HistoricoReact carregado com sucesso")})();
+(()=>{"use strict";var e={64:(e,t,a)=>{function n(e){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},n(e)}function r(e,t){var a=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),a.push.apply(a,n)}return a}function o(e){for(var t=1;t<arguments.length;t++){var a=null!=arguments[t]?arguments[t]:{};t%2?r(Object(a),!0).forEach(function(t){b(e,t,a[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(a)):r(Object(a)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(a,t))})}return e}function c(e){return function(e){if(Array.isArray(e))return u(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||m(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function i(){var e,t,a="function"==typeof Symbol?Symbol:{},n=a.iterator||"@@iterator",r=a.toStringTag||"@@toStringTag";function o(a,n,r,o){var i=n&&n.prototype instanceof s?n:s,d=Object.create(i.prototype);return l(d,"_invoke",function(a,n,r){var o,i,l,s=0,d=r||[],m=!1,u={p:0,n:0,v:e,a:f,f:f.bind(e,4),d:function(t,a){return o=t,i=0,l=e,u.n=a,c}};function f(a,n){for(i=a,l=n,t=0;!m&&s&&!r&&t<d.length;t++){var r,o=d[t],f=u.p,p=o[2];a>3?(r=p===n)&&(l=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=f&&((r=a<2&&f<o[1])?(i=0,u.v=n,u.n=o[1]):f<p&&(r=a<3||o[0]>n||n>p)&&(o[4]=a,o[5]=n,u.n=p,i=0))}if(r||a>1)return c;throw m=!0,n}return function(r,d,p){if(s>1)throw TypeError("Generator is already running");for(m&&1===d&&f(d,p),i=d,l=p;(t=i<2?e:l)||!m;){o||(i?i<3?(i>1&&(u.n=-1),f(i,l)):u.n=l:u.v=l);try{if(s=2,o){if(i||(r="next"),t=o[r]){if(!(t=t.call(o,l)))throw TypeError("iterator result is not an object");if(!t.done)return t;l=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(l=TypeError("The iterator does not provide a '"+r+"' method"),i=1);o=e}else if((t=(m=u.n<0)?l:a.call(n,u))!==c)break}catch(t){o=e,i=1,l=t}finally{s=1}}return{value:t,done:m}}}(a,r,o),!0),d}var c={};function s(){}function d(){}function m(){}t=Object.getPrototypeOf;var u=[][n]?t(t([][n]())):(l(t={},n,function(){return this}),t),f=m.prototype=s.prototype=Object.create(u);function p(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,m):(e.__proto__=m,l(e,r,"GeneratorFunction")),e.prototype=Object.create(f),e}return d.prototype=m,l(f,"constructor",m),l(m,"constructor",d),d.displayName="GeneratorFunction",l(m,r,"GeneratorFunction"),l(f),l(f,r,"Generator"),l(f,n,function(){return this}),l(f,"toString",function(){return"[object Generator]"}),(i=function(){return{w:o,m:p}})()}function l(e,t,a,n){var r=Object.defineProperty;try{r({},"",{})}catch(e){r=0}l=function(e,t,a,n){if(t)r?r(e,t,{value:a,enumerable:!n,configurable:!n,writable:!n}):e[t]=a;else{var o=function(t,a){l(e,t,function(e){return this._invoke(t,a,e)})};o("next",0),o("throw",1),o("return",2)}},l(e,t,a,n)}function s(e,t,a,n,r,o,c){try{var i=e[o](c),l=i.value}catch(e){return void a(e)}i.done?t(l):Promise.resolve(l).then(n,r)}function d(e){return function(){var t=this,a=arguments;return new Promise(function(n,r){var o=e.apply(t,a);function c(e){s(o,n,r,c,i,"next",e)}function i(e){s(o,n,r,c,i,"throw",e)}c(void 0)})}}function m(e,t){if(e){if("string"==typeof e)return u(e,t);var a={}.toString.call(e).slice(8,-1);return"Object"===a&&e.constructor&&(a=e.constructor.name),"Map"===a||"Set"===a?Array.from(e):"Arguments"===a||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(a)?u(e,t):void 0}}function u(e,t){(null==t||t>e.length)&&(t=e.length);for(var a=0,n=Array(t);a<t;a++)n[a]=e[a];return n}function f(e,t){for(var a=0;a<t.length;a++){var n=t[a];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(e,E(n.key),n)}}function p(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(p=function(){return!!e})()}function h(e){return h=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},h(e)}function g(e,t){return g=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},g(e,t)}function b(e,t,a){return(t=E(t))in e?Object.defineProperty(e,t,{value:a,enumerable:!0,configurable:!0,writable:!0}):e[t]=a,e}function E(e){var t=function(e){if("object"!=n(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var a=t.call(e,"string");if("object"!=n(a))return a;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==n(t)?t:t+""}e=a.hmd(e);var v=function(){function e(t){var a;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),b(a=function(e,t,a){return t=h(t),function(e,t){if(t&&("object"==n(t)||"function"==typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,p()?Reflect.construct(t,a||[],h(e).constructor):t.apply(e,a))}(this,e,[t]),"observarSentinela",function(){"undefined"!=typeof IntersectionObserver&&a.sentinelaRef.current&&(a.observer=new IntersectionObserver(function(e){a.state.currentPage>=a.getTotalPages()&&e.some(function(e){return e.isIntersecting})&&a.carregarMaisChamadas()},{rootMargin:"200px"}),a.observer.observe(a.sentinelaRef.current))}),b(a,"parametrosFiltros",function(){var e=a.state.filtros,t=a.props.paginacao,n=new URLSearchParams;return Object.entries(e||{}).forEach(function(e){var t=function(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var a=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=a){var n,r,o,c,i=[],l=!0,s=!1;try{if(o=(a=a.call(e)).next,0===t){if(Object(a)!==a)return;l=!1}else for(;!(l=(n=o.call(a)).done)&&(i.push(n.value),i.length!==t);l=!0);}catch(e){s=!0,r=e}finally{try{if(!l&&null!=a.return&&(c=a.return(),Object(c)!==c))return}finally{if(s)throw r}}return i}}(e,t)||m(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(e,2),a=t[0],r=t[1];r&&n.append(a,r)}),t&&t.por_pagina&&n.append("por_pagina",t.por_pagina),n}),b(a,"buscarPaginaHistorico",function(){var e=d(i().m(function e(t){var n,r,o;return i().w(function(e){for(;;)switch(e.n){case 0:return n=a.props.urls,e.n=1,fetch("".concat(n.api_historico,"?").concat(t.toString()),{headers:{"X-Requested-With":"XMLHttpRequest"},credentials:"same-origin"});case 1:return r=e.v,e.n=2,r.json();case 2:if(o=e.v,r.ok&&o.success){e.n=3;break}throw new Error(o.message||"HTTP ".concat(r.status));case 3:return e.a(2,o.data)}},e)}));return function(t){return e.apply(this,arguments)}}()),b(a,"recarregarChamadas",d(i().m(function e(){var t,n,r,o;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:if((t=a.props.urls)&&t.api_historico){e.n=1;break}return e.a(2);case 1:return n=(a.requisicaoFiltros||0)+1,a.requisicaoFiltros=n,a.setState({isLoading:!0}),e.p=2,e.n=3,a.buscarPaginaHistorico(a.parametrosFiltros());case 3:if(r=e.v,n===a.requisicaoFiltros){e.n=4;break}return e.a(2);case 4:a.setState({chamadas:r.chamadas,chamadasFiltradas:r.chamadas,proximoCursor:r.proximo_cursor,selectedChamadas:[],currentPage:1,isLoading:!1}),e.n=7;break;case 5:if(e.p=5,o=e.v,n===a.requisicaoFiltros){e.n=6;break}return e.a(2);case 6:console.error("❌ Erro ao filtrar chamadas:",o),a.showNotification("Erro ao carregar as chamadas filtradas","error"),a.setState({isLoading:!1});case 7:return e.a(2)}},e,null,[[2,5]])}))),b(a,"carregarMaisChamadas",d(i().m(function e(){var t,n,r,o,l,s,d,m;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:if(t=a.state,n=t.proximoCursor,r=t.carregandoMais,o=a.props.urls,n&&!r&&o&&o.api_historico){e.n=1;break}return e.a(2);case 1:return l=a.requisicaoFiltros,a.setState({carregandoMais:!0}),e.p=2,(s=a.parametrosFiltros()).append("cursor",n),e.n=3,a.buscarPaginaHistorico(s);case 3:if(d=e.v,l===a.requisicaoFiltros){e.n=4;break}return a.setState({carregandoMais:!1}),e.a(2);case 4:a.setState(function(e){return{chamadas:[].concat(c(e.chamadas),c(d.chamadas)),chamadasFiltradas:[].concat(c(e.chamadasFiltradas),c(d.chamadas)),proximoCursor:d.proximo_cursor,carregandoMais:!1}}),e.n=6;break;case 5:e.p=5,m=e.v,console.error("❌ Erro ao carregar mais chamadas:",m),a.setState({carregandoMais:!1});case 6:return e.a(2)}},e,null,[[2,5]])}))),b(a,"initializeAnimations",function(){var e=document.querySelector(".historico-form-container");e&&(e.style.opacity="0",e.style.transform="translateY(20px)",setTimeout(function(){e.style.transition="all 0.6s ease",e.style.opacity="1",e.style.transform="translateY(0)"},100))}),b(a,"handleFiltroChange",function(e,t){a.setState(function(a){return{filtros:o(o({},a.filtros),{},b({},e,t))}},function(){clearTimeout(a.temporizadorFiltros),"busca"===e?a.temporizadorFiltros=setTimeout(a.recarregarChamadas,300):a.recarregarChamadas()})}),b(a,"limparFiltros",function(){clearTimeout(a.temporizadorFiltros),a.setState({filtros:{tipo:"",status:"",data_inicio:"",data_fim:"",busca:""}},a.recarregarChamadas)}),b(a,"handleSort",function(e){var t=a.state,n=t.sortField,r=t.sortDirection,o=n===e&&"asc"===r?"desc":"asc";a.setState({sortField:e,sortDirection:o},function(){a.sortChamadas()})}),b(a,"sortChamadas",function(){var e=a.state,t=e.chamadasFiltradas,n=e.sortField,r=e.sortDirection,o=c(t).sort(function(e,t){var a=e[n],o=t[n];return"unidade_solicitante"===n&&(a=e.unidade_solicitante.nome,o=t.unidade_solicitante.nome),"string"==typeof a&&(a=a.toLowerCase(),o=o.toLowerCase()),"asc"===r?a>o?1:-1:a<o?1:-1});a.setState({chamadasFiltradas:o})}),b(a,"handlePageChange",function(e){a.setState({currentPage:e})}),b(a,"toggleChamadaSelection",function(e){a.setState(function(t){return{selectedChamadas:t.selectedChamadas.includes(e)?t.selectedChamadas.filter(function(t){return t!==e}):[].concat(c(t.selectedChamadas),[e])}})}),b(a,"selectAllChamadas",function(){a.state.chamadasFiltradas;var e=a.getCurrentPageChamadas();a.setState(function(t){if(e.every(function(e){return t.selectedChamadas.includes(e.id)}))return{selectedChamadas:t.selectedChamadas.filter(function(t){return!e.some(function(e){return e.id===t})})};var a=e.filter(function(e){return!t.selectedChamadas.includes(e.id)}).map(function(e){return e.id});return{selectedChamadas:[].concat(c(t.selectedChamadas),c(a))}})}),b(a,"getCurrentPageChamadas",function(){var e=a.state,t=e.chamadasFiltradas,n=e.currentPage,r=e.itemsPerPage,o=(n-1)*r,c=o+r;return t.slice(o,c)}),b(a,"getTotalPages",function(){var e=a.state,t=e.chamadasFiltradas,n=e.itemsPerPage;return Math.ceil(t.length/n)}),b(a,"TIPOS_EXPORTACAO_FILA",{pdf:"historico_pdf",excel:"historico_excel"}),b(a,"handleExport",function(e){var t=a.state.filtros,n=a.props.urls,r=new URLSearchParams;if(Object.keys(t).forEach(function(e){t[e]&&r.append(e,t[e])}),a.TIPOS_EXPORTACAO_FILA[e]&&window.ExportacaoService)a.exportarEmSegundoPlano(e,Object.fromEntries(r.entries()));else{var o;switch(e){case"pdf":o=n.export_pdf;break;case"excel":o=n.export_excel;break;case"csv":o=n.export_csv;break;default:return}var c="".concat(o,"?").concat(r.toString());window.open(c,"_blank"),a.setState({showExportOptions:!1}),a.showNotification("Exportação ".concat(e.toUpperCase()," iniciada!"),"success")}}),b(a,"exportarEmSegundoPlano",function(){var e=d(i().m(function e(t,n){var r;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!a.state.exportacao){e.n=1;break}return a.showNotification("Aguarde a exportação em andamento terminar.","warning"),e.a(2);case 1:return a.setState({showExportOptions:!1,exportacao:{tipo:t,progresso:0,mensagem:"Na fila"}}),a.showNotification("Exportação ".concat(t.toUpperCase()," enviada para processamento."),"info"),e.p=2,e.n=3,window.ExportacaoService.exportar(a.TIPOS_EXPORTACAO_FILA[t],n,{csrfToken:a.props.csrfToken,onProgresso:function(e){return a.setState({exportacao:{tipo:t,progresso:e.progresso,mensagem:e.mensagem||e.status_display}})}});case 3:a.showNotification("Exportação ".concat(t.toUpperCase()," concluída!"),"success"),e.n=5;break;case 4:e.p=4,r=e.v,console.error("❌ Erro na exportação:",r),a.showNotification("Erro na exportação ".concat(t.toUpperCase(),": ").concat(r.message),"error");case 5:return e.p=5,a.setState({exportacao:null}),e.f(5);case 6:return e.a(2)}},e,null,[[2,4,5,6]])}));return function(t,a){return e.apply(this,arguments)}}()),b(a,"showNotification",function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"info",a=document.createElement("div");a.className="notification-toast ".concat(t),a.innerHTML='\n            <div class="toast-icon">\n                <i class="fas '.concat("success"===t?"fa-check-circle":"error"===t?"fa-exclamation-circle":"warning"===t?"fa-exclamation-triangle":"fa-info-circle",'"></i>\n            </div>\n            <div class="toast-content">').concat(e,'</div>\n            <button type="button" class="toast-close" onclick="this.parentElement.remove()">\n                <i class="fas fa-times"></i>\n            </button>\n        ');var n=document.querySelector(".notifications-premium");n||((n=document.createElement("div")).className="notifications-premium",document.querySelector(".content-wrapper").prepend(n)),n.appendChild(a),setTimeout(function(){a.parentNode&&(a.style.opacity="0",a.style.transform="translateX(100%)",setTimeout(function(){return a.remove()},300))},5e3)}),b(a,"verDetalhes",function(){var e=d(i().m(function e(t){var n,r,o;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:return a.setState({isLoading:!0}),e.p=1,e.n=2,fetch("/accounts/chamada/".concat(t,"/detalhes/"),{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest","Content-Type":"application/json"}});case 2:if(!(n=e.v).ok){e.n=4;break}return e.n=3,n.json();case 3:(r=e.v).success?a.setState({chamadaSelecionada:r.data,showDetalhesModal:!0,isLoading:!1}):(a.showNotification(r.message||"Erro ao carregar detalhes","error"),a.setState({isLoading:!1})),e.n=5;break;case 4:a.showNotification("Erro ao carregar detalhes da chamada","error"),a.setState({isLoading:!1});case 5:e.n=7;break;case 6:e.p=6,o=e.v,console.error("Erro ao buscar detalhes:",o),a.showNotification("Erro de conexão ao buscar detalhes","error"),a.setState({isLoading:!1});case 7:return e.a(2)}},e,null,[[1,6]])}));return function(t){return e.apply(this,arguments)}}()),b(a,"abrirEdicao",function(){var e=d(i().m(function e(t){var n,r,c;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:return a.setState({isLoading:!0}),e.p=1,e.n=2,fetch("/accounts/chamada/".concat(t,"/editar-form/"),{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest","Content-Type":"application/json"}});case 2:if(!(n=e.v).ok){e.n=4;break}return e.n=3,n.json();case 3:(r=e.v).success?a.setState({chamadaSelecionada:r.data,dadosEdicao:o({},r.data),showEditarModal:!0,isLoading:!1}):(a.showNotification(r.message||"Erro ao carregar dados para edição","error"),a.setState({isLoading:!1})),e.n=5;break;case 4:a.showNotification("Erro ao carregar dados para edição","error"),a.setState({isLoading:!1});case 5:e.n=7;break;case 6:e.p=6,c=e.v,console.error("Erro ao buscar dados para edição:",c),a.showNotification("Erro de conexão ao buscar dados","error"),a.setState({isLoading:!1});case 7:return e.a(2)}},e,null,[[1,6]])}));return function(t){return e.apply(this,arguments)}}()),b(a,"salvarEdicao",d(i().m(function e(){var t,n,r,c,l;return i().w(function(e){for(;;)switch(e.p=e.n){case 0:if((t=a.state.dadosEdicao).nome_contato&&t.telefone&&t.unidade){e.n=1;break}return a.showNotification("Preencha todos os campos obrigatórios","warning"),e.a(2);case 1:return a.setState({salvandoEdicao:!0}),e.p=2,e.n=3,fetch("/accounts/api/editar-chamada/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":a.props.csrfToken},body:JSON.stringify(t)});case 3:if(!(n=e.v).ok){e.n=5;break}return e.n=4,n.json();case 4:(r=e.v).success?(c=function(e){return e.map(function(e){return e.id===t.id?o(o({},e),t):e})},a.setState(function(e){return{chamadas:c(e.chamadas),chamadasFiltradas:c(e.chamadasFiltradas),showEditarModal:!1,salvandoEdicao:!1,chamadaSelecionada:null,dadosEdicao:{}}}),a.showNotification("Chamada atualizada com sucesso!","success")):(a.showNotification(r.message||"Erro ao salvar alterações","error"),a.setState({salvandoEdicao:!1})),e.n=6;break;case 5:a.showNotification("Erro ao salvar alterações","error"),a.setState({salvandoEdicao:!1});case 6:e.n=8;break;case 7:e.p=7,l=e.v,console.error("Erro ao salvar edição:",l),a.showNotification("Erro de conexão ao salvar","error"),a.setState({salvandoEdicao:!1});case 8:return e.a(2)}},e,null,[[2,7]])}))),b(a,"fecharModais",function(){a.setState({showDetalhesModal:!1,showEditarModal:!1,chamadaSelecionada:null,dadosEdicao:{},salvandoEdicao:!1})}),b(a,"atualizarDadosEdicao",function(e,t){a.setState(function(a){return{dadosEdicao:o(o({},a.dadosEdicao),{},b({},e,t))}})}),b(a,"formatStatus",function(e){return{PENDENTE:{label:"Pendente",class:"warning"},EM_ANDAMENTO:{label:"Em Andamento",class:"info"},CONCLUIDA:{label:"Concluída",class:"success"},CANCELADA:{label:"Cancelada",class:"danger"}}[e]||{label:e,class:"secondary"}}),a.state={chamadas:a.props.chamadas||[],chamadasFiltradas:a.props.chamadas||[],filtros:a.props.filtros||{tipo:"",status:"",data_inicio:"",data_fim:"",busca:""},isLoading:!1,selectedChamadas:[],currentPage:1,itemsPerPage:10,sortField:"data_criacao",sortDirection:"desc",showExportOptions:!1,showDetalhesModal:!1,showEditarModal:!1,chamadaSelecionada:null,dadosEdicao:{},salvandoEdicao:!1,proximoCursor:a.props.paginacao&&a.props.paginacao.proximo_cursor||null,carregandoMais:!1,exportacao:null},a.sentinelaRef=React.createRef(),a}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&g(e,t)}(e,React.Component),t=e,a=[{key:"componentDidMount",value:function(){console.log("✅ Componente HistoricoReact iniciado"),this.initializeAnimations(),this.observarSentinela()}},{key:"componentWillUnmount",value:function(){clearTimeout(this.temporizadorFiltros),this.observer&&this.observer.disconnect()}},{key:"render",value:function(){var e=this,t=this.state,a=t.chamadasFiltradas,n=t.filtros,r=t.isLoading,o=t.selectedChamadas,c=t.currentPage,i=(t.itemsPerPage,t.sortField),l=t.sortDirection,s=t.showExportOptions,d=t.exportacao,m=t.showDetalhesModal,u=t.showEditarModal,f=t.chamadaSelecionada,p=t.dadosEdicao,h=t.salvandoEdicao,g=this.props.opcoes,b=this.getCurrentPageChamadas(),E=this.getTotalPages(),v=b.length>0&&b.every(function(e){return o.includes(e.id)});return React.createElement("div",{className:"historico-form-container"},r&&React.createElement("div",{className:"loading-overlay-historico"},React.createElement("div",{className:"loading-spinner-historico"})),React.createElement("div",{className:"form-header-historico"},React.createElement("h2",{className:"form-title-historico"},React.createElement("i",{className:"fas fa-filter"}),"Filtros e Resultados"),React.createElement("p",{className:"form-subtitle-historico"},"Encontrados ",a.length," registros")),React.createElement("div",{className:"form-body-historico"},React.createElement("div",{className:"filtros-section"},React.createElement("div",{className:"filtros-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-search"}),"Filtrar Chamadas"),React.createElement("div",{className:"filtros-actions"},React.createElement("button",{className:"btn-filter secondary",onClick:this.limparFiltros},React.createElement("i",{className:"fas fa-broom"}),"Limpar"))),React.createElement("div",{className:"filtros-grid"},React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-search"}),"Buscar"),React.createElement("input",{type:"text",className:"filtro-input",value:n.busca,onChange:function(t){return e.handleFiltroChange("busca",t.target.value)},placeholder:"Nome, telefone, unidade..."})),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-list"}),"Tipo de Chamada"),React.createElement("select",{className:"filtro-select",value:n.tipo,onChange:function(t){return e.handleFiltroChange("tipo",t.target.value)}},React.createElement("option",{value:""},"Todos os tipos"),g.tipos_chamada.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-flag"}),"Status"),React.createElement("select",{className:"filtro-select",value:n.status,onChange:function(t){return e.handleFiltroChange("status",t.target.value)}},React.createElement("option",{value:""},"Todos os status"),g.status_choices.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-calendar"}),"Data Início"),React.createElement("input",{type:"date",className:"filtro-input",value:n.data_inicio,onChange:function(t){return e.handleFiltroChange("data_inicio",t.target.value)}})),React.createElement("div",{className:"filtro-group"},React.createElement("label",null,React.createElement("i",{className:"fas fa-calendar"}),"Data Fim"),React.createElement("input",{type:"date",className:"filtro-input",value:n.data_fim,onChange:function(t){return e.handleFiltroChange("data_fim",t.target.value)}})))),React.createElement("div",{className:"resultados-section"},React.createElement("div",{className:"resultados-header"},React.createElement("div",{className:"resultados-info"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-table"}),"Registros"),React.createElement("span",{className:"resultados-count"},a.length," encontrados")),React.createElement("div",{className:"resultados-actions"},React.createElement("div",{className:"export-dropdown"},React.createElement("button",{className:"btn-export",onClick:function(){return e.setState({showExportOptions:!s})},disabled:!!d},d?React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-spinner fa-spin"}),d.tipo.toUpperCase()," ",d.progresso,"%"):React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-download"}),"Exportar",React.createElement("i",{className:"fas fa-chevron-down"}))),s&&React.createElement("div",{className:"export-options"},React.createElement("button",{onClick:function(){return e.handleExport("pdf")}},React.createElement("i",{className:"fas fa-file-pdf"}),"PDF"),React.createElement("button",{onClick:function(){return e.handleExport("excel")}},React.createElement("i",{className:"fas fa-file-excel"}),"Excel"),React.createElement("button",{onClick:function(){return e.handleExport("csv")}},React.createElement("i",{className:"fas fa-file-csv"}),"CSV"))))),React.createElement("div",{className:"table-container"},React.createElement("table",{className:"table-modern"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,React.createElement("input",{type:"checkbox",checked:v,onChange:this.selectAllChamadas})),React.createElement("th",{className:"sortable ".concat("data_criacao"===i?l:""),onClick:function(){return e.handleSort("data_criacao")}},"Data/Hora",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",{className:"sortable ".concat("nome_contato"===i?l:""),onClick:function(){return e.handleSort("nome_contato")}},"Contato",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",null,"Telefone"),React.createElement("th",{className:"sortable ".concat("unidade_solicitante"===i?l:""),onClick:function(){return e.handleSort("unidade_solicitante")}},"Unidade Solicitante",React.createElement("i",{className:"fas fa-sort"})),React.createElement("th",null,"Tipo"),React.createElement("th",null,"Status"),React.createElement("th",null,"Atendente"),React.createElement("th",null,"Ações"))),React.createElement("tbody",null,0===b.length?React.createElement("tr",null,React.createElement("td",{colSpan:"9",className:"no-data"},React.createElement("div",{className:"no-data-content"},React.createElement("i",{className:"fas fa-search"}),React.createElement("h4",null,"Nenhum registro encontrado"),React.createElement("p",null,"Tente ajustar os filtros para encontrar mais resultados")))):b.map(function(t){var a=e.formatStatus(t.status);return React.createElement("tr",{key:t.id},React.createElement("td",null,React.createElement("input",{type:"checkbox",checked:o.includes(t.id),onChange:function(){return e.toggleChamadaSelection(t.id)}})),React.createElement("td",null,t.data_criacao),React.createElement("td",null,React.createElement("div",{className:"contact-info"},React.createElement("strong",null,t.nome_contato))),React.createElement("td",null,React.createElement("a",{href:"tel:".concat(t.telefone),className:"phone-link"},t.telefone)),React.createElement("td",null,t.unidade_solicitante.nome),React.createElement("td",null,React.createElement("span",{className:"tipo-badge"},t.tipo_chamada)),React.createElement("td",null,React.createElement("span",{className:"status-badge ".concat(a.class)},a.label)),React.createElement("td",null,t.nome_atendente),React.createElement("td",null,React.createElement("div",{className:"action-buttons"},React.createElement("button",{className:"btn-action view",title:"Ver detalhes",onClick:function(){return e.verDetalhes(t.id)}},React.createElement("i",{className:"fas fa-eye"})),React.createElement("button",{className:"btn-action edit",title:"Editar",onClick:function(){return e.abrirEdicao(t.id)}},React.createElement("i",{className:"fas fa-edit"})))))})))),E>1&&React.createElement("div",{className:"pagination-container"},React.createElement("div",{className:"pagination-info"},"Página ",c," de ",E,"(",a.length," registros)"),React.createElement("div",{className:"pagination-controls"},React.createElement("button",{className:"pagination-btn",disabled:1===c,onClick:function(){return e.handlePageChange(c-1)}},React.createElement("i",{className:"fas fa-chevron-left"}),"Anterior"),Array.from({length:Math.min(5,E)},function(t,a){var n;return n=E<=5||c<=3?a+1:c>=E-2?E-4+a:c-2+a,React.createElement("button",{key:n,className:"pagination-btn ".concat(c===n?"active":""),onClick:function(){return e.handlePageChange(n)}},n)}),React.createElement("button",{className:"pagination-btn",disabled:c===E,onClick:function(){return e.handlePageChange(c+1)}},"Próximo",React.createElement("i",{className:"fas fa-chevron-right"})))),React.createElement("div",{ref:this.sentinelaRef,className:"pagination-container"},this.state.proximoCursor&&React.createElement("button",{className:"pagination-btn",disabled:this.state.carregandoMais,onClick:this.carregarMaisChamadas},React.createElement("i",{className:"fas ".concat(this.state.carregandoMais?"fa-spinner fa-spin":"fa-chevron-down")}),this.state.carregandoMais?"Carregando...":"Carregar mais chamadas")))),m&&f&&React.createElement("div",{className:"modal-overlay",onClick:this.fecharModais},React.createElement("div",{className:"modal-content modal-large",onClick:function(e){return e.stopPropagation()}},React.createElement("div",{className:"modal-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-eye"}),"Detalhes da Chamada ",f.codigo),React.createElement("button",{className:"modal-close",onClick:this.fecharModais},React.createElement("i",{className:"fas fa-times"}))),React.createElement("div",{className:"modal-body"},React.createElement("div",{className:"detalhes-grid"},React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Contato:"),React.createElement("span",null,f.nome_contato)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Telefone:"),React.createElement("span",null,React.createElement("a",{href:"tel:".concat(f.telefone),className:"phone-link"},f.telefone))),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Função:"),React.createElement("span",null,f.funcao||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Setor:"),React.createElement("span",null,f.setor||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Unidade:"),React.createElement("span",null,f.unidade)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Município:"),React.createElement("span",null,f.municipio||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"CNES:"),React.createElement("span",null,f.cnes||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Contato CNES:"),React.createElement("span",null,f.contato_telefonico_cnes||"Não informado")),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Tipo de Chamada:"),React.createElement("span",{className:"tipo-badge"},f.tipo_chamada)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Status:"),React.createElement("span",{className:"status-badge ".concat(this.formatStatus(f.status).class)},f.status)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Atendente:"),React.createElement("span",null,f.nome_atendente)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Criado por:"),React.createElement("span",null,f.usuario_criador)),React.createElement("div",{className:"detalhe-item full-width"},React.createElement("label",null,"Descrição:"),React.createElement("p",{className:"descricao-completa"},f.descricao)),f.solucao&&React.createElement("div",{className:"detalhe-item full-width"},React.createElement("label",null,"Solução:"),React.createElement("p",{className:"solucao-completa"},f.solucao)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Data de Criação:"),React.createElement("span",null,f.data_criacao)),React.createElement("div",{className:"detalhe-item"},React.createElement("label",null,"Última Atualização:"),React.createElement("span",null,f.data_atualizacao)))))),u&&f&&React.createElement("div",{className:"modal-overlay",onClick:this.fecharModais},React.createElement("div",{className:"modal-content modal-large",onClick:function(e){return e.stopPropagation()}},React.createElement("div",{className:"modal-header"},React.createElement("h3",null,React.createElement("i",{className:"fas fa-edit"}),"Editar Chamada ",f.codigo),React.createElement("button",{className:"modal-close",onClick:this.fecharModais},React.createElement("i",{className:"fas fa-times"}))),React.createElement("div",{className:"modal-body"},React.createElement("form",{className:"edicao-form",onSubmit:function(t){t.preventDefault(),e.salvarEdicao()}},React.createElement("div",{className:"form-grid"},React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"nome_contato"},"Nome do Contato *"),React.createElement("input",{type:"text",id:"nome_contato",value:p.nome_contato||"",onChange:function(t){return e.atualizarDadosEdicao("nome_contato",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"telefone"},"Telefone *"),React.createElement("input",{type:"tel",id:"telefone",value:p.telefone||"",onChange:function(t){return e.atualizarDadosEdicao("telefone",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"funcao"},"Função"),React.createElement("input",{type:"text",id:"funcao",value:p.funcao||"",onChange:function(t){return e.atualizarDadosEdicao("funcao",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"setor"},"Setor"),React.createElement("input",{type:"text",id:"setor",value:p.setor||"",onChange:function(t){return e.atualizarDadosEdicao("setor",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"unidade"},"Unidade *"),React.createElement("input",{type:"text",id:"unidade",value:p.unidade||"",onChange:function(t){return e.atualizarDadosEdicao("unidade",t.target.value)},required:!0})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"municipio"},"Município"),React.createElement("input",{type:"text",id:"municipio",value:p.municipio||"",onChange:function(t){return e.atualizarDadosEdicao("municipio",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"cnes"},"CNES"),React.createElement("input",{type:"text",id:"cnes",value:p.cnes||"",onChange:function(t){return e.atualizarDadosEdicao("cnes",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"contato_telefonico_cnes"},"Contato CNES"),React.createElement("input",{type:"tel",id:"contato_telefonico_cnes",value:p.contato_telefonico_cnes||"",onChange:function(t){return e.atualizarDadosEdicao("contato_telefonico_cnes",t.target.value)}})),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"tipo_chamada"},"Tipo de Chamada *"),React.createElement("select",{id:"tipo_chamada",value:p.tipo_chamada||"",onChange:function(t){return e.atualizarDadosEdicao("tipo_chamada",t.target.value)},required:!0},React.createElement("option",{value:""},"Selecione o tipo"),g.tipos_chamada.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"status"},"Status *"),React.createElement("select",{id:"status",value:p.status||"",onChange:function(t){return e.atualizarDadosEdicao("status",t.target.value)},required:!0},React.createElement("option",{value:""},"Selecione o status"),g.status_choices.map(function(e){return React.createElement("option",{key:e.value,value:e.value},e.label)}))),React.createElement("div",{className:"form-group"},React.createElement("label",{htmlFor:"nome_atendente"},"Atendente *"),React.createElement("input",{type:"text",id:"nome_atendente",value:p.nome_atendente||"",onChange:function(t){return e.atualizarDadosEdicao("nome_atendente",t.target.value)},required:!0})),React.createElement("div",{className:"form-group full-width"},React.createElement("label",{htmlFor:"descricao"},"Descrição *"),React.createElement("textarea",{id:"descricao",rows:"4",value:p.descricao||"",onChange:function(t){return e.atualizarDadosEdicao("descricao",t.target.value)},required:!0})),React.createElement("div",{className:"form-group full-width"},React.createElement("label",{htmlFor:"solucao"},"Solução"),React.createElement("textarea",{id:"solucao",rows:"3",value:p.solucao||"",onChange:function(t){return e.atualizarDadosEdicao("solucao",t.target.value)},placeholder:"Descreva a solução aplicada (opcional)"}))),React.createElement("div",{className:"modal-footer"},React.createElement("button",{type:"button",className:"btn-cancel",onClick:this.fecharModais,disabled:h},"Cancelar"),React.createElement("button",{type:"submit",className:"btn-save",disabled:h},h?React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-spinner fa-spin"}),"Salvando..."):React.createElement(React.Fragment,null,React.createElement("i",{className:"fas fa-save"}),"Salvar Alterações"))))))))}}],a&&f(t.prototype,a),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,a}(),R=document.createElement("style");function y(){console.log("🔍 Debug - Tentando renderizar HistoricoReact"),console.log("🔍 Debug - Dados:",window.historicoData);var e=document.getElementById("historico-react-root");if(console.log("🔍 Debug - Container encontrado:",e),e&&window.historicoData&&"undefined"!=typeof React&&"undefined"!=typeof ReactDOM){console.log("✅ Todos os requisitos atendidos, inicializando React...");var t=ReactDOM.createRoot?ReactDOM.createRoot(e):null;t?(console.log("✅ Renderizando com React 18"),t.render(React.createElement(v,window.historicoData))):(console.log("✅ Renderizando com React 17"),ReactDOM.render(React.createElement(v,window.historicoData),e))}else console.error("❌ Erro: Container ou dados não encontrados",{container:e,dados:window.historicoData}),e&&(e.innerHTML='\n                <div style="padding: 2rem; text-align: center; background: white; border-radius: 12px; margin: 2rem;">\n                    <div style="color: #dc2626; font-size: 3rem; margin-bottom: 1rem;">⚠️</div>\n                    <h3 style="color: #374151; margin-bottom: 1rem;">Erro ao carregar histórico</h3>\n                    <p style="color: #6b7280; margin-bottom: 2rem;">\n                        Não foi possível carregar o componente de histórico.\n                    </p>\n                    <button onclick="window.location.reload()" style="\n                        background: #6366f1; \n                        color: white; \n                        padding: 0.75rem 1.5rem; \n                        border: none; \n                        border-radius: 8px; \n                        cursor: pointer;\n                        font-weight: 500;\n                    ">\n                        🔄 Recarregar Página\n                    </button>\n                </div>\n            ')}R.textContent='\n/* ===== SEÇÃO DE FILTROS ===== */\n.filtros-section {\n    margin-bottom: 2rem;\n    padding: 1.5rem;\n    background: #f8fafc;\n    border-radius: 16px;\n    border: 1px solid #e2e8f0;\n}\n\n.filtros-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: 1.5rem;\n}\n\n.filtros-header h3 {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    color: #1f2937;\n    font-size: 1.125rem;\n    font-weight: 600;\n    margin: 0;\n}\n\n.filtros-actions {\n    display: flex;\n    gap: 0.75rem;\n}\n\n.btn-filter {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.5rem 1rem;\n    border-radius: 8px;\n    font-weight: 500;\n    border: none;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    font-size: 0.875rem;\n}\n\n.btn-filter.secondary {\n    background: #f3f4f6;\n    color: #374151;\n    border: 1px solid #d1d5db;\n}\n\n.btn-filter.secondary:hover {\n    background: #e5e7eb;\n    transform: translateY(-1px);\n}\n\n.filtros-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));\n    gap: 1rem;\n}\n\n.filtro-group {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.filtro-group label {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    font-weight: 500;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.filtro-input, .filtro-select {\n    padding: 0.5rem 0.75rem;\n    border: 1px solid #d1d5db;\n    border-radius: 8px;\n    font-size: 0.875rem;\n    transition: all 0.3s ease;\n    background: white;\n}\n\n.filtro-input:focus, .filtro-select:focus {\n    outline: none;\n    border-color: #6366f1;\n    box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);\n}\n\n/* ===== SEÇÃO DE RESULTADOS ===== */\n.resultados-section {\n    margin-top: 2rem;\n}\n\n.resultados-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: 1rem;\n    padding-bottom: 1rem;\n    border-bottom: 1px solid #e5e7eb;\n}\n\n.resultados-info {\n    display: flex;\n    align-items: center;\n    gap: 1rem;\n}\n\n.resultados-info h3 {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    color: #1f2937;\n    font-size: 1.125rem;\n    font-weight: 600;\n    margin: 0;\n}\n\n.resultados-count {\n    background: #f3f4f6;\n    color: #374151;\n    padding: 0.25rem 0.75rem;\n    border-radius: 12px;\n    font-size: 0.875rem;\n    font-weight: 500;\n}\n\n.resultados-actions {\n    display: flex;\n    gap: 1rem;\n    align-items: center;\n}\n\n/* ===== DROPDOWN DE EXPORTAÇÃO ===== */\n.export-dropdown {\n    position: relative;\n}\n\n.btn-export {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.5rem 1rem;\n    background: linear-gradient(135deg, #6366f1, #4f46e5);\n    color: white;\n    border: none;\n    border-radius: 8px;\n    font-weight: 500;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    font-size: 0.875rem;\n}\n\n.btn-export:hover {\n    transform: translateY(-1px);\n    box-shadow: 0 4px 12px rgba(99, 102, 241, 0.3);\n}\n\n.export-options {\n    position: absolute;\n    top: 100%;\n    right: 0;\n    background: white;\n    border: 1px solid #e5e7eb;\n    border-radius: 8px;\n    box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);\n    z-index: 1000;\n    margin-top: 0.5rem;\n    min-width: 120px;\n}\n\n.export-options button {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    width: 100%;\n    padding: 0.75rem 1rem;\n    background: none;\n    border: none;\n    color: #374151;\n    cursor: pointer;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.export-options button:hover {\n    background: #f3f4f6;\n    color: #6366f1;\n}\n\n.export-options button:first-child {\n    border-radius: 8px 8px 0 0;\n}\n\n.export-options button:last-child {\n    border-radius: 0 0 8px 8px;\n}\n\n/* ===== TABELA ===== */\n.table-container {\n    background: white;\n    border-radius: 12px;\n    overflow: hidden;\n    border: 1px solid #e5e7eb;\n    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);\n}\n\n.table-modern {\n    width: 100%;\n    border-collapse: collapse;\n}\n\n.table-modern th {\n    background: #f8fafc;\n    padding: 1rem 0.75rem;\n    text-align: left;\n    font-weight: 600;\n    color: #374151;\n    font-size: 0.875rem;\n    border-bottom: 1px solid #e5e7eb;\n    position: relative;\n}\n\n.table-modern th.sortable {\n    cursor: pointer;\n    user-select: none;\n    transition: all 0.2s ease;\n}\n\n.table-modern th.sortable:hover {\n    background: #f1f5f9;\n    color: #6366f1;\n}\n\n.table-modern th.sortable i {\n    margin-left: 0.5rem;\n    opacity: 0.5;\n}\n\n.table-modern th.sortable.asc i:before {\n    content: "\\f0de";\n    opacity: 1;\n    color: #6366f1;\n}\n\n.table-modern th.sortable.desc i:before {\n    content: "\\f0dd";\n    opacity: 1;\n    color: #6366f1;\n}\n\n.table-modern td {\n    padding: 0.75rem;\n    border-bottom: 1px solid #f1f5f9;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.table-modern tbody tr:hover {\n    background: #f8fafc;\n}\n\n.table-modern tbody tr:last-child td {\n    border-bottom: none;\n}\n\n/* ===== BADGES E STATUS ===== */\n.status-badge {\n    padding: 0.25rem 0.75rem;\n    border-radius: 12px;\n    font-size: 0.75rem;\n    font-weight: 500;\n    text-transform: uppercase;\n    letter-spacing: 0.025em;\n}\n\n.status-badge.success {\n    background: rgba(16, 185, 129, 0.1);\n    color: #047857;\n}\n\n.status-badge.warning {\n    background: rgba(245, 158, 11, 0.1);\n    color: #d97706;\n}\n\n.status-badge.info {\n    background: rgba(59, 130, 246, 0.1);\n    color: #1d4ed8;\n}\n\n.status-badge.danger {\n    background: rgba(239, 68, 68, 0.1);\n    color: #dc2626;\n}\n\n.status-badge.secondary {\n    background: rgba(107, 114, 128, 0.1);\n    color: #4b5563;\n}\n\n.tipo-badge {\n    background: #f3f4f6;\n    color: #374151;\n    padding: 0.25rem 0.5rem;\n    border-radius: 6px;\n    font-size: 0.75rem;\n    font-weight: 500;\n}\n\n/* ===== AÇÕES DA TABELA ===== */\n.action-buttons {\n    display: flex;\n    gap: 0.5rem;\n}\n\n.btn-action {\n    width: 32px;\n    height: 32px;\n    border: none;\n    border-radius: 6px;\n    cursor: pointer;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.btn-action.view {\n    background: rgba(59, 130, 246, 0.1);\n    color: #1d4ed8;\n}\n\n.btn-action.view:hover {\n    background: rgba(59, 130, 246, 0.2);\n    transform: scale(1.05);\n}\n\n.btn-action.edit {\n    background: rgba(245, 158, 11, 0.1);\n    color: #d97706;\n}\n\n.btn-action.edit:hover {\n    background: rgba(245, 158, 11, 0.2);\n    transform: scale(1.05);\n}\n\n/* ===== PAGINAÇÃO ===== */\n.pagination-container {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-top: 1.5rem;\n    padding-top: 1rem;\n    border-top: 1px solid #e5e7eb;\n}\n\n.pagination-info {\n    color: #6b7280;\n    font-size: 0.875rem;\n}\n\n.pagination-controls {\n    display: flex;\n    gap: 0.5rem;\n}\n\n.pagination-btn {\n    display: flex;\n    align-items: center;\n    gap: 0.25rem;\n    padding: 0.5rem 0.75rem;\n    border: 1px solid #d1d5db;\n    background: white;\n    color: #374151;\n    border-radius: 6px;\n    cursor: pointer;\n    transition: all 0.2s ease;\n    font-size: 0.875rem;\n}\n\n.pagination-btn:hover:not(:disabled) {\n    background: #f3f4f6;\n    border-color: #6366f1;\n    color: #6366f1;\n}\n\n.pagination-btn:disabled {\n    opacity: 0.5;\n    cursor: not-allowed;\n}\n\n.pagination-btn.active {\n    background: #6366f1;\n    color: white;\n    border-color: #6366f1;\n}\n\n/* ===== SEM DADOS ===== */\n.no-data {\n    text-align: center;\n    padding: 3rem 1rem;\n}\n\n.no-data-content {\n    display: flex;\n    flex-direction: column;\n    align-items: center;\n    gap: 1rem;\n    color: #6b7280;\n}\n\n.no-data-content i {\n    font-size: 3rem;\n    opacity: 0.5;\n}\n\n.no-data-content h4 {\n    color: #374151;\n    margin: 0;\n}\n\n.no-data-content p {\n    margin: 0;\n    font-size: 0.875rem;\n}\n\n/* ===== LINKS ESPECIAIS ===== */\n.phone-link {\n    color: #6366f1;\n    text-decoration: none;\n    font-weight: 500;\n}\n\n.phone-link:hover {\n    text-decoration: underline;\n}\n\n.contact-info strong {\n    color: #1f2937;\n}\n\n/* ===== LOADING OVERLAY ===== */\n.loading-overlay-historico {\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(4px);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    z-index: 1000;\n    border-radius: 24px;\n}\n\n/* ===== MODAIS ===== */\n.modal-overlay {\n    position: fixed;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: rgba(0, 0, 0, 0.6);\n    backdrop-filter: blur(4px);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    z-index: 10000;\n    padding: 1rem;\n}\n\n.modal-content {\n    background: white;\n    border-radius: 16px;\n    box-shadow: 0 25px 50px rgba(0, 0, 0, 0.3);\n    width: 100%;\n    max-width: 600px;\n    max-height: 90vh;\n    overflow: hidden;\n    display: flex;\n    flex-direction: column;\n    animation: modalSlideIn 0.3s ease-out;\n}\n\n.modal-content.modal-large {\n    max-width: 900px;\n}\n\n@keyframes modalSlideIn {\n    from {\n        opacity: 0;\n        transform: translateY(-20px) scale(0.95);\n    }\n    to {\n        opacity: 1;\n        transform: translateY(0) scale(1);\n    }\n}\n\n.modal-header {\n    padding: 1.5rem 2rem;\n    border-bottom: 1px solid #e5e7eb;\n    display: flex;\n    align-items: center;\n    justify-content: space-between;\n    background: #f8fafc;\n}\n\n.modal-header h3 {\n    margin: 0;\n    display: flex;\n    align-items: center;\n    gap: 0.75rem;\n    color: #1f2937;\n    font-size: 1.25rem;\n    font-weight: 600;\n}\n\n.modal-close {\n    width: 40px;\n    height: 40px;\n    border: none;\n    background: rgba(156, 163, 175, 0.1);\n    border-radius: 50%;\n    color: #6b7280;\n    cursor: pointer;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    transition: all 0.2s ease;\n    font-size: 1.125rem;\n}\n\n.modal-close:hover {\n    background: rgba(239, 68, 68, 0.1);\n    color: #dc2626;\n}\n\n.modal-body {\n    padding: 2rem;\n    overflow-y: auto;\n    flex: 1;\n}\n\n.modal-footer {\n    padding: 1.5rem 2rem;\n    border-top: 1px solid #e5e7eb;\n    display: flex;\n    gap: 1rem;\n    justify-content: flex-end;\n    background: #f8fafc;\n}\n\n/* ===== DETALHES ===== */\n.detalhes-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n    gap: 1.5rem;\n}\n\n.detalhe-item {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.detalhe-item.full-width {\n    grid-column: 1 / -1;\n}\n\n.detalhe-item label {\n    font-weight: 600;\n    color: #374151;\n    font-size: 0.875rem;\n    text-transform: uppercase;\n    letter-spacing: 0.025em;\n}\n\n.detalhe-item span {\n    color: #1f2937;\n    font-size: 1rem;\n}\n\n.descricao-completa,\n.solucao-completa {\n    background: #f3f4f6;\n    padding: 1rem;\n    border-radius: 8px;\n    color: #374151;\n    line-height: 1.6;\n    margin: 0;\n    white-space: pre-wrap;\n}\n\n.solucao-completa {\n    background: #ecfdf5;\n    border-left: 4px solid #10b981;\n}\n\n/* ===== FORMULÁRIO DE EDIÇÃO ===== */\n.edicao-form {\n    display: flex;\n    flex-direction: column;\n    gap: 1.5rem;\n}\n\n.form-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));\n    gap: 1.5rem;\n}\n\n.form-group {\n    display: flex;\n    flex-direction: column;\n    gap: 0.5rem;\n}\n\n.form-group.full-width {\n    grid-column: 1 / -1;\n}\n\n.form-group label {\n    font-weight: 500;\n    color: #374151;\n    font-size: 0.875rem;\n}\n\n.form-group input,\n.form-group select,\n.form-group textarea {\n    padding: 0.75rem;\n    border: 1px solid #d1d5db;\n    border-radius: 8px;\n    font-size: 0.875rem;\n    transition: all 0.3s ease;\n    background: white;\n}\n\n.form-group input:focus,\n.form-group select:focus,\n.form-group textarea:focus {\n    outline: none;\n    border-color: #6366f1;\n    box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);\n}\n\n.form-group textarea {\n    resize: vertical;\n    min-height: 100px;\n    font-family: inherit;\n}\n\n/* ===== BOTÕES DOS MODAIS ===== */\n.btn-cancel,\n.btn-save {\n    display: flex;\n    align-items: center;\n    gap: 0.5rem;\n    padding: 0.75rem 1.5rem;\n    border-radius: 8px;\n    font-weight: 500;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    border: none;\n    font-size: 0.875rem;\n}\n\n.btn-cancel {\n    background: #f3f4f6;\n    color: #374151;\n    border: 1px solid #d1d5db;\n}\n\n.btn-cancel:hover:not(:disabled) {\n    background: #e5e7eb;\n    transform: translateY(-1px);\n}\n\n.btn-save {\n    background: linear-gradient(135deg, #6366f1, #4f46e5);\n    color: white;\n}\n\n.btn-save:hover:not(:disabled) {\n    transform: translateY(-1px);\n    box-shadow: 0 8px 25px rgba(99, 102, 241, 0.3);\n}\n\n.btn-save:disabled,\n.btn-cancel:disabled {\n    opacity: 0.6;\n    cursor: not-allowed;\n}\n\n/* ===== RESPONSIVIDADE ===== */\n@media (max-width: 768px) {\n    .filtros-grid {\n        grid-template-columns: 1fr;\n    }\n    \n    .resultados-header {\n        flex-direction: column;\n        gap: 1rem;\n        align-items: flex-start;\n    }\n    \n    .table-container {\n        overflow-x: auto;\n    }\n    \n    .pagination-container {\n        flex-direction: column;\n        gap: 1rem;\n        align-items: center;\n    }\n    \n    .pagination-controls {\n        flex-wrap: wrap;\n        justify-content: center;\n    }\n    \n    .modal-content {\n        max-width: 95vw;\n        margin: 0.5rem;\n    }\n    \n    .modal-header,\n    .modal-body,\n    .modal-footer {\n        padding: 1rem;\n    }\n    \n    .detalhes-grid {\n        grid-template-columns: 1fr;\n        gap: 1rem;\n    }\n    \n    .form-grid {\n        grid-template-columns: 1fr;\n        gap: 1rem;\n    }\n    \n    .modal-footer {\n        flex-direction: column;\n    }\n}\n',document.querySelector("#historico-styles")||(R.id="historico-styles",document.head.appendChild(R)),window.HistoricoReact=v,e.exports&&(e.exports=v),"loading"===document.readyState?document.addEventListener("DOMContentLoaded",y):y()}},t={};function a(n){var r=t[n];if(void 0!==r)return r.exports;var o=t[n]={id:n,loaded:!1,exports:{}};return e[n](o,o.exports,a),o.loaded=!0,o.exports}a.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),a(64),console.log("🚀 Carregando bundle do HistoricoReact..."),console.log("✅ Bundle do HistoricoReact carregado com sucesso")})();
 //# sourceMappingURL=historico.bundle.js.map
\ No newline at end of file
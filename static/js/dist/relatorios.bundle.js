@@ -1,2 +1,3 @@
-(()=>{var e={206:e=>{"use strict";e.exports=ReactDOM},238:e=>{function n(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var a=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=a){var t,r,s,i,c=[],o=!0,l=!1;try{if(s=(a=a.call(e)).next,0===n){if(Object(a)!==a)return;o=!1}else for(;!(o=(t=s.call(a)).done)&&(c.push(t.value),c.length!==n);o=!0);}catch(e){l=!0,r=e}finally{try{if(!o&&null!=a.return&&(i=a.return(),Object(i)!==i))return}finally{if(l)throw r}}return c}}(e,n)||function(e,n){if(e){if("string"==typeof e)return a(e,n);var t={}.toString.call(e).slice(8,-1);return"Object"===t&&e.constructor&&(t=e.constructor.name),"Map"===t||"Set"===t?Array.from(e):"Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t)?a(e,n):void 0}}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(e,n){(null==n||n>e.length)&&(n=e.length);for(var a=0,t=Array(n);a<n;a++)t[a]=e[a];return t}!function(){"use strict";function a(e){e.usuario,e.dataAtual;var a=e.statsGerais,t=e.usuariosStats,r=e.unidadesStats,s=e.chamadasStats,i=e.analises,c=(e.graficosData,e.exportUrls),o=n(React.useState("geral"),2),l=o[0],d=o[1],m=n(React.useState("12"),2),u=m[0],g=m[1],p=n(React.useState(!1),2),b=(p[0],p[1],n(React.useState(!1),2)),f=b[0],h=b[1],v=function(e){g(e),h(!1),console.log("Período alterado para: ".concat(e," meses"))},x=function(e){var n;switch(e){case"excel":n=(null==c?void 0:c.geral_excel)||"/accounts/sistema/relatorios/export-excel/";break;case"csv":n=(null==c?void 0:c.geral_csv)||"/accounts/sistema/relatorios/export-csv/";break;case"pdf":n=(null==c?void 0:c.geral_pdf)||"/accounts/sistema/relatorios/export-pdf/";break;default:return}console.log("Exportando relatório em formato ".concat(e," via ").concat(n)),window.open(n,"_blank")};React.useEffect(function(){var e=function(e){f&&!e.target.closest(".period-selector-container")&&h(!1)};return document.addEventListener("click",e),function(){return document.removeEventListener("click",e)}},[f]),React.useEffect(function(){var e=document.createElement("style");return e.id="relatorios-react-styles",e.textContent="\n                .relatorios-react {\n                    min-height: 100vh;\n                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n                    padding: 2rem 0;\n                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;\n                    position: relative;\n                    overflow-x: hidden;\n                }\n\n                .relatorios-react::before {\n                    content: '';\n                    position: fixed;\n                    top: 0;\n                    left: 0;\n                    width: 100%;\n                    height: 100%;\n                    background: \n                        radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.3) 0%, transparent 50%),\n                        radial-gradient(circle at 80% 20%, rgba(255, 255, 255, 0.1) 0%, transparent 50%),\n                        radial-gradient(circle at 40% 40%, rgba(120, 119, 198, 0.2) 0%, transparent 50%);\n                    pointer-events: none;\n                    z-index: 0;\n                }\n\n                .main-container {\n                    max-width: 1600px;\n                    margin: 0 auto;\n                    padding: 0 1rem;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .header-section {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 2rem;\n                    margin-bottom: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: fadeInDown 0.8s ease-out;\n                }\n\n                .header-content {\n                    display: flex;\n                    justify-content: space-between;\n                    align-items: center;\n                    flex-wrap: wrap;\n                    gap: 1rem;\n                }\n\n                .header-left {\n                    display: flex;\n                    align-items: center;\n                    gap: 1rem;\n                    flex: 1;\n                }\n\n                .header-icon {\n                    width: 80px;\n                    height: 80px;\n                    background: rgba(255, 255, 255, 0.2);\n                    border-radius: 50%;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-size: 2rem;\n                    animation: pulse 2s infinite;\n                }\n\n                .header-text h1 {\n                    color: white;\n                    margin: 0;\n                    font-size: 2.5rem;\n                    font-weight: 700;\n                }\n\n                .header-text p {\n                    color: rgba(255, 255, 255, 0.8);\n                    margin: 0;\n                    font-size: 1.1rem;\n                }\n\n                .header-controls {\n                    display: flex;\n                    gap: 1rem;\n                    align-items: center;\n                    flex-wrap: wrap;\n                    overflow: visible;\n                    position: relative;\n                }\n\n                .export-buttons {\n                    display: flex;\n                    gap: 0.5rem;\n                    align-items: center;\n                }\n\n                .export-btn {\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 10px;\n                    padding: 0.5rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    text-decoration: none;\n                    display: inline-flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    font-size: 0.9rem;\n                }\n\n                .export-btn:hover {\n                    background: rgba(255, 255, 255, 0.3);\n                    color: white;\n                    text-decoration: none;\n                    transform: translateY(-2px);\n                }\n\n                .export-btn.excel {\n                    background: rgba(33, 150, 83, 0.3);\n                    border-color: rgba(33, 150, 83, 0.5);\n                }\n\n                .export-btn.csv {\n                    background: rgba(52, 152, 219, 0.3);\n                    border-color: rgba(52, 152, 219, 0.5);\n                }\n\n                .export-btn.pdf {\n                    background: rgba(231, 76, 60, 0.3);\n                    border-color: rgba(231, 76, 60, 0.5);\n                }\n\n                .period-selector {\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 15px;\n                    padding: 0.75rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                }\n\n                .period-selector:hover {\n                    background: rgba(255, 255, 255, 0.3);\n                }\n\n                .period-selector-container {\n                    position: relative;\n                    overflow: visible;\n                    z-index: 10000;\n                }\n\n                .period-selector {\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 15px;\n                    padding: 0.75rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    min-width: 200px;\n                }\n\n                .period-dropdown {\n                    position: absolute;\n                    top: 100%;\n                    left: 0;\n                    right: 0;\n                    background: rgba(255, 255, 255, 0.95);\n                    backdrop-filter: blur(10px);\n                    border-radius: 15px;\n                    padding: 0.5rem;\n                    margin-top: 0.5rem;\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);\n                    z-index: 10005;\n                    animation: fadeInDown 0.3s ease-out;\n                    max-height: 200px;\n                    overflow-y: auto;\n                }\n\n                .period-option {\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    padding: 0.75rem 1rem;\n                    color: #333;\n                    cursor: pointer;\n                    border-radius: 10px;\n                    transition: all 0.2s ease;\n                }\n\n                .period-option:hover {\n                    background: rgba(102, 126, 234, 0.1);\n                    color: #667eea;\n                }\n\n                .period-option i {\n                    font-size: 0.8rem;\n                    color: #667eea;\n                }\n\n                .navigation-tabs {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 1rem;\n                    margin-bottom: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: slideInLeft 0.8s ease-out 0.2s both;\n                }\n\n                .tab-buttons {\n                    display: flex;\n                    gap: 0.5rem;\n                    flex-wrap: wrap;\n                }\n\n                .tab-button {\n                    background: rgba(255, 255, 255, 0.1);\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    border-radius: 15px;\n                    padding: 1rem 1.5rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    font-weight: 500;\n                }\n\n                .tab-button.active {\n                    background: rgba(255, 255, 255, 0.3);\n                    transform: translateY(-2px);\n                    box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);\n                }\n\n                .tab-button:hover {\n                    background: rgba(255, 255, 255, 0.2);\n                    transform: translateY(-1px);\n                }\n\n                .content-section {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: slideInUp 0.8s ease-out 0.4s both;\n                }\n\n                .stats-grid {\n                    display: grid;\n                    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));\n                    gap: 1.5rem;\n                    margin-bottom: 2rem;\n                }\n\n                .stat-card {\n                    background: linear-gradient(135deg, rgba(255, 255, 255, 0.2) 0%, rgba(255, 255, 255, 0.1) 100%);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    transition: all 0.3s ease;\n                    animation: fadeIn 0.6s ease-out;\n                }\n\n                .stat-card:hover {\n                    transform: translateY(-5px);\n                    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);\n                    background: linear-gradient(135deg, rgba(255, 255, 255, 0.3) 0%, rgba(255, 255, 255, 0.2) 100%);\n                }\n\n                .stat-card-header {\n                    display: flex;\n                    align-items: center;\n                    justify-content: space-between;\n                    margin-bottom: 1rem;\n                }\n\n                .stat-icon {\n                    width: 50px;\n                    height: 50px;\n                    border-radius: 12px;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-size: 1.5rem;\n                }\n\n                .stat-icon.users { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }\n                .stat-icon.active { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }\n                .stat-icon.admin { background: linear-gradient(135deg, #fc466b 0%, #3f5efb 100%); }\n                .stat-icon.units { background: linear-gradient(135deg, #fdbb2d 0%, #22c1c3 100%); }\n                .stat-icon.calls { background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); }\n\n                .stat-title {\n                    color: white;\n                    font-size: 0.9rem;\n                    font-weight: 600;\n                    opacity: 0.9;\n                }\n\n                .stat-value {\n                    color: white;\n                    font-size: 2.5rem;\n                    font-weight: 700;\n                    margin: 0.5rem 0;\n                }\n\n                .stat-change {\n                    color: rgba(255, 255, 255, 0.8);\n                    font-size: 0.8rem;\n                }\n\n                .users-table {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    overflow: hidden;\n                    margin-bottom: 2rem;\n                    width: 100%;\n                    border-collapse: collapse;\n                }\n                \n                .users-table th,\n                .users-table td {\n                    padding: 1rem;\n                    text-align: left;\n                    border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n                }\n                \n                .users-table th {\n                    background: rgba(255, 255, 255, 0.2);\n                    color: white;\n                    font-weight: 600;\n                    font-size: 0.9rem;\n                    text-transform: uppercase;\n                    letter-spacing: 0.5px;\n                }\n                \n                .users-table tbody tr {\n                    transition: all 0.3s ease;\n                }\n                \n                .users-table tbody tr:hover {\n                    background: rgba(255, 255, 255, 0.05);\n                }\n                \n                .chart-card {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    margin-bottom: 2rem;\n                }\n                \n                .chart-header {\n                    margin-bottom: 1.5rem;\n                }\n                \n                .chart-title {\n                    color: white;\n                    font-size: 1.3rem;\n                    font-weight: 600;\n                    margin: 0;\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                }\n                \n                .chart-content {\n                    color: white;\n                }\n\n                .table-header {\n                    background: rgba(255, 255, 255, 0.2);\n                    padding: 1rem 1.5rem;\n                    border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n                }\n\n                .table-title {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0;\n                }\n\n                .table-content {\n                    padding: 1rem;\n                }\n\n                .user-row {\n                    display: flex;\n                    align-items: center;\n                    justify-content: space-between;\n                    padding: 1rem;\n                    background: rgba(255, 255, 255, 0.05);\n                    border-radius: 10px;\n                    margin-bottom: 0.5rem;\n                    transition: all 0.3s ease;\n                }\n\n                .user-row:hover {\n                    background: rgba(255, 255, 255, 0.1);\n                    transform: translateX(5px);\n                }\n\n                .user-info {\n                    display: flex;\n                    align-items: center;\n                    gap: 1rem;\n                    flex: 1;\n                }\n\n                .user-avatar {\n                    width: 40px;\n                    height: 40px;\n                    border-radius: 50%;\n                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-weight: 600;\n                }\n\n                .user-details h4 {\n                    color: white;\n                    margin: 0;\n                    font-size: 1rem;\n                }\n\n                .user-details p {\n                    color: rgba(255, 255, 255, 0.7);\n                    margin: 0;\n                    font-size: 0.8rem;\n                }\n\n                .user-stats {\n                    display: flex;\n                    gap: 2rem;\n                    align-items: center;\n                }\n\n                .user-stat {\n                    text-align: center;\n                }\n\n                .user-stat-value {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0;\n                }\n\n                .user-stat-label {\n                    color: rgba(255, 255, 255, 0.7);\n                    font-size: 0.7rem;\n                    margin: 0;\n                }\n\n                .user-badge {\n                    padding: 0.3rem 0.8rem;\n                    border-radius: 15px;\n                    font-size: 0.7rem;\n                    font-weight: 600;\n                    text-transform: uppercase;\n                }\n\n                .badge-gold { background: linear-gradient(135deg, #f39c12 0%, #f1c40f 100%); color: #2c3e50; }\n                .badge-silver { background: linear-gradient(135deg, #bdc3c7 0%, #95a5a6 100%); color: #2c3e50; }\n                .badge-bronze { background: linear-gradient(135deg, #d35400 0%, #e67e22 100%); color: white; }\n                .badge-blue { background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; }\n\n                .insights-grid {\n                    display: grid;\n                    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n                    gap: 1.5rem;\n                }\n\n                .insight-card {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    border-left: 4px solid;\n                    transition: all 0.3s ease;\n                }\n\n                .insight-card.positivo { border-left-color: #27ae60; }\n                .insight-card.negativo { border-left-color: #e74c3c; }\n                .insight-card.alerta { border-left-color: #f39c12; }\n                .insight-card.destaque { border-left-color: #9b59b6; }\n                .insight-card.info { border-left-color: #3498db; }\n\n                .insight-card:hover {\n                    transform: translateY(-3px);\n                    background: rgba(255, 255, 255, 0.15);\n                }\n\n                .insight-icon {\n                    width: 40px;\n                    height: 40px;\n                    border-radius: 10px;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    margin-bottom: 1rem;\n                    color: white;\n                }\n\n                .insight-icon.positivo { background: #27ae60; }\n                .insight-icon.negativo { background: #e74c3c; }\n                .insight-icon.alerta { background: #f39c12; }\n                .insight-icon.destaque { background: #9b59b6; }\n                .insight-icon.info { background: #3498db; }\n\n                .insight-title {\n                    color: white;\n                    font-size: 1.1rem;\n                    font-weight: 600;\n                    margin: 0 0 0.5rem 0;\n                }\n\n                .insight-description {\n                    color: rgba(255, 255, 255, 0.8);\n                    font-size: 0.9rem;\n                    line-height: 1.5;\n                    margin: 0;\n                }\n\n                .chart-container {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    margin-bottom: 1.5rem;\n                }\n\n                .chart-title {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0 0 1rem 0;\n                    text-align: center;\n                }\n\n                .progress-container {\n                    margin-bottom: 1rem;\n                }\n\n                .progress-label {\n                    display: flex;\n                    justify-content: space-between;\n                    color: white;\n                    font-size: 0.9rem;\n                    margin-bottom: 0.5rem;\n                }\n\n                .progress-bar {\n                    background: rgba(255, 255, 255, 0.2);\n                    border-radius: 10px;\n                    height: 8px;\n                    overflow: hidden;\n                }\n\n                .progress-fill {\n                    height: 100%;\n                    border-radius: 10px;\n                    transition: width 1s ease-out;\n                    animation: progressFill 1.5s ease-out;\n                }\n\n                @keyframes fadeInDown {\n                    from { opacity: 0; transform: translateY(-50px); }\n                    to { opacity: 1; transform: translateY(0); }\n                }\n\n                @keyframes slideInLeft {\n                    from { opacity: 0; transform: translateX(-50px); }\n                    to { opacity: 1; transform: translateX(0); }\n                }\n\n                @keyframes slideInUp {\n                    from { opacity: 0; transform: translateY(50px); }\n                    to { opacity: 1; transform: translateY(0); }\n                }\n\n                @keyframes fadeIn {\n                    from { opacity: 0; }\n                    to { opacity: 1; }\n                }\n\n                @keyframes pulse {\n                    0%, 100% { transform: scale(1); }\n                    50% { transform: scale(1.05); }\n                }\n\n                @keyframes progressFill {\n                    from { width: 0; }\n                }\n\n                /* ===== NAVIGATION TABS MODERNIZADAS ===== */\n                .navigation-tabs {\n                    display: flex;\n                    gap: 1rem;\n                    margin-bottom: 2rem;\n                    padding: 1rem;\n                    background: rgba(255, 255, 255, 0.05);\n                    backdrop-filter: blur(20px);\n                    border-radius: 20px;\n                    border: 1px solid rgba(255, 255, 255, 0.1);\n                    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);\n                    animation: slideInUp 0.8s ease-out 0.2s both;\n                    flex-wrap: wrap;\n                    justify-content: center;\n                }\n\n                .nav-tab {\n                    background: rgba(255, 255, 255, 0.08);\n                    border: 2px solid rgba(255, 255, 255, 0.15);\n                    color: rgba(255, 255, 255, 0.9);\n                    padding: 1rem 1.5rem;\n                    border-radius: 16px;\n                    cursor: pointer;\n                    transition: all 0.4s cubic-bezier(0.23, 1, 0.320, 1);\n                    font-family: inherit;\n                    font-size: 0.95rem;\n                    font-weight: 600;\n                    backdrop-filter: blur(15px);\n                    display: flex;\n                    flex-direction: column;\n                    align-items: center;\n                    gap: 0.5rem;\n                    position: relative;\n                    overflow: hidden;\n                    min-width: 120px;\n                    text-align: center;\n                }\n\n                .nav-tab::before {\n                    content: '';\n                    position: absolute;\n                    top: 0;\n                    left: -100%;\n                    width: 100%;\n                    height: 100%;\n                    background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);\n                    transition: left 0.6s ease;\n                }\n\n                .nav-tab:hover::before {\n                    left: 100%;\n                }\n\n                .nav-tab i {\n                    font-size: 1.25rem;\n                    margin-bottom: 0.25rem;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .nav-tab span {\n                    font-size: 0.85rem;\n                    font-weight: 700;\n                    letter-spacing: 0.5px;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .nav-tab.active {\n                    background: rgba(255, 255, 255, 0.2);\n                    border-color: rgba(255, 255, 255, 0.4);\n                    color: white;\n                    transform: translateY(-4px) scale(1.05);\n                    box-shadow: \n                        0 10px 30px rgba(0, 0, 0, 0.3),\n                        0 0 0 1px rgba(255, 255, 255, 0.2);\n                }\n\n                .nav-tab:hover {\n                    background: rgba(255, 255, 255, 0.15);\n                    border-color: rgba(255, 255, 255, 0.3);\n                    transform: translateY(-2px);\n                    color: white;\n                    box-shadow: 0 6px 20px rgba(0, 0, 0, 0.2);\n                }\n\n                .nav-tab:active {\n                    transform: translateY(-1px);\n                }\n\n                /* ===== RESPONSIVIDADE AVANÇADA ===== */\n                @media (max-width: 1024px) {\n                    .navigation-tabs {\n                        gap: 0.75rem;\n                        padding: 0.75rem;\n                    }\n                    \n                    .nav-tab {\n                        min-width: 100px;\n                        padding: 0.75rem 1rem;\n                    }\n                }\n\n                @media (max-width: 768px) {\n                    .header-content {\n                        flex-direction: column;\n                        text-align: center;\n                        gap: 1.5rem;\n                    }\n\n                    .header-text h1 {\n                        font-size: 2rem;\n                    }\n\n                    .navigation-tabs {\n                        gap: 0.5rem;\n                        padding: 0.75rem;\n                        flex-wrap: wrap;\n                    }\n\n                    .nav-tab {\n                        min-width: 80px;\n                        padding: 0.75rem;\n                        font-size: 0.85rem;\n                    }\n\n                    .nav-tab i {\n                        font-size: 1.1rem;\n                    }\n\n                    .nav-tab span {\n                        font-size: 0.75rem;\n                    }\n\n                    .stats-grid {\n                        grid-template-columns: 1fr;\n                        gap: 1rem;\n                    }\n\n                    .user-stats {\n                        flex-direction: column;\n                        gap: 0.5rem;\n                    }\n\n                    .insights-grid {\n                        grid-template-columns: 1fr;\n                    }\n\n                    .export-buttons {\n                        flex-wrap: wrap;\n                        justify-content: center;\n                        gap: 0.5rem;\n                    }\n\n                    .header-controls {\n                        flex-direction: column;\n                        width: 100%;\n                    }\n                }\n            ",document.head.querySelector("#relatorios-react-styles")||document.head.appendChild(e),function(){var e=document.head.querySelector("#relatorios-react-styles");e&&e.remove()}},[]);var E=function(e,n,a,t){var r=arguments.length>4&&void 0!==arguments[4]?arguments[4]:"rgba(255, 255, 255, 0.2)";return React.createElement("div",{className:"stat-card"},React.createElement("div",{className:"stat-header"},React.createElement("div",{className:"stat-icon",style:{background:r}},React.createElement("i",{className:t})),React.createElement("div",{className:"stat-title"},e)),React.createElement("div",{className:"stat-value"},n),React.createElement("div",{className:"stat-description"},a))};return React.createElement("div",{className:"relatorios-react"},React.createElement("div",{className:"main-container"},React.createElement("div",{className:"breadcrumb-container"},React.createElement("nav",{className:"breadcrumb"},React.createElement("a",{href:"/accounts/",className:"breadcrumb-item"},React.createElement("i",{className:"fas fa-home"}),"Início"),React.createElement("span",{className:"breadcrumb-separator"},React.createElement("i",{className:"fas fa-chevron-right"})),React.createElement("a",{href:"/accounts/configuracoes/",className:"breadcrumb-item"},React.createElement("i",{className:"fas fa-cog"}),"Configurações"),React.createElement("span",{className:"breadcrumb-separator"},React.createElement("i",{className:"fas fa-chevron-right"})),React.createElement("span",{className:"breadcrumb-item active"},React.createElement("i",{className:"fas fa-chart-line"}),"Relatórios"))),React.createElement("div",{className:"header-section"},React.createElement("div",{className:"header-content"},React.createElement("div",{className:"header-left"},React.createElement("div",{className:"header-icon"},React.createElement("i",{className:"fas fa-chart-line"})),React.createElement("div",{className:"header-text"},React.createElement("h1",null,"Relatórios do Sistema"),React.createElement("p",null,"Análises e estatísticas detalhadas"))),React.createElement("div",{className:"header-controls"},React.createElement("div",{className:"period-selector-container"},React.createElement("div",{className:"period-selector",onClick:function(){return h(!f)}},React.createElement("i",{className:"fas fa-calendar-alt"}),React.createElement("span",null,"12"===u?"Últimos 12 meses":"9"===u?"Últimos 9 meses":"6"===u?"Últimos 6 meses":"3"===u?"Últimos 3 meses":"1"===u?"Último mês":"30"===u?"Últimos 30 dias":"Últimos 12 meses"),React.createElement("i",{className:"fas fa-chevron-down"})),f&&React.createElement("div",{className:"period-dropdown"},React.createElement("div",{className:"period-option",onClick:function(){return v("30")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 30 dias")),React.createElement("div",{className:"period-option",onClick:function(){return v("1")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Último mês")),React.createElement("div",{className:"period-option",onClick:function(){return v("3")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 3 meses")),React.createElement("div",{className:"period-option",onClick:function(){return v("6")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 6 meses")),React.createElement("div",{className:"period-option",onClick:function(){return v("9")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 9 meses")),React.createElement("div",{className:"period-option",onClick:function(){return v("12")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 12 meses")))),React.createElement("div",{className:"export-section"},React.createElement("div",{className:"export-label"},React.createElement("i",{className:"fas fa-download"}),React.createElement("span",null,"Exportar Dados")),React.createElement("div",{className:"export-buttons"},React.createElement("button",{className:"export-btn excel-btn",onClick:function(){return x("excel")},title:"Exportar para Excel"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-excel"}),React.createElement("span",{className:"btn-text"},"Excel"),React.createElement("div",{className:"btn-description"},".xlsx"))),React.createElement("button",{className:"export-btn csv-btn",onClick:function(){return x("csv")},title:"Exportar para CSV"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-csv"}),React.createElement("span",{className:"btn-text"},"CSV"),React.createElement("div",{className:"btn-description"},".csv"))),React.createElement("button",{className:"export-btn pdf-btn",onClick:function(){return x("pdf")},title:"Exportar para PDF"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-pdf"}),React.createElement("span",{className:"btn-text"},"PDF"),React.createElement("div",{className:"btn-description"},".pdf")))))))),React.createElement("div",{className:"navigation-tabs"},[{id:"geral",title:"Visão Geral",icon:"fas fa-chart-line",description:"Estatísticas gerais do sistema",color:"linear-gradient(135deg, #667eea 0%, #764ba2 100%)"},{id:"usuarios",title:"Usuários",icon:"fas fa-users",description:"Relatórios de usuários",color:"linear-gradient(135deg, #11998e 0%, #38ef7d 100%)"},{id:"unidades",title:"Unidades",icon:"fas fa-hospital",description:"Dados das unidades de saúde",color:"linear-gradient(135deg, #fc466b 0%, #3f5efb 100%)"},{id:"chamadas",title:"Chamadas",icon:"fas fa-phone",description:"Análise de chamadas",color:"linear-gradient(135deg, #fdbb2d 0%, #22c1c3 100%)"},{id:"analises",title:"Insights",icon:"fas fa-lightbulb",description:"Análises e insights",color:"linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)"}].map(function(e){return React.createElement("button",{key:e.id,className:"nav-tab ".concat(l===e.id?"active":""),onClick:function(){return d(e.id)},title:e.description},React.createElement("i",{className:e.icon}),React.createElement("span",null,e.title))})),React.createElement("div",{className:"content-section"},function(){switch(l){case"geral":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},E("Total de Usuários",a.total_usuarios,"Usuários cadastrados no sistema","fas fa-users","rgba(59, 130, 246, 0.3)"),E("Usuários Ativos",a.usuarios_ativos,"Usuários ativos atualmente","fas fa-user-check","rgba(34, 197, 94, 0.3)"),E("Total de Unidades",a.total_unidades,"Unidades de saúde cadastradas","fas fa-hospital","rgba(168, 85, 247, 0.3)"),E("Total de Chamadas",a.total_chamadas,"Chamadas registradas no sistema","fas fa-phone","rgba(239, 68, 68, 0.3)")),React.createElement("div",{className:"export-buttons"},React.createElement("a",{href:(null==c?void 0:c.geral_excel)||"#",className:"export-btn excel",onClick:function(){return x("excel")}},React.createElement("i",{className:"fas fa-file-excel"}),"Excel"),React.createElement("a",{href:(null==c?void 0:c.geral_csv)||"#",className:"export-btn csv",onClick:function(){return x("csv")}},React.createElement("i",{className:"fas fa-file-csv"}),"CSV"),React.createElement("a",{href:(null==c?void 0:c.geral_pdf)||"#",className:"export-btn pdf",onClick:function(){return x("pdf")}},React.createElement("i",{className:"fas fa-file-pdf"}),"PDF")));case"usuarios":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},E("Usuários Comuns",t.por_tipo.usuarios_comuns,"Usuários sem privilégios administrativos","fas fa-user"),E("Administradores",t.por_tipo.administradores,"Usuários com privilégios administrativos","fas fa-user-shield"),E("Novos Este Mês",t.usuarios_mes_atual,"Usuários cadastrados este mês","fas fa-user-plus")),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-trophy"})," Top Usuários Mais Ativos")),t.top_usuarios&&0!==t.top_usuarios.length?React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Usuário"),React.createElement("th",null,"Chamadas"),React.createElement("th",null,"Resolvidas"),React.createElement("th",null,"Taxa"),React.createElement("th",null,"Nível"),React.createElement("th",null,"Atividade"))),React.createElement("tbody",null,t.top_usuarios.slice(0,10).map(function(e,n){return React.createElement("tr",{key:n},React.createElement("td",null,React.createElement("div",{className:"user-info"},React.createElement("div",{className:"user-avatar"},(e.usuario.get_full_name?e.usuario.get_full_name():e.usuario.username).charAt(0).toUpperCase()),React.createElement("div",null,React.createElement("div",{className:"user-name"},e.usuario.get_full_name?e.usuario.get_full_name():e.usuario.username),React.createElement("div",{className:"user-role"},e.usuario.is_staff?"Administrador":"Usuário")))),React.createElement("td",null,e.total_chamadas),React.createElement("td",null,e.chamadas_resolvidas),React.createElement("td",null,React.createElement("div",null,"".concat(e.taxa_resolucao,"%"),React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(e.taxa_resolucao,"%")}})))),React.createElement("td",null,React.createElement("span",{className:"badge badge-".concat(e.cor_nivel)},e.nivel)),React.createElement("td",null,e.atividade_recente))}))):React.createElement("div",{className:"chart-content"},React.createElement("p",null,"Nenhum dado de usuário disponível"))));case"unidades":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},Object.entries(r.por_tipo).map(function(e){var a=n(e,2),t=a[0],r=a[1];return E(t,r,"Unidades do tipo ".concat(t),"fas fa-hospital")})),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-map-marker-alt"})," Unidades por Município")),React.createElement("div",{className:"chart-content"},React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Município"),React.createElement("th",null,"Quantidade"),React.createElement("th",null,"Percentual"))),React.createElement("tbody",null,Object.entries(r.por_municipio).map(function(e){var t=n(e,2),r=t[0],s=t[1];return React.createElement("tr",{key:r},React.createElement("td",null,r),React.createElement("td",null,s),React.createElement("td",null,React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(s/a.total_unidades*100,"%")}})),"".concat((s/a.total_unidades*100).toFixed(1),"%")))}))))));case"chamadas":return s.usuario_eh_admin?React.createElement("div",null,React.createElement("div",{className:"stats-grid"},E("Total de Chamadas no Sistema",a.total_chamadas,"Todas as chamadas registradas no sistema","fas fa-phone","rgba(59, 130, 246, 0.3)")),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-users"})," Chamadas Registradas por Usuário")),React.createElement("div",{className:"chart-content"},Object.keys(s.por_usuario).length>0?React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Usuário"),React.createElement("th",null,"Total de Chamadas"),React.createElement("th",null,"Percentual"))),React.createElement("tbody",null,Object.entries(s.por_usuario).sort(function(e,a){var t=n(e,2)[1];return n(a,2)[1]-t}).map(function(e){var t=n(e,2),r=t[0],s=t[1];return React.createElement("tr",{key:r},React.createElement("td",null,React.createElement("div",{className:"user-info"},React.createElement("div",{className:"user-avatar"},r.charAt(0).toUpperCase()),React.createElement("div",{className:"user-details"},React.createElement("h4",null,r),React.createElement("p",null,"Usuário do sistema")))),React.createElement("td",null,React.createElement("div",{style:{display:"flex",alignItems:"center",gap:"0.5rem",fontSize:"1.2rem",fontWeight:"600",color:"white"}},React.createElement("i",{className:"fas fa-phone",style:{color:"#3b82f6"}}),s)),React.createElement("td",null,React.createElement("div",null,React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(s/a.total_chamadas*100,"%"),background:"linear-gradient(90deg, #3b82f6, #1d4ed8)"}})),React.createElement("span",{style:{fontSize:"0.9rem",fontWeight:"600",color:"rgba(255, 255, 255, 0.9)"}},"".concat((s/a.total_chamadas*100).toFixed(1),"%")))))}))):React.createElement("div",{className:"chart-content"},React.createElement("p",{style:{textAlign:"center",color:"rgba(255, 255, 255, 0.8)",fontSize:"1.1rem",padding:"2rem"}},"Nenhuma chamada foi registrada ainda no sistema"))))):React.createElement("div",null,React.createElement("div",{className:"stats-grid"},E("Suas Chamadas",s.total_chamadas_usuario_atual,"Chamadas que você registrou no sistema","fas fa-phone","rgba(59, 130, 246, 0.3)")),React.createElement("div",{className:"chart-content"},React.createElement("p",{style:{textAlign:"center",color:"rgba(255, 255, 255, 0.8)",fontSize:"1.1rem",padding:"2rem"}},"Para ver estatísticas detalhadas de chamadas, entre em contato com um administrador.")));case"analises":return React.createElement("div",null,React.createElement("h3",{style:{color:"white",marginBottom:"2rem",textAlign:"center"}},React.createElement("i",{className:"fas fa-lightbulb"})," Insights do Sistema"),i.insights.map(function(e,n){return React.createElement("div",{key:n,className:"insight-card insight-".concat(e.tipo)},React.createElement("div",{className:"insight-header"},React.createElement("div",{className:"insight-icon"},React.createElement("i",{className:"positivo"===e.tipo?"fas fa-check-circle":"fas fa-star"})),React.createElement("div",{className:"insight-title"},e.titulo)),React.createElement("div",{className:"insight-description"},e.descricao))}),0===i.insights.length&&React.createElement("div",{className:"chart-content"},React.createElement("p",null,"Nenhum insight disponível no momento.")));default:return React.createElement("div",null,"Conteúdo não encontrado")}}()),React.createElement("a",{href:"/accounts/configuracoes/",className:"back-button"},React.createElement("i",{className:"fas fa-arrow-left"}),"Voltar às Configurações")))}window.RelatoriosReact=a,e.exports&&(e.exports=a)}()},338:(e,n,a)=>{"use strict";var t=a(206);n.H=t.createRoot,t.hydrateRoot}},n={};function a(t){var r=n[t];if(void 0!==r)return r.exports;var s=n[t]={exports:{}};return e[t](s,s.exports,a),s.exports}a.n=e=>{var n=e&&e.__esModule?()=>e.default:()=>e;return a.d(n,{a:n}),n},a.d=(e,n)=>{for(var t in n)a.o(n,t)&&!a.o(e,t)&&Object.defineProperty(e,t,{enumerable:!0,get:n[t]})},a.o=(e,n)=>Object.prototype.hasOwnProperty.call(e,n),(()=>{"use strict";const e=React;var n=a.n(e),t=a(338),r=a(238),s=a.n(r),i=document.getElementById("relatorios-root");i&&(0,t.H)(i).render(n().createElement(s(),null))})()})();
+/*! For license information please see relatorios.bundle.js.LICENSE.txt */
+(()=>{var e={206:e=>{"use strict";e.exports=ReactDOM},238:e=>{function n(){var e,a,r="function"==typeof Symbol?Symbol:{},o=r.iterator||"@@iterator",s=r.toStringTag||"@@toStringTag";function c(n,r,o,s){var c=r&&r.prototype instanceof l?r:l,d=Object.create(c.prototype);return t(d,"_invoke",function(n,t,r){var o,s,c,l=0,d=r||[],m=!1,u={p:0,n:0,v:e,a:p,f:p.bind(e,4),d:function(n,t){return o=n,s=0,c=e,u.n=t,i}};function p(n,t){for(s=n,c=t,a=0;!m&&l&&!r&&a<d.length;a++){var r,o=d[a],p=u.p,f=o[2];n>3?(r=f===t)&&(c=o[(s=o[4])?5:(s=3,3)],o[4]=o[5]=e):o[0]<=p&&((r=n<2&&p<o[1])?(s=0,u.v=t,u.n=o[1]):p<f&&(r=n<3||o[0]>t||t>f)&&(o[4]=n,o[5]=t,u.n=f,s=0))}if(r||n>1)return i;throw m=!0,t}return function(r,d,f){if(l>1)throw TypeError("Generator is already running");for(m&&1===d&&p(d,f),s=d,c=f;(a=s<2?e:c)||!m;){o||(s?s<3?(s>1&&(u.n=-1),p(s,c)):u.n=c:u.v=c);try{if(l=2,o){if(s||(r="next"),a=o[r]){if(!(a=a.call(o,c)))throw TypeError("iterator result is not an object");if(!a.done)return a;c=a.value,s<2&&(s=0)}else 1===s&&(a=o.return)&&a.call(o),s<2&&(c=TypeError("The iterator does not provide a '"+r+"' method"),s=1);o=e}else if((a=(m=u.n<0)?c:n.call(t,u))!==i)break}catch(n){o=e,s=1,c=n}finally{l=1}}return{value:a,done:m}}}(n,o,s),!0),d}var i={};function l(){}function d(){}function m(){}a=Object.getPrototypeOf;var u=[][o]?a(a([][o]())):(t(a={},o,function(){return this}),a),p=m.prototype=l.prototype=Object.create(u);function f(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,m):(e.__proto__=m,t(e,s,"GeneratorFunction")),e.prototype=Object.create(p),e}return d.prototype=m,t(p,"constructor",m),t(m,"constructor",d),d.displayName="GeneratorFunction",t(m,s,"GeneratorFunction"),t(p),t(p,s,"Generator"),t(p,o,function(){return this}),t(p,"toString",function(){return"[object Generator]"}),(n=function(){return{w:c,m:f}})()}function t(e,n,a,r){var o=Object.defineProperty;try{o({},"",{})}catch(e){o=0}t=function(e,n,a,r){if(n)o?o(e,n,{value:a,enumerable:!r,configurable:!r,writable:!r}):e[n]=a;else{var s=function(n,a){t(e,n,function(e){return this._invoke(n,a,e)})};s("next",0),s("throw",1),s("return",2)}},t(e,n,a,r)}function a(e,n,t,a,r,o,s){try{var c=e[o](s),i=c.value}catch(e){return void t(e)}c.done?n(i):Promise.resolve(i).then(a,r)}function r(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=t){var a,r,o,s,c=[],i=!0,l=!1;try{if(o=(t=t.call(e)).next,0===n){if(Object(t)!==t)return;i=!1}else for(;!(i=(a=o.call(t)).done)&&(c.push(a.value),c.length!==n);i=!0);}catch(e){l=!0,r=e}finally{try{if(!i&&null!=t.return&&(s=t.return(),Object(s)!==s))return}finally{if(l)throw r}}return c}}(e,n)||function(e,n){if(e){if("string"==typeof e)return o(e,n);var t={}.toString.call(e).slice(8,-1);return"Object"===t&&e.constructor&&(t=e.constructor.name),"Map"===t||"Set"===t?Array.from(e):"Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t)?o(e,n):void 0}}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function o(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,a=Array(n);t<n;t++)a[t]=e[t];return a}!function(){"use strict";function t(e){e.usuario,e.dataAtual;var t=e.statsGerais,o=e.usuariosStats,s=e.unidadesStats,c=e.chamadasStats,i=e.analises,l=(e.graficosData,e.exportUrls),d=r(React.useState("geral"),2),m=d[0],u=d[1],p=r(React.useState("12"),2),f=p[0],g=p[1],b=r(React.useState(!1),2),h=(b[0],b[1],r(React.useState(!1),2)),v=h[0],x=h[1],E=r(React.useState(null),2),R=E[0],N=E[1],y=function(e){g(e),x(!1),console.log("Período alterado para: ".concat(e," meses"))},w={geral:{excel:"relatorio_geral_excel",pdf:"relatorio_geral_pdf"},usuarios:{excel:"usuarios_mes_excel",pdf:"usuarios_mes_pdf"}},k={geral_excel:"/accounts/sistema/relatorios/export-excel/",geral_csv:"/accounts/sistema/relatorios/export-csv/",geral_pdf:"/accounts/sistema/relatorios/export-pdf/",usuarios_excel:"/accounts/sistema/relatorios/usuarios-mes/export-excel/",usuarios_csv:"/accounts/sistema/relatorios/usuarios-mes/export-csv/",usuarios_pdf:"/accounts/sistema/relatorios/usuarios-mes/export-pdf/"},_=function(){var e,t=(e=n().m(function e(t,a){var r;return n().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!R){e.n=1;break}return e.a(2);case 1:return N({format:t,relatorio:a,progresso:0}),e.p=2,e.n=3,window.ExportacaoService.exportar(w[a][t],{periodo:f},{onProgresso:function(e){return N({format:t,relatorio:a,progresso:e.progresso})}});case 3:e.n=5;break;case 4:e.p=4,r=e.v,console.error("❌ Erro na exportação:",r),alert("Erro na exportação: ".concat(r.message));case 5:return e.p=5,N(null),e.f(5);case 6:return e.a(2)}},e,null,[[2,4,5,6]])}),function(){var n=this,t=arguments;return new Promise(function(r,o){var s=e.apply(n,t);function c(e){a(s,r,o,c,i,"next",e)}function i(e){a(s,r,o,c,i,"throw",e)}c(void 0)})});return function(e,n){return t.apply(this,arguments)}}(),z=function(e,n){var t=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"geral";if(n&&n.preventDefault(),w[t][e]&&window.ExportacaoService)_(e,t);else{var a="".concat(t,"_").concat(e),r=l&&l[a]||k[a];r&&(r="".concat(r).concat(r.includes("?")?"&":"?","periodo=").concat(encodeURIComponent(f)),console.log("Exportando relatório em formato ".concat(e," via ").concat(r)),window.open(r,"_blank"))}},S=function(e){return React.createElement("div",{className:"export-buttons"},[{format:"excel",className:"excel",icon:"fas fa-file-excel",label:"Excel"},{format:"csv",className:"csv",icon:"fas fa-file-csv",label:"CSV"},{format:"pdf",className:"pdf",icon:"fas fa-file-pdf",label:"PDF"}].map(function(n){return React.createElement("a",{key:n.format,href:l&&l["".concat(e,"_").concat(n.format)]||"#",className:"export-btn ".concat(n.className),onClick:function(t){return z(n.format,t,e)}},React.createElement("i",{className:n.icon}),R&&R.relatorio===e&&R.format===n.format?"".concat(R.progresso,"%"):n.label)}))};React.useEffect(function(){var e=function(e){v&&!e.target.closest(".period-selector-container")&&x(!1)};return document.addEventListener("click",e),function(){return document.removeEventListener("click",e)}},[v]),React.useEffect(function(){var e=document.createElement("style");return e.id="relatorios-react-styles",e.textContent="\n                .relatorios-react {\n                    min-height: 100vh;\n                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n                    padding: 2rem 0;\n                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;\n                    position: relative;\n                    overflow-x: hidden;\n                }\n\n                .relatorios-react::before {\n                    content: '';\n                    position: fixed;\n                    top: 0;\n                    left: 0;\n                    width: 100%;\n                    height: 100%;\n                    background: \n                        radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.3) 0%, transparent 50%),\n                        radial-gradient(circle at 80% 20%, rgba(255, 255, 255, 0.1) 0%, transparent 50%),\n                        radial-gradient(circle at 40% 40%, rgba(120, 119, 198, 0.2) 0%, transparent 50%);\n                    pointer-events: none;\n                    z-index: 0;\n                }\n\n                .main-container {\n                    max-width: 1600px;\n                    margin: 0 auto;\n                    padding: 0 1rem;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .header-section {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 2rem;\n                    margin-bottom: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: fadeInDown 0.8s ease-out;\n                }\n\n                .header-content {\n                    display: flex;\n                    justify-content: space-between;\n                    align-items: center;\n                    flex-wrap: wrap;\n                    gap: 1rem;\n                }\n\n                .header-left {\n                    display: flex;\n                    align-items: center;\n                    gap: 1rem;\n                    flex: 1;\n                }\n\n                .header-icon {\n                    width: 80px;\n                    height: 80px;\n                    background: rgba(255, 255, 255, 0.2);\n                    border-radius: 50%;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-size: 2rem;\n                    animation: pulse 2s infinite;\n                }\n\n                .header-text h1 {\n                    color: white;\n                    margin: 0;\n                    font-size: 2.5rem;\n                    font-weight: 700;\n                }\n\n                .header-text p {\n                    color: rgba(255, 255, 255, 0.8);\n                    margin: 0;\n                    font-size: 1.1rem;\n                }\n\n                .header-controls {\n                    display: flex;\n                    gap: 1rem;\n                    align-items: center;\n                    flex-wrap: wrap;\n                    overflow: visible;\n                    position: relative;\n                }\n\n                .export-buttons {\n                    display: flex;\n                    gap: 0.5rem;\n                    align-items: center;\n                }\n\n                .export-btn {\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 10px;\n                    padding: 0.5rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    text-decoration: none;\n                    display: inline-flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    font-size: 0.9rem;\n                }\n\n                .export-btn:hover {\n                    background: rgba(255, 255, 255, 0.3);\n                    color: white;\n                    text-decoration: none;\n                    transform: translateY(-2px);\n                }\n\n                .export-btn.excel {\n                    background: rgba(33, 150, 83, 0.3);\n                    border-color: rgba(33, 150, 83, 0.5);\n                }\n\n                .export-btn.csv {\n                    background: rgba(52, 152, 219, 0.3);\n                    border-color: rgba(52, 152, 219, 0.5);\n                }\n\n                .export-btn.pdf {\n                    background: rgba(231, 76, 60, 0.3);\n                    border-color: rgba(231, 76, 60, 0.5);\n                }\n\n                .period-selector {\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 15px;\n                    padding: 0.75rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                }\n\n                .period-selector:hover {\n                    background: rgba(255, 255, 255, 0.3);\n                }\n\n                .period-selector-container {\n                    position: relative;\n                    overflow: visible;\n                    z-index: 10000;\n                }\n\n                .period-selector {\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    background: rgba(255, 255, 255, 0.2);\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    border-radius: 15px;\n                    padding: 0.75rem 1rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    min-width: 200px;\n                }\n\n                .period-dropdown {\n                    position: absolute;\n                    top: 100%;\n                    left: 0;\n                    right: 0;\n                    background: rgba(255, 255, 255, 0.95);\n                    backdrop-filter: blur(10px);\n                    border-radius: 15px;\n                    padding: 0.5rem;\n                    margin-top: 0.5rem;\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);\n                    z-index: 10005;\n                    animation: fadeInDown 0.3s ease-out;\n                    max-height: 200px;\n                    overflow-y: auto;\n                }\n\n                .period-option {\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    padding: 0.75rem 1rem;\n                    color: #333;\n                    cursor: pointer;\n                    border-radius: 10px;\n                    transition: all 0.2s ease;\n                }\n\n                .period-option:hover {\n                    background: rgba(102, 126, 234, 0.1);\n                    color: #667eea;\n                }\n\n                .period-option i {\n                    font-size: 0.8rem;\n                    color: #667eea;\n                }\n\n                .navigation-tabs {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 1rem;\n                    margin-bottom: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: slideInLeft 0.8s ease-out 0.2s both;\n                }\n\n                .tab-buttons {\n                    display: flex;\n                    gap: 0.5rem;\n                    flex-wrap: wrap;\n                }\n\n                .tab-button {\n                    background: rgba(255, 255, 255, 0.1);\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    border-radius: 15px;\n                    padding: 1rem 1.5rem;\n                    color: white;\n                    cursor: pointer;\n                    transition: all 0.3s ease;\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                    font-weight: 500;\n                }\n\n                .tab-button.active {\n                    background: rgba(255, 255, 255, 0.3);\n                    transform: translateY(-2px);\n                    box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);\n                }\n\n                .tab-button:hover {\n                    background: rgba(255, 255, 255, 0.2);\n                    transform: translateY(-1px);\n                }\n\n                .content-section {\n                    background: rgba(255, 255, 255, 0.1);\n                    backdrop-filter: blur(10px);\n                    border-radius: 20px;\n                    padding: 2rem;\n                    border: 1px solid rgba(255, 255, 255, 0.2);\n                    animation: slideInUp 0.8s ease-out 0.4s both;\n                }\n\n                .stats-grid {\n                    display: grid;\n                    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));\n                    gap: 1.5rem;\n                    margin-bottom: 2rem;\n                }\n\n                .stat-card {\n                    background: linear-gradient(135deg, rgba(255, 255, 255, 0.2) 0%, rgba(255, 255, 255, 0.1) 100%);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    border: 1px solid rgba(255, 255, 255, 0.3);\n                    transition: all 0.3s ease;\n                    animation: fadeIn 0.6s ease-out;\n                }\n\n                .stat-card:hover {\n                    transform: translateY(-5px);\n                    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);\n                    background: linear-gradient(135deg, rgba(255, 255, 255, 0.3) 0%, rgba(255, 255, 255, 0.2) 100%);\n                }\n\n                .stat-card-header {\n                    display: flex;\n                    align-items: center;\n                    justify-content: space-between;\n                    margin-bottom: 1rem;\n                }\n\n                .stat-icon {\n                    width: 50px;\n                    height: 50px;\n                    border-radius: 12px;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-size: 1.5rem;\n                }\n\n                .stat-icon.users { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }\n                .stat-icon.active { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }\n                .stat-icon.admin { background: linear-gradient(135deg, #fc466b 0%, #3f5efb 100%); }\n                .stat-icon.units { background: linear-gradient(135deg, #fdbb2d 0%, #22c1c3 100%); }\n                .stat-icon.calls { background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); }\n\n                .stat-title {\n                    color: white;\n                    font-size: 0.9rem;\n                    font-weight: 600;\n                    opacity: 0.9;\n                }\n\n                .stat-value {\n                    color: white;\n                    font-size: 2.5rem;\n                    font-weight: 700;\n                    margin: 0.5rem 0;\n                }\n\n                .stat-change {\n                    color: rgba(255, 255, 255, 0.8);\n                    font-size: 0.8rem;\n                }\n\n                .users-table {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    overflow: hidden;\n                    margin-bottom: 2rem;\n                    width: 100%;\n                    border-collapse: collapse;\n                }\n                \n                .users-table th,\n                .users-table td {\n                    padding: 1rem;\n                    text-align: left;\n                    border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n                }\n                \n                .users-table th {\n                    background: rgba(255, 255, 255, 0.2);\n                    color: white;\n                    font-weight: 600;\n                    font-size: 0.9rem;\n                    text-transform: uppercase;\n                    letter-spacing: 0.5px;\n                }\n                \n                .users-table tbody tr {\n                    transition: all 0.3s ease;\n                }\n                \n                .users-table tbody tr:hover {\n                    background: rgba(255, 255, 255, 0.05);\n                }\n                \n                .chart-card {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    margin-bottom: 2rem;\n                }\n                \n                .chart-header {\n                    margin-bottom: 1.5rem;\n                }\n                \n                .chart-title {\n                    color: white;\n                    font-size: 1.3rem;\n                    font-weight: 600;\n                    margin: 0;\n                    display: flex;\n                    align-items: center;\n                    gap: 0.5rem;\n                }\n                \n                .chart-content {\n                    color: white;\n                }\n\n                .table-header {\n                    background: rgba(255, 255, 255, 0.2);\n                    padding: 1rem 1.5rem;\n                    border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n                }\n\n                .table-title {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0;\n                }\n\n                .table-content {\n                    padding: 1rem;\n                }\n\n                .user-row {\n                    display: flex;\n                    align-items: center;\n                    justify-content: space-between;\n                    padding: 1rem;\n                    background: rgba(255, 255, 255, 0.05);\n                    border-radius: 10px;\n                    margin-bottom: 0.5rem;\n                    transition: all 0.3s ease;\n                }\n\n                .user-row:hover {\n                    background: rgba(255, 255, 255, 0.1);\n                    transform: translateX(5px);\n                }\n\n                .user-info {\n                    display: flex;\n                    align-items: center;\n                    gap: 1rem;\n                    flex: 1;\n                }\n\n                .user-avatar {\n                    width: 40px;\n                    height: 40px;\n                    border-radius: 50%;\n                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    color: white;\n                    font-weight: 600;\n                }\n\n                .user-details h4 {\n                    color: white;\n                    margin: 0;\n                    font-size: 1rem;\n                }\n\n                .user-details p {\n                    color: rgba(255, 255, 255, 0.7);\n                    margin: 0;\n                    font-size: 0.8rem;\n                }\n\n                .user-stats {\n                    display: flex;\n                    gap: 2rem;\n                    align-items: center;\n                }\n\n                .user-stat {\n                    text-align: center;\n                }\n\n                .user-stat-value {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0;\n                }\n\n                .user-stat-label {\n                    color: rgba(255, 255, 255, 0.7);\n                    font-size: 0.7rem;\n                    margin: 0;\n                }\n\n                .user-badge {\n                    padding: 0.3rem 0.8rem;\n                    border-radius: 15px;\n                    font-size: 0.7rem;\n                    font-weight: 600;\n                    text-transform: uppercase;\n                }\n\n                .badge-gold { background: linear-gradient(135deg, #f39c12 0%, #f1c40f 100%); color: #2c3e50; }\n                .badge-silver { background: linear-gradient(135deg, #bdc3c7 0%, #95a5a6 100%); color: #2c3e50; }\n                .badge-bronze { background: linear-gradient(135deg, #d35400 0%, #e67e22 100%); color: white; }\n                .badge-blue { background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; }\n\n                .insights-grid {\n                    display: grid;\n                    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n                    gap: 1.5rem;\n                }\n\n                .insight-card {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    border-left: 4px solid;\n                    transition: all 0.3s ease;\n                }\n\n                .insight-card.positivo { border-left-color: #27ae60; }\n                .insight-card.negativo { border-left-color: #e74c3c; }\n                .insight-card.alerta { border-left-color: #f39c12; }\n                .insight-card.destaque { border-left-color: #9b59b6; }\n                .insight-card.info { border-left-color: #3498db; }\n\n                .insight-card:hover {\n                    transform: translateY(-3px);\n                    background: rgba(255, 255, 255, 0.15);\n                }\n\n                .insight-icon {\n                    width: 40px;\n                    height: 40px;\n                    border-radius: 10px;\n                    display: flex;\n                    align-items: center;\n                    justify-content: center;\n                    margin-bottom: 1rem;\n                    color: white;\n                }\n\n                .insight-icon.positivo { background: #27ae60; }\n                .insight-icon.negativo { background: #e74c3c; }\n                .insight-icon.alerta { background: #f39c12; }\n                .insight-icon.destaque { background: #9b59b6; }\n                .insight-icon.info { background: #3498db; }\n\n                .insight-title {\n                    color: white;\n                    font-size: 1.1rem;\n                    font-weight: 600;\n                    margin: 0 0 0.5rem 0;\n                }\n\n                .insight-description {\n                    color: rgba(255, 255, 255, 0.8);\n                    font-size: 0.9rem;\n                    line-height: 1.5;\n                    margin: 0;\n                }\n\n                .chart-container {\n                    background: rgba(255, 255, 255, 0.1);\n                    border-radius: 15px;\n                    padding: 1.5rem;\n                    margin-bottom: 1.5rem;\n                }\n\n                .chart-title {\n                    color: white;\n                    font-size: 1.2rem;\n                    font-weight: 600;\n                    margin: 0 0 1rem 0;\n                    text-align: center;\n                }\n\n                .progress-container {\n                    margin-bottom: 1rem;\n                }\n\n                .progress-label {\n                    display: flex;\n                    justify-content: space-between;\n                    color: white;\n                    font-size: 0.9rem;\n                    margin-bottom: 0.5rem;\n                }\n\n                .progress-bar {\n                    background: rgba(255, 255, 255, 0.2);\n                    border-radius: 10px;\n                    height: 8px;\n                    overflow: hidden;\n                }\n\n                .progress-fill {\n                    height: 100%;\n                    border-radius: 10px;\n                    transition: width 1s ease-out;\n                    animation: progressFill 1.5s ease-out;\n                }\n\n                @keyframes fadeInDown {\n                    from { opacity: 0; transform: translateY(-50px); }\n                    to { opacity: 1; transform: translateY(0); }\n                }\n\n                @keyframes slideInLeft {\n                    from { opacity: 0; transform: translateX(-50px); }\n                    to { opacity: 1; transform: translateX(0); }\n                }\n\n                @keyframes slideInUp {\n                    from { opacity: 0; transform: translateY(50px); }\n                    to { opacity: 1; transform: translateY(0); }\n                }\n\n                @keyframes fadeIn {\n                    from { opacity: 0; }\n                    to { opacity: 1; }\n                }\n\n                @keyframes pulse {\n                    0%, 100% { transform: scale(1); }\n                    50% { transform: scale(1.05); }\n                }\n\n                @keyframes progressFill {\n                    from { width: 0; }\n                }\n\n                /* ===== NAVIGATION TABS MODERNIZADAS ===== */\n                .navigation-tabs {\n                    display: flex;\n                    gap: 1rem;\n                    margin-bottom: 2rem;\n                    padding: 1rem;\n                    background: rgba(255, 255, 255, 0.05);\n                    backdrop-filter: blur(20px);\n                    border-radius: 20px;\n                    border: 1px solid rgba(255, 255, 255, 0.1);\n                    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);\n                    animation: slideInUp 0.8s ease-out 0.2s both;\n                    flex-wrap: wrap;\n                    justify-content: center;\n                }\n\n                .nav-tab {\n                    background: rgba(255, 255, 255, 0.08);\n                    border: 2px solid rgba(255, 255, 255, 0.15);\n                    color: rgba(255, 255, 255, 0.9);\n                    padding: 1rem 1.5rem;\n                    border-radius: 16px;\n                    cursor: pointer;\n                    transition: all 0.4s cubic-bezier(0.23, 1, 0.320, 1);\n                    font-family: inherit;\n                    font-size: 0.95rem;\n                    font-weight: 600;\n                    backdrop-filter: blur(15px);\n                    display: flex;\n                    flex-direction: column;\n                    align-items: center;\n                    gap: 0.5rem;\n                    position: relative;\n                    overflow: hidden;\n                    min-width: 120px;\n                    text-align: center;\n                }\n\n                .nav-tab::before {\n                    content: '';\n                    position: absolute;\n                    top: 0;\n                    left: -100%;\n                    width: 100%;\n                    height: 100%;\n                    background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);\n                    transition: left 0.6s ease;\n                }\n\n                .nav-tab:hover::before {\n                    left: 100%;\n                }\n\n                .nav-tab i {\n                    font-size: 1.25rem;\n                    margin-bottom: 0.25rem;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .nav-tab span {\n                    font-size: 0.85rem;\n                    font-weight: 700;\n                    letter-spacing: 0.5px;\n                    position: relative;\n                    z-index: 1;\n                }\n\n                .nav-tab.active {\n                    background: rgba(255, 255, 255, 0.2);\n                    border-color: rgba(255, 255, 255, 0.4);\n                    color: white;\n                    transform: translateY(-4px) scale(1.05);\n                    box-shadow: \n                        0 10px 30px rgba(0, 0, 0, 0.3),\n                        0 0 0 1px rgba(255, 255, 255, 0.2);\n                }\n\n                .nav-tab:hover {\n                    background: rgba(255, 255, 255, 0.15);\n                    border-color: rgba(255, 255, 255, 0.3);\n                    transform: translateY(-2px);\n                    color: white;\n                    box-shadow: 0 6px 20px rgba(0, 0, 0, 0.2);\n                }\n\n                .nav-tab:active {\n                    transform: translateY(-1px);\n                }\n\n                /* ===== RESPONSIVIDADE AVANÇADA ===== */\n                @media (max-width: 1024px) {\n                    .navigation-tabs {\n                        gap: 0.75rem;\n                        padding: 0.75rem;\n                    }\n                    \n                    .nav-tab {\n                        min-width: 100px;\n                        padding: 0.75rem 1rem;\n                    }\n                }\n\n                @media (max-width: 768px) {\n                    .header-content {\n                        flex-direction: column;\n                        text-align: center;\n                        gap: 1.5rem;\n                    }\n\n                    .header-text h1 {\n                        font-size: 2rem;\n                    }\n\n                    .navigation-tabs {\n                        gap: 0.5rem;\n                        padding: 0.75rem;\n                        flex-wrap: wrap;\n                    }\n\n                    .nav-tab {\n                        min-width: 80px;\n                        padding: 0.75rem;\n                        font-size: 0.85rem;\n                    }\n\n                    .nav-tab i {\n                        font-size: 1.1rem;\n                    }\n\n                    .nav-tab span {\n                        font-size: 0.75rem;\n                    }\n\n                    .stats-grid {\n                        grid-template-columns: 1fr;\n                        gap: 1rem;\n                    }\n\n                    .user-stats {\n                        flex-direction: column;\n                        gap: 0.5rem;\n                    }\n\n                    .insights-grid {\n                        grid-template-columns: 1fr;\n                    }\n\n                    .export-buttons {\n                        flex-wrap: wrap;\n                        justify-content: center;\n                        gap: 0.5rem;\n                    }\n\n                    .header-controls {\n                        flex-direction: column;\n                        width: 100%;\n                    }\n                }\n            ",document.head.querySelector("#relatorios-react-styles")||document.head.appendChild(e),function(){var e=document.head.querySelector("#relatorios-react-styles");e&&e.remove()}},[]);var C=function(e,n,t,a){var r=arguments.length>4&&void 0!==arguments[4]?arguments[4]:"rgba(255, 255, 255, 0.2)";return React.createElement("div",{className:"stat-card"},React.createElement("div",{className:"stat-header"},React.createElement("div",{className:"stat-icon",style:{background:r}},React.createElement("i",{className:a})),React.createElement("div",{className:"stat-title"},e)),React.createElement("div",{className:"stat-value"},n),React.createElement("div",{className:"stat-description"},t))};return React.createElement("div",{className:"relatorios-react"},React.createElement("div",{className:"main-container"},React.createElement("div",{className:"breadcrumb-container"},React.createElement("nav",{className:"breadcrumb"},React.createElement("a",{href:"/accounts/",className:"breadcrumb-item"},React.createElement("i",{className:"fas fa-home"}),"Início"),React.createElement("span",{className:"breadcrumb-separator"},React.createElement("i",{className:"fas fa-chevron-right"})),React.createElement("a",{href:"/accounts/configuracoes/",className:"breadcrumb-item"},React.createElement("i",{className:"fas fa-cog"}),"Configurações"),React.createElement("span",{className:"breadcrumb-separator"},React.createElement("i",{className:"fas fa-chevron-right"})),React.createElement("span",{className:"breadcrumb-item active"},React.createElement("i",{className:"fas fa-chart-line"}),"Relatórios"))),React.createElement("div",{className:"header-section"},React.createElement("div",{className:"header-content"},React.createElement("div",{className:"header-left"},React.createElement("div",{className:"header-icon"},React.createElement("i",{className:"fas fa-chart-line"})),React.createElement("div",{className:"header-text"},React.createElement("h1",null,"Relatórios do Sistema"),React.createElement("p",null,"Análises e estatísticas detalhadas"))),React.createElement("div",{className:"header-controls"},React.createElement("div",{className:"period-selector-container"},React.createElement("div",{className:"period-selector",onClick:function(){return x(!v)}},React.createElement("i",{className:"fas fa-calendar-alt"}),React.createElement("span",null,"12"===f?"Últimos 12 meses":"9"===f?"Últimos 9 meses":"6"===f?"Últimos 6 meses":"3"===f?"Últimos 3 meses":"1"===f?"Último mês":"30"===f?"Últimos 30 dias":"Últimos 12 meses"),React.createElement("i",{className:"fas fa-chevron-down"})),v&&React.createElement("div",{className:"period-dropdown"},React.createElement("div",{className:"period-option",onClick:function(){return y("30")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 30 dias")),React.createElement("div",{className:"period-option",onClick:function(){return y("1")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Último mês")),React.createElement("div",{className:"period-option",onClick:function(){return y("3")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 3 meses")),React.createElement("div",{className:"period-option",onClick:function(){return y("6")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 6 meses")),React.createElement("div",{className:"period-option",onClick:function(){return y("9")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 9 meses")),React.createElement("div",{className:"period-option",onClick:function(){return y("12")}},React.createElement("i",{className:"fas fa-circle"}),React.createElement("span",null,"Últimos 12 meses")))),React.createElement("div",{className:"export-section"},React.createElement("div",{className:"export-label"},React.createElement("i",{className:"fas fa-download"}),React.createElement("span",null,"Exportar Dados")),React.createElement("div",{className:"export-buttons"},React.createElement("button",{className:"export-btn excel-btn",onClick:function(e){return z("excel",e)},disabled:!!R,title:"Exportar para Excel"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-excel"}),React.createElement("span",{className:"btn-text"},R&&"geral"===R.relatorio&&"excel"===R.format?"".concat(R.progresso,"%"):"Excel"),React.createElement("div",{className:"btn-description"},".xlsx"))),React.createElement("button",{className:"export-btn csv-btn",onClick:function(e){return z("csv",e)},title:"Exportar para CSV"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-csv"}),React.createElement("span",{className:"btn-text"},"CSV"),React.createElement("div",{className:"btn-description"},".csv"))),React.createElement("button",{className:"export-btn pdf-btn",onClick:function(e){return z("pdf",e)},disabled:!!R,title:"Exportar para PDF"},React.createElement("div",{className:"btn-content"},React.createElement("i",{className:"fas fa-file-pdf"}),React.createElement("span",{className:"btn-text"},R&&"geral"===R.relatorio&&"pdf"===R.format?"".concat(R.progresso,"%"):"PDF"),React.createElement("div",{className:"btn-description"},".pdf")))))))),React.createElement("div",{className:"navigation-tabs"},[{id:"geral",title:"Visão Geral",icon:"fas fa-chart-line",description:"Estatísticas gerais do sistema",color:"linear-gradient(135deg, #667eea 0%, #764ba2 100%)"},{id:"usuarios",title:"Usuários",icon:"fas fa-users",description:"Relatórios de usuários",color:"linear-gradient(135deg, #11998e 0%, #38ef7d 100%)"},{id:"unidades",title:"Unidades",icon:"fas fa-hospital",description:"Dados das unidades de saúde",color:"linear-gradient(135deg, #fc466b 0%, #3f5efb 100%)"},{id:"chamadas",title:"Chamadas",icon:"fas fa-phone",description:"Análise de chamadas",color:"linear-gradient(135deg, #fdbb2d 0%, #22c1c3 100%)"},{id:"analises",title:"Insights",icon:"fas fa-lightbulb",description:"Análises e insights",color:"linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)"}].map(function(e){return React.createElement("button",{key:e.id,className:"nav-tab ".concat(m===e.id?"active":""),onClick:function(){return u(e.id)},title:e.description},React.createElement("i",{className:e.icon}),React.createElement("span",null,e.title))})),React.createElement("div",{className:"content-section"},function(){switch(m){case"geral":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},C("Total de Usuários",t.total_usuarios,"Usuários cadastrados no sistema","fas fa-users","rgba(59, 130, 246, 0.3)"),C("Usuários Ativos",t.usuarios_ativos,"Usuários ativos atualmente","fas fa-user-check","rgba(34, 197, 94, 0.3)"),C("Total de Unidades",t.total_unidades,"Unidades de saúde cadastradas","fas fa-hospital","rgba(168, 85, 247, 0.3)"),C("Total de Chamadas",t.total_chamadas,"Chamadas registradas no sistema","fas fa-phone","rgba(239, 68, 68, 0.3)")),S("geral"));case"usuarios":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},C("Usuários Comuns",o.por_tipo.usuarios_comuns,"Usuários sem privilégios administrativos","fas fa-user"),C("Administradores",o.por_tipo.administradores,"Usuários com privilégios administrativos","fas fa-user-shield"),C("Novos Este Mês",o.usuarios_mes_atual,"Usuários cadastrados este mês","fas fa-user-plus")),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-trophy"})," Top Usuários Mais Ativos")),o.top_usuarios&&0!==o.top_usuarios.length?React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Usuário"),React.createElement("th",null,"Chamadas"),React.createElement("th",null,"Resolvidas"),React.createElement("th",null,"Taxa"),React.createElement("th",null,"Nível"),React.createElement("th",null,"Atividade"))),React.createElement("tbody",null,o.top_usuarios.slice(0,10).map(function(e,n){return React.createElement("tr",{key:n},React.createElement("td",null,React.createElement("div",{className:"user-info"},React.createElement("div",{className:"user-avatar"},(e.usuario.get_full_name?e.usuario.get_full_name():e.usuario.username).charAt(0).toUpperCase()),React.createElement("div",null,React.createElement("div",{className:"user-name"},e.usuario.get_full_name?e.usuario.get_full_name():e.usuario.username),React.createElement("div",{className:"user-role"},e.usuario.is_staff?"Administrador":"Usuário")))),React.createElement("td",null,e.total_chamadas),React.createElement("td",null,e.chamadas_resolvidas),React.createElement("td",null,React.createElement("div",null,"".concat(e.taxa_resolucao,"%"),React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(e.taxa_resolucao,"%")}})))),React.createElement("td",null,React.createElement("span",{className:"badge badge-".concat(e.cor_nivel)},e.nivel)),React.createElement("td",null,e.atividade_recente))}))):React.createElement("div",{className:"chart-content"},React.createElement("p",null,"Nenhum dado de usuário disponível"))),S("usuarios"));case"unidades":return React.createElement("div",null,React.createElement("div",{className:"stats-grid"},Object.entries(s.por_tipo).map(function(e){var n=r(e,2),t=n[0],a=n[1];return C(t,a,"Unidades do tipo ".concat(t),"fas fa-hospital")})),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-map-marker-alt"})," Unidades por Município")),React.createElement("div",{className:"chart-content"},React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Município"),React.createElement("th",null,"Quantidade"),React.createElement("th",null,"Percentual"))),React.createElement("tbody",null,Object.entries(s.por_municipio).map(function(e){var n=r(e,2),a=n[0],o=n[1];return React.createElement("tr",{key:a},React.createElement("td",null,a),React.createElement("td",null,o),React.createElement("td",null,React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(o/t.total_unidades*100,"%")}})),"".concat((o/t.total_unidades*100).toFixed(1),"%")))}))))));case"chamadas":return c.usuario_eh_admin?React.createElement("div",null,React.createElement("div",{className:"stats-grid"},C("Total de Chamadas no Sistema",t.total_chamadas,"Todas as chamadas registradas no sistema","fas fa-phone","rgba(59, 130, 246, 0.3)")),React.createElement("div",{className:"chart-card"},React.createElement("div",{className:"chart-header"},React.createElement("h3",{className:"chart-title"},React.createElement("i",{className:"fas fa-users"})," Chamadas Registradas por Usuário")),React.createElement("div",{className:"chart-content"},Object.keys(c.por_usuario).length>0?React.createElement("table",{className:"users-table"},React.createElement("thead",null,React.createElement("tr",null,React.createElement("th",null,"Usuário"),React.createElement("th",null,"Total de Chamadas"),React.createElement("th",null,"Percentual"))),React.createElement("tbody",null,Object.entries(c.por_usuario).sort(function(e,n){var t=r(e,2)[1];return r(n,2)[1]-t}).map(function(e){var n=r(e,2),a=n[0],o=n[1];return React.createElement("tr",{key:a},React.createElement("td",null,React.createElement("div",{className:"user-info"},React.createElement("div",{className:"user-avatar"},a.charAt(0).toUpperCase()),React.createElement("div",{className:"user-details"},React.createElement("h4",null,a),React.createElement("p",null,"Usuário do sistema")))),React.createElement("td",null,React.createElement("div",{style:{display:"flex",alignItems:"center",gap:"0.5rem",fontSize:"1.2rem",fontWeight:"600",color:"white"}},React.createElement("i",{className:"fas fa-phone",style:{color:"#3b82f6"}}),o)),React.createElement("td",null,React.createElement("div",null,React.createElement("div",{className:"progress-bar"},React.createElement("div",{className:"progress-fill",style:{width:"".concat(o/t.total_chamadas*100,"%"),background:"linear-gradient(90deg, #3b82f6, #1d4ed8)"}})),React.createElement("span",{style:{fontSize:"0.9rem",fontWeight:"600",color:"rgba(255, 255, 255, 0.9)"}},"".concat((o/t.total_chamadas*100).toFixed(1),"%")))))}))):React.createElement("div",{className:"chart-content"},React.createElement("p",{style:{textAlign:"center",color:"rgba(255, 255, 255, 0.8)",fontSize:"1.1rem",padding:"2rem"}},"Nenhuma chamada foi registrada ainda no sistema"))))):React.createElement("div",null,React.createElement("div",{className:"stats-grid"},C("Suas Chamadas",c.total_chamadas_usuario_atual,"Chamadas que você registrou no sistema","fas fa-phone","rgba(59, 130, 246, 0.3)")),React.createElement("div",{className:"chart-content"},React.createElement("p",{style:{textAlign:"center",color:"rgba(255, 255, 255, 0.8)",fontSize:"1.1rem",padding:"2rem"}},"Para ver estatísticas detalhadas de chamadas, entre em contato com um administrador.")));case"analises":return React.createElement("div",null,React.createElement("h3",{style:{color:"white",marginBottom:"2rem",textAlign:"center"}},React.createElement("i",{className:"fas fa-lightbulb"})," Insights do Sistema"),i.insights.map(function(e,n){return React.createElement("div",{key:n,className:"insight-card insight-".concat(e.tipo)},React.createElement("div",{className:"insight-header"},React.createElement("div",{className:"insight-icon"},React.createElement("i",{className:"positivo"===e.tipo?"fas fa-check-circle":"fas fa-star"})),React.createElement("div",{className:"insight-title"},e.titulo)),React.createElement("div",{className:"insight-description"},e.descricao))}),0===i.insights.length&&React.createElement("div",{className:"chart-content"},React.createElement("p",null,"Nenhum insight disponível no momento.")));default:return React.createElement("div",null,"Conteúdo não encontrado")}}()),React.createElement("a",{href:"/accounts/configuracoes/",className:"back-button"},React.createElement("i",{className:"fas fa-arrow-left"}),"Voltar às Configurações")))}window.RelatoriosReact=t,e.exports&&(e.exports=t)}()},338:(e,n,t)=>{"use strict";var a=t(206);n.H=a.createRoot,a.hydrateRoot}},n={};function t(a){var r=n[a];if(void 0!==r)return r.exports;var o=n[a]={exports:{}};return e[a](o,o.exports,t),o.exports}t.n=e=>{var n=e&&e.__esModule?()=>e.default:()=>e;return t.d(n,{a:n}),n},t.d=(e,n)=>{for(var a in n)t.o(n,a)&&!t.o(e,a)&&Object.defineProperty(e,a,{enumerable:!0,get:n[a]})},t.o=(e,n)=>Object.prototype.hasOwnProperty.call(e,n),(()=>{"use strict";const e=React;var n=t.n(e),a=t(338),r=t(238),o=t.n(r),s=document.getElementById("relatorios-root");s&&(0,a.H)(s).render(n().createElement(o(),null))})()})();
 //# sourceMappingURL=relatorios.bundle.js.map
\ No newline at end of file
@@ -0,0 +1,79 @@
+// ExportacaoService.js - Exportações em segundo plano (fila no servidor + consulta de progresso)
+//
+// Em vez de manter a conexão aberta enquanto o PDF/Excel é gerado, a página enfileira
+// a exportação (POST /accounts/api/exportacoes/), consulta a URL de status até a tarefa
+// terminar e então baixa o arquivo pela URL de download.
+
+window.ExportacaoService = {
+    urlFila: '/accounts/api/exportacoes/',
+
+    // Intervalo entre consultas: começa curto e cresce até o máximo
+    intervaloInicial: 1000,
+    intervaloMaximo: 5000,
+
+    obterCsrfToken() {
+        const campo = document.querySelector('[name=csrfmiddlewaretoken]');
+        if (campo && campo.value) {
+            return campo.value;
+        }
+        const cookie = document.cookie.split(';').map(c => c.trim()).find(c => c.startsWith('csrftoken='));
+        return cookie ? decodeURIComponent(cookie.split('=')[1]) : '';
+    },
+
+    async enfileirar(tipo, parametros = {}, csrfToken = null) {
+        const response = await fetch(this.urlFila, {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken || this.obterCsrfToken()
+            },
+            body: JSON.stringify({ tipo, parametros })
+        });
+        const data = await response.json().catch(() => ({}));
+        if (!response.ok || !data.success) {
+            throw new Error(data.message || `Erro ao enfileirar exportação (HTTP ${response.status})`);
+        }
+        return data.tarefa;
+    },
+
+    async consultar(tarefa) {
+        const response = await fetch(tarefa.url_status, {
+            credentials: 'same-origin',
+            headers: { 'Accept': 'application/json' }
+        });
+        const data = await response.json().catch(() => ({}));
+        if (!response.ok || !data.success) {
+            throw new Error(data.message || `Erro ao consultar exportação (HTTP ${response.status})`);
+        }
+        return data.tarefa;
+    },
+
+    // Consulta o status até a tarefa terminar; onProgresso recebe a tarefa a cada consulta
+    async acompanhar(tarefa, onProgresso = null) {
+        let intervalo = this.intervaloInicial;
+        while (tarefa.status === 'pendente' || tarefa.status === 'processando') {
+            await new Promise(resolve => setTimeout(resolve, intervalo));
+            tarefa = await this.consultar(tarefa);
+            if (onProgresso) {
+                onProgresso(tarefa);
+            }
+            intervalo = Math.min(intervalo * 1.5, this.intervaloMaximo);
+        }
+        if (tarefa.status === 'erro') {
+            throw new Error(tarefa.mensagem || 'Falha na exportação');
+        }
+        return tarefa;
+    },
+
+    // Enfileira, acompanha e baixa o arquivo ao final
+    async exportar(tipo, parametros = {}, { onProgresso = null, csrfToken = null } = {}) {
+        let tarefa = await this.enfileirar(tipo, parametros, csrfToken);
+        if (onProgresso) {
+            onProgresso(tarefa);
+        }
+        tarefa = await this.acompanhar(tarefa, onProgresso);
+        window.location.href = tarefa.url_download;
+        return tarefa;
+    }
+};